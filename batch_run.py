@@ -9,6 +9,12 @@ Usage:
     python batch_run.py                    # Run default sweep
     python batch_run.py --configs 100      # Run 100 configurations
     python batch_run.py --output results.csv
+    python batch_run.py --vectorized       # Whole sweep as runs x steps arrays
+
+    # Full SimulationEngine scenarios, 50 seeded runs each (resumable:
+    # rerunning with the same --output skips completed runs)
+    python batch_run.py --scenario scenarios/f16_vs_sa6.yaml --runs 50 \
+        --output output/f16_mc.csv
 
 Requirements:
     pip install tqdm
@@ -40,7 +46,9 @@ from src.simulation.headless_runner import (
     SimulationResult,
     run_single_simulation,
 )
+from src.simulation.monte_carlo import MonteCarloBatch, RunStatistics
 from src.simulation.scenario_generator import ParameterSpace, ScenarioGenerator
+from src.simulation.sweep_executor import SweepExecutor
 
 
 def run_batch(
@@ -105,6 +113,114 @@ def run_batch(
     return results
 
 
+def run_vectorized_batch(
+    configs: List[SimulationConfig],
+    output_file: str = "output/batch_results.csv",
+) -> List[SimulationResult]:
+    """
+    Run batch of simulations as vectorized array blocks in this process.
+
+    Same results as run_batch() (per-run seeds are honoured), without the
+    per-run Python loop or worker processes.
+
+    Args:
+        configs: List of simulation configurations
+        output_file: Output CSV file path
+
+    Returns:
+        List of simulation results, in configuration order
+    """
+    print(f"=" * 60)
+    print(f"RadarSim Batch Processor (vectorized)")
+    print(f"=" * 60)
+    print(f"Configurations: {len(configs)}")
+    print(f"Output: {output_file}")
+    print(f"=" * 60)
+
+    start_time = time.perf_counter()
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    results = SweepExecutor().run(configs)
+    total_time = time.perf_counter() - start_time
+
+    _save_results_csv(results, output_file)
+    _print_summary(results, total_time)
+
+    return results
+
+
+def run_scenario_batch(
+    scenarios: List[str],
+    n_runs: int,
+    output_file: str,
+    base_seed: int = 0,
+    duration_s: float = None,
+    n_workers: int = None,
+) -> List[RunStatistics]:
+    """
+    Run seeded SimulationEngine scenarios, appending results as they complete.
+
+    Args:
+        scenarios: Scenario YAML files
+        n_runs: Monte Carlo runs per scenario
+        output_file: Output .csv file or .parquet dataset directory
+        base_seed: Seed from which every run seed is derived
+        duration_s: Simulated duration per run [s] (default: scenario's)
+        n_workers: Number of parallel workers (default: CPU count - 1)
+
+    Returns:
+        Results of the runs executed now (completed runs are skipped)
+    """
+    batch = MonteCarloBatch(
+        scenarios,
+        n_runs=n_runs,
+        output_path=output_file,
+        base_seed=base_seed,
+        duration_s=duration_s,
+        n_workers=n_workers,
+    )
+    pending = batch.pending()
+
+    print(f"=" * 60)
+    print(f"RadarSim Monte Carlo Processor")
+    print(f"=" * 60)
+    print(f"Scenarios: {len(scenarios)}")
+    print(f"Runs: {len(batch.tasks())} ({len(batch.tasks()) - len(pending)} already done)")
+    print(f"Workers: {batch.n_workers}")
+    print(f"Output: {output_file}")
+    print(f"=" * 60)
+
+    start_time = time.perf_counter()
+    if TQDM_AVAILABLE:
+        with tqdm(total=len(pending), desc="Simulating") as bar:
+            results = batch.run(progress=lambda stats, done, total: bar.update(1))
+    else:
+        print("Running simulations...")
+
+        def report(stats, done, total):
+            if done % 10 == 0 or done == total:
+                print(f"  Completed: {done}/{total}")
+
+        results = batch.run(progress=report)
+    total_time = time.perf_counter() - start_time
+
+    failed = [stats for stats in results if stats.error]
+    print(f"\n" + "=" * 60)
+    print(f"MONTE CARLO COMPLETE")
+    print(f"=" * 60)
+    print(f"Runs completed: {len(results) - len(failed)}")
+    print(f"Runs failed: {len(failed)}")
+    for stats in failed[:5]:
+        print(f"  {stats.scenario} run {stats.run}: {stats.error}")
+    if len(results) > len(failed):
+        ok = [stats for stats in results if not stats.error]
+        print(f"Average Pd: {sum(r.detection_ratio for r in ok) / len(ok):.3f}")
+        print(f"Runs/second: {len(ok) / total_time:.2f}")
+    print(f"Total time: {total_time:.2f}s")
+    print(f"=" * 60)
+
+    return results
+
+
 def _save_results_csv(results: List[SimulationResult], filepath: str) -> None:
     """Save results to CSV file."""
     if not results:
@@ -173,14 +289,49 @@ def main():
         "--output",
         type=str,
         default=None,
-        help="Output CSV file (default: output/batch_YYYYMMDD_HHMMSS.csv)",
+        help="Output CSV file, or .parquet dataset for --scenario "
+        "(default: output/batch_YYYYMMDD_HHMMSS.csv)",
     )
     parser.add_argument(
         "--quick", action="store_true", help="Run quick sweep (10 ranges, 5 runs each)"
     )
+    parser.add_argument(
+        "--scenario",
+        nargs="+",
+        default=None,
+        help="Run full SimulationEngine scenarios (YAML) instead of the range sweep",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Base seed for scenario runs (default: 0)"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=None,
+        help="Simulated seconds per scenario run (default: scenario duration)",
+    )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Evaluate the sweep as array blocks in one process instead of a worker pool",
+    )
 
     args = parser.parse_args()
 
+    if args.scenario:
+        if args.output is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            args.output = f"output/monte_carlo_{timestamp}.csv"
+        results = run_scenario_batch(
+            scenarios=args.scenario,
+            n_runs=args.runs,
+            output_file=args.output,
+            base_seed=args.seed,
+            duration_s=args.duration,
+            n_workers=args.workers,
+        )
+        return 1 if any(stats.error for stats in results) else 0
+
     # Generate output filename
     if args.output is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -206,9 +357,10 @@ def main():
         configs = configs[: args.configs]
 
     # Run batch
-    results = run_batch(
-        configs=configs, n_workers=args.workers, output_file=args.output
-    )
+    if args.vectorized:
+        run_vectorized_batch(configs=configs, output_file=args.output)
+    else:
+        run_batch(configs=configs, n_workers=args.workers, output_file=args.output)
 
     return 0
 
@@ -0,0 +1,139 @@
+import time
+import numpy as np
+import sys
+import os
+from scipy.optimize import linear_sum_assignment
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.simulation.network_manager import NetworkTrack, TrackAssociator
+
+
+NODE_COUNTS = (5, 20, 50)
+TRACK_COUNTS = (20, 200, 2000)
+P_SEEN = 0.9  # Probability that a node holds a track on a given target
+TARGET_SPACING_M = 3000.0  # Mean spacing of targets on the surveillance grid
+POSITION_SIGMA_M = 50.0
+GATE_M = 1000.0
+MAX_LOOP_PAIRS = 2e6  # Skip the pairwise Python loop above this many pair evaluations
+
+
+def previous_associate(associator, tracks_a, tracks_b):
+    """Previous TrackAssociator.associate: Python double loop over all pairs."""
+    cost = np.full((len(tracks_a), len(tracks_b)), np.inf)
+    for row, track_a in enumerate(tracks_a):
+        for col, track_b in enumerate(tracks_b):
+            innovation = track_a.state[:2] - track_b.state[:2]
+            if np.linalg.norm(innovation) > associator.gate_distance_m:
+                continue
+            S = track_a.covariance[:2, :2] + track_b.covariance[:2, :2]
+            nis = float(innovation @ np.linalg.solve(S, innovation))
+            if nis <= associator.gate_threshold:
+                cost[row, col] = nis
+    if not np.isfinite(cost).any():
+        return []
+    rows, columns = linear_sum_assignment(np.where(np.isfinite(cost), cost, 1e12))
+    return [
+        (tracks_a[row], tracks_b[col])
+        for row, col in zip(rows, columns)
+        if np.isfinite(cost[row, col])
+    ]
+
+
+def sequential(associate, track_lists):
+    """Node-by-node clustering against the first track of every cluster."""
+    clusters = []
+    for tracks in track_lists:
+        representatives = [cluster[0] for cluster in clusters]
+        index = {representative.track_id: i for i, representative in enumerate(representatives)}
+        matched = set()
+        for representative, track in associate(representatives, tracks):
+            clusters[index[representative.track_id]].append(track)
+            matched.add(track.track_id)
+        clusters.extend([track] for track in tracks if track.track_id not in matched)
+    return clusters
+
+
+def make_track_lists(rng, n_nodes, n_targets):
+    side = TARGET_SPACING_M * np.sqrt(n_targets)
+    targets = rng.uniform(0.0, side, (n_targets, 2))
+    covariance = np.diag([POSITION_SIGMA_M**2, POSITION_SIGMA_M**2, 25.0, 25.0])
+    track_lists = []
+    for node in range(n_nodes):
+        seen = np.flatnonzero(rng.random(n_targets) < P_SEEN)
+        positions = targets[seen] + rng.normal(0.0, POSITION_SIGMA_M, (len(seen), 2))
+        track_lists.append(
+            [
+                NetworkTrack(f"{node}:{k}", str(node), np.array([*p, 0.0, 0.0]), covariance, 0.0)
+                for k, p in zip(seen, positions)
+            ]
+        )
+    return track_lists
+
+
+def correct_fraction(clusters, track_lists):
+    """Fraction of targets whose tracks form exactly one cluster."""
+    truth = {}
+    for tracks in track_lists:
+        for track in tracks:
+            truth.setdefault(track.track_id.split(":")[1], set()).add(track.track_id)
+    found = {frozenset(track.track_id for track in cluster) for cluster in clusters}
+    return sum(frozenset(ids) in found for ids in truth.values()) / len(truth)
+
+
+def timed(function, *args):
+    start_time = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start_time) * 1000
+
+
+def run_benchmark():
+    associator = TrackAssociator(gate_distance_m=GATE_M)
+    print("=" * 78)
+    print(
+        f"Track Association Benchmark (gate {GATE_M:.0f} m, sigma {POSITION_SIGMA_M:.0f} m, "
+        f"target spacing {TARGET_SPACING_M / 1000:.0f} km)"
+    )
+    print("=" * 78)
+    print(
+        f"{'nodes':>5} {'tracks':>6} {'loop ms':>9} {'seq ms':>9} {'global ms':>10} "
+        f"{'seq ok':>7} {'global ok':>9} {'seq order':>9}"
+    )
+
+    for n_nodes in NODE_COUNTS:
+        for n_targets in TRACK_COUNTS:
+            track_lists = make_track_lists(np.random.default_rng(1), n_nodes, n_targets)
+
+            loop_ms = "-"
+            if n_nodes * n_targets**2 <= MAX_LOOP_PAIRS:
+                _, elapsed = timed(
+                    sequential,
+                    lambda a, b: previous_associate(associator, a, b),
+                    track_lists,
+                )
+                loop_ms = f"{elapsed:.1f}"
+            seq, seq_ms = timed(sequential, associator.associate, track_lists)
+            joint, global_ms = timed(associator.associate_global, track_lists)
+
+            # Share of clusters that differ when the node order is reversed
+            reversed_seq = sequential(associator.associate, track_lists[::-1])
+            seq_partition = {frozenset(t.track_id for t in c) for c in seq}
+            reversed_partition = {frozenset(t.track_id for t in c) for c in reversed_seq}
+            order_change = len(seq_partition ^ reversed_partition) / (2 * len(seq_partition))
+
+            print(
+                f"{n_nodes:>5} {n_targets:>6} {loop_ms:>9} {seq_ms:>9.1f} {global_ms:>10.1f} "
+                f"{100 * correct_fraction(seq, track_lists):>6.1f}% "
+                f"{100 * correct_fraction(joint, track_lists):>8.1f}% "
+                f"{100 * order_change:>8.1f}%"
+            )
+    print(
+        "\nloop: previous pairwise Python loop, sequential; seq: vectorized, sequential;"
+        "\nok: targets whose tracks form exactly one cluster;"
+        "\nseq order: clusters that change when the node order is reversed"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
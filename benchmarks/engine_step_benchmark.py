@@ -0,0 +1,76 @@
+import time
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.physics.rcs import SwerlingModel
+from src.simulation.engine import SimulationEngine
+from src.simulation.objects import Radar, Target
+
+
+TARGET_COUNTS = [10, 50, 100, 250, 500, 1000]
+STEPS_PER_RUN = 20
+
+
+def build_engine(n_targets, seed=0):
+    """Swarm-saturation style scene: small drones spread over 5-60 km."""
+    rng = np.random.default_rng(seed)
+    radar = Radar(
+        radar_id="bench",
+        position=np.array([0.0, 0.0, 20.0]),
+        frequency_hz=3e9,
+        power_watts=100e3,
+        antenna_gain_db=35.0,
+    )
+    targets = []
+    for i in range(n_targets):
+        bearing = rng.uniform(0.0, 2.0 * np.pi)
+        ground_range = rng.uniform(5e3, 60e3)
+        targets.append(
+            Target(
+                target_id=i,
+                position=np.array(
+                    [
+                        ground_range * np.cos(bearing),
+                        ground_range * np.sin(bearing),
+                        rng.uniform(50.0, 500.0),
+                    ]
+                ),
+                velocity=rng.uniform(-40.0, 40.0, 3),
+                rcs_m2=0.01,
+                target_type="drone",
+                swerling_model=SwerlingModel.SWERLING_1,
+            )
+        )
+    return SimulationEngine(radar=radar, targets=targets, dt=0.1)
+
+
+def time_steps(engine, batched):
+    step = engine.step_batch if batched else engine.step
+    step()  # warm caches and JIT outside the timed region
+    start_time = time.perf_counter()
+    for _ in range(STEPS_PER_RUN):
+        step()
+    return (time.perf_counter() - start_time) / STEPS_PER_RUN * 1000  # ms
+
+
+def run_benchmark():
+    print("=" * 60)
+    print("SimulationEngine Step Benchmark (scalar loop vs. batched)")
+    print("=" * 60)
+    print(f"{'targets':>8} {'step() ms':>12} {'step_batch() ms':>16} {'speedup':>9}")
+
+    for n_targets in TARGET_COUNTS:
+        scalar_ms = time_steps(build_engine(n_targets), batched=False)
+        batch_ms = time_steps(build_engine(n_targets), batched=True)
+        print(
+            f"{n_targets:>8d} {scalar_ms:>12.2f} {batch_ms:>16.2f} "
+            f"{scalar_ms / batch_ms:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,79 @@
+import time
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.tracking.ekf import ExtendedKalmanFilter
+from src.tracking.filter_bank import FilterBank
+from src.tracking.kalman import LinearKalmanFilter
+
+
+TRACK_COUNTS = [10, 100, 300, 1000, 3000]
+REPEATS = 5
+
+
+def build_states(kf, n_tracks, seed=0):
+    rng = np.random.default_rng(seed)
+    states = [
+        kf.initialize(rng.uniform(-5e4, 5e4, 2), rng.uniform(-300.0, 300.0, 2))
+        for _ in range(n_tracks)
+    ]
+    measurements = np.array([state.x[:2] for state in states]) + rng.normal(
+        0.0, 50.0, (n_tracks, 2)
+    )
+    return states, measurements
+
+
+def scalar_cycle(kf, states, measurements, ekf):
+    for state, measurement in zip(states, measurements):
+        predicted = kf.predict(state, 0.1)
+        if ekf:
+            kf.update_cartesian(predicted, tuple(measurement))
+        else:
+            kf.update(predicted, tuple(measurement))
+
+
+def bank_cycle(kf, states, measurements, ekf):
+    bank = FilterBank.from_states(states)
+    bank.predict(kf, 0.1)
+    if ekf:
+        bank.update_cartesian(kf, measurements)
+    else:
+        bank.update_linear(kf, measurements)
+
+
+def best_ms(cycle, kf, states, measurements, ekf):
+    timings = []
+    for _ in range(REPEATS):
+        start_time = time.perf_counter()
+        cycle(kf, states, measurements, ekf)
+        timings.append((time.perf_counter() - start_time) * 1000)
+    return min(timings)
+
+
+def run_benchmark():
+    print("=" * 70)
+    print("Filter Bank Benchmark (per-track predict+update vs. FilterBank)")
+    print("=" * 70)
+    print(
+        f"{'tracks':>7} {'KF loop ms':>11} {'KF bank ms':>11} "
+        f"{'EKF loop ms':>12} {'EKF bank ms':>12} {'speedup':>8}"
+    )
+
+    for n_tracks in TRACK_COUNTS:
+        row = []
+        for kf, ekf in ((LinearKalmanFilter(), False), (ExtendedKalmanFilter(), True)):
+            states, measurements = build_states(kf, n_tracks)
+            row.append(best_ms(scalar_cycle, kf, states, measurements, ekf))
+            row.append(best_ms(bank_cycle, kf, states, measurements, ekf))
+        print(
+            f"{n_tracks:>7d} {row[0]:>11.2f} {row[1]:>11.2f} "
+            f"{row[2]:>12.2f} {row[3]:>12.2f} {row[0] / row[1]:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,96 @@
+import time
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.simulation.network_manager import NetworkManager, NetworkTrack
+
+
+N_NODES = 8
+N_TARGETS = 60
+P_SEEN = 0.8  # Probability that a node holds a track on a given target
+N_CYCLES = 40
+CYCLE_S = 0.5
+
+
+def make_targets(rng):
+    positions = rng.uniform(-80e3, 80e3, (N_TARGETS, 2))
+    velocities = rng.uniform(-250.0, 250.0, (N_TARGETS, 2))
+    return np.hstack([positions, velocities])
+
+
+def node_tracks(rng, node_id, targets, seen, time_s):
+    tracks = []
+    for j in np.flatnonzero(seen):
+        state = targets[j].copy()
+        state[:2] += state[2:] * time_s
+        tracks.append(
+            NetworkTrack(
+                track_id=f"{node_id}:{j}",
+                node_id=node_id,
+                state=state + rng.standard_normal(4) * np.array([20.0, 20.0, 1.0, 1.0]),
+                covariance=np.diag([400.0, 400.0, 4.0, 4.0]),
+                timestamp=time_s,
+            )
+        )
+    return tracks
+
+
+def run_mode(changed_per_cycle):
+    """Fusion cycles where ``changed_per_cycle`` nodes deliver new tracks each cycle."""
+    rng = np.random.default_rng(3)
+    targets = make_targets(rng)
+    seen = rng.random((N_NODES, N_TARGETS)) < P_SEEN
+    manager = NetworkManager(link_delay_ms=0.0, association_gate_m=1500.0)
+    node_ids = [f"radar_{i}" for i in range(N_NODES)]
+    for i, node_id in enumerate(node_ids):
+        manager.register_node(node_id, position_xy=np.array([i * 5000.0, 0.0]))
+        manager.submit_tracks(node_id, node_tracks(rng, node_id, targets, seen[i], 0.0), 0.0)
+    previous = {tuple(track.source_nodes): track.fused_id for track in manager.fuse(0.0)}
+
+    latencies, kept = [], []
+    for cycle in range(1, N_CYCLES + 1):
+        time_s = cycle * CYCLE_S
+        for k in range(changed_per_cycle):
+            i = (cycle * changed_per_cycle + k) % N_NODES
+            tracks = node_tracks(rng, node_ids[i], targets, seen[i], time_s)
+            manager.submit_tracks(node_ids[i], tracks, time_s)
+        start_time = time.perf_counter()
+        fused = manager.fuse(time_s)
+        latencies.append((time.perf_counter() - start_time) * 1000)
+        ids = {track.fused_id for track in fused}
+        kept.append(len(ids & set(previous.values())) / len(previous))
+        previous = {tuple(track.source_nodes): track.fused_id for track in fused}
+    return np.array(latencies), np.mean(kept), len(fused)
+
+
+def run_benchmark():
+    print("=" * 78)
+    print(
+        f"Incremental Fusion Benchmark ({N_NODES} nodes, {N_TARGETS} targets, "
+        f"{N_CYCLES} cycles of {CYCLE_S:.1f} s)"
+    )
+    print("=" * 78)
+    print(
+        f"{'nodes updated per cycle':>26} {'mean ms':>9} {'p95 ms':>9} {'ids kept':>9} "
+        f"{'fused':>7}"
+    )
+    results = {}
+    for changed in (1, N_NODES // 2, N_NODES):
+        latencies, kept, n_fused = run_mode(changed)
+        results[changed] = latencies.mean()
+        print(
+            f"{changed:>26} {latencies.mean():>9.2f} {np.percentile(latencies, 95):>9.2f} "
+            f"{100 * kept:>8.1f}% {n_fused:>7}"
+        )
+    print(
+        f"\none changed node costs {results[1] / results[N_NODES]:.2f}x "
+        f"of a full resubmission"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
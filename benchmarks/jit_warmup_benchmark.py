@@ -0,0 +1,75 @@
+import time
+import tempfile
+import subprocess
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.jit_cache import CACHE_DIR_ENV
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Fresh process: import RadarSim, then time the first engine steps
+FIRST_STEP = """
+import time
+start = time.perf_counter()
+import numpy as np
+from src.simulation.engine import SimulationEngine
+from src.simulation.objects import Radar, Target
+imported = time.perf_counter()
+engine = SimulationEngine(
+    radar=Radar(radar_id="bench", position=np.zeros(3)),
+    targets=[Target(target_id=1, position=np.array([20e3, 5e3, 1e3]))],
+)
+engine.step()
+first = time.perf_counter()
+print(imported - start, first - imported)
+"""
+
+
+def run_python(args, cache_dir):
+    env = dict(os.environ, **{CACHE_DIR_ENV: cache_dir})
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable] + args, cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return time.perf_counter() - start, output
+
+
+def first_step(cache_dir):
+    wall_s, output = run_python(["-c", FIRST_STEP], cache_dir)
+    import_s, step_s = (float(value) for value in output.split())
+    return wall_s, import_s, step_s
+
+
+def run_benchmark():
+    print("=" * 78)
+    print("JIT Warmup Benchmark (fresh process: import RadarSim, first engine step)")
+    print("=" * 78)
+    print(f"{'case':>40} {'process s':>10} {'import s':>9} {'1st step s':>11}")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold = first_step(cache_dir)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        warmup_s, _ = run_python(["-m", "src", "warmup", "--cache-dir", cache_dir], cache_dir)
+        rewarm_s, report = run_python(["-m", "src", "warmup", "--cache-dir", cache_dir], cache_dir)
+        warm = first_step(cache_dir)
+
+    for label, (wall_s, import_s, step_s) in (
+        ("empty cache (compile on first step)", cold),
+        ("after `python -m src warmup`", warm),
+    ):
+        print(f"{label:>40} {wall_s:>10.2f} {import_s:>9.2f} {step_s:>11.3f}")
+    kernels_ms = float(report.splitlines()[-1].split()[-1])
+    print(
+        f"\n`python -m src warmup`: {warmup_s:.1f} s into an empty cache, {rewarm_s:.1f} s when "
+        f"cached ({kernels_ms:.0f} ms loading kernels)"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,70 @@
+import time
+import tempfile
+import sys
+import os
+from multiprocessing import Pool
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.simulation.monte_carlo import MonteCarloBatch, run_task
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCENARIOS = os.path.join(ROOT, "scenarios")
+SCENARIO_FILES = ("f16_vs_sa6.yaml", "ground_clutter_filtering.yaml")
+N_RUNS = 8
+DURATION_S = 2.0
+N_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+
+def run_cold(tasks):
+    """Fresh worker process per task: imports, scenario parse and JIT load every run."""
+    with Pool(N_WORKERS, maxtasksperchild=1) as pool:
+        return list(pool.imap_unordered(run_task, tasks))
+
+
+def run_benchmark():
+    scenarios = [os.path.join(SCENARIOS, name) for name in SCENARIO_FILES]
+
+    print("=" * 78)
+    print(
+        f"Monte Carlo Benchmark ({len(scenarios)} scenarios x {N_RUNS} runs, "
+        f"{DURATION_S:.0f} s simulated each, {N_WORKERS} workers)"
+    )
+    print("=" * 78)
+    print(f"{'mode':>34} {'wall s':>8} {'runs/s':>8} {'mean run ms':>12}")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        batch = MonteCarloBatch(
+            scenarios,
+            n_runs=N_RUNS,
+            output_path=os.path.join(output_dir, "mc.csv"),
+            duration_s=DURATION_S,
+            n_workers=N_WORKERS,
+        )
+        tasks = batch.tasks()
+
+        start_time = time.perf_counter()
+        cold = run_cold(tasks)
+        cold_s = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        warm = batch.run()
+        warm_s = time.perf_counter() - start_time
+
+        resume_start = time.perf_counter()
+        batch.run()  # Everything already in the output
+        resume_s = time.perf_counter() - resume_start
+
+    for label, results, wall_s in (
+        ("fresh process per run", cold, cold_s),
+        ("warm pool, streamed to CSV", warm, warm_s),
+    ):
+        mean_ms = 1000 * sum(stats.runtime_s for stats in results) / len(results)
+        print(f"{label:>34} {wall_s:>8.2f} {len(results) / wall_s:>8.2f} {mean_ms:>12.1f}")
+    print(f"{'resume of a completed sweep':>34} {resume_s:>8.3f} {'-':>8} {'-':>12}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
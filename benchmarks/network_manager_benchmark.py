@@ -2,75 +2,146 @@ import time
 import numpy as np
 import sys
 import os
+from scipy.optimize import minimize
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.simulation.network_manager import NetworkManager, RadarNode, NetworkTrack
+from src.simulation.network_manager import NetworkManager, NetworkTrack
 
 
-def run_benchmark():
-    print("=" * 50)
-    print("NetworkManager Performance Benchmark")
-    print("=" * 50)
-
-    # Initialize a 5-node network
-    manager = NetworkManager()
-
-    # Create 5 radar nodes
-    nodes = []
-    node_ids = []
-    for i in range(5):
-        nid = f"radar_{i}"
-        node = manager.register_node(nid, position_xy=np.array([i * 1000, i * 1000]))
-        nodes.append(node)
-        node_ids.append(nid)
-
-    # Generate random tracks for each node to simulate a busy environment
-    # 20 tracks per node = 100 tracks total to associate
-    for i, nid in enumerate(node_ids):
-        tracks = []
-        for j in range(20):
-            track = NetworkTrack(
-                track_id=f"{nid}_track_{j}",
-                node_id=nid,
-                state=np.array(
-                    [
-                        np.random.uniform(-50000, 50000),
-                        np.random.uniform(-50000, 50000),
-                        np.random.uniform(-300, 300),
-                        np.random.uniform(-300, 300),
-                    ]
-                ),
-                covariance=np.eye(4) * 100,
-                timestamp=time.time(),
-                snr_db=20.0,
+N_NODES = 5
+N_TARGETS = 20
+P_SEEN = 0.8  # Probability that a node holds a track on a given target
+N_CYCLES = 100
+LATENCY_BUDGET_MS = 10.0
+
+
+def previous_fuse_multiple(states, covariances):
+    """Previous CovarianceIntersection.fuse_multiple: cold-started SLSQP per cluster."""
+    identity = np.eye(states[0].size)
+    information = [np.linalg.solve(covariance, identity) for covariance in covariances]
+
+    def objective(weights):
+        fused = sum(weight * matrix for weight, matrix in zip(weights, information))
+        return float(np.trace(np.linalg.solve(fused, identity)))
+
+    def gradient(weights):
+        fused = sum(weight * matrix for weight, matrix in zip(weights, information))
+        covariance = np.linalg.solve(fused, identity)
+        return -np.array([np.trace(covariance @ matrix @ covariance) for matrix in information])
+
+    n_estimates = len(states)
+    result = minimize(
+        objective,
+        np.full(n_estimates, 1.0 / n_estimates),
+        jac=gradient,
+        method="SLSQP",
+        bounds=[(0.0, 1.0)] * n_estimates,
+        constraints={"type": "eq", "fun": lambda weights: np.sum(weights) - 1.0},
+        options={"ftol": 1e-10, "maxiter": 1000},
+    )
+    weights = np.clip(result.x, 0.0, 1.0)
+    weights /= weights.sum()
+    fused = sum(weight * matrix for weight, matrix in zip(weights, information))
+    P_fused = np.linalg.solve(fused, identity)
+    x_fused = P_fused @ sum(w * m @ x for w, m, x in zip(weights, information, states))
+    return x_fused, 0.5 * (P_fused + P_fused.T)
+
+
+def previous_fuse_batch(states, covariances, initial_weights=None):
+    """fuse_batch replacement that fuses each cluster with previous_fuse_multiple."""
+    fused = [previous_fuse_multiple(x, P) for x, P in zip(states, covariances)]
+    x_fused = np.array([x for x, _ in fused])
+    P_fused = np.array([P for _, P in fused])
+    return x_fused, P_fused, np.full(states.shape[:2], 1.0 / states.shape[1])
+
+
+def random_covariance(rng):
+    """Full 4x4 track covariance: correlated position/velocity errors."""
+    A = rng.standard_normal((4, 4)) * np.array([30.0, 30.0, 3.0, 3.0])[:, np.newaxis]
+    return A @ A.T + np.diag([100.0, 100.0, 4.0, 4.0])
+
+
+def build_manager(rng):
+    manager = NetworkManager(link_delay_ms=0.0, association_gate_m=2000.0)
+    targets = rng.uniform(-50e3, 50e3, (N_TARGETS, 4)) * np.array([1.0, 1.0, 0.006, 0.006])
+    for i in range(N_NODES):
+        node_id = f"radar_{i}"
+        manager.register_node(node_id, position_xy=np.array([i * 1000.0, i * 1000.0]))
+        tracks = [
+            NetworkTrack(
+                track_id=f"{node_id}:{j}",
+                node_id=node_id,
+                state=target + rng.standard_normal(4) * np.array([20.0, 20.0, 1.0, 1.0]),
+                covariance=random_covariance(rng),
+                timestamp=1.0,
             )
-            tracks.append(track)
-        manager.submit_tracks(nid, tracks, current_time=1.0)
+            for j, target in enumerate(targets)
+            if rng.random() < P_SEEN
+        ]
+        manager.submit_tracks(node_id, tracks, current_time=1.0)
+    return manager
 
-    print("Simulating T2TA for 5-node network (100 tracks total)...")
 
-    # Run association 100 times to get average latency
+def time_cycles(manager):
     latencies = []
-    for _ in range(100):
-        start_time = time.time()
-        # Trigger fusion/association logic
-        manager.fuse(current_time=1.0)
-        end_time = time.time()
-        latencies.append((end_time - start_time) * 1000)  # ms
+    for cycle in range(N_CYCLES):
+        start_time = time.perf_counter()
+        # Advancing time re-fuses every cluster
+        fused = manager.fuse(current_time=1.0 + 0.1 * (cycle + 1))
+        latencies.append((time.perf_counter() - start_time) * 1000)
+    return np.array(latencies), fused
+
+
+def run_benchmark():
+    print("=" * 78)
+    print(
+        f"NetworkManager Fusion Benchmark ({N_NODES} nodes, {N_TARGETS} targets, "
+        f"{N_CYCLES} fusion cycles)"
+    )
+    print("=" * 78)
+
+    previous = build_manager(np.random.default_rng(7))
+    previous.ci.fuse_batch = previous_fuse_batch
+    previous_ms, previous_fused = time_cycles(previous)
+
+    current = build_manager(np.random.default_rng(7))
+    first_start = time.perf_counter()
+    current.fuse(current_time=1.0)  # Cold start: no previous weights
+    cold_ms = (time.perf_counter() - first_start) * 1000
+    current_ms, current_fused = time_cycles(current)
 
-    avg_latency = np.mean(latencies)
-    max_latency = np.max(latencies)
+    sizes = np.bincount([len(track.source_nodes) for track in current_fused])
+    print(
+        "cluster sizes: "
+        + ", ".join(f"{size} src x{count}" for size, count in enumerate(sizes) if count)
+    )
+    print(f"{'fusion cycle':>36} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for label, latencies in (
+        ("SLSQP per cluster (previous)", previous_ms),
+        ("batched Newton, warm-started", current_ms),
+    ):
+        print(
+            f"{label:>36} {latencies.mean():>9.2f} {np.percentile(latencies, 95):>9.2f} "
+            f"{latencies.max():>9.2f}"
+        )
+    print(f"{'batched Newton, first (cold) cycle':>36} {cold_ms:>9.2f} {'-':>9} {'-':>9}")
 
-    print(f"Average Latency: {avg_latency:.2f} ms")
-    print(f"Max Latency:     {max_latency:.2f} ms")
+    trace_error = max(
+        abs(np.trace(new.covariance) - np.trace(old.covariance)) / np.trace(old.covariance)
+        for new, old in zip(current_fused, previous_fused)
+    )
+    print(
+        f"\nspeedup {previous_ms.mean() / current_ms.mean():.1f}x, "
+        f"max relative tr(P) difference {trace_error:.1e}"
+    )
 
-    if avg_latency > 10.0:
-        print("\nWARNING: Latency exceeds 10ms threshold!")
+    if current_ms.mean() > LATENCY_BUDGET_MS:
+        print(f"\nWARNING: Latency exceeds {LATENCY_BUDGET_MS:.0f}ms threshold!")
         sys.exit(1)
     else:
-        print("\nSUCCESS: Latency is within 10ms threshold.")
+        print(f"\nSUCCESS: Latency is within {LATENCY_BUDGET_MS:.0f}ms threshold.")
         sys.exit(0)
 
 
@@ -0,0 +1,48 @@
+import time
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.physics.metrics import PdTable, calculate_pd_swerling
+
+
+N_QUERIES = 2000
+
+
+def run_benchmark():
+    print("=" * 60)
+    print("Swerling Pd: exact quadrature vs. interpolated PdTable")
+    print("=" * 60)
+    snr_db = np.random.default_rng(0).uniform(-10.0, 30.0, N_QUERIES)
+
+    for swerling_case in range(5):
+        start_time = time.perf_counter()
+        table = PdTable(pfa=1e-6, swerling_case=swerling_case, n_pulses=4)
+        build_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        exact = [calculate_pd_swerling(snr, 1e-6, swerling_case, 4) for snr in snr_db]
+        exact_us = (time.perf_counter() - start_time) / N_QUERIES * 1e6
+
+        start_time = time.perf_counter()
+        for snr in snr_db:
+            table(snr)
+        scalar_us = (time.perf_counter() - start_time) / N_QUERIES * 1e6
+
+        start_time = time.perf_counter()
+        interpolated = table(snr_db)
+        array_us = (time.perf_counter() - start_time) / N_QUERIES * 1e6
+
+        print(
+            f"Swerling {swerling_case}: build {build_ms:7.1f} ms | "
+            f"exact {exact_us:8.1f} us/query | table scalar {scalar_us:5.1f} us | "
+            f"table array {array_us:6.3f} us | "
+            f"max |error| {np.max(np.abs(interpolated - exact)):.1e}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
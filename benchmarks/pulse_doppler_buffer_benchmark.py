@@ -0,0 +1,85 @@
+import time
+import tracemalloc
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.signal.pulse_doppler import PulseDopplerProcessor
+
+
+N_CPI = 50
+CONFIGURATIONS = [(64, 512), (128, 2048)]
+
+
+def allocating_chain(processor, raw, buffers):
+    return processor.doppler_fft(processor.mti_cancel(processor.range_compress(raw)))
+
+
+def preallocated_chain(processor, raw, buffers):
+    compressed, filtered, rd = buffers
+    processor.range_compress(raw, out=compressed)
+    processor.mti_cancel(compressed, out=filtered)
+    return processor.doppler_fft(filtered, out=rd)
+
+
+def measure(processor, chain, raw):
+    """Return (ms per CPI, peak traced bytes per CPI above the input)."""
+    n_doppler = processor.n_pulses - processor.mti_order
+    shapes = [raw.shape, (n_doppler, raw.shape[1]), (n_doppler, raw.shape[1])]
+    buffers = [np.empty(shape, dtype=processor.complex_dtype) for shape in shapes]
+    chain(processor, raw, buffers)  # size work buffers outside the measurement
+
+    tracemalloc.start()
+    peak_bytes = 0
+    for _ in range(N_CPI):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        chain(processor, raw, buffers)
+        peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    start_time = time.perf_counter()
+    for _ in range(N_CPI):
+        chain(processor, raw, buffers)
+    return (time.perf_counter() - start_time) / N_CPI * 1000, peak_bytes
+
+
+def run_benchmark():
+    print("=" * 78)
+    print("Range/Doppler Processing Buffer Benchmark")
+    print("'CPI allocs' = peak transient bytes per CPI / bytes of one complex128 CPI")
+    print("=" * 78)
+    print(
+        f"{'pulses x bins':>14} {'mode':>26} {'ms/CPI':>8} "
+        f"{'peak MB':>9} {'CPI allocs':>11}"
+    )
+
+    for n_pulses, n_range_bins in CONFIGURATIONS:
+        raw = np.random.default_rng(0).standard_normal(
+            (n_pulses, n_range_bins)
+        ).astype(np.complex128)
+        cpi_bytes = raw.nbytes
+        runs = [
+            ("complex128, allocating", np.complex128, allocating_chain),
+            ("complex128, out=", np.complex128, preallocated_chain),
+            ("complex64, out=", np.complex64, preallocated_chain),
+        ]
+        for label, dtype, chain in runs:
+            processor = PulseDopplerProcessor(
+                n_pulses=n_pulses,
+                n_range_bins=n_range_bins,
+                mti_order=1,
+                complex_dtype=dtype,
+            )
+            ms, peak_bytes = measure(processor, chain, raw)
+            print(
+                f"{f'{n_pulses} x {n_range_bins}':>14} {label:>26} {ms:>8.2f} "
+                f"{peak_bytes / 1e6:>9.2f} {peak_bytes / cpi_bytes:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,85 @@
+import time
+import tempfile
+import tracemalloc
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.simulation.recorder import FlightRecorder
+
+
+N_TARGETS = 50
+DT = 0.05
+SESSION_STEPS = (2000, 8000)
+CONFIG = {"radar_frequency_hz": 10e9, "radar_power_watts": 100e3, "max_range_km": 150}
+
+
+def build_state(step):
+    """GUI-style state dict for N_TARGETS targets."""
+    return {
+        "time": step * DT,
+        "targets": [
+            {
+                "id": target_id,
+                "type": "aircraft",
+                "rcs_m2": 5.0,
+                "position": [1000.0 * target_id + step, 2.0 * step, 5000.0],
+                "velocity": [20.0, 40.0, 0.0],
+                "range_km": 50.0,
+                "azimuth_rad": 0.5,
+                "snr_db": 15.0,
+                "is_detected": step % 2 == 0,
+            }
+            for target_id in range(N_TARGETS)
+        ],
+    }
+
+
+def measure(recorder, steps):
+    states = [build_state(step) for step in range(steps)]
+    tracemalloc.start()
+    recorder.start_recording(CONFIG)
+    start_time = time.perf_counter()
+    for state in states:
+        recorder.record_state(state)
+    record_ms = (time.perf_counter() - start_time) * 1000
+    memory_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    start_time = time.perf_counter()
+    filepath = recorder.stop_recording()
+    stop_ms = (time.perf_counter() - start_time) * 1000
+    recorder.wait_for_save()
+    saved_ms = (time.perf_counter() - start_time) * 1000
+    tracemalloc.stop()
+    return record_ms / steps, memory_mb, stop_ms, saved_ms, os.path.getsize(filepath) / 1e6
+
+
+def run_benchmark():
+    print("=" * 86)
+    print(f"FlightRecorder Benchmark ({N_TARGETS} targets per snapshot)")
+    print("=" * 86)
+    print(
+        f"{'recorder':>18} {'steps':>6} {'record ms/step':>15} {'memory MB':>10} "
+        f"{'stop ms':>8} {'saved ms':>9} {'file MB':>8}"
+    )
+
+    modes = [
+        ("in-memory", {}),
+        ("streaming gzip", {"streaming": True, "compression": "gzip"}),
+        ("streaming lzf", {"streaming": True, "compression": "lzf"}),
+    ]
+    for steps in SESSION_STEPS:
+        for label, options in modes:
+            with tempfile.TemporaryDirectory() as output_dir:
+                per_step_ms, memory_mb, stop_ms, saved_ms, file_mb = measure(
+                    FlightRecorder(output_dir, **options), steps
+                )
+            print(
+                f"{label:>18} {steps:>6d} {per_step_ms:>15.3f} {memory_mb:>10.1f} "
+                f"{stop_ms:>8.1f} {saved_ms:>9.1f} {file_mb:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    run_benchmark()
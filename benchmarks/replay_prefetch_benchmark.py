@@ -0,0 +1,76 @@
+import time
+import tempfile
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io.replay_cache import ReplayFrameCache
+from src.io.replay_loader import ReplayLoader
+
+from replay_scrub_benchmark import N_SNAPSHOTS, N_TARGETS, write_recording
+
+
+FRAME_S = 0.016  # PlaybackPanel.FRAME_INTERVAL_MS
+RENDER_S = 0.006  # display update time per frame, off the data path
+N_FRAMES = 300
+SPEEDS = (4.0, 8.0, 16.0)
+
+
+def play(source, speed, start_s):
+    """Run a fixed-rate playback loop; return per-frame state latencies [ms]."""
+    latencies = []
+    t = start_s
+    next_frame = time.perf_counter()
+    for _ in range(N_FRAMES):
+        start_time = time.perf_counter()
+        source.get_state_at_time(t)
+        latencies.append((time.perf_counter() - start_time) * 1000)
+        time.sleep(RENDER_S)
+        next_frame += FRAME_S
+        time.sleep(max(0.0, next_frame - time.perf_counter()))
+        t += FRAME_S * speed
+    return np.array(latencies)
+
+
+def run_benchmark():
+    print("=" * 78)
+    print(
+        f"Replay Prefetch Benchmark ({N_TARGETS} targets, {N_FRAMES} frames at "
+        f"{1 / FRAME_S:.0f} FPS, {RENDER_S * 1000:.0f} ms render)"
+    )
+    print("=" * 78)
+    print(
+        f"{'speed':>6} {'source':>16} {'state ms':>9} {'p95 ms':>7} "
+        f"{'late frames':>12} {'hit rate':>9}"
+    )
+
+    budget_ms = (FRAME_S - RENDER_S) * 1000
+    with tempfile.TemporaryDirectory() as output_dir:
+        filepath = os.path.join(output_dir, "chunked.h5")
+        write_recording(filepath, chunked=True)
+        duration = N_SNAPSHOTS * 0.05
+
+        with ReplayLoader(filepath) as loader:
+            for index, speed in enumerate(SPEEDS):
+                # Separate stretches of the file so block-cache reuse does not carry over
+                start_s = duration * (index + 1) / (2 * len(SPEEDS) + 1)
+                for label in ("loader", "prefetch cache"):
+                    if label == "loader":
+                        latencies = play(loader, speed, start_s)
+                        hit_rate = "-"
+                    else:
+                        with ReplayFrameCache(loader, lookahead=32) as frames:
+                            latencies = play(frames, speed, start_s + duration / 2)
+                            hit_rate = f"{frames.stats.hit_rate:.1%}"
+                    late = np.count_nonzero(latencies > budget_ms)
+                    print(
+                        f"{speed:>5g}x {label:>16} {latencies.mean():>9.2f} "
+                        f"{np.percentile(latencies, 95):>7.2f} {late:>12d} {hit_rate:>9}"
+                    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
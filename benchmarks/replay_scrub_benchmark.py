@@ -0,0 +1,135 @@
+import time
+import tempfile
+import json
+import numpy as np
+import h5py
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io.replay_loader import ReplayLoader
+
+
+N_TARGETS = 100
+N_SNAPSHOTS = 20000  # 1000 s at 20 Hz
+DT = 0.05
+N_SCRUBS = 200
+DRAG_RATE_S = 4.0 / 30.0  # slider drag: 4x playback speed at 30 FPS
+
+
+def write_recording(filepath, chunked):
+    """FlightRecorder-layout file: contiguous (in-memory mode) or chunked gzip (streaming)."""
+    rng = np.random.default_rng(0)
+    times = np.arange(N_SNAPSHOTS) * DT
+    options = {"compression": "gzip", "shuffle": True} if chunked else {}
+
+    def dataset(group, name, data):
+        # Same chunking as FlightRecorder(streaming=True): one 1024-row batch per chunk
+        chunks = (1024,) + data.shape[1:] if chunked else None
+        return group.create_dataset(name, data=data, chunks=chunks, **options)
+
+    with h5py.File(filepath, "w") as f:
+        f.create_group("config").attrs["radar_frequency_hz"] = 10e9
+        targets = f.create_group("targets")
+        for target_id in range(N_TARGETS):
+            group = targets.create_group(str(target_id))
+            track = np.cumsum(rng.normal(0.0, 10.0, (N_SNAPSHOTS, 3)), axis=0) + 3e4
+            dataset(group, "positions", np.column_stack([times, track]))
+            dataset(group, "velocities", np.column_stack([times, np.gradient(track, DT, axis=0)]))
+            group.attrs["metadata"] = json.dumps({"type": "aircraft", "rcs_m2": 5.0})
+
+        measurements = f.create_group("measurements")
+        n_rows = N_SNAPSHOTS * N_TARGETS
+        columns = {
+            "time": np.repeat(times, N_TARGETS),
+            "target_id": np.tile(np.arange(N_TARGETS), N_SNAPSHOTS),
+            "range_m": rng.uniform(1e3, 1e5, n_rows),
+            "azimuth_rad": rng.uniform(-np.pi, np.pi, n_rows),
+            "snr_db": rng.uniform(-5.0, 30.0, n_rows),
+            "detected": rng.random(n_rows) < 0.5,
+        }
+        for name, values in columns.items():
+            dataset(measurements, name, values)
+        dataset(f, "timestamps", times)
+
+
+class FullScanReplay:
+    """Previous behaviour: load everything, scan the time column per scrub."""
+
+    def __init__(self, filepath):
+        with h5py.File(filepath, "r") as f:
+            self.tracks = {
+                int(name): (group["positions"][()], group["velocities"][()])
+                for name, group in f["targets"].items()
+            }
+            self.measurements = {name: f["measurements"][name][()] for name in f["measurements"]}
+            self.timestamps = f["timestamps"][()]
+
+    def get_state_at_time(self, t):
+        idx = min(np.searchsorted(self.timestamps, t), len(self.timestamps) - 1)
+        i0 = max(idx - 1, 0)
+        mask = np.abs(self.measurements["time"] - t) < 0.5
+        lookup = {
+            int(self.measurements["target_id"][i]): self.measurements["snr_db"][i]
+            for i in np.where(mask)[0]
+        }
+        states = []
+        for target_id, (positions, velocities) in self.tracks.items():
+            position = positions[i0, 1:4] + 0.5 * (positions[idx, 1:4] - positions[i0, 1:4])
+            states.append((target_id, position, np.linalg.norm(position), lookup.get(target_id)))
+        return states
+
+
+def scrub_latency_ms(loader, scrub_times):
+    latencies = []
+    for t in scrub_times:
+        start_time = time.perf_counter()
+        loader.get_state_at_time(t)
+        latencies.append((time.perf_counter() - start_time) * 1000)
+    return np.mean(latencies), np.percentile(latencies, 95)
+
+
+def run_benchmark():
+    rng = np.random.default_rng(1)
+    seek_times = rng.uniform(0.0, N_SNAPSHOTS * DT, N_SCRUBS)
+    drag_times = 300.0 + DRAG_RATE_S * np.arange(N_SCRUBS)
+
+    print("=" * 78)
+    print(
+        f"Replay Scrub Benchmark ({N_TARGETS} targets x {N_SNAPSHOTS} snapshots, "
+        f"{N_SCRUBS} scrubs)"
+    )
+    print("=" * 78)
+    print(
+        f"{'file':>11} {'loader':>22} {'open ms':>9} {'seek ms':>8} {'p95 ms':>7} "
+        f"{'drag ms':>8} {'p95 ms':>7}"
+    )
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        for layout in ("contiguous", "chunked"):
+            filepath = os.path.join(output_dir, f"{layout}.h5")
+            write_recording(filepath, chunked=layout == "chunked")
+
+            loaders = [
+                ("full scan (previous)", lambda: FullScanReplay(filepath)),
+                ("indexed, first open", lambda: ReplayLoader(filepath)),
+                ("indexed, sidecar", lambda: ReplayLoader(filepath)),
+            ]
+            for label, open_loader in loaders:
+                start_time = time.perf_counter()
+                loader = open_loader()
+                open_ms = (time.perf_counter() - start_time) * 1000
+                seek_ms, seek_p95 = scrub_latency_ms(loader, seek_times)
+                drag_ms, drag_p95 = scrub_latency_ms(loader, drag_times)
+                if isinstance(loader, ReplayLoader):
+                    loader.close()
+                print(
+                    f"{layout:>11} {label:>22} {open_ms:>9.1f} {seek_ms:>8.2f} {seek_p95:>7.2f} "
+                    f"{drag_ms:>8.2f} {drag_p95:>7.2f}"
+                )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,110 @@
+import time
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.simulation.network_manager import NetworkManager, NetworkTrack
+
+
+N_NODES = 30
+N_TARGETS = 1500
+AREA_M = 600e3  # Side of the defended area
+RADAR_RANGE_M = 200e3
+N_CYCLES = 10
+CYCLE_S = 1.0
+WORKER_COUNTS = (0, 1, 2, 4, 8)
+N_SHARDS = 8
+SHARD_SIZE_M = 100e3
+
+
+def make_scenario(rng):
+    radars = rng.uniform(0.0, AREA_M, (N_NODES, 2))
+    targets = np.hstack(
+        [rng.uniform(0.0, AREA_M, (N_TARGETS, 2)), rng.uniform(-250.0, 250.0, (N_TARGETS, 2))]
+    )
+    return radars, targets
+
+
+def node_tracks(rng, node, radar, targets, time_s):
+    positions = targets[:, :2] + targets[:, 2:] * time_s
+    visible = np.flatnonzero(np.linalg.norm(positions - radar, axis=1) < RADAR_RANGE_M)
+    noise = rng.normal(0.0, 1.0, (len(visible), 4)) * np.array([30.0, 30.0, 2.0, 2.0])
+    covariance = np.diag([900.0, 900.0, 4.0, 4.0])
+    return [
+        NetworkTrack(
+            f"R{node}:{k}",
+            f"R{node}",
+            np.concatenate([positions[k], targets[k, 2:]]) + noise[i],
+            covariance,
+            time_s,
+        )
+        for i, k in enumerate(visible)
+    ]
+
+
+def run_mode(n_workers, worker_processes=False):
+    rng = np.random.default_rng(9)
+    radars, targets = make_scenario(rng)
+    manager = NetworkManager(
+        link_delay_ms=0.0,
+        association_gate_m=1000.0,
+        association_mode="global",
+        n_workers=n_workers,
+        worker_processes=worker_processes,
+        n_shards=N_SHARDS,
+        shard_size_m=SHARD_SIZE_M,
+    )
+    for node, radar in enumerate(radars):
+        manager.register_node(f"R{node}", radar)
+
+    latencies = []
+    try:
+        for cycle in range(N_CYCLES + 1):
+            time_s = cycle * CYCLE_S
+            for node, radar in enumerate(radars):
+                manager.submit_tracks(
+                    f"R{node}", node_tracks(rng, node, radar, targets, time_s), time_s
+                )
+            start_time = time.perf_counter()
+            fused = manager.fuse(time_s)
+            if cycle:  # The first cycle also starts the pool
+                latencies.append((time.perf_counter() - start_time) * 1000)
+    finally:
+        manager.close()
+    return np.array(latencies), fused
+
+
+def run_benchmark():
+    print("=" * 78)
+    print(
+        f"Sharded Fusion Benchmark ({N_NODES} nodes, {N_TARGETS} targets, "
+        f"{N_SHARDS} shards, {os.cpu_count()} CPUs available)"
+    )
+    print("=" * 78)
+    print(f"{'pool':>22} {'mean ms':>9} {'p95 ms':>9} {'speedup':>8} {'identical':>10}")
+
+    modes = [(n_workers, False) for n_workers in WORKER_COUNTS] + [(max(WORKER_COUNTS), True)]
+    reference_ms = reference = None
+    for n_workers, worker_processes in modes:
+        latencies, fused = run_mode(n_workers, worker_processes)
+        if reference is None:
+            reference_ms, reference = latencies.mean(), fused
+        identical = all(
+            a.fused_id == b.fused_id and np.allclose(a.covariance, b.covariance, rtol=1e-9)
+            for a, b in zip(fused, reference)
+        ) and len(fused) == len(reference)
+        label = f"{n_workers} {'processes' if worker_processes else 'threads'}"
+        if n_workers == 0:
+            label = "serial"
+        print(
+            f"{label:>22} {latencies.mean():>9.1f} {np.percentile(latencies, 95):>9.1f} "
+            f"{reference_ms / latencies.mean():>7.2f}x {str(identical):>10}"
+        )
+    print(f"\nfused tracks: {len(reference)}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
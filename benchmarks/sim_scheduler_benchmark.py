@@ -0,0 +1,123 @@
+import time
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.physics.rcs import SwerlingModel
+from src.simulation.engine import SimulationEngine
+from src.simulation.objects import Radar, Target
+from src.simulation.scheduler import FixedStepScheduler
+from src.simulation.snapshot import SnapshotBuffers, fill_snapshot
+
+
+N_TARGETS = 20
+PHYSICS_RATE_HZ = 100.0
+DISPLAY_RATE_HZ = 30.0
+RUN_S = 1.5
+SPEEDS = (1.0, 4.0, 10.0)
+
+
+def build_engine():
+    rng = np.random.default_rng(0)
+    radar = Radar(radar_id="bench", position=np.array([0.0, 0.0, 30.0]))
+    targets = []
+    for i in range(N_TARGETS):
+        position = rng.uniform(-60e3, 60e3, 3)
+        position[2] = abs(position[2]) / 20.0
+        targets.append(
+            Target(
+                target_id=i,
+                position=position,
+                velocity=rng.uniform(-300.0, 300.0, 3),
+                rcs_m2=rng.uniform(0.5, 10.0),
+                swerling_model=SwerlingModel.SWERLING_0,
+            )
+        )
+    engine = SimulationEngine(radar=radar, targets=targets, dt=1.0 / PHYSICS_RATE_HZ)
+    for _ in range(5):  # Warm caches before timing
+        engine.step()
+    return engine
+
+
+def publish(engine, buffers, sequence):
+    """UI frame: fill a snapshot; the consumer releases it immediately."""
+    snapshot = buffers.acquire()
+    fill_snapshot(snapshot, engine, sequence)
+    snapshot.release()
+
+
+def run_previous(engine, speed):
+    """Previous SimulationWorker.run: dt = elapsed * speed, one frame per step."""
+    buffers = SnapshotBuffers()
+    update_interval = 1.0 / DISPLAY_RATE_HZ
+    step_dts, step_ms, frames = [], [], 0
+    start = last_update = time.perf_counter()
+    while time.perf_counter() - start < RUN_S:
+        current_time = time.perf_counter()
+        elapsed = current_time - last_update
+        if elapsed >= update_interval:
+            dt = elapsed * speed
+            step_start = time.perf_counter()
+            engine.step(dt)
+            step_ms.append((time.perf_counter() - step_start) * 1000)
+            step_dts.append(dt)
+            frames += 1
+            publish(engine, buffers, frames)
+            last_update = current_time
+        time.sleep(0.01)
+    wall_s = time.perf_counter() - start
+    return sum(step_dts) / wall_s, max(step_dts), len(step_dts), frames, np.percentile(step_ms, 95)
+
+
+def run_scheduled(engine, speed):
+    buffers = SnapshotBuffers()
+    scheduler = FixedStepScheduler(
+        physics_rate_hz=PHYSICS_RATE_HZ, display_rate_hz=DISPLAY_RATE_HZ, speed_factor=speed
+    )
+    frames = 0
+    start = time.perf_counter()
+    scheduler.start(start)
+    while time.perf_counter() - start < RUN_S:
+        now = time.perf_counter()
+        for _ in range(scheduler.steps_due(now)):
+            step_start = time.perf_counter()
+            engine.step(scheduler.step_dt)
+            scheduler.record_step(time.perf_counter() - step_start)
+        if scheduler.frame_due(now):
+            frames += 1
+            publish(engine, buffers, frames)
+            scheduler.record_frame()
+        time.sleep(scheduler.time_until_next(time.perf_counter()))
+    stats = scheduler.stats()
+    return stats.real_time_factor, scheduler.step_dt, stats.steps, frames, stats.step_p95_ms
+
+
+def run_benchmark():
+    print("=" * 78)
+    print(
+        f"Simulation Scheduler Benchmark ({N_TARGETS} targets, {PHYSICS_RATE_HZ:.0f} Hz physics, "
+        f"{DISPLAY_RATE_HZ:.0f} Hz display, {RUN_S} s)"
+    )
+    print("=" * 78)
+    print(
+        f"{'speed':>6} {'loop':>22} {'RTF':>6} {'max dt ms':>10} {'steps':>6} "
+        f"{'frames':>7} {'step p95 ms':>12}"
+    )
+
+    for speed in SPEEDS:
+        for label, loop in (
+            ("variable dt (previous)", run_previous),
+            ("fixed step", run_scheduled),
+        ):
+            rtf, max_dt, steps, frames, p95 = loop(build_engine(), speed)
+            print(
+                f"{speed:>5g}x {label:>22} {rtf:>6.2f} {max_dt * 1000:>10.1f} {steps:>6d} "
+                f"{frames:>7d} {p95:>12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    run_benchmark()
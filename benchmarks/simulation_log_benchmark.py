@@ -0,0 +1,99 @@
+import time
+import tracemalloc
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.simulation.engine import DetectionBlock, SimulationLog
+
+
+N_TARGETS = 200
+N_STEPS = 3000  # 30 s at 100 Hz
+DT = 0.01
+RETENTION_S = 5.0
+
+
+def build_block(step, rng):
+    """Synthetic step_batch() output for N_TARGETS targets."""
+    floats = {
+        name: rng.uniform(0.0, 1e4, N_TARGETS)
+        for name in (
+            "true_range_m", "true_azimuth_rad", "true_elevation_rad",
+            "true_velocity_mps", "true_rcs_m2", "measured_range_m",
+            "measured_azimuth_rad", "measured_elevation_rad", "snr_db", "pd",
+            "atmospheric_loss_db", "rain_attenuation_db", "surface_clutter_loss_db",
+            "surface_sigma0_db", "surface_cell_area_m2", "surface_clutter_rcs_m2",
+            "rain_clutter_loss_db", "jammer_jsr_db", "jammer_loss_db",
+            "receiver_input_power_dbm", "receiver_headroom_db",
+            "receiver_clipping_loss_db",
+        )
+    }
+    return DetectionBlock(
+        time=step * DT,
+        target_id=np.arange(N_TARGETS),
+        is_detected=rng.random(N_TARGETS) < 0.5,
+        receiver_overloaded=np.zeros(N_TARGETS, dtype=bool),
+        surface_clutter_model=np.full(N_TARGETS, "disabled"),
+        **floats,
+    )
+
+
+class ObjectListLog:
+    """Previous behaviour: one DetectionResult object per target per step."""
+
+    def __init__(self):
+        self.detection_history = []
+
+    def add_block(self, block):
+        self.detection_history.extend(block.to_results())
+
+    def get_target_history(self, target_id):
+        return [r for r in self.detection_history if r.target_id == target_id]
+
+
+def measure(log, blocks):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    for block in blocks:
+        log.add_block(block)
+    add_ms = (time.perf_counter() - start_time) * 1000
+    memory_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+
+    log.get_target_history(0)  # build the index outside the timed query
+    start_time = time.perf_counter()
+    history = log.get_target_history(N_TARGETS // 2)
+    query_ms = (time.perf_counter() - start_time) * 1000
+    return add_ms, memory_mb, query_ms, len(history)
+
+
+def run_benchmark():
+    rng = np.random.default_rng(0)
+    blocks = [build_block(step, rng) for step in range(1, N_STEPS + 1)]
+
+    print("=" * 78)
+    print(f"SimulationLog Benchmark ({N_TARGETS} targets x {N_STEPS} steps at 100 Hz)")
+    print("=" * 78)
+    print(
+        f"{'log':>28} {'add ms/step':>12} {'memory MB':>10} "
+        f"{'history ms':>11} {'rows':>6}"
+    )
+
+    logs = [
+        ("DetectionResult list", ObjectListLog()),
+        ("columnar, unbounded", SimulationLog()),
+        (f"columnar, last {RETENTION_S:g} s", SimulationLog(retention_s=RETENTION_S)),
+    ]
+    for label, log in logs:
+        add_ms, memory_mb, query_ms, rows = measure(log, blocks)
+        print(
+            f"{label:>28} {add_ms / N_STEPS:>12.3f} {memory_mb:>10.1f} "
+            f"{query_ms:>11.2f} {rows:>6d}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,136 @@
+import time
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.physics.rcs import SwerlingModel
+from src.simulation.engine import SimulationEngine
+from src.simulation.objects import Radar, Target
+from src.simulation.snapshot import SnapshotBuffers, fill_snapshot
+
+
+N_FRAMES = 100
+TARGET_COUNTS = (10, 100, 500)
+N_PULSES = 64  # Doppler bins of the range-Doppler map (x 512 range bins)
+
+
+def build_engine(n_targets):
+    rng = np.random.default_rng(0)
+    radar = Radar(radar_id="bench", position=np.array([0.0, 0.0, 30.0]))
+    targets = []
+    for i in range(n_targets):
+        position = rng.uniform(-60e3, 60e3, 3)
+        position[2] = abs(position[2]) / 20.0
+        targets.append(
+            Target(
+                target_id=i,
+                position=position,
+                velocity=rng.uniform(-300.0, 300.0, 3),
+                rcs_m2=rng.uniform(0.5, 10.0),
+                swerling_model=SwerlingModel.SWERLING_0,
+            )
+        )
+    engine = SimulationEngine(radar=radar, targets=targets, dt=0.1)
+    engine.set_pulse_doppler_mode(True, n_pulses=N_PULSES)
+    while engine._rd_map is None:
+        engine.step(engine.dt)
+    return engine
+
+
+def legacy_state_dict(engine):
+    """Previous SimulationWorker._build_state_dict: per-target geometry and .tolist()."""
+    targets_data = []
+    for target in engine.targets:
+        geom = engine.radar.calculate_target_geometry(target.position, target.velocity)
+        targets_data.append(
+            {
+                "id": target.target_id,
+                "name": target.target_type,
+                "type": target.target_type,
+                "position": target.position.tolist(),
+                "velocity": target.velocity.tolist(),
+                "range_m": geom["range_m"],
+                "range_km": geom["range_m"] / 1000,
+                "azimuth_rad": geom["azimuth_rad"],
+                "azimuth_deg": geom["azimuth_deg"],
+                "elevation_rad": geom["elevation_rad"],
+                "elevation_deg": geom["elevation_deg"],
+                "radial_velocity_mps": geom["radial_velocity_mps"],
+                "rcs_m2": target.rcs_mean,
+                "is_detected": engine.state.detections.get(target.target_id, False),
+                "snr_db": engine.state.snr_values.get(target.target_id, 0.0),
+            }
+        )
+    rdm = engine._rd_map
+    return {
+        "time": engine.simulation_time,
+        "targets": targets_data,
+        "rd_map": rdm.data_db.tolist(),
+        "pd_metadata": {
+            "range_axis_m": rdm.range_axis_m.tolist(),
+            "velocity_axis_mps": rdm.velocity_axis_mps.tolist(),
+        },
+    }
+
+
+def consume(state):
+    """What the displays read per frame: every target dict and the R-D image."""
+    rd_db = np.array(state["rd_map"], dtype=np.float32)
+    ranges = [target["range_km"] for target in state["targets"]]
+    return rd_db.shape, len(ranges)
+
+
+def frame_times_ms(produce):
+    produce_ms, consume_ms = [], []
+    for _ in range(N_FRAMES):
+        start_time = time.perf_counter()
+        state = produce()
+        produce_ms.append((time.perf_counter() - start_time) * 1000)
+        start_time = time.perf_counter()
+        consume(state)
+        consume_ms.append((time.perf_counter() - start_time) * 1000)
+        release = getattr(state, "release", None)
+        if release is not None:
+            release()
+    return np.mean(produce_ms), np.mean(consume_ms)
+
+
+def run_benchmark():
+    print("=" * 78)
+    print(
+        f"State Snapshot Benchmark ({N_FRAMES} frames, {N_PULSES}x512 range-Doppler map)"
+    )
+    print("=" * 78)
+    print(
+        f"{'targets':>8} {'state':>18} {'worker ms':>10} {'UI ms':>8} "
+        f"{'frame ms':>9} {'speedup':>8}"
+    )
+
+    for n_targets in TARGET_COUNTS:
+        engine = build_engine(n_targets)
+        buffers = SnapshotBuffers(count=2)
+        sequence = iter(range(1, 10**9))
+
+        def snapshot():
+            return fill_snapshot(buffers.acquire(), engine, next(sequence))
+
+        rows = [
+            ("dict (previous)", lambda: legacy_state_dict(engine)),
+            ("snapshot", snapshot),
+        ]
+        baseline = None
+        for label, produce in rows:
+            worker_ms, ui_ms = frame_times_ms(produce)
+            frame_ms = worker_ms + ui_ms
+            baseline = baseline or frame_ms
+            print(
+                f"{n_targets:>8d} {label:>18} {worker_ms:>10.3f} {ui_ms:>8.3f} "
+                f"{frame_ms:>9.3f} {baseline / frame_ms:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,79 @@
+import time
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.simulation.headless_runner import run_single_simulation
+from src.simulation.scenario_generator import ScenarioGenerator
+from src.simulation.sweep_executor import SweepExecutor
+
+
+N_RANGES = 100
+N_RUNS = 100  # Monte Carlo runs per range: 10,000 runs in total
+LOOP_SAMPLE = 300  # Runs timed with the per-run loop, extrapolated to the sweep
+
+
+def pd_curve(results):
+    """Mean detection ratio per range, in sweep order."""
+    ratios = np.array([result.detection_ratio for result in results])
+    return ratios.reshape(N_RANGES, N_RUNS).mean(axis=1)
+
+
+def run_benchmark():
+    configs = ScenarioGenerator.quick_sweep(
+        range_min_km=10, range_max_km=150, n_ranges=N_RANGES, n_runs=N_RUNS
+    )
+    n_steps = int(configs[0].duration_s / configs[0].dt_s)
+
+    print("=" * 78)
+    print(
+        f"Pd-vs-Range Sweep Benchmark ({N_RANGES} ranges x {N_RUNS} runs = {len(configs)} runs, "
+        f"{n_steps} steps each)"
+    )
+    print("=" * 78)
+    print(f"{'executor':>34} {'wall s':>9} {'runs/s':>10} {'speedup':>8}")
+
+    sample = configs[:: len(configs) // LOOP_SAMPLE][:LOOP_SAMPLE]
+    start_time = time.perf_counter()
+    looped = [run_single_simulation(config) for config in sample]
+    loop_s = (time.perf_counter() - start_time) * len(configs) / len(sample)
+
+    executor = SweepExecutor()
+    executor.run(configs[:8])  # Warm caches before timing
+    start_time = time.perf_counter()
+    results = executor.run(configs)
+    sweep_s = time.perf_counter() - start_time
+
+    for label, wall_s in (
+        ("per-run loop (extrapolated)", loop_s),
+        ("vectorized runs x steps", sweep_s),
+    ):
+        print(
+            f"{label:>34} {wall_s:>9.2f} {len(configs) / wall_s:>10.0f} {loop_s / wall_s:>7.1f}x"
+        )
+
+    by_config = {id(result.config): result for result in results}
+    max_snr_error = max(
+        abs(by_config[id(result.config)].mean_snr_db - result.mean_snr_db) for result in looped
+    )
+    detections_equal = all(
+        by_config[id(result.config)].n_detections == result.n_detections for result in looped
+    )
+    curve = pd_curve(results)
+    print(
+        f"\nsampled runs identical: detections {detections_equal}, "
+        f"max |mean SNR diff| {max_snr_error:.1e} dB"
+    )
+    print(
+        f"Pd at {configs[0].target_range_m / 1000:.0f} / "
+        f"{configs[len(configs) // 2].target_range_m / 1000:.0f} / "
+        f"{configs[-1].target_range_m / 1000:.0f} km: "
+        f"{curve[0]:.3f} / {curve[N_RANGES // 2]:.3f} / {curve[-1]:.3f}"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,85 @@
+import time
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.physics.terrain import create_ambush_terrain
+
+
+TARGET_COUNTS = [10, 50, 100, 500, 1000]
+REPEATS = 10
+
+
+def build_rays(n_targets, seed=0):
+    """Low fliers spread around the ambush ridge, 5-100 km from the radar."""
+    rng = np.random.default_rng(seed)
+    bearing = rng.uniform(0.0, 2.0 * np.pi, n_targets)
+    ground_range = rng.uniform(5e3, 100e3, n_targets)
+    return np.column_stack(
+        [
+            ground_range * np.sin(bearing),
+            ground_range * np.cos(bearing),
+            rng.uniform(1500.0, 6000.0, n_targets),
+        ]
+    )
+
+
+def time_call(fn):
+    fn()  # warm JIT outside the timed region
+    start_time = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - start_time) / REPEATS * 1000  # ms
+
+
+def run_benchmark():
+    print("=" * 68)
+    print("Terrain LOS Benchmark (raymarch vs. heightmap vs. horizon profile)")
+    print("=" * 68)
+
+    radar = np.array([0.0, 0.0, 1500.0])
+    terrain = create_ambush_terrain()
+    start_time = time.perf_counter()
+    terrain.build_height_grid((0.0, 0.0), 110e3, resolution_m=100.0)
+    build_s = time.perf_counter() - start_time
+    grid = terrain.height_grid
+    print(
+        f"heightmap {grid.heights.shape[1]}x{grid.heights.shape[0]} @ "
+        f"{grid.resolution_m:g} m: {grid.memory_bytes / 1024**2:.1f} MiB, "
+        f"built in {build_s:.2f} s (incl. JIT)"
+    )
+    start_time = time.perf_counter()
+    profile = terrain.build_horizon_profile(radar)
+    print(
+        f"horizon profile {profile.mask_slope.shape[0]} az x "
+        f"{profile.mask_slope.shape[1]} range bins, built in "
+        f"{time.perf_counter() - start_time:.2f} s (incl. JIT)"
+    )
+    print(
+        f"{'targets':>8} {'scalar ms':>11} {'batch ms':>10} {'grid ms':>9} "
+        f"{'profile ms':>11} {'speedup':>9}"
+    )
+
+    for n_targets in TARGET_COUNTS:
+        rays = build_rays(n_targets)
+
+        terrain.clear_height_grid()
+        scalar_ms = time_call(
+            lambda: [terrain.check_line_of_sight(radar, p) for p in rays]
+        )
+        batch_ms = time_call(lambda: terrain.check_line_of_sight_batch(radar, rays))
+        terrain.height_grid = grid
+        grid_ms = time_call(lambda: terrain.check_line_of_sight_batch(radar, rays))
+        profile_ms = time_call(lambda: profile.is_visible(rays))
+
+        print(
+            f"{n_targets:>8d} {scalar_ms:>11.2f} {batch_ms:>10.2f} {grid_ms:>9.2f} "
+            f"{profile_ms:>11.3f} {scalar_ms / profile_ms:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,87 @@
+import time
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scipy.optimize import linear_sum_assignment
+
+from src.tracking.tracker import Track, TrackManager, assign_gated_pairs
+
+
+TRACK_COUNTS = [100, 300, 1000, 3000]
+CLUTTER_PER_TRACK = [0, 2, 10]
+AREA_HALF_WIDTH_M = 50e3
+DENSE_MAX_ENTRIES = 3_000_000
+FRAME_BUDGET_MS = 100.0
+
+
+def build_scene(n_tracks, clutter_per_track, seed=0):
+    """Tracks over 100 x 100 km, one detection each plus uniform clutter."""
+    rng = np.random.default_rng(seed)
+    manager = TrackManager(gate_distance=500.0, measurement_noise=50.0)
+    positions = rng.uniform(-AREA_HALF_WIDTH_M, AREA_HALF_WIDTH_M, (n_tracks, 2))
+    for track_id, position in enumerate(positions, start=1):
+        state = manager.kf.initialize(position, position_uncertainty=200.0)
+        manager.tracks[track_id] = Track(id=track_id, state=state)
+    clutter = rng.uniform(
+        -AREA_HALF_WIDTH_M, AREA_HALF_WIDTH_M, (n_tracks * clutter_per_track, 2)
+    )
+    detections = np.vstack([positions + rng.normal(0.0, 50.0, positions.shape), clutter])
+    return manager, detections
+
+
+def dense_padded_assignment(rows, cols, costs, n_rows, n_cols):
+    """Whole-scene linear_sum_assignment with 1e12 for ungated pairs."""
+    dense = np.full((n_rows, n_cols), 1e12)
+    dense[rows, cols] = costs
+    matched_rows, matched_cols = linear_sum_assignment(dense)
+    keep = dense[matched_rows, matched_cols] < 1e12
+    return matched_rows[keep], matched_cols[keep]
+
+
+def run_benchmark():
+    print("=" * 78)
+    print("Track Assignment Benchmark (dense padded LSA vs. connected components)")
+    print("=" * 78)
+    print(
+        f"{'tracks':>7} {'clutter/trk':>11} {'pairs':>8} {'dense ms':>10} "
+        f"{'components ms':>14} {'_associate ms':>14} {'budget':>7}"
+    )
+
+    for n_tracks in TRACK_COUNTS:
+        for clutter_per_track in CLUTTER_PER_TRACK:
+            manager, detections = build_scene(n_tracks, clutter_per_track)
+            tracks = list(manager.tracks.values())
+            rows, cols, nis = manager._gated_pairs(tracks, detections)
+            shape = (len(tracks), len(detections))
+
+            if shape[0] * shape[1] <= DENSE_MAX_ENTRIES:
+                start_time = time.perf_counter()
+                dense_rows, dense_cols = dense_padded_assignment(rows, cols, nis, *shape)
+                dense_text = f"{(time.perf_counter() - start_time) * 1000:>10.1f}"
+            else:
+                dense_rows = None
+                dense_text = f"{'-':>10}"
+
+            start_time = time.perf_counter()
+            matched_rows, matched_cols = assign_gated_pairs(rows, cols, nis, *shape)
+            component_ms = (time.perf_counter() - start_time) * 1000
+            if dense_rows is not None:
+                assert matched_rows.size == dense_rows.size
+
+            start_time = time.perf_counter()
+            manager._associate(detections)
+            associate_ms = (time.perf_counter() - start_time) * 1000
+
+            verdict = "ok" if associate_ms <= FRAME_BUDGET_MS else "over"
+            print(
+                f"{n_tracks:>7d} {clutter_per_track:>11d} {rows.size:>8d} {dense_text} "
+                f"{component_ms:>14.2f} {associate_ms:>14.2f} {verdict:>7}"
+            )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,80 @@
+import time
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.tracking.tracker import Track, TrackManager
+
+
+SCENE_SIZES = [50, 100, 300, 1000]
+AREA_HALF_WIDTH_M = 50e3
+
+
+def build_scene(n_tracks, seed=0):
+    """Tracks spread over 100 x 100 km with one noisy detection per track."""
+    rng = np.random.default_rng(seed)
+    manager = TrackManager(gate_distance=500.0, measurement_noise=50.0)
+    positions = rng.uniform(-AREA_HALF_WIDTH_M, AREA_HALF_WIDTH_M, (n_tracks, 2))
+    for track_id, position in enumerate(positions, start=1):
+        state = manager.kf.initialize(position)
+        manager.tracks[track_id] = Track(id=track_id, state=state)
+    detections = positions + rng.normal(0.0, 50.0, positions.shape)
+    return manager, [tuple(detection) for detection in detections]
+
+
+def pairwise_cost_matrix(manager, detections):
+    """Per-pair loop with one covariance solve per (track, detection)."""
+    tracks = list(manager.tracks.values())
+    cost = np.full((len(tracks), len(detections)), np.inf)
+    for row, track in enumerate(tracks):
+        covariance = manager.kf.H @ track.state.P @ manager.kf.H.T + manager.kf.R
+        for col, detection in enumerate(detections):
+            innovation = np.asarray(detection) - np.asarray(track.position)
+            if float(np.linalg.norm(innovation)) > manager.gate_distance:
+                continue
+            nis = float(innovation @ np.linalg.solve(covariance, innovation))
+            if nis <= manager.gate_threshold:
+                cost[row, col] = nis
+    return cost
+
+
+def run_benchmark():
+    print("=" * 64)
+    print("TrackManager Gating Benchmark (pairwise loop vs. vectorized)")
+    print("=" * 64)
+    print(
+        f"{'tracks':>7} {'loop ms':>10} {'vectorized ms':>14} "
+        f"{'_associate ms':>14} {'speedup':>8}"
+    )
+
+    for n_tracks in SCENE_SIZES:
+        manager, detections = build_scene(n_tracks)
+        tracks = list(manager.tracks.values())
+        detection_array = np.asarray(detections)
+
+        start_time = time.perf_counter()
+        expected = pairwise_cost_matrix(manager, detections)
+        loop_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        rows, cols, nis = manager._gated_pairs(tracks, detection_array)
+        vector_ms = (time.perf_counter() - start_time) * 1000
+        cost = np.full(expected.shape, np.inf)
+        cost[rows, cols] = nis
+        assert np.array_equal(np.isfinite(cost), np.isfinite(expected))
+
+        start_time = time.perf_counter()
+        manager._associate(detections)
+        associate_ms = (time.perf_counter() - start_time) * 1000
+
+        print(
+            f"{n_tracks:>7d} {loop_ms:>10.1f} {vector_ms:>14.2f} "
+            f"{associate_ms:>14.2f} {loop_ms / vector_ms:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
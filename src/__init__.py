@@ -8,6 +8,9 @@ Professional radar simulation with:
 - Modern PySide6 visualization
 """
 
+# Kernels pick their numba cache when decorated: importing jit_cache configures it
+from src.utils import jit_cache  # noqa: F401
+
 # Re-export from modern subpackages
 from src.physics import (
     BOLTZMANN_CONSTANT,
@@ -1,11 +1,21 @@
-"""RadarSim desktop application entry point."""
+"""RadarSim desktop application entry point.
+
+``python -m src warmup`` precompiles the numba kernels instead (see
+``src.utils.jit_cache``).
+"""
 
 from __future__ import annotations
 
 import sys
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["warmup"]:
+        from src.utils.jit_cache import main as warmup_main
+
+        return warmup_main(argv[1:])
+
     try:
         from PySide6.QtGui import QColor, QPalette
         from PySide6.QtWidgets import QApplication
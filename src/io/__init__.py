@@ -4,6 +4,13 @@ RadarSim I/O Package
 Data import/export and replay functionality.
 """
 
-from .replay_loader import ReplayLoader, SimulationState
+from .replay_cache import FrameCacheStats, ReplayFrameCache
+from .replay_loader import ReplayFrame, ReplayLoader, SimulationState
 
-__all__ = ["ReplayLoader", "SimulationState"]
+__all__ = [
+    "FrameCacheStats",
+    "ReplayFrame",
+    "ReplayFrameCache",
+    "ReplayLoader",
+    "SimulationState",
+]
@@ -0,0 +1,198 @@
+"""
+Prefetching Replay Frame Cache
+
+Read-ahead and LRU cache layer around ReplayLoader for playback and
+timeline scrubbing.
+
+Frames are keyed by time quantized to ``time_resolution_s`` (1 ms by
+default), so a playback clock that advances by a fixed step requests
+exactly the frames a predictor can compute ahead of it. After each
+request a worker thread computes the next ``lookahead`` frames in the
+direction and step of the last move, while the UI thread is idle
+between ticks. Recently visited frames stay in a bounded LRU, so
+scrubbing back over them is free.
+
+Usage:
+    loader = ReplayLoader('output/session_20231222_120000.h5')
+    frames = ReplayFrameCache(loader, lookahead=32)
+    state = frames.get_state_at_time(15.5)
+    frames.close()
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from .replay_loader import ReplayLoader, SimulationState
+
+
+@dataclass
+class FrameCacheStats:
+    """Request and prefetch counters of a ReplayFrameCache."""
+
+    hits: int = 0
+    misses: int = 0
+    prefetched: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of requests served from the cache."""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+class ReplayFrameCache:
+    """
+    Read-ahead frame cache for one ReplayLoader.
+
+    get_state_at_time() is a drop-in replacement for the loader's method
+    that returns the state at the nearest multiple of time_resolution_s.
+    A request whose frame the worker is computing waits for that result
+    instead of computing it a second time.
+    """
+
+    def __init__(
+        self,
+        loader: ReplayLoader,
+        lookahead: int = 32,
+        capacity: int = 512,
+        time_resolution_s: float = 1e-3,
+    ):
+        """
+        Start the prefetch worker.
+
+        Args:
+            loader: Open replay loader (read from two threads)
+            lookahead: Frames computed ahead of the last request
+            capacity: Maximum cached frames (must exceed lookahead)
+            time_resolution_s: Frame time quantization [s]
+        """
+        if lookahead < 0:
+            raise ValueError("lookahead must be non-negative")
+        if capacity <= lookahead:
+            raise ValueError("capacity must exceed lookahead")
+        if time_resolution_s <= 0:
+            raise ValueError("time_resolution_s must be positive")
+
+        self.loader = loader
+        self.lookahead = lookahead
+        self.capacity = capacity
+        self.time_resolution_s = time_resolution_s
+        self.stats = FrameCacheStats()
+
+        self._frames: "OrderedDict[int, SimulationState]" = OrderedDict()
+        self._last_key = int(round(loader.duration / time_resolution_s))
+        self._cursor: Optional[int] = None
+        self._step = 0
+        self._pending_key: Optional[int] = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._worker = threading.Thread(
+            target=self._prefetch_loop, name="ReplayPrefetch", daemon=True
+        )
+        self._worker.start()
+
+    def get_state_at_time(self, t: float) -> SimulationState:
+        """
+        Simulation state at the frame time nearest to t.
+
+        Args:
+            t: Time in seconds from start
+
+        Returns:
+            SimulationState (shared with the cache; treat as read-only)
+        """
+        key = int(round(t / self.time_resolution_s))
+        with self._condition:
+            self._observe(key)
+            while key == self._pending_key:
+                self._condition.wait()
+            state = self._frames.get(key)
+            if state is not None:
+                self._frames.move_to_end(key)
+                self.stats.hits += 1
+                return state
+            self.stats.misses += 1
+
+        state = self.loader.get_state_at_time(key * self.time_resolution_s)
+        with self._condition:
+            self._store(key, state)
+        return state
+
+    def clear(self) -> None:
+        """Drop cached frames and the playback direction (statistics are kept)."""
+        with self._condition:
+            self._frames.clear()
+            self._cursor = None
+            self._step = 0
+
+    def close(self) -> None:
+        """Stop the prefetch worker. The loader is left open."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ═══════════════════════════════════════════════════════════════
+    # PREFETCH (callers hold self._condition)
+    # ═══════════════════════════════════════════════════════════════
+
+    def _observe(self, key: int) -> None:
+        """Record a request; its move from the previous one sets the prefetch step."""
+        if self._cursor is not None and key != self._cursor:
+            self._step = key - self._cursor
+        self._cursor = key
+        self._condition.notify_all()
+
+    def _next_prefetch_key(self) -> Optional[int]:
+        if self._cursor is None or self._step == 0:
+            return None
+        for ahead in range(1, self.lookahead + 1):
+            key = self._cursor + ahead * self._step
+            if key < 0 or key > self._last_key:
+                return None
+            if key not in self._frames:
+                return key
+        return None
+
+    def _store(self, key: int, state: SimulationState) -> None:
+        self._frames[key] = state
+        self._frames.move_to_end(key)
+        while len(self._frames) > self.capacity:
+            self._frames.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _prefetch_loop(self) -> None:
+        while True:
+            with self._condition:
+                key = self._next_prefetch_key()
+                while key is None and not self._closed:
+                    self._condition.wait()
+                    key = self._next_prefetch_key()
+                if self._closed:
+                    return
+                self._pending_key = key
+
+            try:
+                state = self.loader.get_state_at_time(key * self.time_resolution_s)
+            except Exception:
+                # Loader closed or unreadable: stop reading ahead until
+                # the next request sets a direction again
+                state = None
+
+            with self._condition:
+                self._pending_key = None
+                if state is not None:
+                    self._store(key, state)
+                    self.stats.prefetched += 1
+                else:
+                    self._step = 0
+                self._condition.notify_all()
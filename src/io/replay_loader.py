@@ -12,8 +12,13 @@ Matches the HDF5 schema from src/simulation/recorder.py:
     /timestamps - simulation time array
 
 Features:
-    - Lazy load (file stays open, data read on demand)
-    - Linear interpolation for smooth timeline scrubbing
+    - Lazy load (file stays open, data read on demand): contiguous
+      datasets are memory-mapped, chunked ones read a chunk at a time
+      through a bounded LRU block cache
+    - Per-target time index, persisted next to the recording as
+      <file>.idx.npz, so a seek is a binary search instead of a scan
+    - Linear interpolation for smooth timeline scrubbing, evaluated for
+      all targets at once
     - Thread-safe read operations
 
 Usage:
@@ -23,12 +28,20 @@ Usage:
 """
 
 import json
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import h5py
 import numpy as np
 
+_INDEX_VERSION = 1
+_MEASUREMENT_WINDOW_S = 0.5  # measurements within ±0.5 s annotate a frame
+_DEFAULT_BLOCK_ROWS = 4096  # cache block size for contiguous, unmappable data
+
 
 @dataclass
 class TargetState:
@@ -110,6 +123,150 @@ class ReplayMetadata:
     created: str = ""
 
 
+@dataclass
+class ReplayFrame:
+    """
+    Interpolated state of every recorded target at one time, as arrays.
+
+    Row k describes target_ids[k]. Targets without position data are
+    omitted; targets without a measurement within the lookup window get
+    snr_db = 0 and is_detected = False.
+    """
+
+    time: float
+    target_ids: np.ndarray  # (K,)
+    positions: np.ndarray  # (K, 3) [m]
+    velocities: np.ndarray  # (K, 3) [m/s]
+    range_km: np.ndarray  # (K,)
+    azimuth_deg: np.ndarray  # (K,) in [0, 360)
+    speed_mps: np.ndarray  # (K,)
+    snr_db: np.ndarray  # (K,)
+    is_detected: np.ndarray  # (K,) bool
+
+
+class _BlockCache:
+    """Thread-safe LRU cache of dataset row blocks, bounded in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._blocks: "OrderedDict[Tuple[str, int], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, int], load, *args) -> np.ndarray:
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is not None:
+                self._blocks.move_to_end(key)
+                return block
+
+            block = load(*args)
+            self._blocks[key] = block
+            self.nbytes += block.nbytes
+            while self.nbytes > self.max_bytes and len(self._blocks) > 1:
+                _, evicted = self._blocks.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+            return block
+
+
+class _LazyColumn:
+    """
+    Row access to one HDF5 dataset without reading all of it.
+
+    Contiguous, uncompressed datasets (the in-memory recorder's output)
+    are memory-mapped. Chunked datasets (the streaming recorder's output)
+    are read one chunk-sized block at a time through the block cache.
+    """
+
+    def __init__(self, dataset: h5py.Dataset, cache: _BlockCache):
+        self.name = dataset.name
+        self.shape = dataset.shape
+        self.dtype = dataset.dtype
+        self._dataset = dataset
+        self._cache = cache
+        self._block_rows = dataset.chunks[0] if dataset.chunks else _DEFAULT_BLOCK_ROWS
+        self._mmap = self._memory_map(dataset)
+
+    @staticmethod
+    def _memory_map(dataset: h5py.Dataset) -> Optional[np.ndarray]:
+        if (
+            dataset.chunks is not None
+            or dataset.compression is not None
+            or dataset.size == 0
+            or dataset.dtype.hasobject
+        ):
+            return None
+        offset = dataset.id.get_offset()
+        if offset is None:
+            return None
+        mapped = np.memmap(
+            dataset.file.filename,
+            dtype=dataset.dtype,
+            mode="r",
+            offset=offset,
+            shape=dataset.shape,
+        )
+        # Plain ndarray view: indexing skips the memmap subclass overhead
+        return mapped.view(np.ndarray)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def read(self) -> np.ndarray:
+        """Whole dataset as an in-memory array."""
+        if self._mmap is not None:
+            return np.array(self._mmap)
+        return self._dataset[()]
+
+    def take(self, rows: np.ndarray) -> np.ndarray:
+        """Rows at the given indices, in the given order."""
+        rows = np.asarray(rows, dtype=np.intp)
+        if self._mmap is not None:
+            return np.asarray(self._mmap[rows])
+
+        out = np.empty(rows.shape + self.shape[1:], dtype=self.dtype)
+        blocks = rows // self._block_rows
+        for block in np.unique(blocks):
+            selected = blocks == block
+            data = self._cache.get((self.name, int(block)), self._read_block, int(block))
+            out[selected] = data[rows[selected] - block * self._block_rows]
+        return out
+
+    def row(self, index: int) -> np.ndarray:
+        """One row; the cheap path for per-target reads."""
+        if self._mmap is not None:
+            return self._mmap[index]
+        block, offset = divmod(index, self._block_rows)
+        return self._cache.get((self.name, block), self._read_block, block)[offset]
+
+    def _read_block(self, block: int) -> np.ndarray:
+        start = block * self._block_rows
+        return self._dataset[start : start + self._block_rows]
+
+
+def _segment_searchsorted(
+    values: np.ndarray, starts: np.ndarray, ends: np.ndarray, query: float
+) -> np.ndarray:
+    """
+    searchsorted(side="left") of one query in many sorted segments at once.
+
+    Segment k is values[starts[k]:ends[k]]. Returns, per segment, the
+    offset of the first element >= query (the segment length if none),
+    using one vectorized bisection step per halving of the longest segment.
+    """
+    lo = np.asarray(starts, dtype=np.int64).copy()
+    hi = np.asarray(ends, dtype=np.int64).copy()
+    last = max(len(values) - 1, 0)
+    active = lo < hi
+    while active.any():
+        mid = (lo + hi) // 2
+        below = active & (values[np.minimum(mid, last)] < query)
+        lo = np.where(below, mid + 1, lo)
+        hi = np.where(active & ~below, mid, hi)
+        active = lo < hi
+    return lo - starts
+
+
 class ReplayLoader:
     """
     Lazy-loading HDF5 session replay.
@@ -128,32 +285,56 @@ class ReplayLoader:
             time, target_id, range_m, azimuth_rad, snr_db, detected
         /timestamps
             array of simulation times
+
+    Opening a file reads only timestamps, attributes and the time index.
+    The index holds every target's position time column and the
+    measurement rows sorted by (target_id, time); it is built on first
+    open and saved as ``<filepath>.idx.npz`` (rebuilt whenever the
+    recording's size or modification time changes). Seeking is then a
+    binary search per target, done for all targets in one vectorized
+    pass, and only the rows around the requested time are read.
     """
 
-    def __init__(self, filepath: str):
+    def __init__(
+        self,
+        filepath: str,
+        persist_index: bool = True,
+        cache_bytes: int = 64 * 1024 * 1024,
+    ):
         """
         Open HDF5 file for replay.
 
         Args:
             filepath: Path to .h5 session file
+            persist_index: Save/reuse the time index sidecar file
+            cache_bytes: Budget for cached blocks of chunked datasets
 
         Raises:
             FileNotFoundError: If file doesn't exist
             ValueError: If file format is invalid
         """
         self.filepath = filepath
+        self.persist_index = persist_index
         self._file: Optional[h5py.File] = None
+        self._cache = _BlockCache(cache_bytes)
         self._timestamps: Optional[np.ndarray] = None
-        self._target_data: Dict[
-            int, Dict
-        ] = {}  # id -> {positions, velocities, metadata}
-        self._measurements: Optional[Dict[str, np.ndarray]] = None
+        self._target_ids = np.empty(0, dtype=np.int64)
+        self._target_metadata: Dict[int, Dict] = {}
+        self._positions: List[Optional[_LazyColumn]] = []
+        self._velocities: List[Optional[_LazyColumn]] = []
+        self._measurements: Dict[str, _LazyColumn] = {}
+        self._index: Dict[str, np.ndarray] = {}
         self.metadata: Optional[ReplayMetadata] = None
 
         self._open_file()
 
+    @property
+    def index_path(self) -> Path:
+        """Sidecar file holding the persisted time index."""
+        return Path(f"{self.filepath}.idx.npz")
+
     def _open_file(self) -> None:
-        """Open and validate HDF5 file."""
+        """Open and validate HDF5 file, then load or build the time index."""
         try:
             self._file = h5py.File(self.filepath, "r")
         except OSError as e:
@@ -181,70 +362,39 @@ class ReplayLoader:
             )
             max_range_km = config.attrs.get("max_range_km", 150.0)
 
-        # Load target data
+        # Target metadata and lazy position/velocity columns
+        target_ids = []
         targets_group = self._file.get("targets", None)
         if targets_group:
             for target_id_str in targets_group.keys():
                 target_id = int(target_id_str)
                 target_group = targets_group[target_id_str]
+                target_ids.append(target_id)
 
-                # Load positions (Nx4: t, x, y, z)
-                positions = None
-                if "positions" in target_group:
-                    positions = np.array(target_group["positions"])
-
-                # Load velocities (Nx4: t, vx, vy, vz)
-                velocities = None
-                if "velocities" in target_group:
-                    velocities = np.array(target_group["velocities"])
+                self._positions.append(self._lazy(target_group, "positions"))
+                self._velocities.append(self._lazy(target_group, "velocities"))
 
-                # Load metadata
                 metadata = {"type": "unknown", "rcs_m2": 1.0, "has_jammer": False}
                 if "metadata" in target_group.attrs:
                     try:
                         metadata = json.loads(target_group.attrs["metadata"])
                     except (json.JSONDecodeError, TypeError):
                         pass
+                self._target_metadata[target_id] = metadata
+        self._target_ids = np.array(target_ids, dtype=np.int64)
 
-                self._target_data[target_id] = {
-                    "positions": positions,
-                    "velocities": velocities,
-                    "metadata": metadata,
-                }
-
-        # Load measurements
         meas_group = self._file.get("measurements", None)
         if meas_group:
-            self._measurements = {
-                "time": np.array(meas_group["time"])
-                if "time" in meas_group
-                else np.array([]),
-                "target_id": (
-                    np.array(meas_group["target_id"])
-                    if "target_id" in meas_group
-                    else np.array([])
-                ),
-                "range_m": (
-                    np.array(meas_group["range_m"])
-                    if "range_m" in meas_group
-                    else np.array([])
-                ),
-                "azimuth_rad": (
-                    np.array(meas_group["azimuth_rad"])
-                    if "azimuth_rad" in meas_group
-                    else np.array([])
-                ),
-                "snr_db": (
-                    np.array(meas_group["snr_db"])
-                    if "snr_db" in meas_group
-                    else np.array([])
-                ),
-                "detected": (
-                    np.array(meas_group["detected"])
-                    if "detected" in meas_group
-                    else np.array([])
-                ),
-            }
+            for name in ("time", "target_id", "range_m", "azimuth_rad", "snr_db", "detected"):
+                column = self._lazy(meas_group, name)
+                if column is not None:
+                    self._measurements[name] = column
+
+        self._index = self._load_index()
+        if self._index is None:
+            self._index = self._build_index()
+            if self.persist_index:
+                self._save_index(self._index)
 
         # Create metadata
         self.metadata = ReplayMetadata(
@@ -252,14 +402,88 @@ class ReplayLoader:
             frequency_hz=float(frequency_hz),
             power_watts=float(power_watts),
             max_range_km=float(max_range_km),
-            target_ids=list(self._target_data.keys()),
+            target_ids=target_ids,
             num_measurements=len(self._measurements["time"])
-            if self._measurements
+            if "time" in self._measurements
             else 0,
             version=self._file.attrs.get("version", "1.0") if self._file else "1.0",
             created=self._file.attrs.get("created", "") if self._file else "",
         )
 
+    def _lazy(self, group: h5py.Group, name: str) -> Optional[_LazyColumn]:
+        dataset = group.get(name, None)
+        if not isinstance(dataset, h5py.Dataset):
+            return None
+        return _LazyColumn(dataset, self._cache)
+
+    # ═══════════════════════════════════════════════════════════════
+    # TIME INDEX
+    # ═══════════════════════════════════════════════════════════════
+
+    def _source_signature(self) -> np.ndarray:
+        stat = os.stat(self.filepath)
+        return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+    def _build_index(self) -> Dict[str, np.ndarray]:
+        """Per-target time columns and (target_id, time)-sorted measurement rows."""
+        track_times = [
+            column._dataset[:, 0] if column is not None and len(column) else np.empty(0)
+            for column in self._positions
+        ]
+        track_offsets = np.zeros(len(track_times) + 1, dtype=np.int64)
+        track_offsets[1:] = np.cumsum([len(times) for times in track_times])
+
+        if "time" in self._measurements and "target_id" in self._measurements:
+            times = self._measurements["time"].read().astype(np.float64)
+            target_ids = self._measurements["target_id"].read().astype(np.int64)
+        else:
+            times = np.empty(0)
+            target_ids = np.empty(0, dtype=np.int64)
+        # lexsort is stable: equal times keep file order
+        rows = np.lexsort((times, target_ids))
+        meas_target_ids, starts = np.unique(target_ids[rows], return_index=True)
+
+        return {
+            "version": np.array(_INDEX_VERSION),
+            "source": self._source_signature(),
+            "target_ids": self._target_ids,
+            "track_offsets": track_offsets,
+            "track_times": np.concatenate(track_times).astype(np.float64)
+            if track_times
+            else np.empty(0),
+            "meas_target_ids": meas_target_ids,
+            "meas_offsets": np.append(starts, len(rows)).astype(np.int64),
+            "meas_times": times[rows],
+            "meas_rows": rows.astype(np.int64),
+        }
+
+    def _load_index(self) -> Optional[Dict[str, np.ndarray]]:
+        """Persisted index if it exists and matches this file, else None."""
+        if not self.persist_index or not self.index_path.exists():
+            return None
+        try:
+            with np.load(self.index_path) as data:
+                index = {name: data[name] for name in data.files}
+        except Exception:
+            return None
+        if (
+            index.get("version") != _INDEX_VERSION
+            or not np.array_equal(index.get("source"), self._source_signature())
+            or not np.array_equal(index.get("target_ids"), self._target_ids)
+        ):
+            return None
+        return index
+
+    def _save_index(self, index: Dict[str, np.ndarray]) -> None:
+        """Write the sidecar atomically; an unwritable location keeps it in memory."""
+        temporary = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(temporary, "wb") as f:
+                np.savez(f, **index)
+            os.replace(temporary, self.index_path)
+        except OSError:
+            temporary.unlink(missing_ok=True)
+
     @property
     def duration(self) -> float:
         """Total recording duration in seconds."""
@@ -273,6 +497,9 @@ class ReplayLoader:
     def close(self) -> None:
         """Close HDF5 file."""
         if self._file:
+            self._positions = [None] * len(self._positions)
+            self._velocities = [None] * len(self._velocities)
+            self._measurements = {}
             self._file.close()
             self._file = None
 
@@ -282,41 +509,115 @@ class ReplayLoader:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-    def _find_time_indices(self, t: float) -> Tuple[int, int, float]:
-        """
-        Find indices surrounding time t for interpolation.
+    # ═══════════════════════════════════════════════════════════════
+    # STATE ACCESS
+    # ═══════════════════════════════════════════════════════════════
 
-        Returns:
-            (i0, i1, alpha) where state = lerp(state[i0], state[i1], alpha)
+    def get_frame_at_time(self, t: float) -> ReplayFrame:
         """
-        if self._timestamps is None or len(self._timestamps) == 0:
-            return 0, 0, 0.0
+        Interpolated state of all targets at time t, as arrays.
 
-        # Clamp to valid range
-        t = max(0.0, min(t, self.duration))
+        Each target is interpolated linearly between its two recorded
+        samples around t (clamped to [0, duration] and to the target's own
+        first/last sample). SNR and detection come from the target's
+        latest measurement within ±0.5 s of t.
 
-        # Binary search for efficiency
-        idx = np.searchsorted(self._timestamps, t)
+        Args:
+            t: Time in seconds from start
 
-        if idx == 0:
-            return 0, 0, 0.0
-        if idx >= len(self._timestamps):
-            idx = len(self._timestamps) - 1
-            return idx, idx, 0.0
+        Returns:
+            ReplayFrame for every target with position data
+        """
+        index = self._index
+        offsets = index["track_offsets"]
+        counts_all = np.diff(offsets)
+        present = np.flatnonzero(counts_all > 0)
+        target_ids = self._target_ids[present]
+        starts = offsets[:-1][present]
+        counts = counts_all[present]
+
+        # Bracketing samples per target (as the scalar searchsorted version)
+        t_clamped = max(0.0, min(t, self.duration))
+        track_times = index["track_times"]
+        found = _segment_searchsorted(track_times, starts, starts + counts, t_clamped)
+        past_end = found >= counts
+        i1 = np.where(past_end, counts - 1, found)
+        i0 = np.where((found == 0) | past_end, i1, found - 1)
+        t0 = track_times[starts + i0]
+        t1 = track_times[starts + i1]
+        span = t1 - t0
+        alpha = np.where(span > 0, (t_clamped - t0) / np.where(span > 0, span, 1.0), 0.0)
+
+        pos0 = np.empty((present.size, 3))
+        pos1 = np.empty((present.size, 3))
+        vel0 = np.zeros((present.size, 3))
+        vel1 = np.zeros((present.size, 3))
+        for k, (target, first, second) in enumerate(
+            zip(present.tolist(), i0.tolist(), i1.tolist())
+        ):
+            positions = self._positions[target]
+            pos0[k] = positions.row(first)[1:4]
+            pos1[k] = positions.row(second)[1:4]
+            velocities = self._velocities[target]
+            if velocities is not None and len(velocities) > 0:
+                last = len(velocities) - 1
+                vel0[k] = velocities.row(min(first, last))[1:4]
+                vel1[k] = velocities.row(min(second, last))[1:4]
 
-        i0 = idx - 1
-        i1 = idx
+        weight = alpha[:, np.newaxis]
+        positions = pos0 + weight * (pos1 - pos0)
+        velocities = vel0 + weight * (vel1 - vel0)
 
-        # Calculate interpolation factor
-        t0 = self._timestamps[i0]
-        t1 = self._timestamps[i1]
+        azimuth_deg = np.degrees(np.arctan2(positions[:, 1], positions[:, 0]))
+        azimuth_deg = np.where(azimuth_deg < 0, azimuth_deg + 360, azimuth_deg)
 
-        if t1 - t0 > 0:
-            alpha = (t - t0) / (t1 - t0)
-        else:
-            alpha = 0.0
+        snr_db, is_detected = self._measurements_near(target_ids, t)
 
-        return i0, i1, alpha
+        return ReplayFrame(
+            time=t,
+            target_ids=target_ids,
+            positions=positions,
+            velocities=velocities,
+            range_km=np.linalg.norm(positions, axis=1) / 1000,
+            azimuth_deg=azimuth_deg,
+            speed_mps=np.linalg.norm(velocities, axis=1),
+            snr_db=snr_db,
+            is_detected=is_detected,
+        )
+
+    def _measurements_near(
+        self, target_ids: np.ndarray, t: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """SNR and detection flag of each target's latest measurement within the window."""
+        snr_db = np.zeros(target_ids.size)
+        is_detected = np.zeros(target_ids.size, dtype=bool)
+
+        index = self._index
+        meas_ids = index["meas_target_ids"]
+        if meas_ids.size == 0 or target_ids.size == 0:
+            return snr_db, is_detected
+
+        slot = np.minimum(np.searchsorted(meas_ids, target_ids), meas_ids.size - 1)
+        known = meas_ids[slot] == target_ids
+        starts = np.where(known, index["meas_offsets"][slot], 0)
+        ends = np.where(known, index["meas_offsets"][slot + 1], 0)
+
+        meas_times = index["meas_times"]
+        found = _segment_searchsorted(
+            meas_times, starts, ends, t + _MEASUREMENT_WINDOW_S
+        )
+        latest = starts + found - 1
+        valid = found > 0
+        valid[valid] = np.abs(meas_times[latest[valid]] - t) < _MEASUREMENT_WINDOW_S
+        if not valid.any():
+            return snr_db, is_detected
+
+        rows = index["meas_rows"][latest[valid]]
+        if "snr_db" in self._measurements:
+            snr_db[valid] = self._measurements["snr_db"].take(rows)
+        if "detected" in self._measurements:
+            is_detected[valid] = self._measurements["detected"].take(rows)
+        return snr_db, is_detected
 
     def get_state_at_time(self, t: float) -> SimulationState:
         """
@@ -331,82 +632,25 @@ class ReplayLoader:
         Returns:
             SimulationState with all targets at time t
         """
-        i0, i1, alpha = self._find_time_indices(t)
-
-        # Find measurements near this time
-        measurement_lookup = {}
-        if self._measurements and len(self._measurements["time"]) > 0:
-            time_arr = self._measurements["time"]
-            mask = np.abs(time_arr - t) < 0.5  # Within 0.5s
-
-            for idx in np.where(mask)[0]:
-                tid = int(self._measurements["target_id"][idx])
-                measurement_lookup[tid] = {
-                    "snr_db": float(self._measurements["snr_db"][idx]),
-                    "detected": bool(self._measurements["detected"][idx]),
-                    "range_m": float(self._measurements["range_m"][idx]),
-                    "azimuth_rad": float(self._measurements["azimuth_rad"][idx]),
-                }
+        frame = self.get_frame_at_time(t)
 
-        # Build target states with interpolation
         targets = []
-        detection_count = 0
-
-        for target_id, data in self._target_data.items():
-            positions = data["positions"]
-            velocities = data["velocities"]
-            metadata = data["metadata"]
-
-            if positions is None or len(positions) == 0:
-                continue
-
-            # Find indices for this target's data
-            n_pos = len(positions)
-            i0_clamped = min(i0, n_pos - 1)
-            i1_clamped = min(i1, n_pos - 1)
-
-            # Interpolate position (columns: t, x, y, z)
-            pos0 = positions[i0_clamped, 1:4]
-            pos1 = positions[i1_clamped, 1:4]
-            position = pos0 + alpha * (pos1 - pos0)
-
-            # Get velocity
-            if velocities is not None and len(velocities) > 0:
-                vel0 = velocities[min(i0_clamped, len(velocities) - 1), 1:4]
-                vel1 = velocities[min(i1_clamped, len(velocities) - 1), 1:4]
-                velocity = vel0 + alpha * (vel1 - vel0)
-            else:
-                velocity = np.zeros(3)
-
-            # Calculate range and azimuth
-            range_m = np.linalg.norm(position)
-            azimuth_rad = np.arctan2(position[1], position[0])  # East from North
-            azimuth_deg = np.degrees(azimuth_rad)
-            if azimuth_deg < 0:
-                azimuth_deg += 360
-
-            # Get measurement data if available
-            meas = measurement_lookup.get(target_id, {})
-            snr_db = meas.get("snr_db", 0.0)
-            is_detected = meas.get("detected", False)
-
-            if is_detected:
-                detection_count += 1
-
+        for k, target_id in enumerate(frame.target_ids.tolist()):
+            metadata = self._target_metadata.get(target_id, {})
             targets.append(
                 TargetState(
                     target_id=target_id,
                     name=f"Target {target_id}",
                     target_type=metadata.get("type", "unknown"),
-                    position=position,
-                    velocity=velocity,
-                    range_km=range_m / 1000,
-                    azimuth_deg=azimuth_deg,
-                    speed_mps=np.linalg.norm(velocity),
+                    position=frame.positions[k],
+                    velocity=frame.velocities[k],
+                    range_km=frame.range_km[k],
+                    azimuth_deg=frame.azimuth_deg[k],
+                    speed_mps=frame.speed_mps[k],
                     rcs_m2=metadata.get("rcs_m2", 1.0),
                     has_jammer=metadata.get("has_jammer", False),
-                    snr_db=snr_db,
-                    is_detected=is_detected,
+                    snr_db=float(frame.snr_db[k]),
+                    is_detected=bool(frame.is_detected[k]),
                 )
             )
 
@@ -417,13 +661,17 @@ class ReplayLoader:
         return SimulationState(
             time=t,
             targets=targets,
-            detection_count=detection_count,
+            detection_count=int(np.count_nonzero(frame.is_detected)),
             total_targets=len(targets),
             beam_azimuth_rad=beam_azimuth_rad,
             frequency_hz=self.metadata.frequency_hz if self.metadata else 10e9,
             power_watts=self.metadata.power_watts if self.metadata else 100e3,
         )
 
+    # ═══════════════════════════════════════════════════════════════
+    # ANALYSIS
+    # ═══════════════════════════════════════════════════════════════
+
     def get_snr_history(self, target_id: int = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get SNR values over time.
@@ -434,18 +682,30 @@ class ReplayLoader:
         Returns:
             (times, snr_values) arrays
         """
-        if self._measurements is None or len(self._measurements["time"]) == 0:
+        if "time" not in self._measurements or "snr_db" not in self._measurements:
             return np.array([]), np.array([])
 
-        times = self._measurements["time"]
-        snr_values = self._measurements["snr_db"]
+        if target_id is None:
+            return self._measurements["time"].read(), self._measurements["snr_db"].read()
 
-        if target_id is not None:
-            mask = self._measurements["target_id"] == target_id
-            times = times[mask]
-            snr_values = snr_values[mask]
+        index = self._index
+        slot = np.searchsorted(index["meas_target_ids"], target_id)
+        if slot >= index["meas_target_ids"].size or index["meas_target_ids"][slot] != target_id:
+            return np.array([]), np.array([])
+        start, end = index["meas_offsets"][slot], index["meas_offsets"][slot + 1]
+        rows = index["meas_rows"][start:end]
+        return index["meas_times"][start:end], self._measurements["snr_db"].take(rows)
 
-        return times, snr_values
+    def get_detection_history(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the detection flag of every measurement over time.
+
+        Returns:
+            (times, detected) arrays in recording order
+        """
+        if "time" not in self._measurements or "detected" not in self._measurements:
+            return np.array([]), np.array([], dtype=bool)
+        return self._measurements["time"].read(), self._measurements["detected"].read()
 
     def get_detection_stats(self) -> Dict[str, Any]:
         """
@@ -454,7 +714,11 @@ class ReplayLoader:
         Returns:
             Dictionary with detection metrics
         """
-        if self._measurements is None or len(self._measurements["time"]) == 0:
+        if (
+            "detected" not in self._measurements
+            or "snr_db" not in self._measurements
+            or len(self._measurements["detected"]) == 0
+        ):
             return {
                 "total_measurements": 0,
                 "total_detections": 0,
@@ -465,8 +729,8 @@ class ReplayLoader:
                 "duration": 0.0,
             }
 
-        detected = self._measurements["detected"]
-        snr_values = self._measurements["snr_db"]
+        detected = self._measurements["detected"].read()
+        snr_values = self._measurements["snr_db"].read()
 
         total = len(detected)
         n_detected = np.sum(detected)
@@ -377,10 +377,14 @@ class ScenarioLoader:
         scenario = self.data.get("scenario", {})
         return scenario.get("required_radar_preset", None)
 
-    def create_simulation_engine(self):
+    def create_simulation_engine(self, **engine_options):
         """
         Create a SimulationEngine from the loaded scenario.
 
+        Args:
+            **engine_options: Extra SimulationEngine keyword arguments
+                (e.g. batch_mode=True, log_retention_s=1.0)
+
         Returns:
             Configured SimulationEngine instance
 
@@ -479,6 +483,7 @@ class ScenarioLoader:
                 -self._config.environment.ground_relative_permittivity_loss,
             ),
             ground_rms_height_m=self._config.environment.ground_rms_height_m,
+            **engine_options,
         )
 
         return engine
@@ -14,7 +14,7 @@ Modules:
     - terrain: Terrain generation and line-of-sight physics
 """
 
-from .atmospheric import ITU_R_P676
+from .atmospheric import AtmosphereState, ITU_R_P676
 from .constants import (
     BOLTZMANN_CONSTANT,
     EARTH_RADIUS,
@@ -52,6 +52,7 @@ __all__ = [
     "calculate_doppler_shift",
     # Atmospheric
     "ITU_R_P676",
+    "AtmosphereState",
     # RCS
     "SwerlingModel",
     "SwerlingRCS",
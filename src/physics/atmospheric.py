@@ -1,6 +1,7 @@
 """ITU-R P.676-13 line-by-line gaseous attenuation."""
 
-from typing import Tuple
+from functools import lru_cache
+from typing import Tuple, Union
 
 import numpy as np
 
@@ -258,6 +259,106 @@ class ITU_R_P676:
         return oxygen, water, oxygen + water
 
 
+_SPECIFIC_ATTENUATION_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_SPECIFIC_ATTENUATION_CACHE_SIZE)
+def _cached_specific_attenuation(
+    frequency_ghz: float,
+    temperature_c: float,
+    pressure_hpa: float,
+    water_vapor_density: float,
+) -> Tuple[float, float]:
+    oxygen = ITU_R_P676.specific_attenuation_oxygen(
+        frequency_ghz, temperature_c, pressure_hpa, water_vapor_density
+    )
+    water = ITU_R_P676.specific_attenuation_water_vapor(
+        frequency_ghz, temperature_c, water_vapor_density, pressure_hpa
+    )
+    return oxygen, water
+
+
+class AtmosphereState:
+    """
+    Fixed path atmosphere with memoized P.676 specific attenuation.
+
+    Frequency, temperature, pressure and humidity normally stay constant for a
+    whole run while only range changes, so the oxygen and water-vapour dB/km
+    values are evaluated once per (frequency, T, P, rho) and kept in a bounded
+    LRU cache shared by all instances. Path attenuation is then a multiply,
+    and accepts range arrays.
+    """
+
+    def __init__(
+        self,
+        temperature_c: float = 15.0,
+        pressure_hpa: float = STANDARD_PRESSURE,
+        water_vapor_density: float = STANDARD_WATER_VAPOR_DENSITY,
+    ):
+        ITU_R_P676._atmospheric_state(temperature_c, pressure_hpa, water_vapor_density)
+        self.temperature_c = float(temperature_c)
+        self.pressure_hpa = float(pressure_hpa)
+        self.water_vapor_density = float(water_vapor_density)
+
+    def matches(
+        self, temperature_c: float, pressure_hpa: float, water_vapor_density: float
+    ) -> bool:
+        """Return True when this instance describes the given state."""
+        return (
+            self.temperature_c == temperature_c
+            and self.pressure_hpa == pressure_hpa
+            and self.water_vapor_density == water_vapor_density
+        )
+
+    def specific_attenuation(self, frequency_ghz: float) -> Tuple[float, float]:
+        """Oxygen and water-vapour specific attenuation [dB/km]."""
+        return _cached_specific_attenuation(
+            float(frequency_ghz),
+            self.temperature_c,
+            self.pressure_hpa,
+            self.water_vapor_density,
+        )
+
+    def total_attenuation(
+        self,
+        range_km: Union[float, np.ndarray],
+        frequency_ghz: float,
+        two_way: bool = True,
+    ) -> Union[float, np.ndarray]:
+        """
+        Gaseous path attenuation [dB] for one range or an array of ranges.
+
+        Matches ``ITU_R_P676.total_attenuation`` bit for bit at every range.
+        """
+        oxygen_specific, water_specific = self.specific_attenuation(frequency_ghz)
+        path_multiplier = 2.0 if two_way else 1.0
+        if np.ndim(range_km) == 0:
+            if range_km < 0.0:
+                raise ValueError("range_km cannot be negative")
+            return (
+                oxygen_specific * range_km * path_multiplier
+                + water_specific * range_km * path_multiplier
+            )
+
+        ranges = np.asarray(range_km, dtype=float)
+        if np.any(ranges < 0.0):
+            raise ValueError("range_km cannot be negative")
+        return (
+            oxygen_specific * ranges * path_multiplier
+            + water_specific * ranges * path_multiplier
+        )
+
+    @staticmethod
+    def cache_info():
+        """Hit/miss statistics of the shared specific-attenuation cache."""
+        return _cached_specific_attenuation.cache_info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop every memoized specific-attenuation entry."""
+        _cached_specific_attenuation.cache_clear()
+
+
 def validate_itu_60ghz() -> dict:
     gamma_o = ITU_R_P676.specific_attenuation_oxygen(60.0)
     expected_gamma = 14.6234747964861
@@ -300,6 +300,40 @@ class ClutterModel:
             * min(ground_range_extent, elevation_limited_extent)
         )
 
+    @staticmethod
+    def surface_resolution_cell_area_array(
+        range_m: np.ndarray,
+        pulse_width_s: float,
+        azimuth_beamwidth_rad: float,
+        elevation_beamwidth_rad: float,
+        grazing_angle_rad: np.ndarray,
+    ) -> np.ndarray:
+        """Array form of ``surface_resolution_cell_area``."""
+        range_m = np.asarray(range_m, dtype=np.float64)
+        grazing_angle_rad = np.asarray(grazing_angle_rad, dtype=np.float64)
+        if np.any(range_m <= 0.0) or min(
+            pulse_width_s, azimuth_beamwidth_rad, elevation_beamwidth_rad
+        ) <= 0.0:
+            raise ValueError("range, pulse width, and beamwidths must be positive")
+        if np.any((grazing_angle_rad <= 0.0) | (grazing_angle_rad >= np.pi / 2.0)):
+            raise ValueError("grazing_angle_rad must be between 0 and pi/2")
+
+        range_gate_m = SPEED_OF_LIGHT * pulse_width_s / 2.0
+        ground_range_extent = range_gate_m / np.cos(grazing_angle_rad)
+        elevation_limited_extent = (
+            2.0
+            * range_m
+            * np.tan(elevation_beamwidth_rad / 2.0)
+            / np.sin(grazing_angle_rad)
+        )
+        cross_range_extent = 2.0 * range_m * np.tan(azimuth_beamwidth_rad / 2.0)
+        return (
+            np.pi
+            / 4.0
+            * cross_range_extent
+            * np.minimum(ground_range_extent, elevation_limited_extent)
+        )
+
     @staticmethod
     def signal_to_noise_plus_clutter_db(
         snr_db: float, target_rcs_m2: float, clutter_rcs_m2: float
@@ -17,6 +17,7 @@ from typing import List, Optional, Tuple
 
 import numba
 import numpy as np
+from scipy import special
 
 
 class ECMType(Enum):
@@ -126,6 +127,63 @@ def apply_receiver_hard_limiter(
     )
 
 
+def apply_receiver_hard_limiter_array(
+    signal_power_watts: np.ndarray,
+    interference_power_watts: np.ndarray,
+    full_scale_power_watts: float,
+) -> ReceiverLimiterResult:
+    """Array form of :func:`apply_receiver_hard_limiter`.
+
+    Every field of the returned result is an array aligned with the inputs.
+    """
+    signal_power_watts = np.asarray(signal_power_watts, dtype=np.float64)
+    interference_power_watts = np.asarray(interference_power_watts, dtype=np.float64)
+    if np.any(signal_power_watts <= 0.0):
+        raise ValueError("signal_power_watts must be positive")
+    if np.any(interference_power_watts <= 0.0):
+        raise ValueError("interference_power_watts must be positive")
+    if full_scale_power_watts <= 0.0:
+        raise ValueError("full_scale_power_watts must be positive")
+
+    total_input = signal_power_watts + interference_power_watts
+    clipping_ratio = full_scale_power_watts / total_input
+    input_sinr = signal_power_watts / interference_power_watts
+
+    linear = clipping_ratio >= 50.0
+    tail = np.exp(-clipping_ratio)
+    coherent_gain = np.where(
+        linear,
+        1.0,
+        1.0
+        - tail
+        + 0.5 * np.sqrt(pi * clipping_ratio) * special.erfc(np.sqrt(clipping_ratio)),
+    )
+    output_power = np.where(linear, total_input, total_input * (1.0 - tail))
+    distortion_power = np.where(
+        linear,
+        0.0,
+        np.maximum(output_power - coherent_gain**2 * total_input, 0.0),
+    )
+
+    output_signal = coherent_gain**2 * signal_power_watts
+    output_interference = (
+        coherent_gain**2 * interference_power_watts + distortion_power
+    )
+    sinr_db = 10.0 * np.log10(output_signal / output_interference)
+    input_sinr_db = 10.0 * np.log10(input_sinr)
+    headroom_db = 10.0 * np.log10(clipping_ratio)
+    return ReceiverLimiterResult(
+        sinr_db=sinr_db,
+        clipping_loss_db=np.maximum(input_sinr_db - sinr_db, 0.0),
+        input_power_dbm=10.0 * np.log10(total_input / 1e-3),
+        headroom_db=headroom_db,
+        coherent_gain=coherent_gain,
+        distortion_power_watts=distortion_power,
+        output_power_watts=output_power,
+        overloaded=headroom_db < 0.0,
+    )
+
+
 @dataclass
 class ChaffCloud:
     """
@@ -55,6 +55,32 @@ def _coefficient(
     return float(10.0**value if logarithmic_output else value)
 
 
+def _combined_coefficients(
+    frequency_ghz: float,
+    elevation_angle_deg,
+    polarization_tilt_deg: float,
+):
+    k_h = _coefficient(frequency_ghz, _KH, -0.18961, 0.71147, True)
+    k_v = _coefficient(frequency_ghz, _KV, -0.16398, 0.63297, True)
+    alpha_h = _coefficient(frequency_ghz, _ALPHA_H, 0.67849, -1.95537, False)
+    alpha_v = _coefficient(frequency_ghz, _ALPHA_V, -0.053739, 0.83433, False)
+
+    elevation = np.radians(elevation_angle_deg)
+    tilt = np.radians(polarization_tilt_deg)
+    geometry = np.cos(elevation) ** 2 * np.cos(2.0 * tilt)
+    k = 0.5 * (k_h + k_v + (k_h - k_v) * geometry)
+    alpha = (
+        0.5
+        * (
+            k_h * alpha_h
+            + k_v * alpha_v
+            + (k_h * alpha_h - k_v * alpha_v) * geometry
+        )
+        / k
+    )
+    return k, alpha
+
+
 class ITU_R_P838:
     """P.838-3 power-law coefficients and specific rain attenuation."""
 
@@ -69,23 +95,8 @@ class ITU_R_P838:
         if not -90.0 <= elevation_angle_deg <= 90.0:
             raise ValueError("elevation_angle_deg must be between -90 and 90")
 
-        k_h = _coefficient(frequency_ghz, _KH, -0.18961, 0.71147, True)
-        k_v = _coefficient(frequency_ghz, _KV, -0.16398, 0.63297, True)
-        alpha_h = _coefficient(frequency_ghz, _ALPHA_H, 0.67849, -1.95537, False)
-        alpha_v = _coefficient(frequency_ghz, _ALPHA_V, -0.053739, 0.83433, False)
-
-        elevation = np.radians(elevation_angle_deg)
-        tilt = np.radians(polarization_tilt_deg)
-        geometry = np.cos(elevation) ** 2 * np.cos(2.0 * tilt)
-        k = 0.5 * (k_h + k_v + (k_h - k_v) * geometry)
-        alpha = (
-            0.5
-            * (
-                k_h * alpha_h
-                + k_v * alpha_v
-                + (k_h * alpha_h - k_v * alpha_v) * geometry
-            )
-            / k
+        k, alpha = _combined_coefficients(
+            frequency_ghz, elevation_angle_deg, polarization_tilt_deg
         )
         return float(k), float(alpha)
 
@@ -125,3 +136,32 @@ class ITU_R_P838:
             polarization_tilt_deg,
         )
         return specific * path_length_km * (2.0 if two_way else 1.0)
+
+    @classmethod
+    def path_attenuation_array(
+        cls,
+        path_length_km: np.ndarray,
+        frequency_ghz: float,
+        rain_rate_mm_hr: float,
+        elevation_angle_deg: np.ndarray,
+        polarization_tilt_deg: float = 0.0,
+        two_way: bool = True,
+    ) -> np.ndarray:
+        """Array form of ``path_attenuation`` for many paths at one frequency."""
+        path_length_km = np.asarray(path_length_km, dtype=np.float64)
+        elevation_angle_deg = np.asarray(elevation_angle_deg, dtype=np.float64)
+        if np.any(path_length_km < 0.0):
+            raise ValueError("path_length_km cannot be negative")
+        if rain_rate_mm_hr < 0.0:
+            raise ValueError("rain_rate_mm_hr cannot be negative")
+        if not 1.0 <= frequency_ghz <= 1000.0:
+            raise ValueError("P.838-3 is valid from 1 to 1000 GHz")
+        if np.any(np.abs(elevation_angle_deg) > 90.0):
+            raise ValueError("elevation_angle_deg must be between -90 and 90")
+        if rain_rate_mm_hr == 0.0:
+            return np.zeros(np.broadcast(path_length_km, elevation_angle_deg).shape)
+        k, alpha = _combined_coefficients(
+            frequency_ghz, elevation_angle_deg, polarization_tilt_deg
+        )
+        specific = k * rain_rate_mm_hr**alpha
+        return specific * path_length_km * (2.0 if two_way else 1.0)
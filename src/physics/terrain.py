@@ -9,6 +9,8 @@ Features:
     - Raymarching LOS algorithm with terrain intersection
     - Earth curvature and refraction effects (4/3 Earth model)
     - Terrain profile extraction for RHI scope
+    - Optional rasterized heightmap with batched, parallel LOS
+    - Per-azimuth horizon (mask-angle) profile for fixed-site radars
 
 References:
     - Skolnik, "Radar Handbook", 3rd Ed., Chapter 2.12 (Radar Horizon)
@@ -16,6 +18,7 @@ References:
     - ITU-R P.526: Propagation by diffraction
 """
 
+import math
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
@@ -196,6 +199,210 @@ def _check_los_raycast(
     return True, 0.0, 0.0, 0.0
 
 
+@numba.jit(nopython=True, parallel=True, cache=True)
+def _rasterize_heights(
+    origin_x: float,
+    origin_y: float,
+    resolution: float,
+    nx: int,
+    ny: int,
+    terrain_scale: float,
+    terrain_height_scale: float,
+    seed: int,
+) -> np.ndarray:
+    """
+    Sample the LOS terrain surface on a regular grid.
+
+    Row ``j`` / column ``i`` holds the height at
+    ``(origin_x + i * resolution, origin_y + j * resolution)``; the surface
+    is the one ``_check_los_raycast`` marches through.
+    """
+    heights = np.empty((ny, nx), dtype=np.float32)
+    for j in numba.prange(ny):
+        y = origin_y + j * resolution
+        for i in range(nx):
+            x = origin_x + i * resolution
+            noise_val = _fractal_noise(
+                x / terrain_scale,
+                y / terrain_scale,
+                octaves=4,
+                persistence=0.5,
+                lacunarity=2.0,
+                seed=seed,
+            )
+            heights[j, i] = (noise_val + 1.0) * 0.5 * terrain_height_scale
+    return heights
+
+
+@numba.jit(nopython=True, cache=True)
+def _terrain_height(
+    px: float,
+    py: float,
+    heights: np.ndarray,
+    origin_x: float,
+    origin_y: float,
+    resolution: float,
+    terrain_scale: float,
+    terrain_height_scale: float,
+    seed: int,
+) -> float:
+    """
+    Terrain height for LOS marching.
+
+    Bilinear interpolation of the heightmap inside its extent; procedural
+    noise outside it (or when the heightmap is empty).
+    """
+    ny, nx = heights.shape
+    if nx >= 2 and ny >= 2:
+        fx = (px - origin_x) / resolution
+        fy = (py - origin_y) / resolution
+        if 0.0 <= fx < nx - 1 and 0.0 <= fy < ny - 1:
+            ix = int(fx)
+            iy = int(fy)
+            u = fx - ix
+            v = fy - iy
+            h0 = heights[iy, ix] * (1.0 - u) + heights[iy, ix + 1] * u
+            h1 = heights[iy + 1, ix] * (1.0 - u) + heights[iy + 1, ix + 1] * u
+            return h0 * (1.0 - v) + h1 * v
+
+    noise_val = _fractal_noise(
+        px / terrain_scale,
+        py / terrain_scale,
+        octaves=4,
+        persistence=0.5,
+        lacunarity=2.0,
+        seed=seed,
+    )
+    return (noise_val + 1.0) * 0.5 * terrain_height_scale
+
+
+@numba.jit(nopython=True, parallel=True, cache=True)
+def _check_los_batch(
+    radar_x: float,
+    radar_y: float,
+    radar_z: float,
+    targets: np.ndarray,
+    heights: np.ndarray,
+    origin_x: float,
+    origin_y: float,
+    resolution: float,
+    terrain_scale: float,
+    terrain_height_scale: float,
+    num_steps: int,
+    seed: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Raymarch N radar-to-target rays in parallel.
+
+    Uses the same stepping and Earth-curvature correction as
+    ``_check_los_raycast``; with an empty heightmap the results are
+    identical to it ray for ray.
+
+    Returns:
+        Tuple of (is_visible, block_range, block_xy) arrays of shape
+        (N,), (N,) and (N, 2); block entries are NaN for visible rays.
+    """
+    n_rays = targets.shape[0]
+    is_visible = np.ones(n_rays, dtype=np.bool_)
+    block_range = np.full(n_rays, np.nan)
+    block_xy = np.full((n_rays, 2), np.nan)
+
+    for k in numba.prange(n_rays):
+        dx = targets[k, 0] - radar_x
+        dy = targets[k, 1] - radar_y
+        dz = targets[k, 2] - radar_z
+
+        total_dist = np.sqrt(dx * dx + dy * dy + dz * dz)
+        if total_dist < 1.0:
+            continue
+
+        dx /= total_dist
+        dy /= total_dist
+        dz /= total_dist
+
+        step_size = total_dist / num_steps
+
+        for i in range(1, num_steps):
+            t = i * step_size
+            px = radar_x + dx * t
+            py = radar_y + dy * t
+            pz = radar_z + dz * t
+
+            earth_curve = (t * t) / (2.0 * EARTH_RADIUS_EFFECTIVE)
+            effective_height = pz - earth_curve
+
+            terrain_height = _terrain_height(
+                px,
+                py,
+                heights,
+                origin_x,
+                origin_y,
+                resolution,
+                terrain_scale,
+                terrain_height_scale,
+                seed,
+            )
+            if effective_height < terrain_height:
+                is_visible[k] = False
+                block_range[k] = t
+                block_xy[k, 0] = px
+                block_xy[k, 1] = py
+                break
+
+    return is_visible, block_range, block_xy
+
+
+@numba.jit(nopython=True, parallel=True, cache=True)
+def _build_mask_slopes(
+    radar_x: float,
+    radar_y: float,
+    radar_z: float,
+    n_azimuth: int,
+    n_range: int,
+    range_step: float,
+    heights: np.ndarray,
+    origin_x: float,
+    origin_y: float,
+    resolution: float,
+    terrain_scale: float,
+    terrain_height_scale: float,
+    seed: int,
+) -> np.ndarray:
+    """
+    Running maximum terrain slope along each azimuth radial.
+
+    Entry ``[a, k]`` is the largest ``(h + r^2 / 2Re - z_radar) / r`` over
+    the samples ``r = range_step * (1 .. k + 1)`` of the radial through the
+    centre of azimuth bin ``a`` (0 = North, clockwise).
+    """
+    slopes = np.empty((n_azimuth, n_range), dtype=np.float32)
+    azimuth_step = 2.0 * np.pi / n_azimuth
+    for a in numba.prange(n_azimuth):
+        azimuth = (a + 0.5) * azimuth_step
+        east = np.sin(azimuth)
+        north = np.cos(azimuth)
+        running_max = -np.inf
+        for k in range(n_range):
+            r = (k + 1) * range_step
+            terrain_height = _terrain_height(
+                radar_x + east * r,
+                radar_y + north * r,
+                heights,
+                origin_x,
+                origin_y,
+                resolution,
+                terrain_scale,
+                terrain_height_scale,
+                seed,
+            )
+            earth_curve = (r * r) / (2.0 * EARTH_RADIUS_EFFECTIVE)
+            slope = (terrain_height + earth_curve - radar_z) / r
+            if slope > running_max:
+                running_max = slope
+            slopes[a, k] = running_max
+    return slopes
+
+
 # =============================================================================
 # TERRAIN MAP CLASS
 # =============================================================================
@@ -226,6 +433,164 @@ class TerrainConfig:
     mountain_peaks: List[Tuple[float, float, float]] = field(default_factory=list)
 
 
+@dataclass
+class TerrainHeightGrid:
+    """
+    Rasterized terrain heights for fast LOS sampling.
+
+    Attributes:
+        origin_x: X coordinate of column 0 [m]
+        origin_y: Y coordinate of row 0 [m]
+        resolution_m: Grid spacing [m]
+        heights: Terrain height per node, shape (ny, nx) [m]
+    """
+
+    origin_x: float
+    origin_y: float
+    resolution_m: float
+    heights: np.ndarray
+
+    @property
+    def extent(self) -> Tuple[float, float, float, float]:
+        """Covered area as (x_min, x_max, y_min, y_max) [m]."""
+        ny, nx = self.heights.shape
+        return (
+            self.origin_x,
+            self.origin_x + (nx - 1) * self.resolution_m,
+            self.origin_y,
+            self.origin_y + (ny - 1) * self.resolution_m,
+        )
+
+    @property
+    def memory_bytes(self) -> int:
+        """Size of the height raster [bytes]."""
+        return int(self.heights.nbytes)
+
+    def sample(self, x, y) -> np.ndarray:
+        """
+        Bilinearly interpolated height at (x, y) [m].
+
+        Points outside the grid return NaN.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        ny, nx = self.heights.shape
+        fx = (x - self.origin_x) / self.resolution_m
+        fy = (y - self.origin_y) / self.resolution_m
+        inside = (fx >= 0.0) & (fx <= nx - 1) & (fy >= 0.0) & (fy <= ny - 1)
+
+        ix = np.clip(np.floor(fx), 0, nx - 2).astype(np.intp)
+        iy = np.clip(np.floor(fy), 0, ny - 2).astype(np.intp)
+        u = np.clip(fx - ix, 0.0, 1.0)
+        v = np.clip(fy - iy, 0.0, 1.0)
+        h = self.heights
+        h0 = h[iy, ix] * (1.0 - u) + h[iy, ix + 1] * u
+        h1 = h[iy + 1, ix] * (1.0 - u) + h[iy + 1, ix + 1] * u
+        return np.where(inside, h0 * (1.0 - v) + h1 * v, np.nan)
+
+
+class HorizonProfile:
+    """
+    Terrain mask profile around a fixed radar site.
+
+    Stores, per azimuth bin and range sample, the steepest terrain slope
+    seen from the radar up to that range (4/3 Earth curvature included).
+    A target is masked when the straight line to it is shallower than the
+    mask slope at the last sample in front of it, so each query is a pair
+    of array lookups instead of a ray march.
+
+    Attributes:
+        radar_position: Radar position [x, y, z] the profile was built for [m]
+        azimuth_resolution_rad: Azimuth bin width [rad]
+        range_resolution_m: Range sample spacing [m]
+        mask_slope: Running-maximum slope, shape (n_azimuth, n_range)
+    """
+
+    def __init__(
+        self,
+        radar_position: np.ndarray,
+        azimuth_resolution_rad: float,
+        range_resolution_m: float,
+        mask_slope: np.ndarray,
+    ) -> None:
+        self.radar_position = np.array(radar_position, dtype=np.float64)
+        self.azimuth_resolution_rad = float(azimuth_resolution_rad)
+        self.range_resolution_m = float(range_resolution_m)
+        self.mask_slope = mask_slope
+
+    @property
+    def max_range_m(self) -> float:
+        """Range of the last profile sample [m]."""
+        return self.mask_slope.shape[1] * self.range_resolution_m
+
+    def matches(self, radar_position: np.ndarray) -> bool:
+        """True if the profile was built for this radar position."""
+        return bool(np.array_equal(self.radar_position, radar_position))
+
+    def _lookup(self, azimuth_rad, ground_range_m) -> Tuple[np.ndarray, np.ndarray]:
+        n_azimuth, n_range = self.mask_slope.shape
+        azimuth_bin = (
+            np.floor(np.mod(azimuth_rad, 2.0 * np.pi) / self.azimuth_resolution_rad)
+            .astype(np.intp)
+            % n_azimuth
+        )
+        # Last sample strictly in front of the target (-1: none)
+        samples_before = np.ceil(ground_range_m / self.range_resolution_m) - 1
+        range_index = np.minimum(samples_before, n_range).astype(np.intp) - 1
+        slope = self.mask_slope[azimuth_bin, np.maximum(range_index, 0)]
+        return np.where(range_index >= 0, slope, -np.inf), range_index
+
+    def mask_angle_deg(self, azimuth_rad, range_m) -> np.ndarray:
+        """
+        Terrain mask elevation angle seen up to a ground range [deg].
+
+        Args:
+            azimuth_rad: Azimuth [rad] (0 = North, clockwise)
+            range_m: Ground range from the radar [m]
+        """
+        slope, _ = self._lookup(np.asarray(azimuth_rad), np.asarray(range_m))
+        return np.degrees(np.arctan(slope))
+
+    def point_is_visible(self, target_position: np.ndarray) -> bool:
+        """Terrain visibility of a single target position [x, y, z] [m]."""
+        east = float(target_position[0]) - self.radar_position[0]
+        north = float(target_position[1]) - self.radar_position[1]
+        height = (
+            float(target_position[2]) if len(target_position) > 2 else 0.0
+        ) - self.radar_position[2]
+        ground_range = math.hypot(east, north)
+        if ground_range < 1.0:
+            return True
+
+        n_azimuth, n_range = self.mask_slope.shape
+        azimuth = math.atan2(east, north) % (2.0 * math.pi)
+        azimuth_bin = int(azimuth / self.azimuth_resolution_rad) % n_azimuth
+        range_index = (
+            min(math.ceil(ground_range / self.range_resolution_m) - 1, n_range) - 1
+        )
+        if range_index < 0:
+            return True
+        return height / ground_range >= self.mask_slope[azimuth_bin, range_index]
+
+    def is_visible(self, target_positions: np.ndarray) -> np.ndarray:
+        """
+        Terrain visibility of targets, shape (N,) bool.
+
+        Args:
+            target_positions: Target positions, shape (N, 3) [m]
+        """
+        targets = np.atleast_2d(np.asarray(target_positions, dtype=np.float64))
+        east = targets[:, 0] - self.radar_position[0]
+        north = targets[:, 1] - self.radar_position[1]
+        ground_range = np.hypot(east, north)
+        mask_slope, _ = self._lookup(np.arctan2(east, north), ground_range)
+
+        height = targets[:, 2] - self.radar_position[2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            target_slope = height / ground_range
+        return (ground_range < 1.0) | (target_slope >= mask_slope)
+
+
 class TerrainMap:
     """
     Terrain model with procedural generation and LOS physics.
@@ -252,6 +617,12 @@ class TerrainMap:
         self._elevation_cache: dict = {}
         self._cache_max_size = 10000
 
+        # Optional rasterized heightmap used by LOS checks
+        self.height_grid: Optional[TerrainHeightGrid] = None
+
+        # Mask profile of the last fixed radar site
+        self._horizon_profile: Optional[HorizonProfile] = None
+
     def get_elevation(self, x: float, y: float) -> float:
         """
         Get terrain elevation at coordinates.
@@ -331,6 +702,15 @@ class TerrainMap:
         if len(target_pos) == 2:
             target_pos = np.array([target_pos[0], target_pos[1], 0.0])
 
+        if self.height_grid is not None:
+            visible, ranges, block_xy = self.check_line_of_sight_batch(
+                radar_pos, target_pos[np.newaxis, :], num_steps
+            )
+            if visible[0]:
+                return True, None, None
+            block_position = (float(block_xy[0, 0]), float(block_xy[0, 1]))
+            return False, float(ranges[0]), block_position
+
         is_visible, block_range, block_x, block_y = _check_los_raycast(
             radar_pos[0],
             radar_pos[1],
@@ -349,6 +729,129 @@ class TerrainMap:
         else:
             return False, block_range, (block_x, block_y)
 
+    def build_height_grid(
+        self,
+        center_xy: Tuple[float, float],
+        half_extent_m: float,
+        resolution_m: float = 100.0,
+        max_memory_mb: float = 64.0,
+    ) -> TerrainHeightGrid:
+        """
+        Rasterize the LOS terrain surface around a point.
+
+        Once built, ``check_line_of_sight`` and ``check_line_of_sight_batch``
+        interpolate this grid instead of evaluating fractal noise at every
+        ray step. Rays leaving the grid fall back to procedural noise.
+
+        Args:
+            center_xy: Grid centre (x, y) [m], typically the radar position
+            half_extent_m: Half side length of the square grid [m]
+            resolution_m: Grid spacing [m]
+            max_memory_mb: Upper bound on the raster size [MiB]
+
+        Returns:
+            The built TerrainHeightGrid (also stored as ``height_grid``)
+
+        Raises:
+            ValueError: On non-positive sizes or if the grid exceeds the cap
+        """
+        if half_extent_m <= 0.0:
+            raise ValueError("half_extent_m must be greater than zero")
+        if resolution_m <= 0.0:
+            raise ValueError("resolution_m must be greater than zero")
+        if max_memory_mb <= 0.0:
+            raise ValueError("max_memory_mb must be greater than zero")
+
+        n_nodes = int(np.ceil(2.0 * half_extent_m / resolution_m)) + 1
+        required_bytes = n_nodes * n_nodes * np.dtype(np.float32).itemsize
+        if required_bytes > max_memory_mb * 1024**2:
+            raise ValueError(
+                f"height grid of {n_nodes}x{n_nodes} nodes needs "
+                f"{required_bytes / 1024**2:.1f} MiB, above max_memory_mb="
+                f"{max_memory_mb:g}; increase resolution_m or the cap"
+            )
+
+        origin_x = float(center_xy[0]) - 0.5 * (n_nodes - 1) * resolution_m
+        origin_y = float(center_xy[1]) - 0.5 * (n_nodes - 1) * resolution_m
+        heights = _rasterize_heights(
+            origin_x,
+            origin_y,
+            float(resolution_m),
+            n_nodes,
+            n_nodes,
+            self.config.scale,
+            self.config.max_height,
+            self.config.seed,
+        )
+        self._horizon_profile = None
+        self.height_grid = TerrainHeightGrid(
+            origin_x=origin_x,
+            origin_y=origin_y,
+            resolution_m=float(resolution_m),
+            heights=heights,
+        )
+        return self.height_grid
+
+    def clear_height_grid(self) -> None:
+        """Drop the heightmap; LOS reverts to exact procedural raymarching."""
+        self.height_grid = None
+        self._horizon_profile = None
+
+    def check_line_of_sight_batch(
+        self,
+        radar_pos: np.ndarray,
+        target_positions: np.ndarray,
+        num_steps: int = 100,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Check line-of-sight from one radar to many targets.
+
+        Rays are marched in parallel. Without a height grid the result
+        matches ``check_line_of_sight`` target by target.
+
+        Args:
+            radar_pos: Radar position [x, y, z] in meters
+            target_positions: Target positions, shape (N, 3) or (N, 2) [m]
+            num_steps: Number of ray steps
+
+        Returns:
+            Tuple of (is_visible, block_range_m, block_xy):
+            - is_visible: Boolean array (N,)
+            - block_range_m: Distance to blocking terrain, NaN if visible (N,)
+            - block_xy: (x, y) of blocking point, NaN if visible (N, 2)
+        """
+        radar_pos = np.asarray(radar_pos, dtype=np.float64)
+        targets = np.atleast_2d(np.asarray(target_positions, dtype=np.float64))
+        if targets.shape[1] == 2:
+            targets = np.column_stack([targets, np.zeros(len(targets))])
+        targets = np.ascontiguousarray(targets[:, :3])
+        radar_z = radar_pos[2] if len(radar_pos) > 2 else 0.0
+
+        grid = self.height_grid
+        if grid is None:
+            heights = np.zeros((0, 0), dtype=np.float32)
+            origin_x = origin_y = 0.0
+            resolution = 1.0
+        else:
+            heights = grid.heights
+            origin_x, origin_y = grid.origin_x, grid.origin_y
+            resolution = grid.resolution_m
+
+        return _check_los_batch(
+            float(radar_pos[0]),
+            float(radar_pos[1]),
+            float(radar_z),
+            targets,
+            heights,
+            origin_x,
+            origin_y,
+            resolution,
+            float(self.config.scale),
+            float(self.config.max_height),
+            int(num_steps),
+            int(self.config.seed),
+        )
+
     def get_terrain_profile(
         self,
         radar_pos: np.ndarray,
@@ -411,9 +914,93 @@ class TerrainMap:
 
         return radar_horizon + target_horizon
 
+    def build_horizon_profile(
+        self,
+        radar_pos: np.ndarray,
+        azimuth_resolution_deg: float = 0.1,
+        range_resolution_m: float = 200.0,
+        max_range_m: Optional[float] = None,
+    ) -> HorizonProfile:
+        """
+        Precompute the terrain mask profile around a fixed radar site.
+
+        Samples the same radials as ``get_terrain_profile`` on every azimuth
+        bin. By default the profile extends to ``get_horizon_range`` between
+        the radar and the highest terrain; rays to anything farther pass
+        above all terrain beyond that point or are already masked, so the
+        last sample answers them.
+
+        Args:
+            radar_pos: Radar position [x, y, z] in meters
+            azimuth_resolution_deg: Azimuth bin width [deg]
+            range_resolution_m: Range sample spacing [m]
+            max_range_m: Profile extent [m] (radar/terrain horizon if None)
+
+        Returns:
+            The built HorizonProfile (also cached for ``get_horizon_profile``)
+        """
+        if azimuth_resolution_deg <= 0.0 or azimuth_resolution_deg > 360.0:
+            raise ValueError("azimuth_resolution_deg must be in (0, 360]")
+        if range_resolution_m <= 0.0:
+            raise ValueError("range_resolution_m must be greater than zero")
+
+        radar_pos = np.asarray(radar_pos, dtype=np.float64)
+        if len(radar_pos) == 2:
+            radar_pos = np.array([radar_pos[0], radar_pos[1], 0.0])
+        if max_range_m is None:
+            max_range_m = self.get_horizon_range(radar_pos[2], self.config.max_height)
+        if max_range_m <= 0.0:
+            raise ValueError("max_range_m must be greater than zero")
+
+        n_azimuth = int(round(360.0 / azimuth_resolution_deg))
+        n_range = max(1, int(np.ceil(max_range_m / range_resolution_m)))
+
+        grid = self.height_grid
+        if grid is None:
+            heights = np.zeros((0, 0), dtype=np.float32)
+            origin_x = origin_y = 0.0
+            resolution = 1.0
+        else:
+            heights = grid.heights
+            origin_x, origin_y = grid.origin_x, grid.origin_y
+            resolution = grid.resolution_m
+
+        mask_slope = _build_mask_slopes(
+            float(radar_pos[0]),
+            float(radar_pos[1]),
+            float(radar_pos[2]),
+            n_azimuth,
+            n_range,
+            float(range_resolution_m),
+            heights,
+            origin_x,
+            origin_y,
+            resolution,
+            float(self.config.scale),
+            float(self.config.max_height),
+            int(self.config.seed),
+        )
+        self._horizon_profile = HorizonProfile(
+            radar_pos, 2.0 * np.pi / n_azimuth, range_resolution_m, mask_slope
+        )
+        return self._horizon_profile
+
+    def get_horizon_profile(self, radar_pos: np.ndarray) -> HorizonProfile:
+        """
+        Return the cached mask profile, rebuilding it if the radar moved.
+
+        Args:
+            radar_pos: Radar position [x, y, z] in meters
+        """
+        profile = self._horizon_profile
+        if profile is None or not profile.matches(radar_pos):
+            profile = self.build_horizon_profile(radar_pos)
+        return profile
+
     def clear_cache(self) -> None:
-        """Clear elevation cache to free memory."""
+        """Clear elevation cache and horizon profile to free memory."""
         self._elevation_cache.clear()
+        self._horizon_profile = None
 
 
 # =============================================================================
@@ -11,6 +11,9 @@ from scipy.optimize import brentq
 from scipy.stats import gamma
 
 
+_OS_2D_BLOCK_BYTES = 32 * 1024**2
+
+
 class CFARType(Enum):
     CA = "cell_averaging"
     GO = "greatest_of"
@@ -35,7 +38,12 @@ def _half_window_multiplier(reference_cells: int, pfa: float, greatest: bool) ->
                 * selection_probability
             )
 
-        return quad(integrand, 0.0, np.inf, epsabs=1e-12, limit=250)[0]
+        # Split at the reference-sum mean so quad cannot step over the peak
+        # of the Erlang density for large (2-D) reference windows.
+        return sum(
+            quad(integrand, lower, upper, epsabs=1e-12, limit=250)[0]
+            for lower, upper in ((0.0, reference_cells), (reference_cells, np.inf))
+        )
 
     return float(brentq(lambda value: achieved_pfa(value) - pfa, 0.0, 1e5))
 
@@ -149,6 +157,29 @@ class CFARDetector:
         reference = np.concatenate((left, right), axis=1)
         return np.partition(reference, self.os_rank - 1, axis=1)[:, self.os_rank - 1]
 
+    def _ordered_statistics_2d(self, power: np.ndarray, rank: int) -> np.ndarray:
+        guard = self.guard_cells
+        reference = self.reference_cells
+        window_length = 2 * (reference + guard) + 1
+        windows_view = np.lib.stride_tricks.sliding_window_view(
+            power, (window_length, window_length)
+        )
+        training = np.ones((window_length, window_length), dtype=bool)
+        training[reference:-reference, reference:-reference] = False
+
+        # Gather the training cells a block of CUT rows at a time to bound the
+        # temporary (rows, columns, training cells) array.
+        row_bytes = windows_view.shape[1] * np.count_nonzero(training) * 8
+        rows_per_block = max(1, _OS_2D_BLOCK_BYTES // row_bytes)
+        statistic = np.empty(windows_view.shape[:2])
+        for start in range(0, windows_view.shape[0], rows_per_block):
+            stop = start + rows_per_block
+            cells = windows_view[start:stop][..., training]
+            statistic[start:stop] = np.partition(cells, rank - 1, axis=-1)[
+                ..., rank - 1
+            ]
+        return statistic
+
     @staticmethod
     def _as_power(signal: np.ndarray, db_input: bool) -> np.ndarray:
         signal = np.asarray(signal, dtype=float)
@@ -162,9 +193,17 @@ class CFARDetector:
     def detect_2d(
         self, rd_map: np.ndarray, db_input: bool = True
     ) -> tuple[np.ndarray, np.ndarray]:
-        """Apply true rectangular 2-D CA-CFAR, excluding a guard rectangle."""
-        if self.cfar_type != CFARType.CA:
-            raise NotImplementedError("calibrated 2-D processing currently supports CA-CFAR")
+        """
+        Apply true rectangular 2-D CFAR, excluding a guard rectangle.
+
+        The training region is the (2m+1)x(2m+1) square around each CUT
+        minus the (2g+1)x(2g+1) guard square (m = guard + reference cells).
+        CA averages it; GO/SO compare the two halves on either side of the
+        CUT column (axis 1), with the CUT column itself split above/below;
+        OS keeps the rank-th smallest cell, with ``os_rank`` scaled from the
+        1-D window to the same fraction of the 2-D training region.
+        Edge cells without a full window get zero threshold.
+        """
         data = np.asarray(rd_map, dtype=float)
         if data.ndim != 2 or not np.all(np.isfinite(data)):
             raise ValueError("rd_map must be a finite two-dimensional array")
@@ -183,34 +222,61 @@ class CFARDetector:
         if min(power.shape) <= 2 * margin:
             return detections, thresholds
 
-        integral = np.pad(power, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
+        cut_shape = (power.shape[0] - 2 * margin, power.shape[1] - 2 * margin)
+        if self.cfar_type == CFARType.OS:
+            rank = int(np.ceil(self.os_rank / (2 * reference) * training_count))
+            training_level = self._ordered_statistics_2d(power, rank)
+            level_count = 1
+            multiplier = _os_multiplier(training_count, rank, self.pfa)
+        else:
+            integral = np.pad(power, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
 
-        def rectangle_sum(r0: int, c0: int, r1: int, c1: int) -> float:
-            return float(
-                integral[r1, c1]
-                - integral[r0, c1]
-                - integral[r1, c0]
-                + integral[r0, c0]
-            )
+            def rectangle_sums(
+                row_offset: int, column_offset: int, height: int, width: int
+            ) -> np.ndarray:
+                # Sum over rows CUT+row_offset .. +height and the same for
+                # columns, for every CUT at once.
+                r0 = margin + row_offset
+                c0 = margin + column_offset
+                r1, c1 = r0 + height, c0 + width
+                rows, columns = cut_shape
+                return (
+                    integral[r1 : r1 + rows, c1 : c1 + columns]
+                    - integral[r0 : r0 + rows, c1 : c1 + columns]
+                    - integral[r1 : r1 + rows, c0 : c0 + columns]
+                    + integral[r0 : r0 + rows, c0 : c0 + columns]
+                )
 
-        multiplier = self.ca_multiplier(training_count, self.pfa)
-        for row in range(margin, power.shape[0] - margin):
-            for column in range(margin, power.shape[1] - margin):
-                outer = rectangle_sum(
-                    row - margin,
-                    column - margin,
-                    row + margin + 1,
-                    column + margin + 1,
+            if self.cfar_type == CFARType.CA:
+                outer = rectangle_sums(-margin, -margin, outer_width, outer_width)
+                inner = rectangle_sums(-guard, -guard, guard_width, guard_width)
+                training_level = outer - inner
+                level_count = training_count
+                multiplier = self.ca_multiplier(training_count, self.pfa)
+            else:
+                half_count = training_count // 2
+                left = (
+                    rectangle_sums(-margin, -margin, outer_width, margin)
+                    - rectangle_sums(-guard, -guard, guard_width, guard)
+                    + rectangle_sums(-margin, 0, reference, 1)
                 )
-                inner = rectangle_sum(
-                    row - guard,
-                    column - guard,
-                    row + guard + 1,
-                    column + guard + 1,
+                right = (
+                    rectangle_sums(-margin, 1, outer_width, margin)
+                    - rectangle_sums(-guard, 1, guard_width, guard)
+                    + rectangle_sums(guard + 1, 0, reference, 1)
                 )
-                threshold = multiplier * (outer - inner) / training_count
-                thresholds[row, column] = threshold
-                detections[row, column] = power[row, column] > threshold
+                greatest = self.cfar_type in {CFARType.GO, CFARType.CAGO}
+                combine = np.maximum if greatest else np.minimum
+                training_level = combine(left, right)
+                level_count = half_count
+                multiplier = _half_window_multiplier(half_count, self.pfa, greatest)
+
+        valid = (
+            slice(margin, power.shape[0] - margin),
+            slice(margin, power.shape[1] - margin),
+        )
+        thresholds[valid] = multiplier * training_level / level_count
+        detections[valid] = power[valid] > thresholds[valid]
         return detections, thresholds
 
     @staticmethod
@@ -5,7 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 import numpy as np
-from scipy.signal import fftconvolve, windows
+from scipy import fft as sp_fft
+from scipy.signal import windows
 
 C_LIGHT = 299_792_458.0
 
@@ -37,6 +38,7 @@ class PulseDopplerProcessor:
     """Generate sampled LFM echoes and form calibrated range-Doppler maps."""
 
     _WINDOWS = {"none", "rectangular", "hann", "hamming", "taylor"}
+    _COMPLEX_DTYPES = {np.dtype(np.complex64), np.dtype(np.complex128)}
 
     def __init__(
         self,
@@ -49,7 +51,14 @@ class PulseDopplerProcessor:
         mti_order: int = 0,
         window_type: str = "hamming",
         sample_rate_hz: float | None = None,
+        complex_dtype: np.dtype | type | str = np.complex128,
     ) -> None:
+        """
+        ``complex_dtype`` sets the processing precision (complex128 or
+        complex64). Raw IQ is always synthesized in double precision and
+        cast on entry to ``range_compress``. Processing reuses per-instance
+        work buffers, so one processor must not be shared between threads.
+        """
         sample_rate_hz = bandwidth_hz if sample_rate_hz is None else sample_rate_hz
         self._validate_configuration(
             prf_hz,
@@ -62,6 +71,9 @@ class PulseDopplerProcessor:
             window_type,
             sample_rate_hz,
         )
+        complex_dtype = np.dtype(complex_dtype)
+        if complex_dtype not in self._COMPLEX_DTYPES:
+            raise ValueError("complex_dtype must be complex64 or complex128")
 
         self.prf_hz = float(prf_hz)
         self.n_pulses = int(n_pulses)
@@ -72,6 +84,8 @@ class PulseDopplerProcessor:
         self.mti_order = int(mti_order)
         self.window_type = window_type
         self.sample_rate_hz = float(sample_rate_hz)
+        self.complex_dtype = complex_dtype
+        self.real_dtype = np.dtype(complex_dtype.char.lower())
 
         self.wavelength_m = C_LIGHT / self.frequency_hz
         self.pri_s = 1.0 / self.prf_hz
@@ -86,6 +100,16 @@ class PulseDopplerProcessor:
 
         self._ref_chirp = self._generate_lfm_reference()
         self._reference_energy = float(np.vdot(self._ref_chirp, self._ref_chirp).real)
+        # Matched filter spectrum for linear (non-circular) fast-time convolution
+        self._fft_length = sp_fft.next_fast_len(
+            self.n_range_bins + len(self._ref_chirp) - 1
+        )
+        matched_filter = np.conj(self._ref_chirp[::-1]) / np.sqrt(
+            self._reference_energy
+        )
+        self._matched_filter_fft = sp_fft.fft(
+            matched_filter, self._fft_length
+        ).astype(self.complex_dtype)
         self.processing_gain_db = 10.0 * np.log10(self._reference_energy)
         self.range_axis_m = (
             np.arange(self.n_range_bins, dtype=float) * self.range_sample_spacing_m
@@ -103,6 +127,11 @@ class PulseDopplerProcessor:
         self.nominal_processing_gain_linear = self._reference_energy * (
             self.n_pulses / self.window_enbw
         )
+        # Work buffers keyed by role; reallocated only when the CPI shape changes
+        self._buffers: dict[str, np.ndarray] = {}
+        # Doppler length -> (window / coherent sum as a column, ENBW in bins)
+        self._doppler_tapers: dict[int, tuple[np.ndarray, float]] = {}
+        self._doppler_taper(self.n_pulses - self.mti_order)
 
     @staticmethod
     def _validate_configuration(
@@ -161,29 +190,92 @@ class PulseDopplerProcessor:
         if ranges.size == 0:
             return cpi
 
-        fast_time = np.arange(len(self._ref_chirp), dtype=float) / self.sample_rate_hz
+        self._add_echoes(
+            cpi[np.newaxis],
+            ranges[np.newaxis],
+            velocities[np.newaxis],
+            amplitudes[np.newaxis],
+        )
+        return cpi
+
+    def generate_cpi_batch(
+        self,
+        target_ranges_m: np.ndarray,
+        target_velocities_mps: np.ndarray,
+        target_amplitudes: np.ndarray,
+        noise_power: float = 1e-12,
+        seed: int | None = None,
+        n_cpi: int | None = None,
+    ) -> np.ndarray:
+        """
+        Generate a stack of CPIs, shape (n_cpi, n_pulses, n_range_bins).
+
+        Target arrays are (n_cpi, n_targets), one row of targets per dwell
+        (pad ragged dwells with zero amplitude), or one-dimensional together
+        with ``n_cpi`` to repeat the same targets in every dwell. Each dwell
+        starts its slow time at zero, like ``generate_cpi``.
+        """
+        ranges, velocities, amplitudes = self._validate_target_batch(
+            target_ranges_m, target_velocities_mps, target_amplitudes, n_cpi
+        )
+        if not np.isfinite(noise_power) or noise_power < 0.0:
+            raise ValueError("noise_power must be finite and non-negative")
+
+        rng = np.random.default_rng(seed)
+        noise_std = np.sqrt(noise_power / 2.0)
+        # One draw of interleaved (I, Q) pairs viewed as complex samples
+        cpis = rng.standard_normal(
+            (ranges.shape[0], self.n_pulses, self.n_range_bins, 2)
+        ).view(np.complex128)[..., 0]
+        cpis *= noise_std
+        if ranges.shape[1] > 0:
+            self._add_echoes(cpis, ranges, velocities, amplitudes)
+        return cpis
+
+    def _add_echoes(
+        self,
+        cpis: np.ndarray,
+        ranges: np.ndarray,
+        velocities: np.ndarray,
+        amplitudes: np.ndarray,
+    ) -> None:
+        """Add delayed, Doppler-shifted LFM echoes of (n_cpi, n_targets) targets."""
+        n_cpi = cpis.shape[0]
+        chirp_length = len(self._ref_chirp)
+        fast_time = np.arange(chirp_length, dtype=float) / self.sample_rate_hz
         pulse_times = np.arange(self.n_pulses, dtype=float) * self.pri_s
-        for target_range, velocity, amplitude in zip(ranges, velocities, amplitudes):
-            instantaneous_ranges = target_range + velocity * pulse_times
-            apparent_ranges = np.mod(
-                instantaneous_ranges, self.max_unambiguous_range_m
+
+        instantaneous_ranges = ranges[..., np.newaxis] + (
+            velocities[..., np.newaxis] * pulse_times
+        )
+        apparent_ranges = np.mod(instantaneous_ranges, self.max_unambiguous_range_m)
+        delays = np.rint(2.0 * apparent_ranges * self.sample_rate_hz / C_LIGHT).astype(
+            int
+        )
+        doppler_hz = 2.0 * velocities / self.wavelength_m
+        fast_phase = np.exp(1j * 2.0 * np.pi * doppler_hz[..., np.newaxis] * fast_time)
+        pulse_phase = np.exp(
+            1j * 2.0 * np.pi * doppler_hz[..., np.newaxis] * pulse_times
+        )
+        echoes = amplitudes[..., np.newaxis] * self._ref_chirp * fast_phase
+
+        cpi_index = np.arange(n_cpi)[:, np.newaxis, np.newaxis]
+        pulse_index = np.arange(self.n_pulses)[np.newaxis, :, np.newaxis]
+        sample_offsets = np.arange(chirp_length)
+        # One target column at a time: within it every (cpi, pulse, sample)
+        # index is unique, so fancy-index accumulation is exact.
+        for target in range(ranges.shape[1]):
+            columns = delays[:, target, :, np.newaxis] + sample_offsets
+            samples = (
+                pulse_phase[:, target, :, np.newaxis]
+                * echoes[:, target, np.newaxis, :]
             )
-            delays = np.rint(
-                2.0 * apparent_ranges * self.sample_rate_hz / C_LIGHT
-            ).astype(int)
-            doppler_hz = 2.0 * velocity / self.wavelength_m
-            fast_phase = np.exp(1j * 2.0 * np.pi * doppler_hz * fast_time)
-            pulse_phase = np.exp(1j * 2.0 * np.pi * doppler_hz * pulse_times)
-            echo = amplitude * self._ref_chirp * fast_phase
-
-            for pulse_index, delay in enumerate(delays):
-                if delay >= self.n_range_bins:
-                    continue
-                sample_count = min(len(echo), self.n_range_bins - delay)
-                cpi[pulse_index, delay : delay + sample_count] += (
-                    pulse_phase[pulse_index] * echo[:sample_count]
-                )
-        return cpi
+            inside = columns < self.n_range_bins
+            cpis[
+                np.broadcast_to(cpi_index, inside.shape)[inside],
+                np.broadcast_to(pulse_index, inside.shape)[inside],
+                columns[inside],
+            ] += samples[inside]
 
     @staticmethod
     def _validate_targets(
@@ -202,39 +294,124 @@ class PulseDopplerProcessor:
             raise ValueError("target ranges and amplitudes must be non-negative")
         return arrays
 
-    def range_compress(self, cpi_data: np.ndarray) -> np.ndarray:
-        """Apply the unit-noise-gain LFM matched filter along fast time."""
-        cpi_data = np.asarray(cpi_data, dtype=np.complex128)
-        if cpi_data.ndim != 2 or cpi_data.shape[1] != self.n_range_bins:
+    @staticmethod
+    def _validate_target_batch(
+        ranges: np.ndarray,
+        velocities: np.ndarray,
+        amplitudes: np.ndarray,
+        n_cpi: int | None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        arrays = tuple(
+            np.asarray(value, dtype=float) for value in (ranges, velocities, amplitudes)
+        )
+        if n_cpi is not None:
+            if int(n_cpi) < 1:
+                raise ValueError("n_cpi must be at least one")
+            if any(value.ndim != 1 for value in arrays):
+                raise ValueError("target arrays must be one-dimensional with n_cpi")
+            arrays = tuple(
+                np.broadcast_to(value, (int(n_cpi), value.size)) for value in arrays
+            )
+        if any(value.ndim != 2 for value in arrays):
+            raise ValueError("target arrays must have shape (n_cpi, n_targets)")
+        if len({value.shape for value in arrays}) != 1:
+            raise ValueError("target arrays must have equal shapes")
+        if arrays[0].shape[0] < 1:
+            raise ValueError("at least one CPI is required")
+        if not all(np.all(np.isfinite(value)) for value in arrays):
+            raise ValueError("target arrays must be finite")
+        if np.any(arrays[0] < 0.0) or np.any(arrays[2] < 0.0):
+            raise ValueError("target ranges and amplitudes must be non-negative")
+        return arrays
+
+    def range_compress(
+        self,
+        cpi_data: np.ndarray,
+        out: np.ndarray | None = None,
+        workers: int | None = None,
+    ) -> np.ndarray:
+        """
+        Apply the unit-noise-gain LFM matched filter along fast time.
+
+        Accepts one CPI (n, n_range_bins) or a stack (n_cpi, n, n_range_bins).
+        The reference spectrum is computed once per processor and the
+        zero-padded FFT runs in place in a reused work buffer. ``out`` must
+        match the input shape and ``complex_dtype``.
+        """
+        cpi_data = np.asarray(cpi_data)
+        if cpi_data.ndim not in {2, 3} or cpi_data.shape[-1] != self.n_range_bins:
             raise ValueError(
-                f"cpi_data must have shape (n, {self.n_range_bins})"
+                f"cpi_data must have shape (n, {self.n_range_bins}) "
+                f"or (n_cpi, n, {self.n_range_bins})"
             )
-        matched_filter = np.conj(self._ref_chirp[::-1]) / np.sqrt(
-            self._reference_energy
-        )
-        full = fftconvolve(
-            cpi_data, matched_filter[np.newaxis, :], mode="full", axes=1
-        )
+        out = self._output(out, cpi_data.shape)
+        work = self._buffer("range", cpi_data.shape[:-1] + (self._fft_length,))
+        work[..., : self.n_range_bins] = cpi_data
+        work[..., self.n_range_bins :] = 0.0
+        spectrum = sp_fft.fft(work, axis=-1, overwrite_x=True, workers=workers)
+        spectrum *= self._matched_filter_fft
+        full = sp_fft.ifft(spectrum, axis=-1, overwrite_x=True, workers=workers)
         start = len(self._ref_chirp) - 1
-        return full[:, start : start + self.n_range_bins]
+        out[...] = full[..., start : start + self.n_range_bins]
+        return out
 
-    def mti_cancel(self, cpi_data: np.ndarray) -> np.ndarray:
+    def mti_cancel(
+        self, cpi_data: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
         """Apply a two- or three-pulse delay-line canceller in slow time."""
         cpi_data = np.asarray(cpi_data)
-        if cpi_data.ndim != 2:
-            raise ValueError("cpi_data must be two-dimensional")
-        return np.diff(cpi_data, n=self.mti_order, axis=0)
+        if cpi_data.ndim not in {2, 3}:
+            raise ValueError("cpi_data must be two- or three-dimensional")
+        if out is None:
+            return np.diff(cpi_data, n=self.mti_order, axis=-2)
+
+        shape = cpi_data.shape[:-2] + (
+            max(0, cpi_data.shape[-2] - self.mti_order),
+            cpi_data.shape[-1],
+        )
+        if out.shape != shape:
+            raise ValueError(f"out must have shape {shape}")
+        if self.mti_order == 0:
+            np.copyto(out, cpi_data)
+        elif self.mti_order == 1:
+            np.subtract(cpi_data[..., 1:, :], cpi_data[..., :-1, :], out=out)
+        else:
+            # Same operation order as np.diff(n=2): difference of differences
+            first = self._buffer(
+                "mti", shape[:-2] + (shape[-2] + 1, shape[-1]), out.dtype
+            )
+            np.subtract(cpi_data[..., 1:, :], cpi_data[..., :-1, :], out=first)
+            np.subtract(first[..., 1:, :], first[..., :-1, :], out=out)
+        return out
 
-    def doppler_fft(self, cpi_data: np.ndarray) -> np.ndarray:
-        """Apply a calibrated slow-time window and normalized Doppler FFT."""
+    def doppler_fft(
+        self,
+        cpi_data: np.ndarray,
+        out: np.ndarray | None = None,
+        workers: int | None = None,
+    ) -> np.ndarray:
+        """
+        Apply a calibrated slow-time window and normalized Doppler FFT.
+
+        The window is cached per slow-time length, pre-divided by its
+        coherent sum, and the FFT runs in place in a reused work buffer.
+        """
         cpi_data = np.asarray(cpi_data)
-        if cpi_data.ndim != 2 or cpi_data.shape[0] < 1:
-            raise ValueError("cpi_data must be a non-empty two-dimensional array")
-        window = self._generate_window(cpi_data.shape[0], self.window_type)
-        coherent_sum = float(window.sum())
-        return np.fft.fftshift(
-            np.fft.fft(cpi_data * window[:, np.newaxis], axis=0), axes=0
-        ) / coherent_sum
+        if cpi_data.ndim not in {2, 3} or cpi_data.shape[-2] < 1:
+            raise ValueError(
+                "cpi_data must be a non-empty two- or three-dimensional array"
+            )
+        out = self._output(out, cpi_data.shape)
+        window, _ = self._doppler_taper(cpi_data.shape[-2])
+        work = self._buffer("doppler", cpi_data.shape)
+        np.multiply(cpi_data, window, out=work)
+        spectrum = sp_fft.fft(work, axis=-2, overwrite_x=True, workers=workers)
+        # fftshift along slow time without the temporary np.roll allocates
+        n_doppler = cpi_data.shape[-2]
+        split = (n_doppler + 1) // 2
+        out[..., : n_doppler - split, :] = spectrum[..., split:, :]
+        out[..., n_doppler - split :, :] = spectrum[..., :split, :]
+        return out
 
     def process_cpi(
         self,
@@ -251,18 +428,73 @@ class PulseDopplerProcessor:
             noise_power,
             seed,
         )
-        compressed = self.range_compress(raw_iq)
-        filtered = self.mti_cancel(compressed)
-        rd_complex = self.doppler_fft(filtered)
-        rd_power = np.abs(rd_complex) ** 2
-        rd_db = 10.0 * np.log10(np.maximum(rd_power, np.finfo(float).tiny))
-        n_doppler = rd_complex.shape[0]
+        return self.process_iq(raw_iq)
+
+    def process_cpi_batch(
+        self,
+        target_ranges_m: np.ndarray,
+        target_velocities_mps: np.ndarray,
+        target_amplitudes: np.ndarray,
+        noise_power: float = 1e-12,
+        seed: int | None = None,
+        n_cpi: int | None = None,
+        workers: int | None = None,
+    ) -> RangeDopplerMap:
+        """
+        Synthesize and process many dwells in one pass.
+
+        Target arrays follow ``generate_cpi_batch``. The returned map holds
+        ``data_db``/``data_linear`` of shape (n_cpi, n_doppler, n_range_bins)
+        with the shared axes; ``workers`` is passed to ``scipy.fft``.
+        """
+        raw_iq = self.generate_cpi_batch(
+            target_ranges_m,
+            target_velocities_mps,
+            target_amplitudes,
+            noise_power,
+            seed,
+            n_cpi,
+        )
+        return self.process_iq(raw_iq, workers=workers)
+
+    def process_iq(
+        self, raw_iq: np.ndarray, workers: int | None = None
+    ) -> RangeDopplerMap:
+        """
+        Range-compress, MTI-filter and Doppler-process raw IQ.
+
+        ``raw_iq`` is one CPI (n_pulses, n_range_bins) or a stack
+        (n_cpi, n_pulses, n_range_bins); map data keep the leading axis.
+        """
+        raw_iq = np.asarray(raw_iq)
+        compressed = self.range_compress(
+            raw_iq, out=self._buffer("compressed", raw_iq.shape), workers=workers
+        )
+        if self.mti_order == 0:
+            filtered = compressed
+        else:
+            filtered = self.mti_cancel(
+                compressed,
+                out=self._buffer(
+                    "filtered",
+                    raw_iq.shape[:-2]
+                    + (raw_iq.shape[-2] - self.mti_order, raw_iq.shape[-1]),
+                ),
+            )
+        rd_complex = self.doppler_fft(
+            filtered, out=self._buffer("rd", filtered.shape), workers=workers
+        )
+        rd_power = np.abs(rd_complex)
+        np.square(rd_power, out=rd_power)
+        rd_db = np.maximum(rd_power, np.finfo(self.real_dtype).tiny)
+        np.log10(rd_db, out=rd_db)
+        rd_db *= 10.0
+        n_doppler = rd_complex.shape[-2]
         doppler_axis = np.fft.fftshift(
             np.fft.fftfreq(n_doppler, d=self.pri_s)
         )
         velocity_axis = doppler_axis * self.wavelength_m / 2.0
-        window = self._generate_window(n_doppler, self.window_type)
-        enbw = self.window_enbw_bins(window)
+        _, enbw = self._doppler_taper(n_doppler)
 
         return RangeDopplerMap(
             data_db=rd_db,
@@ -302,6 +534,35 @@ class PulseDopplerProcessor:
             )
         )
 
+    def _buffer(
+        self, role: str, shape: tuple[int, ...], dtype: np.dtype | None = None
+    ) -> np.ndarray:
+        """Return the reusable work buffer for ``role``, resized on demand."""
+        dtype = self.complex_dtype if dtype is None else np.dtype(dtype)
+        buffer = self._buffers.get(role)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[role] = buffer
+        return buffer
+
+    def _output(self, out: np.ndarray | None, shape: tuple[int, ...]) -> np.ndarray:
+        if out is None:
+            return np.empty(shape, dtype=self.complex_dtype)
+        if out.shape != shape or out.dtype != self.complex_dtype:
+            raise ValueError(
+                f"out must have shape {shape} and dtype {self.complex_dtype}"
+            )
+        return out
+
+    def _doppler_taper(self, n: int) -> tuple[np.ndarray, float]:
+        taper = self._doppler_tapers.get(n)
+        if taper is None:
+            window = self._generate_window(n, self.window_type)
+            scaled = (window / window.sum()).astype(self.real_dtype)
+            taper = (scaled[:, np.newaxis], self.window_enbw_bins(window))
+            self._doppler_tapers[n] = taper
+        return taper
+
     def _generate_lfm_reference(self) -> np.ndarray:
         sample_count = max(1, int(round(self.pulse_width_s * self.sample_rate_hz)))
         time = (
@@ -5,23 +5,33 @@ Headless simulation runners and batch processing tools.
 """
 
 from .headless_runner import HeadlessRunner, SimulationConfig, SimulationResult
+from .monte_carlo import MonteCarloBatch, MonteCarloTask, RunStatistics
 from .scenario_generator import ParameterSpace, ScenarioGenerator
+from .sweep_executor import SweepExecutor
 
 __all__ = [
     "HeadlessRunner",
     "SimulationConfig",
     "SimulationResult",
+    "MonteCarloBatch",
+    "MonteCarloTask",
+    "RunStatistics",
+    "SweepExecutor",
     "ScenarioGenerator",
     "ParameterSpace",
     "NetworkManager",
     "CovarianceIntersection",
     "StrobeTriangulator",
+    "StrobeIntersector",
+    "JammerFix",
 ]
 
 try:
     from .network_manager import (
         CovarianceIntersection,
+        JammerFix,
         NetworkManager,
+        StrobeIntersector,
         StrobeTriangulator,
     )
 except ImportError:
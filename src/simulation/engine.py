@@ -12,37 +12,48 @@ Features:
 Reference: Skolnik, "Radar Handbook", 3rd Ed., Chapter 2
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+import uuid
+import warnings
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 
-from src.physics.atmospheric import ITU_R_P676
+from src.physics.atmospheric import AtmosphereState
 from src.physics.ecm import (
     DRFMConfig,
     DRFMJammer,
     DRFMState,
     ECMSimulator,
     apply_receiver_hard_limiter,
+    apply_receiver_hard_limiter_array,
+)
+from src.physics.metrics import (
+    calculate_pd_swerling,
+    calculate_pd_swerling_array,
+    get_pd_table,
 )
-from src.physics.metrics import calculate_pd_swerling
 from src.physics.radar_equation import (
     RadarParameters,
     calculate_received_power,
+    calculate_received_power_array,
     calculate_snr,
+    calculate_snr_array,
 )
 from src.physics.rain import ITU_R_P838
 from src.physics.rcs import SwerlingModel
 
-from .objects import MotionModel, Radar, SimulationState, Target
+from .objects import MotionModel, Radar, SimulationState, Target, TargetArrays
 
 # Terrain masking (optional)
 try:
-    from src.physics.terrain import TerrainMap
+    from src.physics.terrain import HorizonProfile, TerrainMap
 
     TERRAIN_AVAILABLE = True
 except ImportError:
     TERRAIN_AVAILABLE = False
+    HorizonProfile = None
     TerrainMap = None
 
 # Track-While-Scan tracking (optional)
@@ -147,6 +158,91 @@ class DetectionResult:
         }
 
 
+# DetectionResult fields that may be None; DetectionBlock stores them as NaN.
+_OPTIONAL_RESULT_FIELDS = frozenset(
+    {
+        "surface_sigma0_db",
+        "jammer_jsr_db",
+        "receiver_input_power_dbm",
+        "receiver_headroom_db",
+    }
+)
+
+
+@dataclass
+class DetectionBlock:
+    """
+    Columnar detection results for all targets at one time step.
+
+    Produced by ``SimulationEngine.step_batch``. Each column holds one value
+    per target in ``target_id`` order and is named after the matching
+    ``DetectionResult`` field. Optional fields use NaN where the scalar path
+    reports None.
+    """
+
+    time: float
+    target_id: np.ndarray
+    true_range_m: np.ndarray
+    true_azimuth_rad: np.ndarray
+    true_elevation_rad: np.ndarray
+    true_velocity_mps: np.ndarray
+    true_rcs_m2: np.ndarray
+    measured_range_m: np.ndarray
+    measured_azimuth_rad: np.ndarray
+    measured_elevation_rad: np.ndarray
+    snr_db: np.ndarray
+    is_detected: np.ndarray
+    pd: np.ndarray
+    atmospheric_loss_db: np.ndarray
+    rain_attenuation_db: np.ndarray
+    surface_clutter_loss_db: np.ndarray
+    surface_sigma0_db: np.ndarray
+    surface_cell_area_m2: np.ndarray
+    surface_clutter_rcs_m2: np.ndarray
+    surface_clutter_model: np.ndarray
+    rain_clutter_loss_db: np.ndarray
+    jammer_jsr_db: np.ndarray
+    jammer_loss_db: np.ndarray
+    receiver_input_power_dbm: np.ndarray
+    receiver_headroom_db: np.ndarray
+    receiver_clipping_loss_db: np.ndarray
+    receiver_overloaded: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.target_id)
+
+    @property
+    def n_detections(self) -> int:
+        """Number of targets detected in this block."""
+        return int(np.count_nonzero(self.is_detected))
+
+    def result(self, index: int) -> DetectionResult:
+        """Materialize a single row as a ``DetectionResult``."""
+        values = {}
+        for f in fields(DetectionResult):
+            if f.name == "time":
+                continue
+            value = getattr(self, f.name)[index : index + 1].tolist()[0]
+            if f.name in _OPTIONAL_RESULT_FIELDS and value != value:
+                value = None
+            values[f.name] = value
+        return DetectionResult(time=self.time, **values)
+
+    def to_results(self) -> List[DetectionResult]:
+        """Materialize the block as a list of ``DetectionResult`` objects."""
+        names = [f.name for f in fields(DetectionResult) if f.name != "time"]
+        columns = []
+        for name in names:
+            values = getattr(self, name).tolist()
+            if name in _OPTIONAL_RESULT_FIELDS:
+                values = [None if v != v else v for v in values]
+            columns.append(values)
+        return [
+            DetectionResult(time=self.time, **dict(zip(names, row)))
+            for row in zip(*columns)
+        ]
+
+
 @dataclass
 class FalseTarget:
     """
@@ -193,17 +289,87 @@ class FalseTarget:
         }
 
 
-@dataclass
+def _log_column_dtype(annotation: Any) -> np.dtype:
+    """Storage dtype of a ``DetectionResult`` field in ``SimulationLog``."""
+    if annotation is bool:
+        return np.dtype(bool)
+    if annotation is int:
+        return np.dtype(np.int64)
+    if annotation is str:
+        return np.dtype(np.int32)  # category codes
+    return np.dtype(np.float64)
+
+
+# Column layout shared by SimulationLog buffers and spill chunks
+_LOG_COLUMNS = {f.name: _log_column_dtype(f.type) for f in fields(DetectionResult)}
+_CATEGORY_COLUMNS = frozenset(f.name for f in fields(DetectionResult) if f.type is str)
+
+
 class SimulationLog:
     """
-    Complete simulation log with all detection results.
+    Columnar simulation log with optional time-based retention.
+
+    Every ``DetectionResult`` field is one preallocated NumPy column that
+    grows by doubling; string fields are stored as category codes and
+    optional fields as NaN. ``DetectionResult`` objects are only built when
+    a history is requested, and a per-target row index (extended lazily on
+    query) makes ``get_target_history`` O(k) in the target's row count.
+
+    Retention:
+        - ``retention_s=None``: keep every row (default)
+        - ``retention_s=T``: ring buffer of the last T seconds of simulation
+          time; older rows are dropped when the buffer would otherwise grow
+        - ``retention_s=T, spill_dir=path``: rows leaving the window are
+          written to ``.npz`` chunks in ``path`` instead, and histories
+          read them back. Chunk names carry a per-log prefix, so logs
+          sharing ``path`` (e.g. after ``reset()``) never overwrite each
+          other's chunks
+
+    Rows are expected in nondecreasing time order, as the engine adds them.
+    ``total_opportunities``/``total_detections`` count every row ever added.
     """
 
-    detection_history: List[DetectionResult] = field(default_factory=list)
-
-    # Statistics
-    total_opportunities: int = 0
-    total_detections: int = 0
+    def __init__(
+        self,
+        retention_s: Optional[float] = None,
+        spill_dir: Optional[Union[str, Path]] = None,
+        initial_capacity: int = 1024,
+    ) -> None:
+        if retention_s is not None and not retention_s > 0.0:
+            raise ValueError("retention_s must be positive")
+        if spill_dir is not None and retention_s is None:
+            raise ValueError("spill_dir requires retention_s")
+        if initial_capacity < 1:
+            raise ValueError("initial_capacity must be at least 1")
+        self.retention_s = retention_s
+        self.spill_dir = None if spill_dir is None else Path(spill_dir)
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+        # Statistics
+        self.total_opportunities = 0
+        self.total_detections = 0
+
+        self._capacity = int(initial_capacity)
+        self._columns = {
+            name: np.empty(self._capacity, dtype=dtype)
+            for name, dtype in _LOG_COLUMNS.items()
+        }
+        # Live rows occupy [_start, _stop); physical row p has sequence
+        # number _first_seq + p, which survives compaction.
+        self._start = 0
+        self._stop = 0
+        self._first_seq = 0
+        self._categories: Dict[str, List[str]] = {n: [] for n in _CATEGORY_COLUMNS}
+        self._category_codes: Dict[str, Dict[str, int]] = {
+            n: {} for n in _CATEGORY_COLUMNS
+        }
+        # target_id -> sorted sequence-number chunks; rows below
+        # _indexed_seq are indexed
+        self._index: Dict[int, List[np.ndarray]] = {}
+        self._indexed_seq = 0
+        self._spill_chunks: List[Path] = []
+        self._spill_prefix = f"detections_{uuid.uuid4().hex[:12]}"
 
     @property
     def detection_ratio(self) -> float:
@@ -212,16 +378,229 @@ class SimulationLog:
             return 0.0
         return self.total_detections / self.total_opportunities
 
+    def __len__(self) -> int:
+        """Rows currently held in memory."""
+        return self._stop - self._start
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes allocated for the in-memory columns."""
+        return sum(column.nbytes for column in self._columns.values())
+
     def add_result(self, result: DetectionResult) -> None:
         """Add a detection result to the log."""
-        self.detection_history.append(result)
+        row = self._reserve(1)
+        for name in _LOG_COLUMNS:
+            value = getattr(result, name)
+            if name in _CATEGORY_COLUMNS:
+                value = self._category_code(name, value)
+            elif value is None:
+                value = np.nan
+            self._columns[name][row] = value
+        self._stop += 1
         self.total_opportunities += 1
         if result.is_detected:
             self.total_detections += 1
 
+    def add_block(self, block: DetectionBlock) -> None:
+        """Add a columnar block of detection results to the log."""
+        n_rows = len(block)
+        row = self._reserve(n_rows)
+        for name in _LOG_COLUMNS:
+            column = self._columns[name][row : row + n_rows]
+            if name == "time":
+                column[:] = block.time
+            elif name in _CATEGORY_COLUMNS:
+                values, inverse = np.unique(getattr(block, name), return_inverse=True)
+                codes = np.array(
+                    [self._category_code(name, str(value)) for value in values],
+                    dtype=column.dtype,
+                )
+                column[:] = codes[inverse.reshape(-1)]
+            else:
+                column[:] = getattr(block, name)
+        self._stop += n_rows
+        self.total_opportunities += n_rows
+        self.total_detections += block.n_detections
+
+    def get_target_columns(self, target_id: int) -> Dict[str, np.ndarray]:
+        """
+        Time-ordered history of one target as columns, without building
+        ``DetectionResult`` objects. String fields are decoded to object
+        arrays; optional fields hold NaN.
+        """
+        return self._gather(target_id, self._target_rows(target_id))
+
     def get_target_history(self, target_id: int) -> List[DetectionResult]:
         """Get detection history for a specific target."""
-        return [r for r in self.detection_history if r.target_id == target_id]
+        return self._results(self.get_target_columns(target_id))
+
+    @property
+    def detection_history(self) -> List[DetectionResult]:
+        """
+        Every logged result, in insertion order, including spilled rows.
+
+        Deprecated: builds every ``DetectionResult`` on each access. Use
+        ``get_target_history()`` or ``get_target_columns()`` instead.
+        """
+        warnings.warn(
+            "SimulationLog.detection_history is deprecated; use get_target_history() "
+            "or get_target_columns()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self._results(self._gather(None, slice(self._start, self._stop)))
+
+    def _gather(self, target_id: Optional[int], rows) -> Dict[str, np.ndarray]:
+        """Decoded columns of spilled rows of ``target_id`` (all for None) and live ``rows``."""
+        parts = [self._load_spilled(target_id, path) for path in self._spill_chunks]
+        live = {}
+        for name in _LOG_COLUMNS:
+            values = self._columns[name][rows]
+            if name in _CATEGORY_COLUMNS:
+                values = np.asarray(self._categories[name], dtype=object)[values]
+            live[name] = values
+        parts.append(live)
+        return {
+            name: np.concatenate([part[name] for part in parts])
+            for name in _LOG_COLUMNS
+        }
+
+    @staticmethod
+    def _results(columns: Dict[str, np.ndarray]) -> List[DetectionResult]:
+        """Build ``DetectionResult`` objects from decoded columns."""
+        names = list(_LOG_COLUMNS)
+        values = []
+        for name in names:
+            column = columns[name].tolist()
+            if name in _OPTIONAL_RESULT_FIELDS:
+                column = [None if v != v else v for v in column]
+            values.append(column)
+        return [DetectionResult(**dict(zip(names, row))) for row in zip(*values)]
+
+    # ═══════════════════════════════════════════════════════════════
+    # STORAGE
+    # ═══════════════════════════════════════════════════════════════
+
+    def _category_code(self, name: str, value: str) -> int:
+        codes = self._category_codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._categories[name])
+            self._categories[name].append(value)
+        return code
+
+    def _reserve(self, n_rows: int) -> int:
+        """Make room for ``n_rows`` and return the physical row to write at."""
+        if self._stop + n_rows <= self._capacity:
+            return self._stop
+        self._evict_expired()
+        live = self._stop - self._start
+        capacity = self._capacity
+        if live + n_rows > capacity // 2:
+            capacity = max(2 * capacity, live + n_rows)
+        for name, column in self._columns.items():
+            if capacity == self._capacity:
+                column[:live] = column[self._start : self._stop]
+            else:
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:live] = column[self._start : self._stop]
+                self._columns[name] = grown
+        self._first_seq += self._start
+        self._start, self._stop, self._capacity = 0, live, capacity
+        return self._stop
+
+    def _evict_expired(self) -> None:
+        """Drop (or spill) rows older than the retention window."""
+        if self.retention_s is None or self._stop == self._start:
+            return
+        times = self._columns["time"][self._start : self._stop]
+        cutoff = times[-1] - self.retention_s
+        expired = int(np.searchsorted(times, cutoff, side="left"))
+        if expired == 0:
+            return
+        if self.spill_dir is not None:
+            self._spill(self._start, self._start + expired)
+        self._start += expired
+
+        first_live_seq = self._first_seq + self._start
+        self._indexed_seq = max(self._indexed_seq, first_live_seq)
+        for target_id in list(self._index):
+            seqs = self._live_seqs(target_id, first_live_seq)
+            if seqs.size:
+                self._index[target_id] = [seqs]
+            else:
+                del self._index[target_id]
+
+    def _spill(self, start: int, stop: int) -> None:
+        first_seq = self._first_seq + start
+        path = self.spill_dir / f"{self._spill_prefix}_{first_seq:012d}.npz"
+        columns = {}
+        for name in _LOG_COLUMNS:
+            values = self._columns[name][start:stop]
+            if name in _CATEGORY_COLUMNS:
+                values = np.asarray(self._categories[name])[values]
+            columns[name] = values
+        np.savez(path, **columns)
+        self._spill_chunks.append(path)
+
+    @staticmethod
+    def _load_spilled(target_id: Optional[int], path: Path) -> Dict[str, np.ndarray]:
+        """Rows of ``target_id`` in a spill chunk (every row for None)."""
+        with np.load(path) as chunk:
+            if target_id is None:
+                rows = np.arange(len(chunk["target_id"]))
+            else:
+                rows = np.flatnonzero(chunk["target_id"] == target_id)
+            return {
+                name: (
+                    chunk[name][rows].astype(object)
+                    if name in _CATEGORY_COLUMNS
+                    else chunk[name][rows]
+                )
+                for name in _LOG_COLUMNS
+            }
+
+    # ═══════════════════════════════════════════════════════════════
+    # TARGET INDEX
+    # ═══════════════════════════════════════════════════════════════
+
+    def _update_index(self) -> None:
+        """Index rows added since the last query, one vectorized pass."""
+        end_seq = self._first_seq + self._stop
+        if self._indexed_seq >= end_seq:
+            return
+        start = self._indexed_seq - self._first_seq
+        target_ids = self._columns["target_id"][start : self._stop]
+        order = np.argsort(target_ids, kind="stable")
+        sorted_ids = target_ids[order]
+        bounds = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+        seqs = order + self._indexed_seq
+        for target_id, chunk in zip(
+            sorted_ids[bounds].tolist(), np.split(seqs, bounds[1:])
+        ):
+            self._index.setdefault(target_id, []).append(chunk)
+        self._indexed_seq = end_seq
+
+    def _live_seqs(self, target_id: int, first_live_seq: int) -> np.ndarray:
+        chunks = self._index.get(target_id)
+        if not chunks:
+            return np.empty(0, dtype=np.int64)
+        seqs = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+        return seqs[np.searchsorted(seqs, first_live_seq) :]
+
+    def _target_rows(self, target_id: int) -> np.ndarray:
+        """Physical rows of one target inside the retention window."""
+        self._update_index()
+        seqs = self._live_seqs(target_id, self._first_seq + self._start)
+        if seqs.size:
+            self._index[target_id] = [seqs]
+        rows = seqs - self._first_seq
+        if self.retention_s is not None and self.spill_dir is None and rows.size:
+            cutoff = self._columns["time"][self._stop - 1] - self.retention_s
+            times = self._columns["time"][rows]
+            rows = rows[np.searchsorted(times, cutoff, side="left") :]
+        return rows
 
 
 class SimulationEngine:
@@ -257,6 +636,11 @@ class SimulationEngine:
         land_gamma_db: Optional[float] = None,
         ground_relative_permittivity: complex = complex(8.0, -0.8),
         ground_rms_height_m: float = 0.01,
+        batch_mode: bool = False,
+        use_pd_table: bool = True,
+        use_horizon_profile: bool = True,
+        log_retention_s: Optional[float] = None,
+        log_spill_dir: Optional[Union[str, Path]] = None,
     ):
         """
         Initialize simulation engine.
@@ -284,6 +668,16 @@ class SimulationEngine:
             land_gamma_db: Measured or calibrated gamma value for the gamma model [dB]
             ground_relative_permittivity: Passive complex soil permittivity eps'-j eps''
             ground_rms_height_m: RMS soil surface height used by Oh-1992 [m]
+            batch_mode: Advance run() with the vectorized step_batch() path
+            use_pd_table: Interpolate Pd from cached PdTable grids instead of
+                evaluating the Swerling quadrature per target
+            use_horizon_profile: While the radar is stationary, mask targets
+                with the terrain's precomputed HorizonProfile instead of
+                ray marching each target every frame
+            log_retention_s: Keep only the last this many seconds of results
+                in the SimulationLog (None keeps the whole run)
+            log_spill_dir: Directory receiving results that leave the
+                retention window, instead of dropping them
         """
         if dt <= 0.0:
             raise ValueError("dt must be greater than zero")
@@ -317,10 +711,14 @@ class SimulationEngine:
         self.atmospheric_temperature_c = atmospheric_temperature_c
         self.atmospheric_pressure_hpa = atmospheric_pressure_hpa
         self.water_vapor_density_g_m3 = water_vapor_density_g_m3
+        self._atmosphere: Optional[AtmosphereState] = None
+        self.use_pd_table = use_pd_table
 
         # Terrain for line-of-sight calculations
         self.terrain = terrain
         self.enable_terrain_masking = terrain is not None
+        self.use_horizon_profile = use_horizon_profile
+        self._los_radar_position: Optional[np.ndarray] = None
 
         # Simulation state
         self.current_time = 0.0
@@ -329,7 +727,7 @@ class SimulationEngine:
             self.state.add_target(target)
 
         # Logging
-        self.log = SimulationLog()
+        self.log = SimulationLog(retention_s=log_retention_s, spill_dir=log_spill_dir)
 
         # Build radar parameters for physics
         self._radar_params = RadarParameters(
@@ -429,10 +827,25 @@ class SimulationEngine:
         self._pd_n_pulses = 64  # Coherent pulses per CPI
         self._pd_prf_hz = radar.prf_hz
 
+        # Structure-of-arrays target view for the vectorized step path
+        self.batch_mode = batch_mode
+        self._target_arrays: Optional[TargetArrays] = None
+
     def add_target(self, target: Target) -> None:
         """Add a target to the simulation."""
         self.targets.append(target)
         self.state.add_target(target)
+        self._target_arrays = None
+
+    def invalidate_target_arrays(self) -> None:
+        """
+        Discard the structure-of-arrays target view.
+
+        Call after changing a target's mean RCS, Swerling model or motion
+        model while running in batch mode; the next ``step_batch`` rebuilds
+        the arrays from the ``Target`` objects.
+        """
+        self._target_arrays = None
 
     def set_pulse_doppler_mode(
         self,
@@ -771,6 +1184,101 @@ class SimulationEngine:
                 "false_target_count": len(self.false_targets),
             }
 
+    def _atmosphere_state(self) -> AtmosphereState:
+        """Return the memoizing atmosphere for the current path state."""
+        state = (
+            self.atmospheric_temperature_c,
+            self.atmospheric_pressure_hpa,
+            self.water_vapor_density_g_m3,
+        )
+        if self._atmosphere is None or not self._atmosphere.matches(*state):
+            self._atmosphere = AtmosphereState(*state)
+        return self._atmosphere
+
+    def _fixed_site_profile(self) -> Optional["HorizonProfile"]:
+        """
+        Terrain mask profile for a stationary radar, or None.
+
+        A radar seen at the same position on consecutive steps is treated
+        as a fixed site and answered from the terrain's cached
+        HorizonProfile; a moving radar is ray marched instead. Call once
+        per step.
+        """
+        if not self.use_horizon_profile:
+            return None
+        radar_pos_3d = np.zeros(3)
+        radar_pos_3d[: len(self.radar.position)] = self.radar.position[:3]
+
+        stationary = self._los_radar_position is not None and np.array_equal(
+            self._los_radar_position, radar_pos_3d
+        )
+        self._los_radar_position = radar_pos_3d
+        if not stationary:
+            return None
+        return self.terrain.get_horizon_profile(radar_pos_3d)
+
+    def _surface_sigma0_db(self, geometric_grazing: float) -> tuple:
+        """
+        Evaluate the configured surface reflectivity model at one grazing angle.
+
+        Args:
+            geometric_grazing: Flat-earth grazing angle from radar height [rad]
+
+        Returns:
+            Tuple of (sigma0 HH [dB], sigma0 VV [dB], model grazing [rad],
+            model name)
+        """
+        freq_ghz = self.radar.frequency_hz / 1e9
+        is_water = (
+            "sea" in self.terrain_type.lower() or "water" in self.terrain_type.lower()
+        )
+
+        if is_water:
+            model_grazing = np.clip(
+                geometric_grazing, np.radians(0.1), np.radians(60.0)
+            )
+            sigma_h_db = ClutterModel.sea_clutter_sigma0(
+                model_grazing,
+                sea_state=self.sea_state,
+                frequency_ghz=freq_ghz,
+                polarization="HH",
+            )
+            sigma_v_db = ClutterModel.sea_clutter_sigma0(
+                model_grazing,
+                sea_state=self.sea_state,
+                frequency_ghz=freq_ghz,
+                polarization="VV",
+            )
+            return sigma_h_db, sigma_v_db, model_grazing, "nrl_five_parameter"
+
+        if self.ground_model == "oh1992":
+            model_grazing = geometric_grazing
+            sigma_h_db = ClutterModel.bare_soil_oh1992_sigma0(
+                model_grazing,
+                freq_ghz,
+                self.ground_relative_permittivity,
+                self.ground_rms_height_m,
+                "HH",
+            )
+            sigma_v_db = ClutterModel.bare_soil_oh1992_sigma0(
+                model_grazing,
+                freq_ghz,
+                self.ground_relative_permittivity,
+                self.ground_rms_height_m,
+                "VV",
+            )
+            return sigma_h_db, sigma_v_db, model_grazing, "oh1992_bare_soil"
+
+        model_grazing = max(geometric_grazing, np.radians(0.1))
+        sigma_h_db = ClutterModel.ground_clutter_sigma0(
+            model_grazing,
+            terrain_type=self.terrain_type,
+            frequency_ghz=freq_ghz,
+            polarization="HH",
+            gamma_db=self.land_gamma_db,
+        )
+        return sigma_h_db, sigma_h_db, model_grazing, "constant_gamma"
+
     def step(self, dt: float = None) -> List[DetectionResult]:
         """
         Advance simulation by one time step.
@@ -788,7 +1296,9 @@ class SimulationEngine:
 
         results = []
 
-        # 1. Update all object kinematics
+        # 1. Update all object kinematics (Target.update rebinds state arrays,
+        # so any structure-of-arrays view is rebuilt by the next batch step)
+        self._target_arrays = None
         self.state.update_all(dt)
         self.current_time = self.state.time
 
@@ -799,6 +1309,10 @@ class SimulationEngine:
         # Increment frame counter for throttled operations
         self._frame_count += 1
 
+        # Terrain mask profile, judged once per step as in step_batch()
+        check_los = self.enable_terrain_masking and self.terrain is not None
+        profile = self._fixed_site_profile() if check_los else None
+
         # 2. Process each target
         for target in self.targets:
             # Calculate geometry
@@ -815,13 +1329,8 @@ class SimulationEngine:
                 freq_ghz = self.radar.frequency_hz / 1e9
                 range_km = geom["range_m"] / 1000
                 if range_km > 0.1:
-                    atm_loss_db = ITU_R_P676.total_attenuation(
-                        range_km,
-                        freq_ghz,
-                        temperature_c=self.atmospheric_temperature_c,
-                        pressure_hpa=self.atmospheric_pressure_hpa,
-                        water_vapor_density=self.water_vapor_density_g_m3,
-                        two_way=True,
+                    atm_loss_db = self._atmosphere_state().total_attenuation(
+                        range_km, freq_ghz, two_way=True
                     )
 
             rain_loss_db = 0.0
@@ -838,25 +1347,28 @@ class SimulationEngine:
 
             # ═══ TERRAIN MASKING CHECK (LOS) ═══
             terrain_masked = False
-            if self.enable_terrain_masking and self.terrain is not None:
-                radar_pos_3d = np.array(
-                    [
-                        self.radar.position[0],
-                        self.radar.position[1],
-                        self.radar.position[2] if len(self.radar.position) > 2 else 0.0,
-                    ]
-                )
-                target_pos_3d = np.array(
-                    [
-                        target.position[0],
-                        target.position[1],
-                        target.position[2] if len(target.position) > 2 else 0.0,
-                    ]
-                )
-                is_visible, block_range, _ = self.terrain.check_line_of_sight(
-                    radar_pos_3d, target_pos_3d
-                )
-                terrain_masked = not is_visible
+            if check_los:
+                if profile is not None:
+                    terrain_masked = not profile.point_is_visible(target.position)
+                else:
+                    radar_pos_3d = np.array(
+                        [
+                            self.radar.position[0],
+                            self.radar.position[1],
+                            self.radar.position[2] if len(self.radar.position) > 2 else 0.0,
+                        ]
+                    )
+                    target_pos_3d = np.array(
+                        [
+                            target.position[0],
+                            target.position[1],
+                            target.position[2] if len(target.position) > 2 else 0.0,
+                        ]
+                    )
+                    is_visible, _, _ = self.terrain.check_line_of_sight(
+                        radar_pos_3d, target_pos_3d
+                    )
+                    terrain_masked = not is_visible
 
             # Calculate SNR (terrain-masked targets get SNR = -inf)
             if terrain_masked:
@@ -886,57 +1398,12 @@ class SimulationEngine:
                 geometric_grazing = np.arcsin(
                     np.clip(radar_height_m / geom["range_m"], 0.0, 1.0)
                 )
-                freq_ghz = self.radar.frequency_hz / 1e9
-                is_water = (
-                    "sea" in self.terrain_type.lower()
-                    or "water" in self.terrain_type.lower()
-                )
-
-                if is_water:
-                    model_grazing = np.clip(
-                        geometric_grazing, np.radians(0.1), np.radians(60.0)
-                    )
-                    sigma_h_db = ClutterModel.sea_clutter_sigma0(
-                        model_grazing,
-                        sea_state=self.sea_state,
-                        frequency_ghz=freq_ghz,
-                        polarization="HH",
-                    )
-                    sigma_v_db = ClutterModel.sea_clutter_sigma0(
-                        model_grazing,
-                        sea_state=self.sea_state,
-                        frequency_ghz=freq_ghz,
-                        polarization="VV",
-                    )
-                    surface_clutter_model = "nrl_five_parameter"
-                elif self.ground_model == "oh1992":
-                    model_grazing = geometric_grazing
-                    sigma_h_db = ClutterModel.bare_soil_oh1992_sigma0(
-                        model_grazing,
-                        freq_ghz,
-                        self.ground_relative_permittivity,
-                        self.ground_rms_height_m,
-                        "HH",
-                    )
-                    sigma_v_db = ClutterModel.bare_soil_oh1992_sigma0(
-                        model_grazing,
-                        freq_ghz,
-                        self.ground_relative_permittivity,
-                        self.ground_rms_height_m,
-                        "VV",
-                    )
-                    surface_clutter_model = "oh1992_bare_soil"
-                else:
-                    model_grazing = max(geometric_grazing, np.radians(0.1))
-                    sigma_h_db = ClutterModel.ground_clutter_sigma0(
-                        model_grazing,
-                        terrain_type=self.terrain_type,
-                        frequency_ghz=freq_ghz,
-                        polarization="HH",
-                        gamma_db=self.land_gamma_db,
-                    )
-                    sigma_v_db = sigma_h_db
-                    surface_clutter_model = "constant_gamma"
+                (
+                    sigma_h_db,
+                    sigma_v_db,
+                    model_grazing,
+                    surface_clutter_model,
+                ) = self._surface_sigma0_db(geometric_grazing)
 
                 tilt = np.radians(self.radar.polarization_tilt_deg)
                 sigma0_linear = (
@@ -1007,7 +1474,7 @@ class SimulationEngine:
             if self.rain_rate_mm_hr > 0 and CLUTTER_AVAILABLE and geom["range_m"] > 100:
                 try:
                     freq_ghz = self.radar.frequency_hz / 1e9
-                    beamwidth_rad = np.radians(self.radar.beamwidth_deg)
+                    beamwidth_rad = self.radar.beamwidth_rad
 
                     eta = ClutterModel.rain_reflectivity_marshall_palmer(
                         self.rain_rate_mm_hr, freq_ghz
@@ -1115,23 +1582,35 @@ class SimulationEngine:
             self.state.snr_values[target.target_id] = snr_db
 
             # 3. Generate ECM false targets for jammer-equipped targets
-            # ═══ THROTTLE: Only generate new targets once per second ═══
             if self.ecm_active and target.jammer_active:
-                # Check if enough time has passed since last generation
-                time_since_activation = self.current_time - self.ecm_activation_time
-                # Generate only at 1 Hz rate (once per second)
-                should_generate = int(time_since_activation) != int(
-                    time_since_activation - dt
-                )
-                if should_generate or len(self.false_targets) == 0:
-                    new_false_targets = self.generate_ecm_false_targets(target)
-                    self.false_targets.extend(new_false_targets)
+                self._spawn_false_targets(target, dt)
+
+        # 4. Update and clean up false targets
+        self._advance_false_targets(dt)
+
+        # 5. Pulse-Doppler processing
+        # Generate Range-Doppler map when enabled
+        self._run_pulse_doppler()
+
+        return results
 
+    def _spawn_false_targets(self, target: Target, dt: float) -> None:
+        """Generate ECM false targets for a jamming target, throttled to 1 Hz."""
+        # ═══ THROTTLE: Only generate new targets once per second ═══
+        time_since_activation = self.current_time - self.ecm_activation_time
+        should_generate = int(time_since_activation) != int(
+            time_since_activation - dt
+        )
+        if should_generate or len(self.false_targets) == 0:
+            new_false_targets = self.generate_ecm_false_targets(target)
+            self.false_targets.extend(new_false_targets)
+
+    def _advance_false_targets(self, dt: float) -> None:
+        """Enforce the false-target cap, then move and expire false targets."""
         # ═══ PERFORMANCE: Enforce FIFO cap on false targets ═══
         while len(self.false_targets) > self.MAX_FALSE_TARGETS:
             self.false_targets.pop(0)  # Remove oldest (FIFO)
 
-        # 4. Update and clean up false targets
         active_false_targets = []
         for ft in self.false_targets:
             if not ft.is_expired(self.current_time):
@@ -1140,11 +1619,335 @@ class SimulationEngine:
                 active_false_targets.append(ft)
         self.false_targets = active_false_targets
 
-        # 5. Pulse-Doppler processing
-        # Generate Range-Doppler map when enabled
+    def step_batch(self, dt: float = None) -> DetectionBlock:
+        """
+        Advance simulation by one time step with a vectorized target pass.
+
+        Target kinematics live in a structure-of-arrays ``TargetArrays``
+        view, and geometry, RCS fluctuation, propagation loss, SNR, clutter,
+        receiver limiting, Pd and the detection draw are evaluated for all
+        targets in array operations. Physics and statistics match ``step``;
+        random draws come from the same global generator but in a different
+        order, so individual outcomes are not bit-identical.
+
+        Terrain line-of-sight, sea and Oh-1992 surface models, and noise
+        jamming are still evaluated per affected target.
+
+        Args:
+            dt: Time step [s] (uses default if None)
+
+        Returns:
+            DetectionBlock with one row per target
+        """
+        if dt is None:
+            dt = self.dt
+
+        if self._target_arrays is None or len(self._target_arrays) != len(
+            self.targets
+        ):
+            self._target_arrays = TargetArrays(self.targets)
+        arrays = self._target_arrays
+
+        # 1. Update all object kinematics
+        self.state.time += dt
+        if self.state.radar:
+            self.state.radar.update(dt)
+        arrays.advance(dt)
+        self.current_time = self.state.time
+
+        if self.ecm_active and self.ecm_type in {"drfm", "drfm_repeater"}:
+            for jammer in self._drfm_jammers.values():
+                jammer.step(dt)
+
+        self._frame_count += 1
+
+        # 2. Geometry for all targets
+        n_targets = len(arrays)
+        freq_ghz = self.radar.frequency_hz / 1e9
+        delta = arrays.position - self.radar.position
+        range_m = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        ground_range_m = np.hypot(delta[:, 0], delta[:, 1])
+        azimuth_rad = np.arctan2(delta[:, 1], delta[:, 0])
+        elevation_rad = np.arctan2(delta[:, 2], ground_range_m)
+        elevation_deg = np.degrees(elevation_rad)
+        relative_velocity = arrays.velocity - self.radar.state.velocity
+        has_range = range_m > 1e-6
+        radial_velocity = np.zeros(n_targets)
+        radial_velocity[has_range] = (
+            np.einsum("ij,ij->i", relative_velocity[has_range], delta[has_range])
+            / range_m[has_range]
+        )
+
+        rcs = arrays.generate_rcs(self.radar.position)
+
+        # Propagation loss
+        range_km = range_m / 1000.0
+        atm_loss_db = np.zeros(n_targets)
+        if self.enable_atmospheric:
+            beyond = range_km > 0.1
+            if np.any(beyond):
+                atm_loss_db[beyond] = self._atmosphere_state().total_attenuation(
+                    range_km[beyond], freq_ghz, two_way=True
+                )
+
+        rain_path_db = np.zeros(n_targets)
+        if self.rain_rate_mm_hr > 0.0:
+            rain_path_db = ITU_R_P838.path_attenuation_array(
+                range_km,
+                freq_ghz,
+                self.rain_rate_mm_hr,
+                elevation_deg,
+                polarization_tilt_deg=self.radar.polarization_tilt_deg,
+                two_way=True,
+            )
+        rain_loss_db = np.where(range_m > 100.0, rain_path_db, 0.0)
+        propagation_loss_db = atm_loss_db + rain_loss_db
+
+        # Terrain masking (LOS)
+        terrain_masked = np.zeros(n_targets, dtype=bool)
+        if self.enable_terrain_masking and self.terrain is not None:
+            profile = self._fixed_site_profile()
+            if profile is not None:
+                terrain_masked = ~profile.is_visible(arrays.position)
+            else:
+                radar_pos_3d = np.zeros(3)
+                radar_pos_3d[: len(self.radar.position)] = self.radar.position[:3]
+                is_visible, _, _ = self.terrain.check_line_of_sight_batch(
+                    radar_pos_3d, arrays.position
+                )
+                terrain_masked = ~is_visible
+
+        # 3. Thermal SNR and echo power
+        snr_db = calculate_snr_array(
+            self._radar_params, rcs, range_m, atmospheric_loss_db=propagation_loss_db
+        )
+        signal_input_power_watts = calculate_received_power_array(
+            self._radar_params, rcs, range_m, atmospheric_loss_db=propagation_loss_db
+        )
+        snr_db[terrain_masked] = -100.0
+        has_echo = ~terrain_masked & (rcs > 0.0)
+
+        # Surface clutter
+        clutter_snr_loss_db = np.zeros(n_targets)
+        surface_sigma0_db = np.full(n_targets, np.nan)
+        surface_cell_area_m2 = np.zeros(n_targets)
+        surface_clutter_rcs_m2 = np.zeros(n_targets)
+        surface_clutter_model = np.full(n_targets, "disabled", dtype=object)
+        if self.clutter_enabled and CLUTTER_AVAILABLE:
+            rows = np.flatnonzero(range_m > 100.0)
+            radar_height_m = max(float(self.radar.position[2]), 0.0)
+            geometric_grazing = np.arcsin(
+                np.clip(radar_height_m / range_m[rows], 0.0, 1.0)
+            )
+            is_water = (
+                "sea" in self.terrain_type.lower()
+                or "water" in self.terrain_type.lower()
+            )
+            if not is_water and self.ground_model == "gamma":
+                # sigma0 = gamma * sin(psi); evaluating at psi = pi/2 validates
+                # the terrain type and returns gamma itself.
+                gamma_db = ClutterModel.ground_clutter_sigma0(
+                    np.pi / 2.0,
+                    terrain_type=self.terrain_type,
+                    frequency_ghz=freq_ghz,
+                    gamma_db=self.land_gamma_db,
+                )
+                model_grazing = np.maximum(geometric_grazing, np.radians(0.1))
+                sigma_h_db = gamma_db + 10.0 * np.log10(np.sin(model_grazing))
+                sigma_v_db = sigma_h_db
+                surface_clutter_model[rows] = "constant_gamma"
+            else:
+                sigma_h_db = np.empty(len(rows))
+                sigma_v_db = np.empty(len(rows))
+                model_grazing = np.empty(len(rows))
+                for j, grazing in enumerate(geometric_grazing):
+                    (
+                        sigma_h_db[j],
+                        sigma_v_db[j],
+                        model_grazing[j],
+                        surface_clutter_model[rows[j]],
+                    ) = self._surface_sigma0_db(grazing)
+
+            tilt = np.radians(self.radar.polarization_tilt_deg)
+            sigma0_linear = (
+                10.0 ** (sigma_h_db / 10.0) * np.cos(tilt) ** 2
+                + 10.0 ** (sigma_v_db / 10.0) * np.sin(tilt) ** 2
+            )
+            surface_sigma0_db[rows] = 10.0 * np.log10(sigma0_linear)
+            if len(rows):
+                surface_cell_area_m2[rows] = (
+                    ClutterModel.surface_resolution_cell_area_array(
+                        range_m[rows],
+                        self.radar.pulse_width_s,
+                        self.radar.beamwidth_rad,
+                        self.radar.beamwidth_el_rad,
+                        model_grazing,
+                    )
+                )
+            surface_clutter_rcs_m2[rows] = sigma0_linear * surface_cell_area_m2[rows]
+
+            cluttered = surface_clutter_rcs_m2 > 0.0
+            if np.any(cluttered & (rcs <= 0.0)):
+                raise ValueError("target_rcs_m2 must be positive")
+            thermal_snr_db = snr_db[cluttered]
+            snr_db[cluttered] = -10.0 * np.log10(
+                10.0 ** (-thermal_snr_db / 10.0)
+                + surface_clutter_rcs_m2[cluttered] / rcs[cluttered]
+            )
+            clutter_snr_loss_db[cluttered] = thermal_snr_db - snr_db[cluttered]
+
+        # Noise jamming (only jamming targets are visited)
+        jammer_snr_loss_db = np.zeros(n_targets)
+        jsr_db = np.full(n_targets, np.nan)
+        if self.ecm_active:
+            for i, target in enumerate(arrays.targets):
+                active_ecm_type = (
+                    target.ecm_type if self.ecm_type == "noise" else self.ecm_type
+                )
+                if not target.jammer_active or "noise" not in active_ecm_type:
+                    continue
+                effective_jammer_bandwidth = target.jammer_bandwidth_hz
+                if self.frequency_agility_enabled:
+                    effective_jammer_bandwidth = max(
+                        effective_jammer_bandwidth, 0.1 * self.radar.frequency_hz
+                    )
+                path_loss_db = (
+                    atm_loss_db[i] + rain_path_db[i] + self.radar.system_losses_db
+                )
+                jsr_db[i] = self._ecm_simulator.calculate_jsr(
+                    radar_pos=self.radar.position,
+                    target_pos=arrays.position[i],
+                    jammer_pos=arrays.position[i],
+                    radar_power=self.radar.power_watts,
+                    radar_gain=10.0 ** (self.radar.antenna_gain_db / 10.0),
+                    jammer_power=target.jammer_power_watts,
+                    target_rcs=rcs[i],
+                    radar_bandwidth=self.radar.receiver_bandwidth_hz,
+                    jammer_bandwidth=effective_jammer_bandwidth,
+                    signal_path_loss_db=path_loss_db,
+                    jammer_path_loss_db=0.5 * path_loss_db,
+                )
+                pre_jamming_snr_db = snr_db[i]
+                snr_db[i] = self._ecm_simulator.calculate_sjnr_db(
+                    pre_jamming_snr_db, jsr_db[i]
+                )
+                jammer_snr_loss_db[i] = pre_jamming_snr_db - snr_db[i]
+
+        # Rain volume clutter
+        rain_clutter_loss_db = np.zeros(n_targets)
+        if self.rain_rate_mm_hr > 0 and CLUTTER_AVAILABLE:
+            eta = ClutterModel.rain_reflectivity_marshall_palmer(
+                self.rain_rate_mm_hr, freq_ghz
+            )
+            rain_clutter_rcs = np.where(
+                range_m > 100.0,
+                ClutterModel.volume_clutter_rcs(
+                    eta, range_m, self.radar.beamwidth_rad, self._pulse_width_s
+                ),
+                0.0,
+            )
+            cluttered = rain_clutter_rcs > 0.0
+            if np.any(cluttered & (rcs <= 0.0)):
+                raise ValueError("target_rcs_m2 must be positive")
+            pre_volume_clutter_snr_db = snr_db[cluttered]
+            snr_db[cluttered] = -10.0 * np.log10(
+                10.0 ** (-pre_volume_clutter_snr_db / 10.0)
+                + rain_clutter_rcs[cluttered] / rcs[cluttered]
+            )
+            rain_clutter_loss_db[cluttered] = (
+                pre_volume_clutter_snr_db - snr_db[cluttered]
+            )
+
+        # Receiver hard limiter
+        receiver_input_power_dbm = np.full(n_targets, np.nan)
+        receiver_headroom_db = np.full(n_targets, np.nan)
+        receiver_clipping_loss_db = np.zeros(n_targets)
+        receiver_overloaded = np.zeros(n_targets, dtype=bool)
+        if np.any(has_echo):
+            signal_power = signal_input_power_watts[has_echo]
+            limiter = apply_receiver_hard_limiter_array(
+                signal_power,
+                signal_power / 10.0 ** (snr_db[has_echo] / 10.0),
+                self.receiver_full_scale_power_watts,
+            )
+            snr_db[has_echo] = limiter.sinr_db
+            receiver_input_power_dbm[has_echo] = limiter.input_power_dbm
+            receiver_headroom_db[has_echo] = limiter.headroom_db
+            receiver_clipping_loss_db[has_echo] = limiter.clipping_loss_db
+            receiver_overloaded[has_echo] = limiter.overloaded
+
+        # 4. Probability of detection per Swerling case, then the draw
+        pd = np.empty(n_targets)
+        for swerling_case in np.unique(arrays.swerling_case):
+            rows = arrays.swerling_case == swerling_case
+            pd[rows] = self._calculate_pd(
+                snr_db[rows], SwerlingModel(int(swerling_case))
+            )
+
+        is_detected = np.random.random(n_targets) < pd
+        if self.mti_enabled:
+            is_detected &= np.abs(radial_velocity) >= self.mti_threshold_mps
+
+        measured_range = np.zeros(n_targets)
+        measured_az = np.zeros(n_targets)
+        measured_el = np.zeros(n_targets)
+        n_detected = int(np.count_nonzero(is_detected))
+        if n_detected:
+            measured_range[is_detected] = range_m[is_detected] + np.random.normal(
+                0, self.range_noise_std, n_detected
+            )
+            measured_az[is_detected] = azimuth_rad[is_detected] + np.random.normal(
+                0, self.angle_noise_std, n_detected
+            )
+            measured_el[is_detected] = elevation_rad[is_detected] + np.random.normal(
+                0, self.angle_noise_std, n_detected
+            )
+
+        block = DetectionBlock(
+            time=self.current_time,
+            target_id=arrays.target_ids.copy(),
+            true_range_m=range_m,
+            true_azimuth_rad=azimuth_rad,
+            true_elevation_rad=elevation_rad,
+            true_velocity_mps=radial_velocity,
+            true_rcs_m2=rcs,
+            measured_range_m=measured_range,
+            measured_azimuth_rad=measured_az,
+            measured_elevation_rad=measured_el,
+            snr_db=snr_db,
+            is_detected=is_detected,
+            pd=pd,
+            atmospheric_loss_db=atm_loss_db,
+            rain_attenuation_db=rain_loss_db,
+            surface_clutter_loss_db=clutter_snr_loss_db,
+            surface_sigma0_db=surface_sigma0_db,
+            surface_cell_area_m2=surface_cell_area_m2,
+            surface_clutter_rcs_m2=surface_clutter_rcs_m2,
+            surface_clutter_model=surface_clutter_model,
+            rain_clutter_loss_db=rain_clutter_loss_db,
+            jammer_jsr_db=jsr_db,
+            jammer_loss_db=jammer_snr_loss_db,
+            receiver_input_power_dbm=receiver_input_power_dbm,
+            receiver_headroom_db=receiver_headroom_db,
+            receiver_clipping_loss_db=receiver_clipping_loss_db,
+            receiver_overloaded=receiver_overloaded,
+        )
+        self.log.add_block(block)
+
+        # Update state tracking
+        target_ids = arrays.target_ids.tolist()
+        self.state.detections.update(zip(target_ids, is_detected.tolist()))
+        self.state.snr_values.update(zip(target_ids, snr_db.tolist()))
+
+        # 5. ECM false targets, false-target motion, pulse-Doppler
+        if self.ecm_active:
+            for target in arrays.targets:
+                if target.jammer_active:
+                    self._spawn_false_targets(target, dt)
+        self._advance_false_targets(dt)
         self._run_pulse_doppler()
 
-        return results
+        return block
 
     def run(self, duration_s: float) -> SimulationLog:
         """
@@ -1157,9 +1960,10 @@ class SimulationEngine:
             SimulationLog with all results
         """
         n_steps = int(duration_s / self.dt)
+        step = self.step_batch if self.batch_mode else self.step
 
         for _ in range(n_steps):
-            self.step()
+            step()
 
         return self.log
 
@@ -1169,32 +1973,48 @@ class SimulationEngine:
         self.state = SimulationState(radar=self.radar)
         for target in self.targets:
             self.state.add_target(target)
-        self.log = SimulationLog()
+        self.log = SimulationLog(
+            retention_s=self.log.retention_s, spill_dir=self.log.spill_dir
+        )
 
     def _calculate_pd(
         self,
-        snr_db: float,
+        snr_db,
         swerling_model: SwerlingModel,
         pfa: Optional[float] = None,
-    ) -> float:
+    ):
         """
         Calculate probability of detection for given SNR.
 
         Uses a square-law detector threshold derived from Pfa. Conditional
         integrated target power follows a non-central chi-square distribution;
         Swerling fluctuations are averaged over their RCS distributions.
+        With ``use_pd_table`` the result is interpolated from a cached
+        ``PdTable`` (see its documented error bound).
 
         Args:
-            snr_db: Signal-to-noise ratio [dB]
+            snr_db: Signal-to-noise ratio [dB], scalar or array
             swerling_model: Target fluctuation model
             pfa: Probability of false alarm
 
         Returns:
-            Probability of detection (0-1)
+            Probability of detection (0-1), matching the shape of snr_db
         """
+        pfa = self.probability_false_alarm if pfa is None else pfa
+        if self.use_pd_table:
+            return get_pd_table(pfa, swerling_model.value, self.pulses_integrated)(
+                snr_db
+            )
+        if np.ndim(snr_db):
+            return calculate_pd_swerling_array(
+                snr_db,
+                pfa=pfa,
+                swerling_case=swerling_model.value,
+                n_pulses=self.pulses_integrated,
+            )
         return calculate_pd_swerling(
             snr_db,
-            pfa=self.probability_false_alarm if pfa is None else pfa,
+            pfa=pfa,
             swerling_case=swerling_model.value,
             n_pulses=self.pulses_integrated,
         )
@@ -23,7 +23,7 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 
 # Import physics without GUI dependencies
-from src.physics import ITU_R_P676, RadarParameters, calculate_snr
+from src.physics import AtmosphereState, RadarParameters, calculate_snr
 
 
 @dataclass
@@ -147,9 +147,8 @@ class HeadlessRunner:
         self.current_time = 0.0
         self.target_range = config.target_range_m
 
-        # Results accumulators
+        # Results accumulators (one SNR per time step)
         self._snr_values: List[float] = []
-        self._detections: List[bool] = []
 
     def run(self) -> SimulationResult:
         """
@@ -164,11 +163,11 @@ class HeadlessRunner:
         self.current_time = 0.0
         self.target_range = self.config.target_range_m
         self._snr_values = []
-        self._detections = []
 
         # Time loop
         n_steps = int(self.config.duration_s / self.config.dt_s)
-        pulses_per_step = int(self.config.prf_hz * self.config.dt_s)
+        atmosphere = AtmosphereState() if self.config.enable_atmospheric else None
+        freq_ghz = self.config.frequency_hz / 1e9
 
         for step in range(n_steps):
             self.current_time = step * self.config.dt_s
@@ -183,10 +182,9 @@ class HeadlessRunner:
 
             # Calculate atmospheric loss if enabled
             atm_loss_db = 0.0
-            if self.config.enable_atmospheric:
-                freq_ghz = self.config.frequency_hz / 1e9
+            if atmosphere is not None:
                 range_km = self.target_range / 1000
-                atm_loss_db = ITU_R_P676.total_attenuation(
+                atm_loss_db = atmosphere.total_attenuation(
                     range_km, freq_ghz, two_way=True
                 )
 
@@ -201,11 +199,8 @@ class HeadlessRunner:
             # Add noise fluctuation (Swerling-like)
             snr_db += np.random.normal(0, 1.5)
 
-            # Process pulses
-            for _ in range(max(1, pulses_per_step)):
-                self._snr_values.append(snr_db)
-                detected = snr_db > self.config.detection_threshold_db
-                self._detections.append(detected)
+            # Every pulse of a step sees the same SNR: record it once per step
+            self._snr_values.append(snr_db)
 
         # Calculate runtime
         runtime = time.perf_counter() - start_time
@@ -220,10 +215,16 @@ class HeadlessRunner:
 
     def _build_result(self, runtime: float) -> SimulationResult:
         """Build simulation result from accumulated data."""
-        n_pulses = len(self._detections)
-        n_detections = sum(self._detections)
+        pulses_per_step = max(1, int(self.config.prf_hz * self.config.dt_s))
+        snr_steps = np.array(self._snr_values)
+        n_pulses = len(snr_steps) * pulses_per_step
+        n_detections = (
+            int(np.count_nonzero(snr_steps > self.config.detection_threshold_db))
+            * pulses_per_step
+        )
 
-        snr_array = np.array(self._snr_values) if self._snr_values else np.array([0])
+        snr_array = snr_steps if len(snr_steps) else np.array([0])
+        history_steps = -(-100 // pulses_per_step)  # Steps covering the first 100 pulses
 
         return SimulationResult(
             config=self.config,
@@ -234,13 +235,13 @@ class HeadlessRunner:
             min_snr_db=float(np.min(snr_array)),
             max_snr_db=float(np.max(snr_array)),
             runtime_s=runtime,
-            snr_history=self._snr_values[:100],  # Keep first 100 for debugging
+            # Keep first 100 pulses for debugging
+            snr_history=np.repeat(snr_steps[:history_steps], pulses_per_step)[:100].tolist(),
         )
 
     def _cleanup(self) -> None:
         """Clean up memory after run."""
         self._snr_values = []
-        self._detections = []
         gc.collect()
 
 
@@ -0,0 +1,427 @@
+"""
+Monte Carlo Scenario Batches
+
+Runs full SimulationEngine scenarios (YAML files read by ScenarioLoader)
+many times with independent seeds, in a pool of long-lived worker
+processes, and appends one row of aggregated statistics per run to a
+CSV file or Parquet dataset as runs complete.
+
+Features:
+    - Per-run seeds derived from (base_seed, scenario, run), so a run
+      reproduces regardless of worker or completion order
+    - Workers parse each scenario once and warm the engine's JIT kernels
+      and Pd tables at start-up, not per task
+    - Only a RunStatistics row travels back to the parent per run;
+      detection blocks are reduced inside the worker
+    - Resumable: runs already present in the output are skipped, and
+      failed runs (non-empty ``error``) are retried
+
+Usage:
+    batch = MonteCarloBatch(
+        ["scenarios/f16_vs_sa6.yaml"], n_runs=100, output_path="output/mc.csv"
+    )
+    batch.run()  # Interrupt and call again to resume
+"""
+
+import csv
+import math
+import os
+import time
+import zlib
+from dataclasses import asdict, dataclass, fields
+from multiprocessing import Pool, cpu_count
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class MonteCarloTask:
+    """One seeded run of one scenario file."""
+
+    scenario: str
+    run: int
+    seed: int
+    duration_s: Optional[float] = None
+
+
+@dataclass
+class RunStatistics:
+    """
+    Aggregated results of one Monte Carlo run.
+
+    Attributes:
+        scenario: Scenario file path (as given to the batch)
+        run: Run index within the scenario
+        seed: Global NumPy seed of the run
+        name: Scenario name from the YAML file
+        duration_s: Simulated duration [s]
+        n_steps: Engine steps
+        n_targets: Targets in the scenario
+        n_opportunities: Target-step detection opportunities
+        n_detections: Successful detections
+        detection_ratio: n_detections / n_opportunities
+        mean_pd: Mean modelled probability of detection
+        mean_snr_db: Mean SNR over all opportunities [dB]
+        min_snr_db: Minimum SNR [dB]
+        max_snr_db: Maximum SNR [dB]
+        targets_detected: Targets detected at least once
+        first_detection_s: Time of the first detection [s] (NaN if none)
+        runtime_s: Wall-clock time of the run [s]
+        error: Exception message if the run failed, else empty
+    """
+
+    scenario: str
+    run: int
+    seed: int
+    name: str = ""
+    duration_s: float = 0.0
+    n_steps: int = 0
+    n_targets: int = 0
+    n_opportunities: int = 0
+    n_detections: int = 0
+    detection_ratio: float = 0.0
+    mean_pd: float = math.nan
+    mean_snr_db: float = math.nan
+    min_snr_db: float = math.nan
+    max_snr_db: float = math.nan
+    targets_detected: int = 0
+    first_detection_s: float = math.nan
+    runtime_s: float = 0.0
+    error: str = ""
+
+    @property
+    def key(self) -> Tuple[str, int]:
+        return (self.scenario, self.run)
+
+    def to_dict(self) -> Dict[str, Union[str, int, float]]:
+        """Flat row for CSV/Parquet export."""
+        return asdict(self)
+
+
+_FIELD_TYPES = {field.name: field.type for field in fields(RunStatistics)}
+
+
+def run_seed(base_seed: int, scenario: str, run: int) -> int:
+    """Deterministic 32-bit seed for one run of one scenario."""
+    sequence = np.random.SeedSequence([base_seed, zlib.crc32(scenario.encode()), run])
+    return int(sequence.generate_state(1)[0])
+
+
+# ═══════════════════════════════════════════════════════════════════
+# WORKER SIDE
+# ═══════════════════════════════════════════════════════════════════
+
+# Per-process scenario cache: workers parse each YAML file once
+_LOADERS: Dict[str, object] = {}
+
+
+def _scenario_loader(path: str):
+    loader = _LOADERS.get(path)
+    if loader is None:
+        from src.io.scenario_loader import ScenarioLoader
+
+        loader = _LOADERS[path] = ScenarioLoader(path)
+    return loader
+
+
+def warm_up_worker() -> None:
+    """
+    Compile the engine's JIT kernels and fill its lookup tables.
+
+    Pool initializer: runs once per worker process, so the first task a
+    worker takes is timed like every other one.
+    """
+    from src.simulation.engine import SimulationEngine
+    from src.simulation.objects import Radar, Target
+
+    radar = Radar(radar_id="warmup", position=np.zeros(3))
+    target = Target(
+        target_id=1,
+        position=np.array([20e3, 5e3, 1e3]),
+        velocity=np.array([-200.0, 0.0, 0.0]),
+    )
+    engine = SimulationEngine(radar=radar, targets=[target], batch_mode=True)
+    state = np.random.get_state()
+    engine.run(5 * engine.dt)
+    np.random.set_state(state)
+
+
+def run_task(task: MonteCarloTask) -> RunStatistics:
+    """
+    Run one scenario with its seed and reduce it to RunStatistics.
+
+    Exceptions are caught and reported in ``error`` so that one failing
+    run does not end the batch.
+    """
+    stats = RunStatistics(scenario=task.scenario, run=task.run, seed=task.seed)
+    start_time = time.perf_counter()
+    try:
+        loader = _scenario_loader(task.scenario)
+        config = loader.get_config()
+        np.random.seed(task.seed)
+        engine = loader.create_simulation_engine(
+            batch_mode=True, log_retention_s=1.0  # Blocks are reduced here
+        )
+        duration_s = config.duration_s if task.duration_s is None else task.duration_s
+        n_steps = int(duration_s / engine.dt)
+        n_targets = len(engine.targets)
+
+        n_detections = 0
+        pd_sum = 0.0
+        snr_sum = 0.0
+        snr_min = math.inf
+        snr_max = -math.inf
+        detected = np.zeros(n_targets, dtype=bool)
+        first_detection_s = math.nan
+        for _ in range(n_steps):
+            block = engine.step_batch()
+            hits = block.is_detected
+            count = int(np.count_nonzero(hits))
+            if count and n_detections == 0:
+                first_detection_s = block.time
+            n_detections += count
+            detected |= hits
+            pd_sum += float(block.pd.sum())
+            snr_sum += float(block.snr_db.sum())
+            if n_targets:
+                snr_min = min(snr_min, float(block.snr_db.min()))
+                snr_max = max(snr_max, float(block.snr_db.max()))
+
+        n_opportunities = n_steps * n_targets
+        stats.name = config.name
+        stats.duration_s = n_steps * engine.dt
+        stats.n_steps = n_steps
+        stats.n_targets = n_targets
+        stats.n_opportunities = n_opportunities
+        stats.n_detections = n_detections
+        stats.targets_detected = int(np.count_nonzero(detected))
+        stats.first_detection_s = first_detection_s
+        if n_opportunities:
+            stats.detection_ratio = n_detections / n_opportunities
+            stats.mean_pd = pd_sum / n_opportunities
+            stats.mean_snr_db = snr_sum / n_opportunities
+            stats.min_snr_db = snr_min
+            stats.max_snr_db = snr_max
+    except Exception as e:
+        stats.error = f"{type(e).__name__}: {e}"
+    stats.runtime_s = time.perf_counter() - start_time
+    return stats
+
+
+# ═══════════════════════════════════════════════════════════════════
+# RESULT SINKS
+# ═══════════════════════════════════════════════════════════════════
+
+
+def _parse_row(row: Dict[str, str]) -> RunStatistics:
+    values = {}
+    for name, text in row.items():
+        kind = _FIELD_TYPES.get(name)
+        if kind is not None:
+            values[name] = kind(text) if text or kind is str else kind()
+    return RunStatistics(**values)
+
+
+class _CsvSink:
+    """Appends one flushed CSV row per completed run."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = None
+        self._writer = None
+
+    def read(self) -> List[RunStatistics]:
+        if not self.path.exists():
+            return []
+        with open(self.path, newline="") as f:
+            return [_parse_row(row) for row in csv.DictReader(f)]
+
+    def write(self, stats: RunStatistics) -> None:
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            new_file = not self.path.exists() or self.path.stat().st_size == 0
+            self._file = open(self.path, "a", newline="")
+            self._writer = csv.DictWriter(self._file, fieldnames=list(_FIELD_TYPES))
+            if new_file:
+                self._writer.writeheader()
+        self._writer.writerow(stats.to_dict())
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._writer = None
+
+
+class _ParquetSink:
+    """Parquet dataset directory; each flush of buffered rows adds a part file."""
+
+    def __init__(self, path: Path, flush_every: int):
+        if not PARQUET_AVAILABLE:
+            raise ImportError("Parquet output requires pyarrow: pip install pyarrow")
+        self.path = path
+        self.flush_every = flush_every
+        self._rows: List[Dict] = []
+
+    def read(self) -> List[RunStatistics]:
+        if not any(self.path.glob("part-*.parquet")):
+            return []
+        table = pq.read_table(str(self.path))
+        return [RunStatistics(**row) for row in table.to_pylist()]
+
+    def write(self, stats: RunStatistics) -> None:
+        self._rows.append(stats.to_dict())
+        if len(self._rows) >= self.flush_every:
+            self._flush()
+
+    def close(self) -> None:
+        self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        part = len(list(self.path.glob("part-*.parquet")))
+        # Write then rename, so an interrupted flush never leaves a partial part
+        tmp_path = self.path / f".part-{part:05d}.parquet.tmp"
+        pq.write_table(pa.Table.from_pylist(self._rows), str(tmp_path))
+        os.replace(tmp_path, self.path / f"part-{part:05d}.parquet")
+        self._rows = []
+
+
+# ═══════════════════════════════════════════════════════════════════
+# BATCH
+# ═══════════════════════════════════════════════════════════════════
+
+
+class MonteCarloBatch:
+    """
+    Resumable Monte Carlo sweep over scenario files.
+
+    Output format follows the output path: ``*.csv`` appends rows to a
+    CSV file (flushed per run); ``*.parquet`` writes a Parquet dataset
+    directory of part files, ``flush_every`` rows each (needs pyarrow).
+    """
+
+    def __init__(
+        self,
+        scenarios: Sequence[Union[str, Path]],
+        n_runs: int,
+        output_path: Union[str, Path],
+        base_seed: int = 0,
+        duration_s: Optional[float] = None,
+        n_workers: Optional[int] = None,
+        flush_every: int = 64,
+    ):
+        """
+        Initialize batch.
+
+        Args:
+            scenarios: Scenario YAML files
+            n_runs: Monte Carlo runs per scenario
+            output_path: Result file (.csv) or dataset directory (.parquet)
+            base_seed: Seed from which every run seed is derived
+            duration_s: Simulated duration per run [s] (default: scenario's)
+            n_workers: Worker processes (default: CPU count - 1; 0 runs
+                in the calling process)
+            flush_every: Rows per Parquet part file
+        """
+        if not scenarios:
+            raise ValueError("at least one scenario is required")
+        if n_runs < 1:
+            raise ValueError("n_runs must be at least 1")
+        if duration_s is not None and duration_s <= 0:
+            raise ValueError("duration_s must be positive")
+        if n_workers is not None and n_workers < 0:
+            raise ValueError("n_workers must be non-negative")
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+
+        self.scenarios = [os.path.normpath(str(path)) for path in scenarios]
+        self.n_runs = n_runs
+        self.output_path = Path(output_path)
+        self.base_seed = base_seed
+        self.duration_s = duration_s
+        self.n_workers = max(1, cpu_count() - 1) if n_workers is None else n_workers
+
+        suffix = self.output_path.suffix.lower()
+        if suffix == ".csv":
+            self._sink = _CsvSink(self.output_path)
+        elif suffix == ".parquet":
+            self._sink = _ParquetSink(self.output_path, flush_every)
+        else:
+            raise ValueError("output_path must end in .csv or .parquet")
+
+    def tasks(self) -> List[MonteCarloTask]:
+        """Every run of the sweep, scenario-major."""
+        return [
+            MonteCarloTask(
+                scenario=scenario,
+                run=run,
+                seed=run_seed(self.base_seed, scenario, run),
+                duration_s=self.duration_s,
+            )
+            for scenario in self.scenarios
+            for run in range(self.n_runs)
+        ]
+
+    def results(self) -> List[RunStatistics]:
+        """Rows already in the output (including failed runs)."""
+        return self._sink.read()
+
+    def completed(self) -> Set[Tuple[str, int]]:
+        """(scenario, run) keys of successful runs in the output."""
+        return {stats.key for stats in self.results() if not stats.error}
+
+    def pending(self) -> List[MonteCarloTask]:
+        """Tasks not yet completed successfully."""
+        done = self.completed()
+        return [task for task in self.tasks() if (task.scenario, task.run) not in done]
+
+    def run(
+        self, progress: Optional[Callable[[RunStatistics, int, int], None]] = None
+    ) -> List[RunStatistics]:
+        """
+        Run all pending tasks, appending each result as it completes.
+
+        Args:
+            progress: Called as progress(stats, n_done, n_pending) per run
+
+        Returns:
+            RunStatistics of the runs executed by this call
+        """
+        tasks = self.pending()
+        results: List[RunStatistics] = []
+        if not tasks:
+            return results
+
+        try:
+            if self.n_workers == 0:
+                warm_up_worker()
+                for stats in map(run_task, tasks):
+                    self._collect(stats, results, len(tasks), progress)
+            else:
+                n_workers = min(self.n_workers, len(tasks))
+                with Pool(n_workers, initializer=warm_up_worker) as pool:
+                    for stats in pool.imap_unordered(run_task, tasks):
+                        self._collect(stats, results, len(tasks), progress)
+        finally:
+            self._sink.close()
+        return results
+
+    def _collect(self, stats, results, n_pending, progress) -> None:
+        self._sink.write(stats)
+        results.append(stats)
+        if progress is not None:
+            progress(stats, len(results), n_pending)
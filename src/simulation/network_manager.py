@@ -7,7 +7,7 @@ multiple radar systems in a distributed sensor network.
 Algorithms:
     - Covariance Intersection (CI): Julier & Uhlmann (1997)
     - Strobe Triangulation: Least Squares bearing intersection
-    - Track-to-Track Association: Euclidean gating
+    - Track-to-Track Association: χ² gating, 2-D or joint S-D assignment
     - Latency Model: Configurable FIFO delay (Link-16 simulation)
 
 Architecture:
@@ -25,11 +25,14 @@ References:
 
 import copy
 import heapq
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-from scipy.optimize import linear_sum_assignment, minimize, minimize_scalar
+from scipy.optimize import linear_sum_assignment, minimize
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from scipy.stats import chi2
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -84,6 +87,7 @@ class StrobeReport:
         bearing_rad: Bearing to jammer [rad]
         timestamp: Time of measurement [s]
         jsr_db: Jam-to-signal ratio [dB]
+        bearing_sigma_rad: 1σ bearing accuracy [rad]
     """
 
     node_id: str
@@ -91,6 +95,7 @@ class StrobeReport:
     bearing_rad: float
     timestamp: float
     jsr_db: float = 20.0
+    bearing_sigma_rad: float = float(np.radians(1.0))
 
     def __post_init__(self) -> None:
         self.radar_position = np.asarray(self.radar_position, dtype=np.float64)
@@ -98,6 +103,8 @@ class StrobeReport:
             raise ValueError("radar_position must contain x and y")
         if not np.isfinite(self.bearing_rad) or not np.isfinite(self.timestamp):
             raise ValueError("strobe bearing and timestamp must be finite")
+        if not self.bearing_sigma_rad > 0.0:
+            raise ValueError("bearing_sigma_rad must be positive")
 
 
 @dataclass
@@ -122,6 +129,31 @@ class FusedTrack:
     timestamp: float = 0.0
 
 
+@dataclass
+class JammerFix:
+    """
+    Jammer position from intersecting strobes of several radars.
+
+    Attributes:
+        position: Estimated jammer position [x, y] [m]
+        covariance: 2×2 position covariance [m²]
+        residual_m: RMS distance of the position from the bearing lines [m]
+        gdop: Geometric dilution of precision of the bearing geometry
+        strobes: Strobe reports assigned to this jammer (one per node)
+    """
+
+    position: np.ndarray
+    covariance: np.ndarray
+    residual_m: float
+    gdop: float
+    strobes: List[StrobeReport]
+
+    @property
+    def node_ids(self) -> List[str]:
+        """Radars contributing a strobe."""
+        return [strobe.node_id for strobe in self.strobes]
+
+
 @dataclass
 class RadarNode:
     """
@@ -232,9 +264,24 @@ class CovarianceIntersection:
 
         where ω ∈ [0, 1] minimizes tr(P_fused)
 
-    Reference: Julier & Uhlmann (1997)
+    The weights are found by Newton's method on the probability simplex.
+    tr((Σ ωᵢ·Pᵢ⁻¹)⁻¹) is convex in ω with closed-form derivatives
+
+        ∂f/∂ωᵢ    = -tr(P·Iᵢ·P)
+        ∂²f/∂ωᵢ∂ωⱼ = 2·tr(P·Iᵢ·P·Iⱼ·P)      (Iᵢ = Pᵢ⁻¹, P = P_fused)
+
+    so a handful of equality-constrained Newton steps with an active set
+    for ωᵢ = 0 converge to machine precision. Steps are evaluated for a
+    whole batch of equally sized clusters at once, and warm-started weights
+    from the previous fusion cycle usually converge in one step.
+
+    Reference: Julier & Uhlmann (1997); Boyd & Vandenberghe,
+    "Convex Optimization", 2004, §10.2
     """
 
+    NEWTON_RTOL = 1e-13  # Newton decrement / tr(P_fused) at convergence
+    NEWTON_MAX_ITER = 50
+
     @staticmethod
     def fuse_two(
         x1: np.ndarray,
@@ -256,53 +303,34 @@ class CovarianceIntersection:
 
         Reference: Julier & Uhlmann (1997), Eq. 3-5
         """
-        CovarianceIntersection._validate_estimate(x1, P1)
-        CovarianceIntersection._validate_estimate(x2, P2)
         if x1.shape != x2.shape:
             raise ValueError("CI state dimensions must match")
-        P1_inv = np.linalg.inv(P1)
-        P2_inv = np.linalg.inv(P2)
-
-        def _trace_objective(omega: float) -> float:
-            """Minimize tr(P_fused) over omega."""
-            P_fused_inv = omega * P1_inv + (1 - omega) * P2_inv
-            P_fused = np.linalg.inv(P_fused_inv)
-            return np.trace(P_fused)
-
-        # Optimize omega ∈ [0, 1]
-        result = minimize_scalar(
-            _trace_objective,
-            bounds=(0.0, 1.0),
-            method="bounded",
-            options={"xatol": 1e-12},
+        x_fused, P_fused, weights = CovarianceIntersection.fuse_batch(
+            np.stack([x1, x2])[np.newaxis], np.stack([P1, P2])[np.newaxis]
         )
-        omega = result.x
-
-        # Compute fused estimate
-        P_fused_inv = omega * P1_inv + (1 - omega) * P2_inv
-        P_fused = np.linalg.inv(P_fused_inv)
-        x_fused = P_fused @ (omega * P1_inv @ x1 + (1 - omega) * P2_inv @ x2)
-
-        # Ensure symmetry
-        P_fused = 0.5 * (P_fused + P_fused.T)
-
-        return x_fused, P_fused, omega
+        return x_fused[0], P_fused[0], float(weights[0, 0])
 
     @staticmethod
     def _validate_estimate(state: np.ndarray, covariance: np.ndarray) -> None:
         if state.ndim != 1 or covariance.shape != (state.size, state.size):
             raise ValueError("state and covariance dimensions do not match")
-        if not np.all(np.isfinite(state)) or not np.all(np.isfinite(covariance)):
+        CovarianceIntersection._validate_estimates(state, covariance)
+
+    @staticmethod
+    def _validate_estimates(states: np.ndarray, covariances: np.ndarray) -> None:
+        """Vectorized checks of stacked states [..., n] and covariances [..., n, n]."""
+        if not np.all(np.isfinite(states)) or not np.all(np.isfinite(covariances)):
             raise ValueError("state and covariance must be finite")
-        if not np.allclose(covariance, covariance.T, atol=1e-10):
+        if not np.allclose(covariances, np.swapaxes(covariances, -1, -2), atol=1e-10):
             raise ValueError("covariance must be symmetric")
-        if np.any(np.linalg.eigvalsh(covariance) <= 0.0):
+        if np.any(np.linalg.eigvalsh(covariances) <= 0.0):
             raise ValueError("covariance must be positive definite")
 
     @staticmethod
     def fuse_multiple(
         states: List[np.ndarray],
         covariances: List[np.ndarray],
+        initial_weights: Optional[np.ndarray] = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Fuse N estimates with a jointly optimized covariance-intersection weight vector.
@@ -310,6 +338,7 @@ class CovarianceIntersection:
         Args:
             states: List of state vectors
             covariances: List of covariance matrices
+            initial_weights: Optional starting weights (e.g. the previous cycle's)
 
         Returns:
             (x_fused, P_fused): Fused state and covariance
@@ -322,37 +351,211 @@ class CovarianceIntersection:
             CovarianceIntersection._validate_estimate(states[0], covariances[0])
             return states[0].copy(), covariances[0].copy()
         for state, covariance in zip(states, covariances):
-            CovarianceIntersection._validate_estimate(state, covariance)
-            if state.shape != states[0].shape:
+            if state.shape != states[0].shape or covariance.shape != covariances[0].shape:
                 raise ValueError("all CI state dimensions must match")
+        CovarianceIntersection._validate_estimate(states[0], covariances[0])
 
-        identity = np.eye(states[0].size)
-        information_matrices = [
-            np.linalg.solve(covariance, identity) for covariance in covariances
-        ]
+        x_fused, P_fused, _ = CovarianceIntersection.fuse_batch(
+            np.stack(states)[np.newaxis],
+            np.stack(covariances)[np.newaxis],
+            None if initial_weights is None else np.asarray(initial_weights)[np.newaxis],
+        )
+        return x_fused[0], P_fused[0]
 
-        def objective(weights: np.ndarray) -> float:
-            information = sum(
-                weight * matrix
-                for weight, matrix in zip(weights, information_matrices)
-            )
-            return float(np.trace(np.linalg.solve(information, identity)))
+    @staticmethod
+    def fuse_batch(
+        states: np.ndarray,
+        covariances: np.ndarray,
+        initial_weights: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Fuse K independent clusters of N estimates each in one pass.
 
-        def gradient(weights: np.ndarray) -> np.ndarray:
-            information = sum(
-                weight * matrix
-                for weight, matrix in zip(weights, information_matrices)
+        Args:
+            states: Stacked state vectors [K, N, n]
+            covariances: Stacked covariance matrices [K, N, n, n]
+            initial_weights: Optional starting weights [K, N]; rows that are
+                not on the simplex start from uniform weights
+
+        Returns:
+            (x_fused [K, n], P_fused [K, n, n], weights [K, N])
+        """
+        states = np.asarray(states, dtype=np.float64)
+        covariances = np.asarray(covariances, dtype=np.float64)
+        if states.ndim != 3 or covariances.shape != states.shape + states.shape[-1:]:
+            raise ValueError("state and covariance dimensions do not match")
+        if states.shape[1] == 0:
+            raise ValueError("Need at least one estimate to fuse")
+        CovarianceIntersection._validate_estimates(states, covariances)
+
+        identity = np.eye(states.shape[-1])
+        information = np.linalg.solve(covariances, identity)
+        weights = CovarianceIntersection._optimal_weights(
+            information, np.trace(covariances, axis1=-2, axis2=-1), initial_weights
+        )
+
+        fused_information = np.einsum("kn,knab->kab", weights, information)
+        P_fused = np.linalg.solve(fused_information, identity)
+        information_state = np.einsum("kn,knab,knb->ka", weights, information, states)
+        x_fused = np.einsum("kab,kb->ka", P_fused, information_state)
+        return x_fused, 0.5 * (P_fused + np.swapaxes(P_fused, -1, -2)), weights
+
+    @staticmethod
+    def _trace_objective(information: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """tr((Σ ωᵢ·Iᵢ)⁻¹) per cluster."""
+        fused_information = np.einsum("kn,knab->kab", weights, information)
+        return np.trace(np.linalg.inv(fused_information), axis1=-2, axis2=-1)
+
+    @staticmethod
+    def _optimal_weights(
+        information: np.ndarray,
+        source_traces: np.ndarray,
+        initial_weights: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Trace-minimizing CI weights for each cluster.
+
+        Args:
+            information: Information matrices Iᵢ = Pᵢ⁻¹ [K, N, n, n]
+            source_traces: tr(Pᵢ) per estimate [K, N]
+            initial_weights: Optional starting weights [K, N]
+
+        Returns:
+            Weights on the simplex [K, N]
+        """
+        n_clusters, n_estimates = information.shape[:2]
+        weights = np.full((n_clusters, n_estimates), 1.0 / n_estimates)
+        if initial_weights is not None:
+            initial = np.asarray(initial_weights, dtype=np.float64)
+            usable = (
+                np.all(np.isfinite(initial), axis=1)
+                & np.all(initial >= 0.0, axis=1)
+                & (initial.sum(axis=1) > 0.0)
             )
-            covariance = np.linalg.solve(information, identity)
-            return -np.array(
-                [
-                    np.trace(covariance @ matrix @ covariance)
-                    for matrix in information_matrices
-                ]
+            weights[usable] = initial[usable] / initial[usable].sum(axis=1, keepdims=True)
+        if n_estimates == 1:
+            return weights
+
+        free = weights > 0.0
+        pending = np.arange(n_clusters)
+        for _ in range(CovarianceIntersection.NEWTON_MAX_ITER):
+            if pending.size == 0:
+                break
+            done = CovarianceIntersection._newton_step(information, weights, free, pending)
+            pending = pending[~done]
+
+        for cluster in pending:  # Not converged: polish with SLSQP
+            weights[cluster] = CovarianceIntersection._slsqp_weights(
+                information[cluster], weights[cluster]
             )
 
-        n_estimates = len(states)
-        initial = np.full(n_estimates, 1.0 / n_estimates)
+        # CI can never do worse than the best single estimate
+        objective = CovarianceIntersection._trace_objective(information, weights)
+        best = np.argmin(source_traces, axis=1)
+        worse = ~(objective <= source_traces[np.arange(n_clusters), best] + 1e-8)
+        weights[worse] = 0.0
+        weights[worse, best[worse]] = 1.0
+        return weights
+
+    @staticmethod
+    def _newton_step(
+        information: np.ndarray,
+        weights: np.ndarray,
+        free: np.ndarray,
+        pending: np.ndarray,
+    ) -> np.ndarray:
+        """
+        One active-set Newton step for the pending clusters, in place.
+
+        Args:
+            information: Information matrices [K, N, n, n]
+            weights: Current weights [K, N] (updated)
+            free: Weights not pinned at zero [K, N] (updated)
+            pending: Indices of clusters still iterating
+
+        Returns:
+            Converged flag per pending cluster
+        """
+        info = information[pending]
+        w = weights[pending]
+        active = free[pending]
+        n_pending, n_estimates = w.shape
+
+        P = np.linalg.inv(np.einsum("kn,knab->kab", w, info))
+        PI = np.einsum("kab,knbc->knac", P, info)  # P·Iᵢ
+        PIP = PI @ P[:, np.newaxis]  # P·Iᵢ·P
+        objective = np.trace(P, axis1=-2, axis2=-1)
+        gradient = -np.trace(PIP, axis1=-2, axis2=-1)
+        hessian = 2.0 * np.einsum("kiab,kjba->kij", PIP, np.swapaxes(PI, -1, -2))
+
+        # KKT system of min gᵀd + ½dᵀHd s.t. Σd = 0 and d = 0 off the free set;
+        # the tiny ridge keeps it solvable when estimates coincide.
+        pair = active[:, :, np.newaxis] & active[:, np.newaxis, :]
+        ridge = 1e-12 * np.abs(hessian).max(axis=(1, 2))
+        kkt = np.zeros((n_pending, n_estimates + 1, n_estimates + 1))
+        kkt[:, :n_estimates, :n_estimates] = np.where(pair, hessian, 0.0)
+        diagonal = np.arange(n_estimates)
+        kkt[:, diagonal, diagonal] += np.where(active, ridge[:, np.newaxis], 1.0)
+        kkt[:, :n_estimates, n_estimates] = active
+        kkt[:, n_estimates, :n_estimates] = active
+        rhs = np.zeros((n_pending, n_estimates + 1))
+        rhs[:, :n_estimates] = np.where(active, -gradient, 0.0)
+        solution = np.linalg.solve(kkt, rhs[..., np.newaxis])[..., 0]
+        step = np.where(active, solution[:, :n_estimates], 0.0)
+        multiplier = solution[:, n_estimates]
+
+        decrement = -np.einsum("kn,kn->k", gradient, step)
+        tolerance = CovarianceIntersection.NEWTON_RTOL * objective
+        stationary = decrement <= tolerance
+        # On a stationary face, release the pinned weight whose gradient
+        # most favours moving mass onto it (KKT: gᵢ + μ ≥ 0 off the face)
+        violation = np.where(active, 0.0, gradient + multiplier[:, np.newaxis])
+        release = violation.argmin(axis=1)
+        releasing = stationary & (violation[np.arange(n_pending), release] < -tolerance)
+        active[releasing, release[releasing]] = True
+        done = stationary & ~releasing
+
+        moving = ~stationary
+        if np.any(moving):
+            w_m, step_m, info_m = w[moving], step[moving], info[moving]
+            ratio = np.where(step_m < 0.0, -w_m / np.where(step_m < 0.0, step_m, -1.0), np.inf)
+            alpha = np.minimum(1.0, ratio.min(axis=1))
+            objective_m, slope = objective[moving], -decrement[moving]
+            for _ in range(30):  # Armijo backtracking
+                trial = CovarianceIntersection._trace_objective(
+                    info_m, np.maximum(w_m + alpha[:, np.newaxis] * step_m, 0.0)
+                )
+                rejected = ~(trial <= objective_m + 1e-4 * alpha * slope)
+                if not np.any(rejected):
+                    break
+                alpha = np.where(rejected, 0.5 * alpha, alpha)
+            updated = np.maximum(w_m + alpha[:, np.newaxis] * step_m, 0.0)
+            # Weights that reached the boundary leave the free set
+            blocked = (ratio <= alpha[:, np.newaxis] * (1.0 + 1e-12)) | (updated <= 0.0)
+            updated[blocked] = 0.0
+            w[moving] = updated / updated.sum(axis=1, keepdims=True)
+            active_m = active[moving]
+            active_m[blocked] = False
+            active[moving] = active_m
+
+        weights[pending] = w
+        free[pending] = active
+        return done
+
+    @staticmethod
+    def _slsqp_weights(information: np.ndarray, initial: np.ndarray) -> np.ndarray:
+        """SLSQP solution for one cluster (fallback when Newton does not converge)."""
+        identity = np.eye(information.shape[-1])
+
+        def objective(weights: np.ndarray) -> float:
+            fused = np.einsum("n,nab->ab", weights, information)
+            return float(np.trace(np.linalg.solve(fused, identity)))
+
+        def gradient(weights: np.ndarray) -> np.ndarray:
+            covariance = np.linalg.solve(np.einsum("n,nab->ab", weights, information), identity)
+            return -np.trace(covariance @ information @ covariance, axis1=-2, axis2=-1)
+
+        n_estimates = len(initial)
         result = minimize(
             objective,
             initial,
@@ -362,9 +565,6 @@ class CovarianceIntersection:
             constraints={"type": "eq", "fun": lambda weights: np.sum(weights) - 1.0},
             options={"ftol": 1e-10, "maxiter": 1000},
         )
-        best_index = int(np.argmin([np.trace(value) for value in covariances]))
-        fallback = np.zeros(n_estimates)
-        fallback[best_index] = 1.0
         candidate = np.asarray(result.x, dtype=float)
         if np.all(np.isfinite(candidate)):
             candidate = np.clip(candidate, 0.0, 1.0)
@@ -374,21 +574,10 @@ class CovarianceIntersection:
         if (
             not np.all(np.isfinite(candidate))
             or not np.isclose(candidate.sum(), 1.0, atol=1e-8)
-            or objective(candidate) > objective(fallback) + 1e-8
+            or objective(candidate) > objective(initial) + 1e-8
         ):
-            candidate = fallback
-        weights = candidate
-        fused_information = sum(
-            weight * matrix
-            for weight, matrix in zip(weights, information_matrices)
-        )
-        P_fused = np.linalg.solve(fused_information, identity)
-        information_state = sum(
-            weight * matrix @ state
-            for weight, matrix, state in zip(weights, information_matrices, states)
-        )
-        x_fused = P_fused @ information_state
-        return x_fused, 0.5 * (P_fused + P_fused.T)
+            candidate = initial
+        return candidate
 
     @staticmethod
     def fusion_gain_db(P_fused: np.ndarray, P_best: np.ndarray) -> float:
@@ -529,17 +718,546 @@ class StrobeTriangulator:
         return float(gdop)
 
 
+def _wrap_angle(angle: np.ndarray) -> np.ndarray:
+    """Wrap angles to [-π, π)."""
+    return (angle + np.pi) % (2.0 * np.pi) - np.pi
+
+
+class StrobeIntersector:
+    """
+    Multi-jammer localization from the strobes of a radar network.
+
+    With several jammers every radar reports several strobes, and the
+    bearing lines of two radars cross in N² points of which only N are
+    jammers ("ghosts"). Strobes are therefore first sorted into jammer
+    hypotheses, each holding at most one strobe per radar:
+
+        1. Candidates: crossings of every strobe pair from different
+           radars, in front of both radars and crossing at more than
+           ``min_crossing_angle_rad``.
+        2. Support: a radar supports a candidate when one of its strobes
+           points at it within ``gate_sigma`` bearing sigmas.
+        3. Greedy selection: the candidate supported by most radars
+           (ties: lowest summed squared bearing error) becomes a jammer;
+           its strobes are re-gated at the least-squares position and
+           consumed. Candidates built from a consumed strobe are
+           dropped, which removes the ghosts of that jammer. Selection
+           stops when no candidate reaches ``min_nodes`` radars.
+
+    All hypotheses are then solved together: a weighted pseudo-linear
+    least squares whose per-strobe weight 1/(σᵢ·rᵢ)² is refined from the
+    range to the current estimate, evaluated as stacked 2×2 systems.
+
+    With ``min_nodes = 2`` (two-radar networks) ghosts cannot be told
+    apart from jammers.
+
+    Reference: Poisel (2012), Ch. 3 and 6
+    """
+
+    WLS_ITERATIONS = 3
+    CANDIDATE_BLOCK = 4096  # Candidates scored per array pass
+
+    def __init__(
+        self,
+        gate_sigma: float = 3.0,
+        min_nodes: int = 3,
+        min_crossing_angle_rad: float = float(np.radians(5.0)),
+        max_range_m: float = 500e3,
+    ) -> None:
+        if gate_sigma <= 0.0:
+            raise ValueError("gate_sigma must be positive")
+        if min_nodes < 2:
+            raise ValueError("min_nodes must be at least 2")
+        if not 0.0 <= min_crossing_angle_rad < np.pi / 2:
+            raise ValueError("min_crossing_angle_rad must be in [0, π/2)")
+        if max_range_m <= 0.0:
+            raise ValueError("max_range_m must be positive")
+        self.gate_sigma = gate_sigma
+        self.min_nodes = min_nodes
+        self.min_crossing_angle_rad = min_crossing_angle_rad
+        self.max_range_m = max_range_m
+
+    def locate(
+        self, strobes: List[StrobeReport], min_nodes: Optional[int] = None
+    ) -> List[JammerFix]:
+        """
+        Locate every jammer seen by the strobes.
+
+        Args:
+            strobes: Strobe reports of all radars
+            min_nodes: Override of the radars required per jammer
+
+        Returns:
+            Jammer fixes, strongest support first
+        """
+        min_nodes = self.min_nodes if min_nodes is None else min_nodes
+        if min_nodes < 2:
+            raise ValueError("min_nodes must be at least 2")
+        if len(strobes) < 2:
+            return []
+        origins = np.array([strobe.radar_position for strobe in strobes])
+        bearings = np.array([strobe.bearing_rad for strobe in strobes], dtype=np.float64)
+        sigmas = np.array([strobe.bearing_sigma_rad for strobe in strobes], dtype=np.float64)
+        _, nodes = np.unique([strobe.node_id for strobe in strobes], return_inverse=True)
+
+        hypotheses = self._hypotheses(origins, bearings, sigmas, nodes, min_nodes)
+        if not hypotheses:
+            return []
+        return self._solve(strobes, origins, bearings, sigmas, hypotheses)
+
+    # ═══════════════════════════════════════════════════════════════
+    # HYPOTHESIS GENERATION
+    # ═══════════════════════════════════════════════════════════════
+
+    def _candidates(
+        self, origins: np.ndarray, bearings: np.ndarray, nodes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Crossings of strobe pairs from different radars.
+
+        Returns:
+            (points [C, 2], first strobe [C], second strobe [C])
+        """
+        first, second = np.triu_indices(len(bearings), k=1)
+        keep = nodes[first] != nodes[second]
+        first, second = first[keep], second[keep]
+        u = np.stack([np.cos(bearings), np.sin(bearings)], axis=1)
+        cross = u[first, 0] * u[second, 1] - u[first, 1] * u[second, 0]
+        offset = origins[second] - origins[first]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_first = (offset[:, 0] * u[second, 1] - offset[:, 1] * u[second, 0]) / cross
+            t_second = (offset[:, 0] * u[first, 1] - offset[:, 1] * u[first, 0]) / cross
+        valid = (
+            (np.abs(cross) >= np.sin(self.min_crossing_angle_rad))
+            & (t_first > 0.0)
+            & (t_second > 0.0)
+            & (t_first <= self.max_range_m)
+            & (t_second <= self.max_range_m)
+        )
+        points = origins[first[valid]] + t_first[valid, np.newaxis] * u[first[valid]]
+        return points, first[valid], second[valid]
+
+    def _support(
+        self,
+        points: np.ndarray,
+        origins: np.ndarray,
+        bearings: np.ndarray,
+        sigmas: np.ndarray,
+        nodes: np.ndarray,
+        min_nodes: int,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gated strobes of every radar for every candidate.
+
+        Only the two strobes of each radar adjacent in bearing to the
+        direction of a candidate are scored, found by binary search in
+        the radar's sorted bearings, so the cost grows with candidates ×
+        radars rather than candidates × strobes. The strobes of one
+        radar share its position. Candidates gated by fewer than
+        ``min_nodes`` radars are dropped: support only shrinks as
+        strobes are consumed.
+
+        Returns:
+            (kept candidates [K], strobes [K, radars, 2] best first with
+            -1 outside the gate, squared normalized bearing errors)
+        """
+        wrapped = _wrap_angle(bearings)
+        radars = []
+        for node in range(int(nodes.max()) + 1):
+            members = np.flatnonzero(nodes == node)
+            radars.append(members[np.argsort(wrapped[members], kind="stable")])
+
+        kept, strobe_blocks, error_blocks = [], [], []
+        for start in range(0, len(points), self.CANDIDATE_BLOCK):
+            block = points[start : start + self.CANDIDATE_BLOCK]
+            strobe = np.empty((len(block), len(radars), 2), dtype=np.intp)
+            error = np.empty((len(block), len(radars), 2))
+            for node, members in enumerate(radars):
+                delta = block - origins[members[0]]
+                pointing = np.arctan2(delta[:, 1], delta[:, 0])
+                above = np.searchsorted(wrapped[members], pointing)
+                for side, neighbour in enumerate((above - 1, above)):
+                    strobe[:, node, side] = members[neighbour % len(members)]
+                    error[:, node, side] = (
+                        _wrap_angle(bearings[strobe[:, node, side]] - pointing)
+                        / sigmas[strobe[:, node, side]]
+                    ) ** 2
+            # Best of the two first, then gate
+            swap = error[..., 1] < error[..., 0]
+            strobe = np.stack(
+                [
+                    np.where(swap, strobe[..., 1], strobe[..., 0]),
+                    np.where(swap, strobe[..., 0], strobe[..., 1]),
+                ],
+                axis=-1,
+            )
+            error = np.stack([error.min(axis=-1), error.max(axis=-1)], axis=-1)
+            outside = error > self.gate_sigma**2
+            strobe[outside] = -1
+            error[outside] = np.inf
+            rows = np.flatnonzero(np.sum(strobe[..., 0] >= 0, axis=1) >= min_nodes)
+            kept.append(rows + start)
+            strobe_blocks.append(strobe[rows])
+            error_blocks.append(error[rows])
+        return np.concatenate(kept), np.concatenate(strobe_blocks), np.concatenate(error_blocks)
+
+    def _hypotheses(
+        self,
+        origins: np.ndarray,
+        bearings: np.ndarray,
+        sigmas: np.ndarray,
+        nodes: np.ndarray,
+        min_nodes: int,
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Greedy ghost-resistant grouping of strobes into jammers.
+
+        Returns:
+            (candidate point [2], strobe indices) per jammer
+        """
+        points, first, second = self._candidates(origins, bearings, nodes)
+        if len(points) == 0:
+            return []
+        candidate, strobe, error = self._support(
+            points, origins, bearings, sigmas, nodes, min_nodes
+        )
+
+        # Supporting strobe of every (candidate, radar); falls back to the
+        # second best once the best is consumed. Only entries touched by a
+        # consumed strobe are updated per selection.
+        chosen = strobe[..., 0].copy()
+        chosen_error = np.where(chosen >= 0, error[..., 0], 0.0)
+        fallen_back = np.zeros(chosen.shape, dtype=bool)
+        support = np.sum(chosen >= 0, axis=1)
+        cost = chosen_error.sum(axis=1)
+        alive = np.ones(len(candidate), dtype=bool)
+
+        # Sentinel slot: strobe -1 reads as consumed
+        available = np.ones(len(bearings) + 1, dtype=bool)
+        available[-1] = False
+        hypotheses = []
+        while True:
+            alive &= support >= min_nodes
+            rows = np.flatnonzero(alive)
+            if len(rows) == 0:
+                break
+            if len(rows) < len(alive) // 2:
+                candidate, strobe, error = candidate[rows], strobe[rows], error[rows]
+                chosen, chosen_error = chosen[rows], chosen_error[rows]
+                fallen_back, support, cost = fallen_back[rows], support[rows], cost[rows]
+                alive, rows = alive[rows], np.arange(len(rows))
+            tied = rows[support[rows] == support[rows].max()]
+            best = tied[np.argmin(cost[tied])]
+            members = chosen[best][chosen[best] >= 0]
+            point, members = self._regate(
+                points[candidate[best]], members, origins, bearings, sigmas, nodes, available
+            )
+            available[members] = False
+            hypotheses.append((point, members))
+
+            consumed = np.zeros(len(available), dtype=bool)
+            consumed[members] = True
+            alive &= ~(consumed[first[candidate]] | consumed[second[candidate]])
+            row, node = np.nonzero(consumed[chosen])
+            replacement = strobe[row, node, 1]
+            usable = ~fallen_back[row, node] & available[replacement]
+            replacement_error = np.where(usable, error[row, node, 1], 0.0)
+            np.subtract.at(support, row[~usable], 1)
+            np.add.at(cost, row, replacement_error - chosen_error[row, node])
+            chosen[row, node] = np.where(usable, replacement, -1)
+            chosen_error[row, node] = replacement_error
+            fallen_back[row, node] = True
+        return hypotheses
+
+    def _regate(
+        self,
+        point: np.ndarray,
+        members: np.ndarray,
+        origins: np.ndarray,
+        bearings: np.ndarray,
+        sigmas: np.ndarray,
+        nodes: np.ndarray,
+        available: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Re-select the strobes of a chosen candidate at its refined position.
+
+        The candidate point is the crossing of only two strobes, so the
+        gate around it can miss strobes of the jammer; those would be
+        left over to form ghosts. Gating again at the least-squares
+        position recovers them.
+
+        Returns:
+            (refined point, strobe indices) — the original ones if the
+            refined position gathers fewer radars
+        """
+        index, mask = members[np.newaxis], np.ones((1, len(members)), dtype=bool)
+        refined, _ = self._weighted_least_squares(
+            origins, bearings, sigmas, index, mask, point[np.newaxis]
+        )
+        refined = refined[0]
+        if not np.all(np.isfinite(refined)):
+            return point, members
+
+        candidates = np.flatnonzero(available[:-1])
+        delta = refined - origins[candidates]
+        pointing = np.arctan2(delta[:, 1], delta[:, 0])
+        error = (_wrap_angle(bearings[candidates] - pointing) / sigmas[candidates]) ** 2
+        gated = error <= self.gate_sigma**2
+        candidates, error = candidates[gated], error[gated]
+        order = np.lexsort((error, nodes[candidates]))
+        candidates = candidates[order]
+        first = np.ones(len(candidates), dtype=bool)
+        first[1:] = nodes[candidates[1:]] != nodes[candidates[:-1]]
+        if np.count_nonzero(first) < len(members):
+            return point, members
+        return refined, candidates[first]
+
+    # ═══════════════════════════════════════════════════════════════
+    # BATCHED WEIGHTED LEAST SQUARES
+    # ═══════════════════════════════════════════════════════════════
+
+    def _weighted_least_squares(
+        self,
+        origins: np.ndarray,
+        bearings: np.ndarray,
+        sigmas: np.ndarray,
+        index: np.ndarray,
+        mask: np.ndarray,
+        position: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Iteratively reweighted bearing-line fit of stacked hypotheses.
+
+        Args:
+            index: Strobe indices per hypothesis, padded [H, M]
+            mask: Valid entries of ``index`` [H, M]
+            position: Initial positions [H, 2]
+
+        Returns:
+            (positions [H, 2], covariances [H, 2, 2]); non-finite where
+            the bearing lines are parallel
+        """
+        o, theta, sigma = origins[index], bearings[index], sigmas[index]
+        # Line i: sin θᵢ·x - cos θᵢ·y = sin θᵢ·xᵢ - cos θᵢ·yᵢ
+        normals = np.stack([np.sin(theta), -np.cos(theta)], axis=-1)
+        offsets = np.einsum("hma,hma->hm", normals, o)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for _ in range(self.WLS_ITERATIONS):
+                ranges = np.maximum(np.linalg.norm(position[:, np.newaxis] - o, axis=-1), 1.0)
+                weights = np.where(mask, 1.0 / (sigma * ranges) ** 2, 0.0)
+                covariance = _inverse_2x2(np.einsum("hm,hma,hmb->hab", weights, normals, normals))
+                position = np.einsum(
+                    "hab,hb->ha", covariance, np.einsum("hm,hma,hm->ha", weights, normals, offsets)
+                )
+        return position, covariance
+
+    def _solve(
+        self,
+        strobes: List[StrobeReport],
+        origins: np.ndarray,
+        bearings: np.ndarray,
+        sigmas: np.ndarray,
+        hypotheses: List[Tuple[np.ndarray, np.ndarray]],
+    ) -> List[JammerFix]:
+        """Weighted LS position, covariance, residual and GDOP of every hypothesis."""
+        n_hypotheses = len(hypotheses)
+        width = max(len(members) for _, members in hypotheses)
+        index = np.zeros((n_hypotheses, width), dtype=np.intp)
+        mask = np.zeros((n_hypotheses, width), dtype=bool)
+        for row, (_, members) in enumerate(hypotheses):
+            index[row, : len(members)] = members
+            mask[row, : len(members)] = True
+
+        position, covariance = self._weighted_least_squares(
+            origins,
+            bearings,
+            sigmas,
+            index,
+            mask,
+            np.array([point for point, _ in hypotheses]),
+        )
+
+        o, theta = origins[index], bearings[index]
+        normals = np.stack([np.sin(theta), -np.cos(theta)], axis=-1)
+        offsets = np.einsum("hma,hma->hm", normals, o)
+        with np.errstate(invalid="ignore"):
+            residuals = np.where(mask, np.einsum("hma,ha->hm", normals, position) - offsets, 0.0)
+        rms = np.sqrt(np.sum(residuals**2, axis=1) / mask.sum(axis=1))
+        # GDOP of the bearing geometry, as StrobeTriangulator.gdop()
+        delta = position[:, np.newaxis] - o
+        angles = np.arctan2(delta[..., 1], delta[..., 0])
+        directions = np.stack([np.cos(angles), np.sin(angles)], axis=-1) * mask[..., np.newaxis]
+        geometry = np.einsum("hma,hmb->hab", directions, directions)
+        det = geometry[:, 0, 0] * geometry[:, 1, 1] - geometry[:, 0, 1] ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gdop = np.where(
+                det >= 1e-12, np.sqrt((geometry[:, 0, 0] + geometry[:, 1, 1]) / det), np.inf
+            )
+
+        return [
+            JammerFix(
+                position=position[row],
+                covariance=0.5 * (covariance[row] + covariance[row].T),
+                residual_m=float(rms[row]),
+                gdop=float(gdop[row]),
+                strobes=[strobes[i] for i in members],
+            )
+            for row, (_, members) in enumerate(hypotheses)
+            if np.all(np.isfinite(position[row])) and np.all(np.isfinite(covariance[row]))
+        ]
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # TRACK-TO-TRACK ASSOCIATION
 # ═══════════════════════════════════════════════════════════════════════
 
 
+def _cell_keys(cells: np.ndarray) -> np.ndarray:
+    """Unique int64 key per integer grid cell (|index| < 2³¹)."""
+    return cells[:, 0] * 4_294_967_296 + cells[:, 1]
+
+
+def _grid_pairs(
+    points_a: np.ndarray, points_b: np.ndarray, cell_m: float, self_join: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Candidate pairs of a spatial hash join.
+
+    Points are bucketed on a square grid of side ``cell_m``; every pair
+    closer than ``cell_m`` lies in the same or an adjacent cell, so only
+    the 3×3 neighbourhood of each point in ``points_b`` is searched. A
+    self-join searches half of the neighbourhood and returns each
+    unordered pair once.
+
+    Returns:
+        (rows into points_a, cols into points_b), unordered; row < col
+        for a self-join
+    """
+    cells_a = np.floor(points_a / cell_m).astype(np.int64)
+    cells_b = np.floor(points_b / cell_m).astype(np.int64)
+    order = np.argsort(_cell_keys(cells_a), kind="stable")
+    sorted_keys = _cell_keys(cells_a)[order]
+
+    rows, cols = [], []
+    offsets = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+    if self_join:
+        offsets = [(0, 0), (1, -1), (1, 0), (1, 1), (0, 1)]
+    for offset in offsets:
+        keys = _cell_keys(cells_b + np.array(offset))
+        lo = np.searchsorted(sorted_keys, keys, side="left")
+        counts = np.searchsorted(sorted_keys, keys, side="right") - lo
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        # Expand every [lo, lo + count) range into explicit indices
+        starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        offset_rows = order[starts + np.arange(total)]
+        offset_cols = np.repeat(np.arange(len(points_b)), counts)
+        if self_join:
+            if offset == (0, 0):
+                # Same-cell pairs are found in both orders
+                keep = offset_rows < offset_cols
+                offset_rows, offset_cols = offset_rows[keep], offset_cols[keep]
+            else:
+                offset_rows, offset_cols = (
+                    np.minimum(offset_rows, offset_cols),
+                    np.maximum(offset_rows, offset_cols),
+                )
+        rows.append(offset_rows)
+        cols.append(offset_cols)
+    if not rows:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    return rows, cols
+
+
+def _nis(innovations: np.ndarray, covariances: np.ndarray) -> np.ndarray:
+    """
+    Normalized innovation squared dᵀS⁻¹d of stacked 2-D innovations.
+
+    Uses the closed-form 2×2 inverse; singular S gives NIS = ∞.
+    """
+    d, s = innovations, covariances
+    det = s[:, 0, 0] * s[:, 1, 1] - s[:, 0, 1] * s[:, 1, 0]
+    quadratic = (
+        s[:, 1, 1] * d[:, 0] ** 2
+        - (s[:, 0, 1] + s[:, 1, 0]) * d[:, 0] * d[:, 1]
+        + s[:, 0, 0] * d[:, 1] ** 2
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(det > 0.0, quadratic / det, np.inf)
+
+
+def _inverse_2x2(matrices: np.ndarray) -> np.ndarray:
+    """Closed-form inverse of stacked 2×2 matrices."""
+    det = matrices[:, 0, 0] * matrices[:, 1, 1] - matrices[:, 0, 1] * matrices[:, 1, 0]
+    inverse = np.empty_like(matrices)
+    inverse[:, 0, 0] = matrices[:, 1, 1]
+    inverse[:, 1, 1] = matrices[:, 0, 0]
+    inverse[:, 0, 1] = -matrices[:, 0, 1]
+    inverse[:, 1, 0] = -matrices[:, 1, 0]
+    return inverse / det[:, np.newaxis, np.newaxis]
+
+
+def _assign(
+    rows: np.ndarray, cols: np.ndarray, cost: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sparse 2-D assignment over gated (row, col, cost) edges.
+
+    The bipartite gate graph is split into connected components; an
+    isolated edge is a match as-is and every larger component is solved
+    with linear_sum_assignment. The result equals one dense assignment
+    with forbidden pairs at prohibitive cost.
+
+    Returns:
+        Matched (rows, cols)
+    """
+    if len(rows) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    local_rows, row_ids = np.unique(rows, return_inverse=True)
+    local_cols, col_ids = np.unique(cols, return_inverse=True)
+    graph = coo_matrix(
+        (np.ones(len(rows)), (row_ids, len(local_rows) + col_ids)),
+        shape=(len(local_rows) + len(local_cols),) * 2,
+    )
+    _, labels = connected_components(graph, directed=False)
+    component = labels[row_ids]
+    edges = np.bincount(component)
+    single = edges[component] == 1
+    matched_rows, matched_cols = [rows[single]], [cols[single]]
+
+    order = np.argsort(component, kind="stable")
+    order = order[~single[order]]
+    bounds = np.flatnonzero(np.diff(component[order])) + 1
+    for edge_ids in np.split(order, bounds) if len(order) else ():
+        sub_rows, row_index = np.unique(rows[edge_ids], return_inverse=True)
+        sub_cols, col_index = np.unique(cols[edge_ids], return_inverse=True)
+        matrix = np.full((len(sub_rows), len(sub_cols)), 1e12)
+        matrix[row_index, col_index] = cost[edge_ids]
+        r, c = linear_sum_assignment(matrix)
+        feasible = matrix[r, c] < 1e12
+        matched_rows.append(sub_rows[r[feasible]])
+        matched_cols.append(sub_cols[c[feasible]])
+    return np.concatenate(matched_rows), np.concatenate(matched_cols)
+
+
 class TrackAssociator:
     """
     Track-to-Track Association (T2TA) for multi-radar fusion.
 
     Associates tracks from different radars that correspond to the
-    same physical target using Euclidean distance gating.
+    same physical target. A pair is admissible when the positions lie
+    within ``gate_distance_m`` and the normalized innovation squared
+    passes the χ²(2) gate at ``gate_probability``.
+
+    Candidate pairs come from a spatial grid of side ``gate_distance_m``
+    and their NIS is evaluated as stacked arrays, so the cost grows with
+    the number of nearby pairs rather than with the product of the track
+    list sizes.
 
     Args:
         gate_distance_m: Maximum association distance [m]
@@ -557,6 +1275,68 @@ class TrackAssociator:
         self.gate_distance_m = gate_distance_m
         self.gate_probability = gate_probability
         self.gate_threshold = float(chi2.ppf(gate_probability, df=2))
+        self._spread_gates = np.empty(0)  # _spread_gate() by cluster size, grown on demand
+
+    def gated_pairs(
+        self,
+        positions_a: np.ndarray,
+        covariances_a: np.ndarray,
+        positions_b: Optional[np.ndarray] = None,
+        covariances_b: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        All gated pairs between two sets of 2-D position estimates.
+
+        Args:
+            positions_a: Positions [A, 2] [m]
+            covariances_a: Position covariances [A, 2, 2]
+            positions_b: Positions [B, 2]; None pairs set A with itself
+            covariances_b: Position covariances [B, 2, 2]
+
+        Returns:
+            (rows, cols, nis) of the admissible pairs; for self-pairing
+            each unordered pair appears once with row < col
+        """
+        positions_a = np.asarray(positions_a, dtype=np.float64).reshape(-1, 2)
+        covariances_a = np.asarray(covariances_a, dtype=np.float64).reshape(-1, 2, 2)
+        self_pairs = positions_b is None
+        if self_pairs:
+            positions_b, covariances_b = positions_a, covariances_a
+        else:
+            positions_b = np.asarray(positions_b, dtype=np.float64).reshape(-1, 2)
+            covariances_b = np.asarray(covariances_b, dtype=np.float64).reshape(-1, 2, 2)
+
+        rows, cols = _grid_pairs(positions_a, positions_b, self.gate_distance_m, self_pairs)
+        innovations = positions_a[rows] - positions_b[cols]
+        near = np.einsum("ni,ni->n", innovations, innovations) <= self.gate_distance_m**2
+        rows, cols = rows[near], cols[near]
+        nis = _nis(innovations[near], covariances_a[rows] + covariances_b[cols])
+        gated = nis <= self.gate_threshold
+        rows, cols, nis = rows[gated], cols[gated], nis[gated]
+        order = np.lexsort((cols, rows))
+        return rows[order], cols[order], nis[order]
+
+    def gate(
+        self,
+        positions_a: np.ndarray,
+        covariances_a: np.ndarray,
+        positions_b: np.ndarray,
+        covariances_b: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Association gate of row-aligned track pairs.
+
+        Args:
+            positions_a, positions_b: Positions [N, 2] [m]
+            covariances_a, covariances_b: Position covariances [N, 2, 2] [m²]
+
+        Returns:
+            Boolean mask [N]: pair i passes the distance and NIS gates
+        """
+        innovations = np.reshape(positions_a, (-1, 2)) - np.reshape(positions_b, (-1, 2))
+        S = np.reshape(covariances_a, (-1, 2, 2)) + np.reshape(covariances_b, (-1, 2, 2))
+        near = np.einsum("ni,ni->n", innovations, innovations) <= self.gate_distance_m**2
+        return near & (_nis(innovations, S) <= self.gate_threshold)
 
     def associate(
         self,
@@ -566,7 +1346,7 @@ class TrackAssociator:
         """
         Associate tracks between two radar nodes.
 
-        Uses greedy nearest-neighbor matching with distance gating.
+        Solves the 2-D assignment minimizing total NIS over gated pairs.
 
         Args:
             tracks_a: Tracks from radar A
@@ -578,31 +1358,241 @@ class TrackAssociator:
         if not tracks_a or not tracks_b:
             return []
 
-        cost = np.full((len(tracks_a), len(tracks_b)), np.inf)
-        for row, track_a in enumerate(tracks_a):
-            for col, track_b in enumerate(tracks_b):
-                innovation = track_a.state[:2] - track_b.state[:2]
-                if np.linalg.norm(innovation) > self.gate_distance_m:
-                    continue
-                innovation_covariance = (
-                    track_a.covariance[:2, :2] + track_b.covariance[:2, :2]
-                )
-                nis = float(
-                    innovation
-                    @ np.linalg.solve(innovation_covariance, innovation)
-                )
-                if nis <= self.gate_threshold:
-                    cost[row, col] = nis
+        rows, cols, nis = self.gated_pairs(
+            [track.state[:2] for track in tracks_a],
+            [track.covariance[:2, :2] for track in tracks_a],
+            [track.state[:2] for track in tracks_b],
+            [track.covariance[:2, :2] for track in tracks_b],
+        )
+        rows, cols = _assign(rows, cols, nis)
+        return [(tracks_a[row], tracks_b[col]) for row, col in sorted(zip(rows, cols))]
+
+    def cluster(
+        self,
+        positions: np.ndarray,
+        covariances: np.ndarray,
+        groups: np.ndarray,
+        map_function=map,
+    ) -> np.ndarray:
+        """
+        Joint multi-node (S-D) association of every node's tracks.
+
+        Instead of matching node lists one after another against cluster
+        representatives, all tracks are partitioned at once into clusters
+        holding at most one track per node (group). A cluster is accepted
+        as one target when, around its information-weighted centroid x̄,
+        the summed residual Σ dᵢᵀPᵢ⁻¹dᵢ passes the χ²(2(n-1)) gate and
+        every member passes a χ²(2) gate on its residual covariance
+        Pᵢ - P̄, Bonferroni-corrected for the n members.
+
+        The problem splits into connected components of the cross-node
+        gate graph:
+
+            - a component with one track per node that passes the
+              centroid test is a single cluster;
+            - a component spanning two nodes is an exact 2-D assignment;
+            - other components are solved approximately by greedy
+              merging: linked cluster pairs with disjoint nodes are tried
+              in order of centroid-to-centroid NIS and merged when the
+              merged cluster passes the centroid test, until no pair is
+              left.
+
+        The partition does not depend on the order of nodes or tracks
+        except through exact NIS ties.
+
+        Args:
+            positions: Track positions [M, 2] [m]
+            covariances: Position covariances [M, 2, 2]
+            groups: Source node index per track [M]
+            map_function: map() used to resolve the ambiguous components,
+                e.g. a worker pool's; results must come back in order
+
+        Returns:
+            Cluster label per track [M], labels 0..K-1
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        covariances = np.asarray(covariances, dtype=np.float64).reshape(-1, 2, 2)
+        groups = np.asarray(groups, dtype=np.int64)
+        n_tracks = len(groups)
+        if n_tracks == 0:
+            return np.empty(0, dtype=np.int64)
+        rows, cols, nis = self.gated_pairs(positions, covariances)
+        cross = groups[rows] != groups[cols]
+        rows, cols, nis = rows[cross], cols[cross], nis[cross]
+
+        graph = coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(n_tracks, n_tracks))
+        n_components, components = connected_components(graph, directed=False)
+        sizes = np.bincount(components, minlength=n_components)
+        n_groups = int(groups.max()) + 1
+        distinct = np.bincount(
+            np.unique(components * n_groups + groups) // n_groups, minlength=n_components
+        )
+
+        # Centroid test of every component taken as one cluster
+        information = _inverse_2x2(covariances)
+        information_sum = np.zeros((n_components, 2, 2))
+        np.add.at(information_sum, components, information)
+        state_sum = np.zeros((n_components, 2))
+        np.add.at(state_sum, components, np.einsum("nij,nj->ni", information, positions))
+        centroid_covariance = _inverse_2x2(information_sum)
+        centroid = np.einsum("nij,nj->ni", centroid_covariance, state_sum)
+        residual = positions - centroid[components]
+        member_nis = _nis(residual, covariances - centroid_covariance[components])
+        failed = np.bincount(
+            components[~(member_nis <= self._member_gate(sizes)[components])],
+            minlength=n_components,
+        )
+        spread = np.bincount(
+            components,
+            weights=np.einsum("ni,nij,nj->n", residual, information, residual),
+            minlength=n_components,
+        )
+        consistent = (failed == 0) & (spread <= self._spread_gate(sizes))
+        clean = (distinct == sizes) & (consistent | (sizes == 1))
+
+        labels = components.copy()
+        next_label = n_components
+        ambiguous = np.flatnonzero(~clean)
+        if len(ambiguous):
+            # Tracks (ascending) and edges of each component as contiguous runs
+            edges = np.bincount(components[rows], minlength=n_components)
+            track_order = np.argsort(components, kind="stable")
+            track_ends = np.cumsum(sizes)
+            edge_order = np.argsort(components[rows], kind="stable")
+            edge_ends = np.cumsum(edges)
+            members = [
+                track_order[track_ends[component] - sizes[component] : track_ends[component]]
+                for component in ambiguous
+            ]
+            edge_ids = [
+                edge_order[edge_ends[component] - edges[component] : edge_ends[component]]
+                for component in ambiguous
+            ]
+            resolved = map_function(
+                self._resolve_component,
+                [positions[tracks] for tracks in members],
+                [covariances[tracks] for tracks in members],
+                [groups[tracks] for tracks in members],
+                [np.searchsorted(t, rows[e]) for t, e in zip(members, edge_ids)],
+                [np.searchsorted(t, cols[e]) for t, e in zip(members, edge_ids)],
+                [nis[e] for e in edge_ids],
+            )
+            for tracks, local in zip(members, resolved):
+                labels[tracks] = next_label + local
+                next_label += int(local.max()) + 1
+
+        _, labels = np.unique(labels, return_inverse=True)
+        return labels
+
+    def _member_gate(self, n_members) -> np.ndarray:
+        """χ²(2) residual gate per member, Bonferroni-corrected for n members."""
+        return -2.0 * np.log((1.0 - self.gate_probability) / np.maximum(n_members, 1))
+
+    def _spread_gate(self, n_members) -> np.ndarray:
+        """χ²(2(n-1)) gate of the summed residual Σ dᵢᵀPᵢ⁻¹dᵢ of n members."""
+        n_members = np.asarray(n_members)
+        if n_members.max(initial=0) >= len(self._spread_gates):
+            sizes = np.arange(2 * n_members.max() + 1)
+            self._spread_gates = chi2.ppf(self.gate_probability, df=2 * np.maximum(sizes - 1, 1))
+        return self._spread_gates[n_members]
+
+    def _resolve_component(
+        self,
+        positions: np.ndarray,
+        covariances: np.ndarray,
+        groups: np.ndarray,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        nis: np.ndarray,
+    ) -> np.ndarray:
+        """Local cluster labels for one ambiguous gate-graph component."""
+        k = len(groups)
+        node_ids, node_index = np.unique(groups, return_inverse=True)
+
+        owner = np.arange(k)
+        if len(node_ids) == 2:
+            # Orient every edge from the first node to the second
+            flip = node_index[rows] == 1
+            rows, cols = np.where(flip, cols, rows), np.where(flip, rows, cols)
+            matched_rows, matched_cols = _assign(rows, cols, nis)
+            owner[matched_cols] = matched_rows
+            return np.unique(owner, return_inverse=True)[1]
+
+        track_information = _inverse_2x2(covariances)
+        information = track_information.copy()
+        state = np.einsum("nij,nj->ni", information, positions)
+        centroid, centroid_covariance = positions.copy(), covariances.copy()
+        nodes = np.zeros((k, len(node_ids)), dtype=bool)
+        nodes[np.arange(k), node_index] = True
+        links = np.zeros((k, k), dtype=bool)
+        links[rows, cols] = links[cols, rows] = True
+        cost = np.full((k, k), np.inf)
+        cost[rows, cols] = cost[cols, rows] = nis
+
+        while True:
+            a, b = np.unravel_index(np.argmin(cost), cost.shape)
+            if not np.isfinite(cost[a, b]):
+                break
+            merged_covariance = _inverse_2x2(information[a : a + 1] + information[b : b + 1])[0]
+            merged_centroid = merged_covariance @ (state[a] + state[b])
+            inside = (owner == a) | (owner == b)
+            residual = positions[inside] - merged_centroid
+            member_nis = _nis(residual, covariances[inside] - merged_covariance)
+            spread = np.einsum("ni,nij,nj->", residual, track_information[inside], residual)
+            n_inside = np.count_nonzero(inside)
+            if not (
+                np.all(member_nis <= self._member_gate(n_inside))
+                and spread <= self._spread_gate(n_inside)
+            ):
+                cost[a, b] = cost[b, a] = np.inf
+                continue
+
+            information[a] += information[b]
+            state[a] += state[b]
+            centroid[a], centroid_covariance[a] = merged_centroid, merged_covariance
+            nodes[a] |= nodes[b]
+            links[a] |= links[b]
+            links[:, a] = links[a]
+            links[b] = links[:, b] = False
+            owner[inside] = a
+
+            # Candidates are ranked by centroid distance; the member test decides
+            cost[b] = cost[:, b] = np.inf
+            candidates = np.flatnonzero(links[a] & ~(nodes[:, nodes[a]].any(axis=1)))
+            cost[a] = cost[:, a] = np.inf
+            cost[a, candidates] = cost[candidates, a] = _nis(
+                centroid[candidates] - centroid[a],
+                centroid_covariance[candidates] + centroid_covariance[a],
+            )
+        return np.unique(owner, return_inverse=True)[1]
 
-        if not np.isfinite(cost).any():
+    def associate_global(
+        self, track_lists: List[List[NetworkTrack]]
+    ) -> List[List[NetworkTrack]]:
+        """
+        Joint association of several nodes' track lists (see cluster()).
+
+        Args:
+            track_lists: One track list per node
+
+        Returns:
+            Clusters of associated tracks, each with at most one track per
+            node, ordered by their first track; unmatched tracks form
+            single-track clusters
+        """
+        tracks = [track for track_list in track_lists for track in track_list]
+        if not tracks:
             return []
-        assignment_cost = np.where(np.isfinite(cost), cost, 1e12)
-        rows, columns = linear_sum_assignment(assignment_cost)
-        return [
-            (tracks_a[row], tracks_b[col])
-            for row, col in zip(rows, columns)
-            if np.isfinite(cost[row, col])
-        ]
+        groups = np.repeat(np.arange(len(track_lists)), [len(t) for t in track_lists])
+        labels = self.cluster(
+            [track.state[:2] for track in tracks],
+            [track.covariance[:2, :2] for track in tracks],
+            groups,
+        )
+        clusters: Dict[int, List[NetworkTrack]] = {}
+        for label, track in zip(labels, tracks):
+            clusters.setdefault(int(label), []).append(track)
+        return list(clusters.values())
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -610,6 +1600,123 @@ class TrackAssociator:
 # ═══════════════════════════════════════════════════════════════════════
 
 
+def _propagate_tracks(
+    states: np.ndarray,
+    covariances: np.ndarray,
+    timestamps: np.ndarray,
+    current_time: float,
+    accel_mps2: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Constant-velocity prediction of stacked tracks to ``current_time``.
+
+    Args:
+        states: Track states [T, 4]
+        covariances: Track covariances [T, 4, 4]
+        timestamps: Track times [T] [s]
+        current_time: Prediction time [s]
+        accel_mps2: White acceleration noise σₐ [m/s²]
+
+    Returns:
+        (states [T, 4], covariances [T, 4, 4]) at ``current_time``
+    """
+    dt = current_time - timestamps
+    if np.any(dt < -1e-12):
+        raise ValueError("cannot fuse a track from the future")
+    dt = np.maximum(dt, 0.0)
+
+    states = states.copy()
+    states[:, :2] += states[:, 2:] * dt[:, np.newaxis]
+    F = np.tile(np.eye(4), (len(dt), 1, 1))
+    F[:, 0, 2] = dt
+    F[:, 1, 3] = dt
+    covariances = F @ covariances @ np.swapaxes(F, -1, -2)
+    # Q = G·Gᵀ·σₐ² with G = [[dt²/2, 0], [0, dt²/2], [dt, 0], [0, dt]]
+    q = accel_mps2**2
+    for position, velocity in ((0, 2), (1, 3)):
+        covariances[:, position, position] += 0.25 * dt**4 * q
+        covariances[:, position, velocity] += 0.5 * dt**3 * q
+        covariances[:, velocity, position] += 0.5 * dt**3 * q
+        covariances[:, velocity, velocity] += dt**2 * q
+    return states, covariances
+
+
+@dataclass
+class _FusionCluster:
+    """
+    Source tracks that make up one persistent fused track.
+
+    Attributes:
+        fused_id: Stable fused track identifier
+        members: Source track_id per contributing node
+        weights: CI weights of the last fusion by (node_id, track_id)
+    """
+
+    fused_id: int
+    members: Dict[str, str] = field(default_factory=dict)
+    weights: Dict[Tuple[str, str], float] = field(default_factory=dict)
+
+
+class _NodeTrackTable:
+    """
+    One node's delivered tracks as stacked arrays.
+
+    Propagation to the fusion time is vectorized over the node's tracks
+    and cached until the fusion time changes.
+    """
+
+    def __init__(self, tracks: List[NetworkTrack]) -> None:
+        self.tracks = {track.track_id: track for track in tracks}
+        self.index = {track_id: row for row, track_id in enumerate(self.tracks)}
+        tracks = list(self.tracks.values())
+        self.states = np.array([track.state for track in tracks]).reshape(-1, 4)
+        self.covariances = np.array([track.covariance for track in tracks]).reshape(-1, 4, 4)
+        self.timestamps = np.array([track.timestamp for track in tracks], dtype=np.float64)
+        self._time: Optional[float] = None
+        self._states = self.states
+        self._covariances = self.covariances
+
+    @property
+    def time(self) -> Optional[float]:
+        """Time of the cached propagation (None before the first one)."""
+        return self._time
+
+    def propagated(self, current_time: float, accel_mps2: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Constant-velocity prediction of every track to ``current_time``.
+
+        Returns:
+            (states [T, 4], covariances [T, 4, 4]) at ``current_time``
+        """
+        if self._time != current_time:
+            self.cache(
+                current_time,
+                _propagate_tracks(
+                    self.states, self.covariances, self.timestamps, current_time, accel_mps2
+                ),
+            )
+        return self._states, self._covariances
+
+    def cache(self, current_time: float, propagated: Tuple[np.ndarray, np.ndarray]) -> None:
+        """Store a propagation to ``current_time`` computed elsewhere."""
+        self._time = current_time
+        self._states, self._covariances = propagated
+
+    def network_track(self, track_id: str, current_time: float, accel_mps2: float) -> NetworkTrack:
+        """Track ``track_id`` propagated to ``current_time``."""
+        states, covariances = self.propagated(current_time, accel_mps2)
+        row = self.index[track_id]
+        source = self.tracks[track_id]
+        return NetworkTrack(
+            track_id=track_id,
+            node_id=source.node_id,
+            state=states[row],
+            covariance=covariances[row],
+            timestamp=current_time,
+            snr_db=source.snr_db,
+        )
+
+
 class NetworkManager:
     """
     Multi-Radar Network Manager.
@@ -625,6 +1732,18 @@ class NetworkManager:
         5. Strobe triangulation for jammer localization
         6. Common Tactical Picture (CTP) generation
 
+    With ``n_workers > 0`` the cycle runs sharded on a worker pool: node
+    tracks are propagated per node, dirty clusters are CI-fused in
+    ``n_shards`` spatially contiguous shards (clusters ordered by the
+    square region of ``shard_size_m`` holding their first member), and
+    ambiguous components of the global association are resolved in
+    parallel. Shards do not depend on the pool, so the output is
+    identical for any number of workers. Threads suit most
+    networks since NumPy releases the GIL in its array and LAPACK loops;
+    ``worker_processes=True`` uses processes, at the cost of shipping
+    the stacked arrays to the workers every cycle. Call close() to shut
+    the pool down.
+
     Example:
         >>> nm = NetworkManager(link_delay_ms=100)
         >>> nm.register_node("R1", position_xy=np.array([0, 0]))
@@ -643,6 +1762,11 @@ class NetworkManager:
         process_noise_accel_mps2: float = 5.0,
         association_gate_probability: float = 0.9973,
         max_strobe_age_s: float = 2.0,
+        association_mode: str = "sequential",
+        n_workers: int = 0,
+        worker_processes: bool = False,
+        n_shards: int = 8,
+        shard_size_m: float = 50_000.0,
     ) -> None:
         """
         Initialize network manager.
@@ -650,6 +1774,14 @@ class NetworkManager:
         Args:
             link_delay_ms: Communication delay [ms]
             association_gate_m: Track association gate [m]
+            association_mode: "sequential" re-associates each updated
+                node against the existing clusters; "global" solves the
+                joint multi-node assignment over all tracks whenever a
+                node updates
+            n_workers: Worker pool size for sharded fusion (0 runs serially)
+            worker_processes: Use a process pool instead of threads
+            n_shards: Fusion jobs per cycle when sharded
+            shard_size_m: Side of the square regions ordering the shards [m]
         """
         self.nodes: Dict[str, RadarNode] = {}
         self.latency = LatencyModel(delay_ms=link_delay_ms)
@@ -657,6 +1789,22 @@ class NetworkManager:
             raise ValueError("process_noise_accel_mps2 cannot be negative")
         if max_strobe_age_s <= 0.0:
             raise ValueError("max_strobe_age_s must be positive")
+        if association_mode not in ("sequential", "global"):
+            raise ValueError("association_mode must be 'sequential' or 'global'")
+        if n_workers < 0:
+            raise ValueError("n_workers must be non-negative")
+        if n_shards < 1:
+            raise ValueError("n_shards must be at least 1")
+        if shard_size_m <= 0.0:
+            raise ValueError("shard_size_m must be positive")
+        self.association_mode = association_mode
+        self.n_workers = n_workers
+        self.n_shards = n_shards
+        self.shard_size_m = shard_size_m
+        self._executor: Optional[Executor] = None
+        if n_workers > 0:
+            pool = ProcessPoolExecutor if worker_processes else ThreadPoolExecutor
+            self._executor = pool(max_workers=n_workers)
         self.associator = TrackAssociator(
             gate_distance_m=association_gate_m,
             gate_probability=association_gate_probability,
@@ -665,11 +1813,34 @@ class NetworkManager:
         self.max_strobe_age_s = max_strobe_age_s
         self.ci = CovarianceIntersection()
         self.triangulator = StrobeTriangulator()
+        self.intersector = StrobeIntersector()
 
         self._fused_tracks: List[FusedTrack] = []
         self._jammer_positions: List[Tuple[np.ndarray, float]] = []
+        self._jammer_fixes: List[JammerFix] = []
         self._fused_id_counter = 0
 
+        # Incremental fusion state, kept across fuse() calls
+        self._tables: Dict[str, _NodeTrackTable] = {}
+        self._changed_nodes: set = set()
+        self._clusters: Dict[int, _FusionCluster] = {}
+        self._memberships: Dict[str, Dict[str, int]] = {}  # node -> track -> fused_id
+        self._fused_by_id: Dict[int, FusedTrack] = {}
+        self._fusion_time: Optional[float] = None
+        self._node_ranks: Dict[str, int] = {}  # Registration order, for member ordering
+
+    def close(self) -> None:
+        """Shut down the worker pool of sharded fusion (no-op when serial)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _map(self, function, *iterables) -> list:
+        """map() on the worker pool, results in input order."""
+        if self._executor is None:
+            return list(map(function, *iterables))
+        return list(self._executor.map(function, *iterables))
+
     def register_node(
         self,
         node_id: str,
@@ -692,6 +1863,10 @@ class NetworkManager:
             position_xy=np.asarray(position_xy, dtype=np.float64),
             lat_lon=lat_lon,
         )
+        if node_id in self.nodes:
+            # Re-registration drops the node's tracks
+            self._tables.pop(node_id, None)
+            self._changed_nodes.add(node_id)
         self.nodes[node_id] = node
         return node
 
@@ -750,36 +1925,21 @@ class NetworkManager:
                 continue
             if message["type"] == "tracks":
                 node.tracks = message["tracks"]
+                self._tables[node.node_id] = _NodeTrackTable(node.tracks)
+                self._changed_nodes.add(node.node_id)
             elif message["type"] == "strobes":
                 node.strobes = message["strobes"]
 
-    def _propagate_track(self, track: NetworkTrack, current_time: float) -> NetworkTrack:
-        dt = current_time - track.timestamp
-        if dt < -1e-12:
-            raise ValueError("cannot fuse a track from the future")
-        if dt <= 0.0:
-            return copy.deepcopy(track)
-        F = np.array(
-            [[1.0, 0.0, dt, 0.0], [0.0, 1.0, 0.0, dt], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]
-        )
-        dt2 = dt * dt
-        G = np.array(
-            [[dt2 / 2.0, 0.0], [0.0, dt2 / 2.0], [dt, 0.0], [0.0, dt]]
-        )
-        Q = G @ G.T * self.process_noise_accel_mps2**2
-        return NetworkTrack(
-            track_id=track.track_id,
-            node_id=track.node_id,
-            state=F @ track.state,
-            covariance=F @ track.covariance @ F.T + Q,
-            timestamp=current_time,
-            snr_db=track.snr_db,
-        )
-
     def fuse(self, current_time: float) -> List[FusedTrack]:
         """
         Execute fusion cycle: process delayed data, associate, fuse.
 
+        Fusion is incremental: clusters persist across cycles and keep
+        their fused_id. Only tracks of nodes that delivered a new track
+        message are re-associated, each first checked against the cluster
+        it belonged to before. Clusters are re-fused when their members
+        changed or the fusion time moved.
+
         Args:
             current_time: Current simulation time [s]
 
@@ -787,77 +1947,350 @@ class NetworkManager:
             List of fused tracks (Common Tactical Picture)
         """
         self._process_ready_messages(current_time)
+        self._propagate_tables(current_time)
+
+        dirty = set()
+        changed = [node_id for node_id in self.nodes if node_id in self._changed_nodes]
+        self._changed_nodes.clear()
+        if self.association_mode == "global":
+            if changed:
+                dirty = self._reassociate_all(current_time)
+        else:
+            # Representatives must exist in the current tables
+            dirty = self._drop_stale_members(changed)
+            for node_id in changed:
+                dirty |= self._reassociate(node_id, current_time)
+
+        if current_time != self._fusion_time:
+            dirty = set(self._clusters)
+            self._fusion_time = current_time
+        for fused_id in list(self._fused_by_id):
+            if fused_id not in self._clusters:
+                del self._fused_by_id[fused_id]
+        self._fuse_clusters(sorted(dirty & self._clusters.keys()), current_time)
+
+        self._fused_tracks = [self._fused_by_id[fused_id] for fused_id in sorted(self._clusters)]
+        return self._fused_tracks
+
+    def _propagate_tables(self, current_time: float) -> None:
+        """Propagate every node's tracks to ``current_time``, one job per node."""
+        stale = [table for table in self._tables.values() if table.time != current_time]
+        if self._executor is None or len(stale) < 2:
+            for table in stale:
+                table.propagated(current_time, self.process_noise_accel_mps2)
+            return
+        results = self._map(
+            _propagate_tracks,
+            [table.states for table in stale],
+            [table.covariances for table in stale],
+            [table.timestamps for table in stale],
+            [current_time] * len(stale),
+            [self.process_noise_accel_mps2] * len(stale),
+        )
+        for table, propagated in zip(stale, results):
+            table.cache(current_time, propagated)
+
+    def _node_rank(self, node_id: str) -> int:
+        if len(self._node_ranks) != len(self.nodes):
+            self._node_ranks = {node: rank for rank, node in enumerate(self.nodes)}
+        return self._node_ranks.get(node_id, len(self.nodes))
+
+    def _ordered_members(self, cluster: _FusionCluster) -> List[Tuple[str, str]]:
+        """(node_id, track_id) members in node registration order."""
+        return sorted(cluster.members.items(), key=lambda member: self._node_rank(member[0]))
+
+    def _representative(self, cluster: _FusionCluster, current_time: float) -> NetworkTrack:
+        """Association representative: the member of the earliest registered node."""
+        node_id, track_id = self._ordered_members(cluster)[0]
+        return self._tables[node_id].network_track(
+            track_id, current_time, self.process_noise_accel_mps2
+        )
 
-        # Collect all tracks from all nodes
-        all_node_tracks: Dict[str, List[NetworkTrack]] = {}
-        for node_id, node in self.nodes.items():
-            if node.tracks:
-                all_node_tracks[node_id] = [
-                    self._propagate_track(track, current_time) for track in node.tracks
-                ]
-
-        # Pairwise association and fusion
-        node_ids = list(all_node_tracks.keys())
-        self._fused_tracks = []
-
-        if len(node_ids) < 2:
-            # Single radar — pass through as "fused"
-            for nid in node_ids:
-                for trk in all_node_tracks[nid]:
-                    self._fused_id_counter += 1
-                    self._fused_tracks.append(
-                        FusedTrack(
-                            fused_id=self._fused_id_counter,
-                            state=trk.state.copy(),
-                            covariance=trk.covariance.copy(),
-                            source_nodes=[nid],
-                            fusion_gain_db=0.0,
-                            timestamp=current_time,
-                        )
-                    )
-            return self._fused_tracks
-
-        clusters: List[List[NetworkTrack]] = [
-            [track] for track in all_node_tracks[node_ids[0]]
+    def _representative_row(
+        self, cluster: _FusionCluster, current_time: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Propagated (state, covariance) of the cluster's representative."""
+        node_id, track_id = self._ordered_members(cluster)[0]
+        table = self._tables[node_id]
+        states, covariances = table.propagated(current_time, self.process_noise_accel_mps2)
+        row = table.index[track_id]
+        return states[row], covariances[row]
+
+    def _new_cluster(self, fused_id: Optional[int] = None) -> _FusionCluster:
+        if fused_id is None:
+            self._fused_id_counter += 1
+            fused_id = self._fused_id_counter
+        cluster = _FusionCluster(fused_id=fused_id)
+        self._clusters[fused_id] = cluster
+        return cluster
+
+    def _join(self, cluster: _FusionCluster, node_id: str, track_id: str) -> None:
+        cluster.members[node_id] = track_id
+        self._memberships.setdefault(node_id, {})[track_id] = cluster.fused_id
+
+    def _drop_stale_members(self, node_ids: List[str]) -> set:
+        """
+        Remove tracks the nodes no longer report from their clusters.
+
+        Returns:
+            fused_ids of the clusters whose members changed
+        """
+        touched = set()
+        for node_id in node_ids:
+            table = self._tables.get(node_id)
+            memberships = self._memberships.get(node_id, {})
+            for track_id in [
+                track_id
+                for track_id in memberships
+                if table is None or track_id not in table.index
+            ]:
+                fused_id = memberships.pop(track_id)
+                cluster = self._clusters[fused_id]
+                cluster.members.pop(node_id, None)
+                touched.add(fused_id)
+                if not cluster.members:
+                    del self._clusters[fused_id]
+        return touched
+
+    def _reassociate(self, node_id: str, current_time: float) -> set:
+        """
+        Re-place a node's tracks after it delivered a new track list.
+
+        A track stays in its previous cluster if that cluster still has
+        other members and the track passes the association gate against
+        the cluster's representative. The remaining tracks are associated
+        against every cluster without a member from this node; unmatched
+        tracks keep their previous fused_id if their cluster emptied,
+        otherwise they start a new cluster.
+
+        Returns:
+            fused_ids of the clusters whose members changed
+        """
+        previous = self._memberships.pop(node_id, {})
+        touched = set(previous.values())
+        for fused_id in touched:
+            self._clusters[fused_id].members.pop(node_id, None)
+
+        table = self._tables.get(node_id)
+        track_ids = list(table.tracks) if table is not None else []
+        # Gate every track against its previous cluster's representative at once
+        returning = [
+            (track_id, self._clusters[previous[track_id]])
+            for track_id in track_ids
+            if previous.get(track_id) in self._clusters
+            and self._clusters[previous[track_id]].members
+        ]
+        rejoined = set()
+        if returning:
+            states, covariances = table.propagated(current_time, self.process_noise_accel_mps2)
+            rows = [table.index[track_id] for track_id, _ in returning]
+            representatives = [
+                self._representative_row(cluster, current_time) for _, cluster in returning
+            ]
+            passed = self.associator.gate(
+                states[rows, :2],
+                covariances[rows, :2, :2],
+                np.array([state[:2] for state, _ in representatives]),
+                np.array([covariance[:2, :2] for _, covariance in representatives]),
+            )
+            for (track_id, cluster), ok in zip(returning, passed):
+                if ok and node_id not in cluster.members:
+                    self._join(cluster, node_id, track_id)
+                    rejoined.add(track_id)
+        pending = [
+            table.network_track(track_id, current_time, self.process_noise_accel_mps2)
+            for track_id in track_ids
+            if track_id not in rejoined
         ]
-        for node_id in node_ids[1:]:
-            node_tracks = all_node_tracks[node_id]
-            representatives = [cluster[0] for cluster in clusters]
-            matches = self.associator.associate(representatives, node_tracks)
-            cluster_by_representative = {
-                id(representative): index
-                for index, representative in enumerate(representatives)
-            }
-            matched_node_tracks = set()
-            for representative, node_track in matches:
-                clusters[cluster_by_representative[id(representative)]].append(node_track)
-                matched_node_tracks.add(id(node_track))
-            clusters.extend(
-                [track]
-                for track in node_tracks
-                if id(track) not in matched_node_tracks
+
+        # Emptied clusters are retired; their ids are offered back below
+        retired = {fused_id for fused_id in touched if not self._clusters[fused_id].members}
+        for fused_id in retired:
+            del self._clusters[fused_id]
+
+        if pending:
+            candidates = [
+                cluster for cluster in self._clusters.values() if node_id not in cluster.members
+            ]
+            matches = self.associator.associate(
+                [self._representative(cluster, current_time) for cluster in candidates], pending
             )
+            matched = set()
+            for representative, track in matches:
+                fused_id = self._memberships[representative.node_id][representative.track_id]
+                self._join(self._clusters[fused_id], node_id, track.track_id)
+                touched.add(fused_id)
+                matched.add(track.track_id)
+            for track in pending:
+                if track.track_id in matched:
+                    continue
+                fused_id = previous.get(track.track_id)
+                reuse = fused_id in retired and fused_id not in self._clusters
+                cluster = self._new_cluster(fused_id if reuse else None)
+                self._join(cluster, node_id, track.track_id)
+                touched.add(cluster.fused_id)
+        return touched
+
+    def _reassociate_all(self, current_time: float) -> set:
+        """
+        Re-partition every node's tracks with the joint assignment.
 
-        for cluster in clusters:
-            states = [track.state for track in cluster]
-            covs = [track.covariance for track in cluster]
-            x_fused, P_fused = self.ci.fuse_multiple(states, covs)
-            best_covariance = min(covs, key=np.trace)
-            gain = self.ci.fusion_gain_db(P_fused, best_covariance)
+        Each new cluster inherits the previous fused_id held by most of
+        its members; larger overlaps claim their fused_id first and every
+        fused_id is given out once.
 
-            self._fused_id_counter += 1
-            self._fused_tracks.append(
-                FusedTrack(
-                    fused_id=self._fused_id_counter,
-                    state=x_fused,
-                    covariance=P_fused,
-                    source_nodes=[track.node_id for track in cluster],
-                    fusion_gain_db=gain,
+        Returns:
+            fused_ids of the clusters whose members changed
+        """
+        members: List[Tuple[str, str]] = []
+        positions, covariances, groups = [], [], []
+        for group, node_id in enumerate(self.nodes):
+            table = self._tables.get(node_id)
+            if table is None or not table.tracks:
+                continue
+            states, node_covariances = table.propagated(
+                current_time, self.process_noise_accel_mps2
+            )
+            members.extend((node_id, track_id) for track_id in table.tracks)
+            positions.append(states[:, :2])
+            covariances.append(node_covariances[:, :2, :2])
+            groups.append(np.full(len(table.tracks), group))
+
+        previous_clusters, previous_memberships = self._clusters, self._memberships
+        self._clusters, self._memberships = {}, {}
+        if not members:
+            return set()
+        labels = self.associator.cluster(
+            np.concatenate(positions),
+            np.concatenate(covariances),
+            np.concatenate(groups),
+            map_function=self._map if self._executor is not None else map,
+        )
+
+        votes: Dict[Tuple[int, int], int] = {}
+        for label, (node_id, track_id) in zip(labels, members):
+            fused_id = previous_memberships.get(node_id, {}).get(track_id)
+            if fused_id is not None:
+                key = (int(label), fused_id)
+                votes[key] = votes.get(key, 0) + 1
+        fused_ids: Dict[int, int] = {}
+        for (label, fused_id), _ in sorted(votes.items(), key=lambda vote: (-vote[1], vote[0])):
+            if label not in fused_ids and fused_id not in fused_ids.values():
+                fused_ids[label] = fused_id
+
+        dirty = set()
+        for label, (node_id, track_id) in zip(labels, members):
+            fused_id = fused_ids.get(int(label))
+            cluster = self._clusters.get(fused_id)
+            if cluster is None:
+                cluster = self._new_cluster(fused_id)
+                fused_ids[int(label)] = cluster.fused_id
+                if fused_id in previous_clusters:
+                    cluster.weights = previous_clusters[fused_id].weights
+            self._join(cluster, node_id, track_id)
+        for fused_id, cluster in self._clusters.items():
+            previous = previous_clusters.get(fused_id)
+            if previous is None or previous.members != cluster.members:
+                dirty.add(fused_id)
+        return dirty
+
+    def _shards(self, fused_ids: List[int], current_time: float) -> List[List[int]]:
+        """
+        Split clusters into ``n_shards`` contiguous runs in region order.
+
+        Clusters are ordered by the region of their first member, then by
+        fused_id, so every shard covers a compact part of the picture.
+        """
+        keys = []
+        for fused_id in fused_ids:
+            node_id, track_id = self._ordered_members(self._clusters[fused_id])[0]
+            table = self._tables[node_id]
+            states, _ = table.propagated(current_time, self.process_noise_accel_mps2)
+            region = np.floor(states[table.index[track_id], :2] / self.shard_size_m)
+            keys.append((int(region[0]), int(region[1]), fused_id))
+        ordered = [fused_id for *_, fused_id in sorted(keys)]
+        return [
+            shard.tolist()
+            for shard in np.array_split(np.array(ordered, dtype=np.int64), self.n_shards)
+            if len(shard)
+        ]
+
+    def _fuse_clusters(self, fused_ids: List[int], current_time: float) -> None:
+        """
+        CI-fuse the given clusters, batching clusters of equal size.
+
+        Clusters with the same members as in their previous fusion start
+        from that fusion's weights. With a worker pool every (shard,
+        size) batch is one job.
+        """
+        shards = [fused_ids]
+        if self._executor is not None:
+            shards = self._shards(fused_ids, current_time)
+
+        batches = []
+        for shard in shards:
+            by_size: Dict[int, List[_FusionCluster]] = {}
+            for fused_id in shard:
+                cluster = self._clusters[fused_id]
+                by_size.setdefault(len(cluster.members), []).append(cluster)
+            batches.extend(
+                self._fusion_batch(clusters, current_time) for clusters in by_size.values()
+            )
+
+        jobs = [batch for batch in batches if batch[2].shape[1] > 1]
+        results = iter(
+            self._map(
+                self.ci.fuse_batch,
+                [states for _, _, states, _, _ in jobs],
+                [covariances for _, _, _, covariances, _ in jobs],
+                [initial for _, _, _, _, initial in jobs],
+            )
+        )
+        for clusters, members, states, covariances, _ in batches:
+            if states.shape[1] == 1:
+                x_fused, P_fused = states[:, 0], covariances[:, 0]
+                weights = np.ones((len(clusters), 1))
+            else:
+                x_fused, P_fused, weights = next(results)
+
+            source_traces = np.trace(covariances, axis1=-2, axis2=-1)
+            best = covariances[np.arange(len(clusters)), np.argmin(source_traces, axis=1)]
+            for row, (cluster, cluster_members) in enumerate(zip(clusters, members)):
+                cluster.weights = dict(zip(cluster_members, weights[row]))
+                self._fused_by_id[cluster.fused_id] = FusedTrack(
+                    fused_id=cluster.fused_id,
+                    state=x_fused[row].copy(),
+                    covariance=P_fused[row].copy(),
+                    source_nodes=[node_id for node_id, _ in cluster_members],
+                    fusion_gain_db=self.ci.fusion_gain_db(P_fused[row], best[row]),
                     timestamp=current_time,
                 )
-            )
 
-        return self._fused_tracks
+    def _fusion_batch(self, clusters: List[_FusionCluster], current_time: float) -> Tuple:
+        """
+        Stacked inputs of equally sized clusters.
+
+        Returns:
+            (clusters, ordered members, states [K, N, 4],
+            covariances [K, N, 4, 4], initial weights [K, N] with NaN rows
+            for a uniform start)
+        """
+        size = len(clusters[0].members)
+        members = [self._ordered_members(cluster) for cluster in clusters]
+        states = np.empty((len(clusters), size, 4))
+        covariances = np.empty((len(clusters), size, 4, 4))
+        initial = np.full((len(clusters), size), np.nan)
+        for row, (cluster, cluster_members) in enumerate(zip(clusters, members)):
+            for column, (node_id, track_id) in enumerate(cluster_members):
+                table = self._tables[node_id]
+                node_states, node_covariances = table.propagated(
+                    current_time, self.process_noise_accel_mps2
+                )
+                states[row, column] = node_states[table.index[track_id]]
+                covariances[row, column] = node_covariances[table.index[track_id]]
+            if set(cluster.weights) == set(cluster_members):
+                initial[row] = [cluster.weights[member] for member in cluster_members]
+        return clusters, members, states, covariances, initial
 
     def triangulate_jammers(
         self, current_time: float = 0.0
@@ -865,6 +2298,10 @@ class NetworkManager:
         """
         Triangulate jammer positions from all strobe reports.
 
+        Strobes are grouped into jammers by the strobe intersector; each
+        jammer needs strobes from ``intersector.min_nodes`` radars, or
+        from every reporting radar in smaller networks.
+
         Returns:
             List of (position_xy, residual_m) for each jammer
         """
@@ -877,16 +2314,16 @@ class NetworkManager:
                 if 0.0 <= current_time - strobe.timestamp <= self.max_strobe_age_s
             )
 
-        if len(all_strobes) < 2:
+        n_reporting = len({strobe.node_id for strobe in all_strobes})
+        if n_reporting < 2:
+            self._jammer_fixes = []
             self._jammer_positions = []
             return []
 
-        result = self.triangulator.triangulate(all_strobes)
-        if result is not None:
-            self._jammer_positions = [result]
-        else:
-            self._jammer_positions = []
-
+        self._jammer_fixes = self.intersector.locate(
+            all_strobes, min_nodes=min(self.intersector.min_nodes, n_reporting)
+        )
+        self._jammer_positions = [(fix.position, fix.residual_m) for fix in self._jammer_fixes]
         return self._jammer_positions
 
     @property
@@ -899,6 +2336,11 @@ class NetworkManager:
         """Get triangulated jammer positions."""
         return self._jammer_positions
 
+    @property
+    def jammer_fixes(self) -> List[JammerFix]:
+        """Get jammer fixes with covariance, GDOP and contributing strobes."""
+        return self._jammer_fixes
+
     def get_status(self) -> dict:
         """Get network status for UI."""
         return {
@@ -19,7 +19,7 @@ import os
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numba
 import numpy as np
@@ -377,6 +377,123 @@ class Target:
         }
 
 
+_SWERLING_INDEX = {model: model.value for model in SwerlingModel}
+
+
+class TargetArrays:
+    """
+    Structure-of-arrays view of a target population.
+
+    Positions, velocities, accelerations and mean RCS are held in contiguous
+    float64 arrays with one row per target. Binding rebinds each target's
+    ``KinematicState`` vectors to row views of these arrays, so the
+    ``Target`` objects observe every in-place kinematic update without any
+    per-target copying.
+
+    Calling ``Target.update`` on a bound target replaces its state vectors
+    and detaches it; owners should rebuild the arrays after any scalar
+    update.
+    """
+
+    def __init__(self, targets: List["Target"]):
+        """
+        Gather target state into arrays and bind the targets to row views.
+
+        Args:
+            targets: Targets to bind, in simulation order
+        """
+        n_targets = len(targets)
+        self.targets = list(targets)
+        self.target_ids = np.array([t.target_id for t in targets], dtype=np.int64)
+        self.position = np.zeros((n_targets, 3))
+        self.velocity = np.zeros((n_targets, 3))
+        self.acceleration = np.zeros((n_targets, 3))
+        self.rcs_mean = np.array([t.rcs_mean for t in targets], dtype=np.float64)
+        self.swerling_case = np.array(
+            [_SWERLING_INDEX[t.swerling_model] for t in targets], dtype=np.int64
+        )
+        self.moving = np.array(
+            [
+                t.motion_model
+                in (MotionModel.CONSTANT_VELOCITY, MotionModel.CONSTANT_ACCELERATION)
+                for t in targets
+            ],
+            dtype=bool,
+        )
+        self.accelerating = np.array(
+            [t.motion_model == MotionModel.CONSTANT_ACCELERATION for t in targets],
+            dtype=bool,
+        )
+
+        for i, target in enumerate(targets):
+            self.position[i] = target.state.position
+            self.velocity[i] = target.state.velocity
+            self.acceleration[i] = target.state.acceleration
+            target.state.position = self.position[i]
+            target.state.velocity = self.velocity[i]
+            target.state.acceleration = self.acceleration[i]
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def advance(self, dt: float) -> None:
+        """
+        Advance all bound targets by one time step in place.
+
+        Applies the same CV and CA equations as ``Target.update``; static
+        and coordinated-turn targets are left untouched, as in the scalar
+        path. Each target's position history is extended the same way.
+
+        Args:
+            dt: Time step [s]
+        """
+        acc = self.acceleration * self.accelerating[:, np.newaxis]
+        step = self.velocity * dt + 0.5 * acc * (dt * dt)
+        self.position += step * self.moving[:, np.newaxis]
+        self.velocity += acc * dt
+
+        # Rows of one copy; the history must not alias the live arrays
+        positions = self.position.copy()
+        for target, position in zip(self.targets, positions):
+            target._position_history.append(position)
+            if len(target._position_history) > 1000:
+                target._position_history.pop(0)
+
+    @property
+    def heading(self) -> np.ndarray:
+        """Heading angle per target [rad] (0 = North)."""
+        return np.arctan2(self.velocity[:, 1], self.velocity[:, 0])
+
+    def generate_rcs(self, radar_position: np.ndarray) -> np.ndarray:
+        """
+        Draw fluctuated RCS for all targets.
+
+        Vector equivalent of ``Target.get_rcs``: the same aspect factor is
+        applied to the mean RCS before one Swerling draw per target from the
+        global NumPy generator.
+
+        Args:
+            radar_position: Radar position [x, y, z] [m]
+
+        Returns:
+            Fluctuated RCS per target [m²]
+        """
+        delta = np.asarray(radar_position)[np.newaxis, :2] - self.position[:, :2]
+        bearing_to_radar = np.arctan2(delta[:, 1], delta[:, 0])
+        aspect = np.abs(bearing_to_radar - self.heading) % (2 * np.pi)
+        aspect = np.where(aspect > np.pi, 2 * np.pi - aspect, aspect)
+        mean_rcs = self.rcs_mean * (0.5 + 0.5 * np.abs(np.sin(aspect)))
+
+        rcs = mean_rcs.copy()
+        exponential = (self.swerling_case == 1) | (self.swerling_case == 2)
+        chi_square = (self.swerling_case == 3) | (self.swerling_case == 4)
+        if np.any(exponential):
+            rcs[exponential] = np.random.exponential(mean_rcs[exponential])
+        if np.any(chi_square):
+            rcs[chi_square] = np.random.gamma(2, mean_rcs[chi_square] / 2)
+        return np.where(mean_rcs > 0.0, rcs, 0.0)
+
+
 class Radar:
     """
     Radar system with position and orientation.
@@ -8,6 +8,8 @@ Features:
     - Target trajectories with timestamps
     - Detection measurements
     - Automatic filename with timestamp
+    - Optional streaming mode: fixed-size batches appended to chunked,
+      compressed datasets by a background writer thread
 
 Reference: HDF5 Best Practices for Scientific Data
 
@@ -15,15 +17,32 @@ Author: RadarSim Scientific Team
 """
 
 import json
+import queue
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import h5py
 import numpy as np
 
+_COMPRESSION_FILTERS = ("gzip", "lzf", None)
+
+# Streamed dataset layout: path suffix -> (dtype, row shape)
+_TRACK_COLUMNS = {
+    "positions": (np.float64, (4,)),
+    "velocities": (np.float64, (4,)),
+}
+_MEASUREMENT_COLUMNS = {
+    "measurements/time": (np.float64, ()),
+    "measurements/target_id": (np.int64, ()),
+    "measurements/range_m": (np.float64, ()),
+    "measurements/azimuth_rad": (np.float64, ()),
+    "measurements/snr_db": (np.float64, ()),
+    "measurements/detected": (np.bool_, ()),
+}
+
 
 @dataclass
 class RecordingSession:
@@ -52,6 +71,144 @@ class RecordingSession:
         self.timestamps = []
 
 
+class _StagingBuffer:
+    """
+    Fixed-size row buffer for one or more datasets appended together.
+
+    Rows are written into preallocated arrays; a full buffer is drained
+    as one batch of copies, so its memory never grows.
+    """
+
+    def __init__(
+        self, columns: Dict[str, Tuple[Any, Tuple[int, ...]]], batch_size: int
+    ):
+        self.columns = {
+            path: np.empty((batch_size,) + shape, dtype=dtype)
+            for path, (dtype, shape) in columns.items()
+        }
+        self.batch_size = batch_size
+        self.count = 0
+
+    def append(self, row: Sequence) -> bool:
+        """Store one row (one value per column); True once the batch is full."""
+        for column, value in zip(self.columns.values(), row):
+            column[self.count] = value
+        self.count += 1
+        return self.count == self.batch_size
+
+    def extend(self, columns: Sequence[Sequence]) -> List[Dict[str, np.ndarray]]:
+        """Store several rows (one sequence per column); returns batches filled."""
+        n_rows = len(columns[0]) if columns else 0
+        done = 0
+        full = []
+        while done < n_rows:
+            take = min(n_rows - done, self.batch_size - self.count)
+            for column, values in zip(self.columns.values(), columns):
+                column[self.count : self.count + take] = values[done : done + take]
+            self.count += take
+            done += take
+            if self.count == self.batch_size:
+                full.append(self.drain())
+        return full
+
+    def drain(self) -> Dict[str, np.ndarray]:
+        """Copy out the buffered rows and reset."""
+        batch = {path: column[: self.count].copy() for path, column in self.columns.items()}
+        self.count = 0
+        return batch
+
+
+class _HDF5StreamWriter(threading.Thread):
+    """
+    Background thread owning one HDF5 file while a session is streamed.
+
+    Consumes ("attrs", group_path, attrs) and ("append", {dataset_path: rows})
+    items from a bounded queue until a None sentinel, then closes the file.
+    Datasets are created on their first append as resizable along axis 0,
+    chunked one batch per chunk, and compressed. All h5py calls for the
+    file happen on this thread.
+    """
+
+    def __init__(
+        self,
+        filepath: Path,
+        config: Dict[str, Any],
+        created: str,
+        batch_size: int,
+        compression: Optional[str],
+        queue_size: int,
+    ):
+        # Not a daemon: the interpreter waits for a stopped session to be saved
+        super().__init__(name="FlightRecorderWriter")
+        self.filepath = filepath
+        self.config = config
+        self.created = created
+        self.batch_size = batch_size
+        self.compression = compression
+        self.queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.error: Optional[BaseException] = None
+        self._datasets: Dict[str, h5py.Dataset] = {}
+
+    def run(self):
+        done = False
+        try:
+            with h5py.File(self.filepath, "w") as f:
+                _write_config(f, self.config)
+                f.create_group("targets")
+                _write_file_attrs(f, self.created)
+
+                while not done:
+                    item = self.queue.get()
+                    done = item is None
+                    if not done:
+                        self._write(f, item)
+        except Exception as error:
+            self.error = error
+            # Keep consuming so producers blocked on a full queue return
+            while not done:
+                done = self.queue.get() is None
+
+    def _write(self, f: h5py.File, item: Tuple) -> None:
+        if item[0] == "attrs":
+            _, group_path, attrs = item
+            f.require_group(group_path).attrs.update(attrs)
+            return
+
+        for path, rows in item[1].items():
+            dataset = self._datasets.get(path)
+            if dataset is None:
+                row_shape = rows.shape[1:]
+                dataset = f.create_dataset(
+                    path,
+                    shape=(0,) + row_shape,
+                    maxshape=(None,) + row_shape,
+                    dtype=rows.dtype,
+                    chunks=(self.batch_size,) + row_shape,
+                    compression=self.compression,
+                    shuffle=self.compression is not None,
+                )
+                self._datasets[path] = dataset
+            start = dataset.shape[0]
+            dataset.resize(start + len(rows), axis=0)
+            dataset[start:] = rows
+
+
+def _write_config(f: h5py.File, config: Dict[str, Any]) -> None:
+    """Write the /config group (non-scalar values as JSON strings)."""
+    config_group = f.create_group("config")
+    for key, value in config.items():
+        if isinstance(value, (int, float, str, bool)):
+            config_group.attrs[key] = value
+        else:
+            config_group.attrs[key] = json.dumps(value)
+
+
+def _write_file_attrs(f: h5py.File, created: str) -> None:
+    f.attrs["version"] = "1.0"
+    f.attrs["created"] = created
+    f.attrs["software"] = "RadarSim"
+
+
 class FlightRecorder:
     """
     HDF5 Flight Data Recorder.
@@ -77,49 +234,122 @@ class FlightRecorder:
             - detected (array)
 
     Reference: HDF5 for Scientific Data, NSCA
+
+    By default the session is kept in memory and written when recording
+    stops. With ``streaming=True`` the file is created at start and rows
+    are staged in fixed-size batches that a background thread appends to
+    resizable, chunked, compressed datasets through a bounded queue, so
+    memory stays constant (record_state blocks if the writer falls
+    ``queue_size`` batches behind). stop_recording hands the last partial
+    batches to the writer and returns without waiting for it to close the
+    file; wait_for_save() blocks until it has. Both modes produce the same
+    file layout.
     """
 
-    def __init__(self, output_dir: str = "output"):
+    def __init__(
+        self,
+        output_dir: str = "output",
+        streaming: bool = False,
+        batch_size: int = 1024,
+        compression: Optional[str] = "gzip",
+        queue_size: int = 16,
+    ):
         """
         Initialize flight recorder.
 
         Args:
             output_dir: Directory for HDF5 output files
+            streaming: Append batches to the file during recording
+            batch_size: Rows per streamed batch (and per HDF5 chunk)
+            compression: Streamed dataset filter: "gzip", "lzf" or None
+            queue_size: Maximum batches waiting for the writer thread
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        if compression not in _COMPRESSION_FILTERS:
+            raise ValueError(f"compression must be one of {_COMPRESSION_FILTERS}")
+
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        self.streaming = streaming
+        self.batch_size = batch_size
+        self.compression = compression
+        self.queue_size = queue_size
+
         self.session = RecordingSession()
         self.is_recording = False
         self._lock = threading.Lock()
 
+        # Streaming state
+        self._writer: Optional[_HDF5StreamWriter] = None
+        self._closing_writer: Optional[_HDF5StreamWriter] = None
+        self._timestamp_buffer: Optional[_StagingBuffer] = None
+        self._measurement_buffer: Optional[_StagingBuffer] = None
+        self._track_buffers: Dict[int, _StagingBuffer] = {}
+        self._stream_stats = {"duration_s": 0, "num_snapshots": 0, "num_measurements": 0}
+
     def start_recording(self, config: Dict[str, Any]):
         """
         Start a new recording session.
 
+        In streaming mode a session still being recorded is stopped, and
+        the previous session's file is finished, first.
+
         Args:
             config: Radar configuration dictionary
+
+        Raises:
+            RuntimeError: If writing the previous streamed session failed
         """
         with self._lock:
             self.session.clear()
             self.session.config = config.copy()
+            if self.streaming:
+                self._finish_stream()
+                self._wait_for_writer()
+                self._start_stream(self.session.config)
             self.is_recording = True
 
     def stop_recording(self) -> Optional[str]:
         """
         Stop recording and save to HDF5.
 
+        In streaming mode the file may still be closing when this returns;
+        call wait_for_save() before reading it.
+
         Returns:
             Path to saved file, or None if no data
         """
         with self._lock:
             self.is_recording = False
 
+            if self.streaming:
+                return self._finish_stream()
+
             if not self.session.timestamps:
                 return None
 
             return self._save_to_hdf5()
 
+    def wait_for_save(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a stopped streaming session to be fully written.
+
+        Args:
+            timeout: Maximum wait [s], or None to wait indefinitely
+
+        Returns:
+            True if no save is pending any more
+
+        Raises:
+            RuntimeError: If the streaming writer thread failed
+        """
+        with self._lock:
+            return self._wait_for_writer(timeout)
+
     def record_state(self, state: Dict[str, Any]):
         """
         Record a simulation state snapshot.
@@ -134,6 +364,11 @@ class FlightRecorder:
             return
 
         with self._lock:
+            if self.streaming:
+                if self._writer is not None:
+                    self._stream_state(state)
+                return
+
             time = state.get("time", 0.0)
             self.session.timestamps.append(time)
 
@@ -145,11 +380,7 @@ class FlightRecorder:
                     self.session.target_tracks[target_id] = {
                         "positions": [],
                         "velocities": [],
-                        "metadata": {
-                            "type": target.get("type", "unknown"),
-                            "rcs_m2": target.get("rcs_m2", 1.0),
-                            "has_jammer": target.get("has_jammer", False),
-                        },
+                        "metadata": self._target_metadata(target),
                     }
 
                 track = self.session.target_tracks[target_id]
@@ -164,16 +395,140 @@ class FlightRecorder:
 
                 # Record measurement
                 self.session.measurements.append(
-                    {
-                        "time": time,
-                        "target_id": target_id,
-                        "range_m": target.get("range_km", 0) * 1000,
-                        "azimuth_rad": target.get("azimuth_rad", 0),
-                        "snr_db": target.get("snr_db", 0),
-                        "detected": target.get("is_detected", False),
-                    }
+                    self._measurement(time, target_id, target)
                 )
 
+    @staticmethod
+    def _target_metadata(target: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "type": target.get("type", "unknown"),
+            "rcs_m2": target.get("rcs_m2", 1.0),
+            "has_jammer": target.get("has_jammer", False),
+        }
+
+    @staticmethod
+    def _measurement(time: float, target_id: int, target: Dict[str, Any]) -> Dict:
+        # Key order matches _MEASUREMENT_COLUMNS
+        return {
+            "time": time,
+            "target_id": target_id,
+            "range_m": target.get("range_km", 0) * 1000,
+            "azimuth_rad": target.get("azimuth_rad", 0),
+            "snr_db": target.get("snr_db", 0),
+            "detected": target.get("is_detected", False),
+        }
+
+    @staticmethod
+    def _new_filepath(output_dir: Path) -> Tuple[str, Path]:
+        """Timestamp string and session_<timestamp>.h5 path."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return timestamp, output_dir / f"session_{timestamp}.h5"
+
+    # ═══════════════════════════════════════════════════════════════
+    # STREAMING MODE
+    # ═══════════════════════════════════════════════════════════════
+
+    def _start_stream(self, config: Dict[str, Any]) -> None:
+        timestamp, filepath = self._new_filepath(self.output_dir)
+        self._writer = _HDF5StreamWriter(
+            filepath,
+            config,
+            timestamp,
+            self.batch_size,
+            self.compression,
+            self.queue_size,
+        )
+        self._timestamp_buffer = _StagingBuffer(
+            {"timestamps": (np.float64, ())}, self.batch_size
+        )
+        self._measurement_buffer = _StagingBuffer(_MEASUREMENT_COLUMNS, self.batch_size)
+        self._track_buffers = {}
+        self._stream_stats = {"duration_s": 0, "num_snapshots": 0, "num_measurements": 0}
+        self._writer.start()
+
+    def _stream_state(self, state: Dict[str, Any]) -> None:
+        time = state.get("time", 0.0)
+        targets = state.get("targets", [])
+        self._stream_row(self._timestamp_buffer, (time,))
+
+        for target in targets:
+            target_id = target["id"]
+            buffer = self._track_buffers.get(target_id)
+            if buffer is None:
+                group_path = f"targets/{target_id}"
+                buffer = _StagingBuffer(
+                    {f"{group_path}/{name}": spec for name, spec in _TRACK_COLUMNS.items()},
+                    self.batch_size,
+                )
+                self._track_buffers[target_id] = buffer
+                metadata = json.dumps(self._target_metadata(target))
+                self._writer.queue.put(("attrs", group_path, {"metadata": metadata}))
+
+            pos = target.get("position", [0, 0, 0])
+            vel = target.get("velocity", [0, 0, 0])
+            self._stream_row(
+                buffer,
+                ((time, pos[0], pos[1], pos[2]), (time, vel[0], vel[1], vel[2])),
+            )
+
+        # One column-wise block per snapshot instead of a row per target
+        rows = [self._measurement(time, t["id"], t).values() for t in targets]
+        for batch in self._measurement_buffer.extend(list(zip(*rows))):
+            self._writer.queue.put(("append", batch))
+
+        stats = self._stream_stats
+        stats["duration_s"] = time
+        stats["num_snapshots"] += 1
+        stats["num_measurements"] += len(targets)
+
+    def _stream_row(self, buffer: _StagingBuffer, row: Sequence) -> None:
+        if buffer.append(row):
+            self._writer.queue.put(("append", buffer.drain()))
+
+    def _finish_stream(self) -> Optional[str]:
+        """Hand the partial batches and the close request to the writer."""
+        writer = self._writer
+        if writer is None:
+            return None
+        self._writer = None
+
+        # All partial batches travel as one item so a full queue delays
+        # the caller by at most two writes
+        final_batch: Dict[str, np.ndarray] = {}
+        buffers = [self._timestamp_buffer, self._measurement_buffer]
+        buffers.extend(self._track_buffers.values())
+        for buffer in buffers:
+            if buffer.count:
+                final_batch.update(buffer.drain())
+        if final_batch:
+            writer.queue.put(("append", final_batch))
+        writer.queue.put(None)
+        self._closing_writer = writer
+
+        if self._stream_stats["num_snapshots"] == 0:
+            self._wait_for_writer()
+            writer.filepath.unlink(missing_ok=True)
+            return None
+        return str(writer.filepath)
+
+    def _wait_for_writer(self, timeout: Optional[float] = None) -> bool:
+        writer = self._closing_writer
+        if writer is None:
+            return True
+        writer.join(timeout)
+        if writer.is_alive():
+            return False
+        self._closing_writer = None
+        if writer.error is not None:
+            raise RuntimeError(
+                f"Streaming write to {writer.filepath} failed"
+            ) from writer.error
+        return True
+
+    # ═══════════════════════════════════════════════════════════════
+    # IN-MEMORY MODE
+    # ═══════════════════════════════════════════════════════════════
+
     def _save_to_hdf5(self) -> str:
         """
         Save session data to HDF5 file.
@@ -181,19 +536,10 @@ class FlightRecorder:
         Returns:
             Path to saved file
         """
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"session_{timestamp}.h5"
-        filepath = self.output_dir / filename
+        timestamp, filepath = self._new_filepath(self.output_dir)
 
         with h5py.File(filepath, "w") as f:
-            # Write config
-            config_group = f.create_group("config")
-            for key, value in self.session.config.items():
-                if isinstance(value, (int, float, str, bool)):
-                    config_group.attrs[key] = value
-                else:
-                    config_group.attrs[key] = json.dumps(value)
+            _write_config(f, self.session.config)
 
             # Write target tracks
             targets_group = f.create_group("targets")
@@ -235,10 +581,7 @@ class FlightRecorder:
             if self.session.timestamps:
                 f.create_dataset("timestamps", data=np.array(self.session.timestamps))
 
-            # Add file attributes
-            f.attrs["version"] = "1.0"
-            f.attrs["created"] = timestamp
-            f.attrs["software"] = "RadarSim"
+            _write_file_attrs(f, timestamp)
 
         return str(filepath)
 
@@ -250,6 +593,12 @@ class FlightRecorder:
             Dict with recording stats
         """
         with self._lock:
+            if self.streaming:
+                return {
+                    "is_recording": self.is_recording,
+                    **self._stream_stats,
+                    "num_targets": len(self._track_buffers),
+                }
             return {
                 "is_recording": self.is_recording,
                 "duration_s": self.session.timestamps[-1]
@@ -0,0 +1,195 @@
+"""
+Fixed-Timestep Simulation Scheduler
+
+Decouples the physics rate of a simulation loop from its display rate.
+
+    physics:  engine.step(step_dt) at physics_rate_hz (x speed factor)
+    display:  one UI frame at display_rate_hz, independent of physics
+
+Wall-clock time is scaled by the speed factor and collected in an
+accumulator; each tick runs as many fixed steps as it holds. A tick
+runs at most max_steps_per_tick steps; if the host cannot keep up, the
+remaining backlog is discarded (counted as skipped steps) instead of
+growing without bound, and the real-time factor drops below the
+requested speed.
+
+The scheduler never reads the clock itself: callers pass the current
+time, so it runs deterministically under test.
+
+Reference: G. Fiedler, "Fix Your Timestep!" (2004)
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass
+class SchedulerStats:
+    """Throughput and latency counters of a FixedStepScheduler."""
+
+    steps: int = 0
+    skipped_steps: int = 0
+    frames_published: int = 0
+    dropped_frames: int = 0
+    sim_time_s: float = 0.0
+    wall_time_s: float = 0.0
+    step_p50_ms: float = 0.0
+    step_p95_ms: float = 0.0
+    step_p99_ms: float = 0.0
+
+    @property
+    def real_time_factor(self) -> float:
+        """Simulated seconds per wall-clock second while running."""
+        return self.sim_time_s / self.wall_time_s if self.wall_time_s > 0 else 0.0
+
+
+class FixedStepScheduler:
+    """
+    Fixed-timestep physics and independent display clock for one loop.
+
+    Usage:
+        scheduler = FixedStepScheduler(physics_rate_hz=100.0, display_rate_hz=30.0)
+        scheduler.start(time.perf_counter())
+        while running:
+            now = time.perf_counter()
+            for _ in range(scheduler.steps_due(now)):
+                start = time.perf_counter()
+                engine.step(scheduler.step_dt)
+                scheduler.record_step(time.perf_counter() - start)
+            if scheduler.frame_due(now):
+                publish()
+            time.sleep(scheduler.time_until_next(time.perf_counter()))
+    """
+
+    def __init__(
+        self,
+        physics_rate_hz: float = 100.0,
+        display_rate_hz: float = 30.0,
+        max_steps_per_tick: int = 10,
+        speed_factor: float = 1.0,
+        latency_window: int = 1024,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            physics_rate_hz: Physics steps per simulated second [Hz]
+            display_rate_hz: UI frames per wall-clock second [Hz]
+            max_steps_per_tick: Catch-up limit per tick
+            speed_factor: Simulated seconds per wall-clock second
+            latency_window: Recent step durations kept for percentiles
+        """
+        if physics_rate_hz <= 0:
+            raise ValueError("physics_rate_hz must be positive")
+        if display_rate_hz <= 0:
+            raise ValueError("display_rate_hz must be positive")
+        if max_steps_per_tick < 1:
+            raise ValueError("max_steps_per_tick must be at least 1")
+        if latency_window < 1:
+            raise ValueError("latency_window must be at least 1")
+
+        self.step_dt = 1.0 / physics_rate_hz
+        self.frame_interval = 1.0 / display_rate_hz
+        self.max_steps_per_tick = max_steps_per_tick
+        self.speed_factor = 1.0
+        self.set_speed(speed_factor)
+
+        self._latencies_s = np.zeros(latency_window)
+        self._latency_count = 0
+        self._accumulator = 0.0
+        self._last_tick: Optional[float] = None
+        self._next_frame = 0.0
+        self._stats = SchedulerStats()
+
+    def set_speed(self, factor: float) -> None:
+        """Set simulated seconds per wall-clock second."""
+        if factor <= 0:
+            raise ValueError("speed factor must be positive")
+        self.speed_factor = factor
+
+    def start(self, now: float) -> None:
+        """
+        (Re)start the clocks at wall time ``now``.
+
+        Call on start and on resume, so paused time is neither caught up
+        nor counted against the real-time factor. Counters are kept.
+        """
+        self._last_tick = now
+        self._accumulator = 0.0
+        self._next_frame = now
+
+    # ═══════════════════════════════════════════════════════════════
+    # CLOCKS
+    # ═══════════════════════════════════════════════════════════════
+
+    def steps_due(self, now: float) -> int:
+        """
+        Number of fixed steps to run at wall time ``now``.
+
+        Returns:
+            Steps in [0, max_steps_per_tick]
+        """
+        if self._last_tick is None:
+            self.start(now)
+        elapsed = max(now - self._last_tick, 0.0)
+        self._last_tick = now
+        self._stats.wall_time_s += elapsed
+        self._accumulator += elapsed * self.speed_factor
+
+        # Tolerance keeps round-off (0.02 / 0.01 = 1.999...) from deferring a step
+        steps = int(self._accumulator / self.step_dt + 1e-9)
+        if steps > self.max_steps_per_tick:
+            self._stats.skipped_steps += steps - self.max_steps_per_tick
+            steps = self.max_steps_per_tick
+            self._accumulator = 0.0
+        else:
+            self._accumulator -= steps * self.step_dt
+        self._stats.sim_time_s += steps * self.step_dt
+        return steps
+
+    def frame_due(self, now: float) -> bool:
+        """Whether a UI frame is due at wall time ``now`` (consumes it)."""
+        if now < self._next_frame:
+            return False
+        self._next_frame += self.frame_interval
+        if self._next_frame <= now:
+            # More than a frame behind: do not publish a burst to catch up
+            self._next_frame = now + self.frame_interval
+        return True
+
+    def time_until_next(self, now: float) -> float:
+        """Wall-clock seconds until the next step or frame is due."""
+        if self._last_tick is None:
+            return 0.0
+        step_wait = (self.step_dt - self._accumulator) / self.speed_factor
+        step_at = self._last_tick + step_wait
+        return max(min(step_at, self._next_frame) - now, 0.0)
+
+    # ═══════════════════════════════════════════════════════════════
+    # ACCOUNTING
+    # ═══════════════════════════════════════════════════════════════
+
+    def record_step(self, duration_s: float) -> None:
+        """Record the wall-clock duration of one step."""
+        self._latencies_s[self._latency_count % len(self._latencies_s)] = duration_s
+        self._latency_count += 1
+        self._stats.steps += 1
+
+    def record_frame(self, published: bool = True) -> None:
+        """Record a due frame as published or dropped."""
+        if published:
+            self._stats.frames_published += 1
+        else:
+            self._stats.dropped_frames += 1
+
+    def stats(self) -> SchedulerStats:
+        """Copy of the counters with current step latency percentiles."""
+        window = self._latencies_s[: min(self._latency_count, len(self._latencies_s))]
+        stats = SchedulerStats(**vars(self._stats))
+        if len(window):
+            stats.step_p50_ms, stats.step_p95_ms, stats.step_p99_ms = (
+                np.percentile(window, [50, 95, 99]) * 1000
+            ).tolist()
+        return stats
@@ -0,0 +1,509 @@
+"""
+Array-Based Simulation Frame Snapshots
+
+Typed, preallocated per-frame state handed from the simulation thread to
+the UI without per-target dict building or ``.tolist()`` serialization.
+
+    targets:        structured array, one row per target (TARGET_DTYPE)
+    tracks:         structured array, one row per track (TRACK_DTYPE)
+    false_targets:  structured array, one row per ECM false target
+    rd_map:         range-Doppler map [dB] as a read-only ndarray
+
+Snapshots come from a SnapshotBuffers pool (double-buffered by default).
+The producer acquires a free snapshot, fills it in place and hands it to
+the consumer, which calls release() when done; a snapshot is never
+written while it is out with the consumer. When every buffer is out the
+producer gets None and skips that frame instead of queuing more work.
+
+FrameSnapshot also reads as a mapping with the keys of the former state
+dict; its "targets", "tracks" and "false_targets" entries are lists of
+dicts built on first access (once per frame, shared by all readers).
+Values read that way stay valid after release(); the arrays do not.
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+TYPE_LENGTH = 24
+HISTORY_LENGTH = 20  # Track trail points kept per snapshot
+
+TARGET_DTYPE = np.dtype(
+    [
+        ("id", np.int64),
+        ("type", f"U{TYPE_LENGTH}"),
+        ("position", np.float64, (3,)),
+        ("velocity", np.float64, (3,)),
+        ("range_m", np.float64),
+        ("azimuth_rad", np.float64),
+        ("elevation_rad", np.float64),
+        ("radial_velocity_mps", np.float64),
+        ("rcs_m2", np.float64),
+        ("snr_db", np.float64),
+        ("is_detected", np.bool_),
+    ]
+)
+
+TRACK_DTYPE = np.dtype(
+    [
+        ("track_id", np.int64),
+        ("status", f"U{TYPE_LENGTH}"),
+        ("position", np.float64, (2,)),
+        ("velocity", np.float64, (2,)),
+        ("speed_mps", np.float64),
+        ("heading_rad", np.float64),
+        ("hits", np.int64),
+        ("misses", np.int64),
+        ("history", np.float64, (HISTORY_LENGTH, 2)),
+        ("history_length", np.int64),
+        ("classification", f"U{TYPE_LENGTH}"),
+        ("confidence", np.float64),
+        ("covariance", np.float64, (4, 4)),
+        ("has_covariance", np.bool_),
+    ]
+)
+
+FALSE_TARGET_DTYPE = np.dtype(
+    [
+        ("target_id", np.int64),
+        ("position", np.float64, (3,)),
+        ("velocity", np.float64, (3,)),
+        ("rcs_m2", np.float64),
+        ("ecm_type", f"U{TYPE_LENGTH}"),
+    ]
+)
+
+_MAPPING_KEYS = (
+    "time",
+    "radar",
+    "targets",
+    "tracks",
+    "detection_count",
+    "total_targets",
+    "total_tracks",
+    "jamming_active",
+    "ecm_type",
+    "false_targets",
+    "pulse_doppler_enabled",
+    "rd_map",
+    "pd_metadata",
+    "eccm",
+    "log",
+    "scheduler",
+)
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class FrameSnapshot(Mapping):
+    """
+    One frame of simulation state, filled in place by its producer.
+
+    Attributes:
+        time: Simulation time [s]
+        radar: Radar position, antenna azimuth, frequency and power
+        targets: (N,) TARGET_DTYPE rows (read-only view)
+        tracks: (M,) TRACK_DTYPE rows (read-only view)
+        false_targets: (K,) FALSE_TARGET_DTYPE rows (read-only view)
+        rd_map: Range-Doppler map [dB] (read-only) or None
+        pd_metadata: Range-Doppler axes and processing parameters, or None
+        sequence: Frame counter of the producer
+        scheduler: Producer's SchedulerStats at fill time, or None
+    """
+
+    def __init__(self, pool: Optional["SnapshotBuffers"] = None):
+        self._pool = pool
+        self._target_rows = np.zeros(0, dtype=TARGET_DTYPE)
+        self._track_rows = np.zeros(0, dtype=TRACK_DTYPE)
+        self._false_target_rows = np.zeros(0, dtype=FALSE_TARGET_DTYPE)
+        self._rd_buffer: Optional[np.ndarray] = None
+        self._legacy: Dict[str, Any] = {}
+
+        self.sequence = -1
+        self.time = 0.0
+        self.radar: Dict[str, Any] = {}
+        self.targets = _read_only(self._target_rows)
+        self.tracks = _read_only(self._track_rows)
+        self.false_targets = _read_only(self._false_target_rows)
+        self.rd_map: Optional[np.ndarray] = None
+        self.pd_metadata: Optional[Dict[str, Any]] = None
+        self.pulse_doppler_enabled = False
+        self.jamming_active = False
+        self.ecm_type = "noise"
+        self.eccm: Dict[str, Any] = {}
+        self.log: Dict[str, Any] = {}
+        self.scheduler = None  # SchedulerStats set by the producer, if any
+
+    # ═══════════════════════════════════════════════════════════════
+    # PRODUCER SIDE
+    # ═══════════════════════════════════════════════════════════════
+
+    def begin(self, sequence: int, time: float) -> None:
+        """Start refilling this snapshot for a new frame."""
+        self.sequence = sequence
+        self.time = time
+        self.scheduler = None
+        self._legacy = {}
+
+    def target_rows(self, count: int) -> np.ndarray:
+        """Writable (count,) target rows; the buffer grows, never shrinks."""
+        self._target_rows = self._grow(self._target_rows, count)
+        self.targets = _read_only(self._target_rows[:count])
+        return self._target_rows[:count]
+
+    def track_rows(self, count: int) -> np.ndarray:
+        """Writable (count,) track rows."""
+        self._track_rows = self._grow(self._track_rows, count)
+        self.tracks = _read_only(self._track_rows[:count])
+        return self._track_rows[:count]
+
+    def false_target_rows(self, count: int) -> np.ndarray:
+        """Writable (count,) false-target rows."""
+        self._false_target_rows = self._grow(self._false_target_rows, count)
+        self.false_targets = _read_only(self._false_target_rows[:count])
+        return self._false_target_rows[:count]
+
+    def set_rd_map(self, data_db: Optional[np.ndarray]) -> None:
+        """Copy a range-Doppler map into this snapshot's own buffer."""
+        if data_db is None:
+            self.rd_map = None
+            return
+        if self._rd_buffer is None or self._rd_buffer.shape != data_db.shape:
+            self._rd_buffer = np.empty(data_db.shape, dtype=data_db.dtype)
+        np.copyto(self._rd_buffer, data_db, casting="unsafe")
+        self.rd_map = _read_only(self._rd_buffer)
+
+    @staticmethod
+    def _grow(rows: np.ndarray, count: int) -> np.ndarray:
+        if count <= len(rows):
+            return rows
+        return np.zeros(max(count, 2 * len(rows)), dtype=rows.dtype)
+
+    # ═══════════════════════════════════════════════════════════════
+    # CONSUMER SIDE
+    # ═══════════════════════════════════════════════════════════════
+
+    @property
+    def detection_count(self) -> int:
+        return int(np.count_nonzero(self.targets["is_detected"]))
+
+    def release(self) -> None:
+        """Hand the snapshot back to its pool for reuse by the producer."""
+        if self._pool is not None:
+            self._pool.release(self)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "targets":
+            return self._cached("targets", self._target_dicts)
+        if key == "tracks":
+            return self._cached("tracks", self._track_dicts)
+        if key == "false_targets":
+            return self._cached("false_targets", self._false_target_dicts)
+        if key == "total_targets":
+            return len(self.targets)
+        if key == "total_tracks":
+            return len(self.tracks)
+        if key in _MAPPING_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_MAPPING_KEYS)
+
+    def __len__(self) -> int:
+        return len(_MAPPING_KEYS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Independent copy in the former nested-dict layout."""
+        state = dict(self)
+        if self.rd_map is not None:
+            state["rd_map"] = self.rd_map.copy()
+        return state
+
+    def _cached(self, key: str, build) -> List[Dict[str, Any]]:
+        value = self._legacy.get(key)
+        if value is None:
+            value = self._legacy[key] = build()
+        return value
+
+    def _target_dicts(self) -> List[Dict[str, Any]]:
+        rows = self.targets
+        columns = zip(
+            rows["id"].tolist(),
+            rows["type"].tolist(),
+            rows["position"].tolist(),
+            rows["velocity"].tolist(),
+            rows["range_m"].tolist(),
+            (rows["range_m"] / 1000).tolist(),
+            rows["azimuth_rad"].tolist(),
+            np.degrees(rows["azimuth_rad"]).tolist(),
+            rows["elevation_rad"].tolist(),
+            np.degrees(rows["elevation_rad"]).tolist(),
+            rows["radial_velocity_mps"].tolist(),
+            rows["rcs_m2"].tolist(),
+            rows["is_detected"].tolist(),
+            rows["snr_db"].tolist(),
+        )
+        keys = (
+            "id",
+            "type",
+            "position",
+            "velocity",
+            "range_m",
+            "range_km",
+            "azimuth_rad",
+            "azimuth_deg",
+            "elevation_rad",
+            "elevation_deg",
+            "radial_velocity_mps",
+            "rcs_m2",
+            "is_detected",
+            "snr_db",
+        )
+        targets = []
+        for values in columns:
+            target = dict(zip(keys, values))
+            target["name"] = target["type"]  # For MIL-STD-2525 affiliation
+            targets.append(target)
+        return targets
+
+    def _track_dicts(self) -> List[Dict[str, Any]]:
+        rows = self.tracks
+        columns = zip(
+            rows["track_id"].tolist(),
+            rows["status"].tolist(),
+            rows["position"].tolist(),
+            rows["velocity"].tolist(),
+            rows["speed_mps"].tolist(),
+            rows["heading_rad"].tolist(),
+            rows["hits"].tolist(),
+            rows["misses"].tolist(),
+            rows["history"].tolist(),
+            rows["history_length"].tolist(),
+            rows["classification"].tolist(),
+            rows["confidence"].tolist(),
+            rows["covariance"].tolist(),
+            rows["has_covariance"].tolist(),
+        )
+        tracks = []
+        for (
+            track_id,
+            status,
+            position,
+            velocity,
+            speed,
+            heading,
+            hits,
+            misses,
+            history,
+            history_length,
+            classification,
+            confidence,
+            covariance,
+            has_covariance,
+        ) in columns:
+            track = {
+                "track_id": track_id,
+                "id": track_id,
+                "status": status,
+                "position": position,
+                "velocity": velocity,
+                "speed_mps": speed,
+                "heading_rad": heading,
+                "hits": hits,
+                "misses": misses,
+                "history": [tuple(point) for point in history[:history_length]],
+                "classification": classification,
+                "confidence": confidence,
+            }
+            # Covariance drives the EKF uncertainty ellipse.
+            if has_covariance:
+                track["covariance"] = covariance
+            tracks.append(track)
+        return tracks
+
+    def _false_target_dicts(self) -> List[Dict[str, Any]]:
+        rows = self.false_targets
+        return [
+            {
+                "target_id": target_id,
+                "position": position,
+                "velocity": velocity,
+                "rcs_m2": rcs,
+                "ecm_type": ecm_type,
+                "is_false_target": True,
+            }
+            for target_id, position, velocity, rcs, ecm_type in zip(
+                rows["target_id"].tolist(),
+                rows["position"].tolist(),
+                rows["velocity"].tolist(),
+                rows["rcs_m2"].tolist(),
+                rows["ecm_type"].tolist(),
+            )
+        ]
+
+
+class SnapshotBuffers:
+    """
+    Fixed pool of reusable FrameSnapshot buffers.
+
+    acquire() hands out a snapshot no consumer holds, or None when all
+    are out; release() (usually FrameSnapshot.release) returns one.
+    """
+
+    def __init__(self, count: int = 2):
+        if count < 1:
+            raise ValueError("count must be at least 1")
+        self._free: List[FrameSnapshot] = [FrameSnapshot(self) for _ in range(count)]
+        self._lock = threading.Lock()
+        self.count = count
+
+    def acquire(self) -> Optional[FrameSnapshot]:
+        with self._lock:
+            return self._free.pop() if self._free else None
+
+    def release(self, snapshot: FrameSnapshot) -> None:
+        with self._lock:
+            if all(free is not snapshot for free in self._free):
+                self._free.append(snapshot)
+
+    @property
+    def available(self) -> int:
+        with self._lock:
+            return len(self._free)
+
+
+def fill_snapshot(
+    snapshot: FrameSnapshot,
+    engine,
+    sequence: int,
+    tracks: Sequence = (),
+    eccm_state: Optional[Dict[str, Any]] = None,
+) -> FrameSnapshot:
+    """
+    Write the engine's current state into a snapshot in place.
+
+    Target geometry (range, azimuth, elevation, radial velocity) is
+    computed for all targets at once with the same formulas as
+    Radar.calculate_target_geometry.
+
+    Args:
+        snapshot: Snapshot acquired from a SnapshotBuffers pool
+        engine: SimulationEngine after its latest step
+        sequence: Frame counter
+        tracks: Current tracker output (Track objects)
+        eccm_state: ECCM status dict for the control panel
+
+    Returns:
+        The same snapshot
+    """
+    radar = engine.radar
+    snapshot.begin(sequence, engine.simulation_time)
+    snapshot.radar = {
+        "position": radar.position.tolist(),
+        "antenna_azimuth_rad": radar.antenna_azimuth,
+        "antenna_azimuth_deg": np.degrees(radar.antenna_azimuth),
+        "frequency_ghz": radar.frequency_hz / 1e9,
+        "power_kw": radar.power_watts / 1e3,
+    }
+
+    targets = engine.targets
+    rows = snapshot.target_rows(len(targets))
+    if targets:
+        positions = rows["position"]
+        velocities = rows["velocity"]
+        for index, target in enumerate(targets):
+            positions[index] = target.position
+            velocities[index] = target.velocity
+        rows["id"] = [target.target_id for target in targets]
+        rows["type"] = [target.target_type for target in targets]
+        rows["rcs_m2"] = [target.rcs_mean for target in targets]
+        detections = engine.state.detections
+        snr_values = engine.state.snr_values
+        rows["is_detected"] = [detections.get(target.target_id, False) for target in targets]
+        rows["snr_db"] = [snr_values.get(target.target_id, 0.0) for target in targets]
+
+        delta = positions - radar.state.position
+        range_m = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        rows["range_m"] = range_m
+        rows["azimuth_rad"] = np.arctan2(delta[:, 1], delta[:, 0])  # East from North
+        rows["elevation_rad"] = np.arctan2(
+            delta[:, 2], np.sqrt(delta[:, 0] ** 2 + delta[:, 1] ** 2)
+        )
+        closing = np.einsum("ij,ij->i", velocities - radar.state.velocity, delta)
+        resolved = range_m > 1e-6
+        rows["radial_velocity_mps"] = np.where(
+            resolved, closing / np.where(resolved, range_m, 1.0), 0.0
+        )
+
+    track_rows = snapshot.track_rows(len(tracks))
+    for row, track in zip(track_rows, tracks):
+        history = track.history[-HISTORY_LENGTH:]
+        row["track_id"] = track.id
+        row["status"] = track.status.value
+        row["position"] = track.position
+        row["velocity"] = track.velocity
+        row["speed_mps"] = track.speed_mps
+        row["heading_rad"] = track.heading_rad
+        row["hits"] = track.hits
+        row["misses"] = track.misses
+        row["history_length"] = len(history)
+        if history:
+            row["history"][: len(history)] = history
+        row["classification"] = track.classification
+        row["confidence"] = track.confidence
+        covariance = getattr(track.state, "P", None)
+        row["has_covariance"] = covariance is not None
+        if covariance is not None:
+            row["covariance"] = covariance
+
+    false_targets = engine.false_targets[:20]  # Cap at 20 for display
+    false_rows = snapshot.false_target_rows(len(false_targets))
+    for row, false_target in zip(false_rows, false_targets):
+        row["target_id"] = false_target.false_id
+        row["position"] = false_target.position
+        row["velocity"] = false_target.velocity
+        row["rcs_m2"] = false_target.rcs_m2
+        row["ecm_type"] = false_target.ecm_type
+
+    snapshot.pulse_doppler_enabled = getattr(engine, "pulse_doppler_enabled", False)
+    rd_map = engine._rd_map if snapshot.pulse_doppler_enabled else None
+    snapshot.set_rd_map(None if rd_map is None else rd_map.data_db)
+    snapshot.pd_metadata = None if rd_map is None else _pd_metadata(rd_map)
+
+    snapshot.jamming_active = getattr(engine, "ecm_active", False)
+    snapshot.ecm_type = getattr(engine, "ecm_type", "noise")
+    snapshot.eccm = eccm_state if eccm_state is not None else {}
+    snapshot.log = {
+        "total_opportunities": engine.log.total_opportunities,
+        "total_detections": engine.log.total_detections,
+        "detection_ratio": engine.log.detection_ratio,
+    }
+    return snapshot
+
+
+def _pd_metadata(rdm) -> Dict[str, Any]:
+    """Axes (read-only copies) and scalars of a RangeDopplerMap."""
+    return {
+        "range_axis_m": _read_only(rdm.range_axis_m.copy()),
+        "velocity_axis_mps": _read_only(rdm.velocity_axis_mps.copy()),
+        "blind_speeds_mps": rdm.blind_speeds_mps,
+        "mti_order": rdm.mti_order,
+        "processing_gain_db": rdm.processing_gain_db,
+        "n_pulses": rdm.n_pulses,
+        "prf_hz": rdm.prf_hz,
+        "wavelength_m": rdm.wavelength_m,
+        "sample_rate_hz": rdm.sample_rate_hz,
+        "range_sample_spacing_m": rdm.range_sample_spacing_m,
+        "max_instrumented_range_m": rdm.max_instrumented_range_m,
+        "max_unambiguous_range_m": rdm.max_unambiguous_range_m,
+        "max_unambiguous_velocity_mps": rdm.max_unambiguous_velocity_mps,
+        "coherent_processing_gain_db": rdm.coherent_processing_gain_db,
+        "window_enbw_bins": rdm.window_enbw_bins,
+    }
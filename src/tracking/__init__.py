@@ -8,6 +8,7 @@ Components:
     - LinearKalmanFilter: Constant Velocity Kalman Filter (Cartesian)
     - ExtendedKalmanFilter: EKF with polar [r, θ] measurement model
     - TrackManager: Multi-target track management with data association
+    - FilterBank: Stacked track states for batched predict/update
     - Track: Individual target track container
     - TrackStatus: Track lifecycle states
 
@@ -21,6 +22,7 @@ Reference:
     - Bar-Shalom, Y. "Estimation with Applications to Tracking", 2001
 """
 
+from .filter_bank import FilterBank
 from .kalman import KalmanState, LinearKalmanFilter
 from .tracker import Track, TrackManager, TrackStatus
 
@@ -32,6 +34,7 @@ try:
         "LinearKalmanFilter",
         "ExtendedKalmanFilter",
         "KalmanState",
+        "FilterBank",
         "TrackManager",
         "Track",
         "TrackStatus",
@@ -40,6 +43,7 @@ except ImportError:
     __all__ = [
         "LinearKalmanFilter",
         "KalmanState",
+        "FilterBank",
         "TrackManager",
         "Track",
         "TrackStatus",
@@ -0,0 +1,254 @@
+"""
+Bank of Kalman Filters for Batched Multi-Track Processing
+
+Holds the states of many constant-velocity tracks as stacked arrays and
+runs the LinearKalmanFilter / ExtendedKalmanFilter equations for all of
+them in single NumPy calls instead of one small matrix product per track.
+
+    x: (N, 4) state vectors [x, y, vx, vy]
+    P: (N, 4, 4) covariance matrices
+
+F, Q, H and R are taken from the scalar filter passed to each call, and
+every batched expression keeps the operand order of its scalar
+counterpart. Linear predict/update results are bit-identical to
+LinearKalmanFilter; EKF results differ from ExtendedKalmanFilter only by
+the last-ulp differences of NumPy's vectorized arctan2 and power.
+
+Reference:
+    - Bar-Shalom, Y. "Estimation with Applications to Tracking and Navigation", 2001
+"""
+
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from .ekf import ExtendedKalmanFilter
+from .kalman import KalmanState, LinearKalmanFilter
+
+CVFilter = Union[LinearKalmanFilter, ExtendedKalmanFilter]
+
+
+class FilterBank:
+    """
+    Stacked constant-velocity filter states.
+
+    ``state(i)`` returns a KalmanState whose arrays are views into the bank,
+    so in-place updates are visible through it. ``rows`` arguments select
+    the tracks an update applies to, in processing order.
+
+    Example:
+        >>> kf = LinearKalmanFilter()
+        >>> bank = FilterBank.from_states([kf.initialize((0, 0)), kf.initialize((5, 5))])
+        >>> bank.predict(kf, dt=1.0)
+        >>> bank.update_linear(kf, [(1.0, 2.0)], rows=[1])
+    """
+
+    def __init__(self, x: np.ndarray, P: np.ndarray) -> None:
+        x = np.array(x, dtype=np.float64)
+        P = np.array(P, dtype=np.float64)
+        if x.ndim != 2 or x.shape[1] != 4:
+            raise ValueError("x must have shape (N, 4)")
+        if P.shape != (x.shape[0], 4, 4):
+            raise ValueError("P must have shape (N, 4, 4)")
+        self.x = x
+        self.P = P
+
+    @classmethod
+    def from_states(cls, states: Sequence[KalmanState]) -> "FilterBank":
+        """Stack existing per-track states (copies their arrays)."""
+        if len(states) == 0:
+            return cls(np.empty((0, 4)), np.empty((0, 4, 4)))
+        return cls(
+            np.stack([state.x for state in states]),
+            np.stack([state.P for state in states]),
+        )
+
+    def __len__(self) -> int:
+        return self.x.shape[0]
+
+    def state(self, index: int) -> KalmanState:
+        """KalmanState view of one track."""
+        return KalmanState(x=self.x[index], P=self.P[index])
+
+    def states(self) -> List[KalmanState]:
+        """KalmanState views of all tracks, in bank order."""
+        return [self.state(index) for index in range(len(self))]
+
+    # ═══════════════════════════════════════════════════════════════
+    # PREDICTION
+    # ═══════════════════════════════════════════════════════════════
+
+    def predict(self, kf: CVFilter, dt: float) -> None:
+        """
+        Predict every track by dt with the filter's CV model.
+
+        x_pred = F * x
+        P_pred = F * P * F^T + Q
+        """
+        if dt <= 0.0:
+            raise ValueError("dt must be positive")
+        if isinstance(kf, ExtendedKalmanFilter):
+            F = kf._transition_matrix(dt)
+            Q = kf._process_noise_matrix(dt)
+        else:
+            F = kf._get_transition_matrix(dt)
+            Q = kf._get_process_noise(dt)
+
+        self.x = (F @ self.x[:, :, np.newaxis])[:, :, 0]
+        self.P = F @ self.P @ F.T + Q
+
+    # ═══════════════════════════════════════════════════════════════
+    # UPDATE
+    # ═══════════════════════════════════════════════════════════════
+
+    def update_linear(
+        self,
+        kf: LinearKalmanFilter,
+        measurements: np.ndarray,
+        rows: Optional[Sequence[int]] = None,
+    ) -> None:
+        """
+        Linear position update with Joseph-form covariance.
+
+        Args:
+            kf: Filter providing H and R
+            measurements: (M, 2) Cartesian positions [m]
+            rows: Bank rows receiving the measurements (default: all)
+        """
+        rows, z = self._select(measurements, rows)
+        if rows.size == 0:
+            return
+        x = self.x[rows]
+        P = self.P[rows]
+        H, R = kf.H, kf.R
+
+        y = z - (H @ x[:, :, np.newaxis])[:, :, 0]
+        S = H @ P @ H.T + R
+        K = np.swapaxes(np.linalg.solve(S, H @ P), 1, 2)
+        self._joseph_update(rows, x, P, K, H, R, y)
+
+    def update_polar(
+        self,
+        ekf: ExtendedKalmanFilter,
+        measurements: np.ndarray,
+        rows: Optional[Sequence[int]] = None,
+        snr_db: Union[float, np.ndarray] = 20.0,
+    ) -> None:
+        """
+        EKF update with polar [r, θ] measurements.
+
+        Evaluates h(x), the range/azimuth Jacobian, SNR-adaptive R, the gain
+        and the Joseph-form covariance for all selected tracks at once, and
+        advances the filter's divergence counter in ``rows`` order.
+
+        Args:
+            ekf: Filter providing R_nominal and the SNR adaptation setting
+            measurements: (M, 2) polar (range_m, azimuth_rad)
+            rows: Bank rows receiving the measurements (default: all)
+            snr_db: Scalar or (M,) SNR [dB] per measurement
+        """
+        rows, z = self._select(measurements, rows)
+        if rows.size == 0:
+            return
+        x = self.x[rows]
+        P = self.P[rows]
+
+        px, py = x[:, 0], x[:, 1]
+        z_pred = np.column_stack([np.sqrt(px**2 + py**2), np.arctan2(py, px)])
+        y = z - z_pred
+        y[:, 1] = ExtendedKalmanFilter._wrap_angle(y[:, 1])
+
+        r = np.maximum(np.sqrt(px**2 + py**2), ExtendedKalmanFilter._EPSILON_RANGE)
+        r2 = r**2
+        H = np.zeros((rows.size, 2, 4))
+        H[:, 0, 0] = px / r
+        H[:, 0, 1] = py / r
+        H[:, 1, 0] = -py / r2
+        H[:, 1, 1] = px / r2
+
+        snr = np.broadcast_to(np.asarray(snr_db, dtype=np.float64), (rows.size,))
+        if ekf.snr_adapt:
+            scale = np.clip(10.0 ** ((20.0 - np.clip(snr, -10.0, 40.0)) / 10.0), 0.3, 30.0)
+            R = ekf.R_nominal * scale[:, np.newaxis, np.newaxis]
+        else:
+            R = np.broadcast_to(ekf.R_nominal, (rows.size, 2, 2))
+
+        H_T = np.swapaxes(H, 1, 2)
+        S = H @ P @ H_T + R
+        S_inv = self._invert_2x2(S)
+        K = P @ H_T @ S_inv
+        self._joseph_update(rows, x, P, K, H, R, y)
+
+        nis = np.einsum("ni,ni->n", (y[:, np.newaxis, :] @ S_inv)[:, 0, :], y)
+        for value in nis:
+            if value > 25.0:  # ~5σ threshold for 2 DOF, as in the scalar EKF
+                ekf._divergence_count += 1
+            else:
+                ekf._divergence_count = max(0, ekf._divergence_count - 1)
+
+    def update_cartesian(
+        self,
+        ekf: ExtendedKalmanFilter,
+        measurements: np.ndarray,
+        rows: Optional[Sequence[int]] = None,
+    ) -> None:
+        """EKF update from Cartesian (x, y) detections converted to polar."""
+        measurements = np.asarray(measurements, dtype=np.float64).reshape(-1, 2)
+        polar = np.column_stack(
+            [
+                np.sqrt(measurements[:, 0] ** 2 + measurements[:, 1] ** 2),
+                np.arctan2(measurements[:, 1], measurements[:, 0]),
+            ]
+        )
+        self.update_polar(ekf, polar, rows)
+
+    # ═══════════════════════════════════════════════════════════════
+    # HELPERS
+    # ═══════════════════════════════════════════════════════════════
+
+    def _select(
+        self, measurements: np.ndarray, rows: Optional[Sequence[int]]
+    ) -> tuple:
+        z = np.asarray(measurements, dtype=np.float64).reshape(-1, 2)
+        rows = (
+            np.arange(len(self))
+            if rows is None
+            else np.asarray(rows, dtype=np.intp).reshape(-1)
+        )
+        if rows.size != z.shape[0]:
+            raise ValueError("measurements and rows must have the same length")
+        if np.unique(rows).size != rows.size:
+            raise ValueError("rows must not repeat")
+        return rows, z
+
+    def _joseph_update(
+        self,
+        rows: np.ndarray,
+        x: np.ndarray,
+        P: np.ndarray,
+        K: np.ndarray,
+        H: np.ndarray,
+        R: np.ndarray,
+        y: np.ndarray,
+    ) -> None:
+        """x + K y and (I - KH) P (I - KH)^T + K R K^T, symmetrized."""
+        K_T = np.swapaxes(K, 1, 2)
+        I_KH = np.eye(4) - K @ H
+        P_new = I_KH @ P @ np.swapaxes(I_KH, 1, 2) + K @ R @ K_T
+        self.x[rows] = x + (K @ y[:, :, np.newaxis])[:, :, 0]
+        self.P[rows] = 0.5 * (P_new + np.swapaxes(P_new, 1, 2))
+
+    @staticmethod
+    def _invert_2x2(M: np.ndarray) -> np.ndarray:
+        """Explicit stacked 2×2 inverse; np.linalg.inv for degenerate entries."""
+        det = M[:, 0, 0] * M[:, 1, 1] - M[:, 0, 1] * M[:, 1, 0]
+        degenerate = np.abs(det) < 1e-30
+        inv_det = 1.0 / np.where(degenerate, 1.0, det)
+        inverse = np.empty_like(M)
+        inverse[:, 0, 0] = M[:, 1, 1] * inv_det
+        inverse[:, 0, 1] = -M[:, 0, 1] * inv_det
+        inverse[:, 1, 0] = -M[:, 1, 0] * inv_det
+        inverse[:, 1, 1] = M[:, 0, 0] * inv_det
+        if degenerate.any():
+            inverse[degenerate] = np.linalg.inv(M[degenerate])
+        return inverse
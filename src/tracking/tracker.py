@@ -19,8 +19,12 @@ from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from scipy.optimize import linear_sum_assignment
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
 from scipy.stats import chi2
 
+from .filter_bank import CVFilter, FilterBank
 from .kalman import KalmanState, LinearKalmanFilter
 
 # Extended Kalman filter
@@ -33,6 +37,99 @@ except ImportError:
     ExtendedKalmanFilter = None
 
 
+# Placeholder cost for ungated pairs inside an assignment sub-problem
+_UNGATED_COST = 1e12
+# Problems up to this many matrix entries are solved densely in one call
+_DENSE_ASSIGNMENT_MAX_ENTRIES = 10_000
+
+
+def _padded_assignment(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    costs: np.ndarray,
+    n_rows: int,
+    n_cols: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    cost = np.full((n_rows, n_cols), _UNGATED_COST)
+    gated = np.zeros((n_rows, n_cols), dtype=bool)
+    cost[rows, cols] = costs
+    gated[rows, cols] = True
+    matched_rows, matched_cols = linear_sum_assignment(cost)
+    keep = gated[matched_rows, matched_cols]
+    return matched_rows[keep], matched_cols[keep]
+
+
+def assign_gated_pairs(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    costs: np.ndarray,
+    n_rows: int,
+    n_cols: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Minimum-cost assignment restricted to gated (row, col) pairs.
+
+    The gated bipartite graph is split into connected components and each
+    component is solved on its own. Components with a single row or a single
+    column take their cheapest pair; the rest use ``linear_sum_assignment``
+    on their small dense sub-matrix. Ungated entries cost ``_UNGATED_COST``,
+    so every component first maximizes its number of gated matches and then
+    minimizes their total cost, which is what a dense padded solve over the
+    whole matrix does, without its cubic cost in the total track count.
+
+    Returns:
+        Matched row and column indices (gated pairs only), sorted by row.
+    """
+    rows = np.asarray(rows, dtype=np.intp)
+    cols = np.asarray(cols, dtype=np.intp)
+    costs = np.asarray(costs, dtype=float)
+    if rows.size == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    if n_rows * n_cols <= _DENSE_ASSIGNMENT_MAX_ENTRIES:
+        return _padded_assignment(rows, cols, costs, n_rows, n_cols)
+
+    graph = coo_matrix(
+        (np.ones(rows.size), (rows, n_rows + cols)),
+        shape=(n_rows + n_cols, n_rows + n_cols),
+    )
+    n_components, labels = connected_components(graph, directed=False)
+    pair_labels = labels[rows]
+    row_count = np.bincount(labels[:n_rows], minlength=n_components)
+    col_count = np.bincount(labels[n_rows:], minlength=n_components)
+    star = (row_count == 1) | (col_count == 1)
+
+    # Stars: the cheapest pair of each component (lexsort's last key is primary)
+    order = np.lexsort((costs, pair_labels))
+    first = order[np.r_[True, pair_labels[order[1:]] != pair_labels[order[:-1]]]]
+    first = first[star[pair_labels[first]]]
+    matched_rows = [rows[first]]
+    matched_cols = [cols[first]]
+
+    remaining = np.flatnonzero(~star[pair_labels])
+    if remaining.size:
+        order = remaining[np.argsort(pair_labels[remaining], kind="stable")]
+        sorted_labels = pair_labels[order]
+        bounds = np.flatnonzero(np.r_[True, sorted_labels[1:] != sorted_labels[:-1]])
+        for members in np.split(order, bounds[1:]):
+            local_rows, row_index = np.unique(rows[members], return_inverse=True)
+            local_cols, col_index = np.unique(cols[members], return_inverse=True)
+            sub_rows, sub_cols = _padded_assignment(
+                row_index,
+                col_index,
+                costs[members],
+                local_rows.size,
+                local_cols.size,
+            )
+            matched_rows.append(local_rows[sub_rows])
+            matched_cols.append(local_cols[sub_cols])
+
+    matched_rows = np.concatenate(matched_rows)
+    matched_cols = np.concatenate(matched_cols)
+    order = np.argsort(matched_rows, kind="stable")
+    return matched_rows[order], matched_cols[order]
+
+
 class TrackStatus(Enum):
     """Track lifecycle states."""
 
@@ -118,6 +215,10 @@ class TrackManager:
         ...     print(f"Track {track.id}: {track.position}")
     """
 
+    # Track x detection pair count above which the Euclidean pre-gate uses
+    # KD-trees instead of a dense distance matrix
+    KD_TREE_MIN_PAIRS = 4096
+
     def __init__(
         self,
         gate_distance: float = 500.0,
@@ -197,29 +298,25 @@ class TrackManager:
         self.current_time += dt
         current_time = self.current_time
 
-        # 1. Predict all tracks
-        for track in self.tracks.values():
-            if track.status != TrackStatus.DELETED:
-                if self.use_ekf and self._ekf is not None:
-                    track.state = self._ekf.predict(track.state, dt)
-                else:
-                    track.state = self.kf.predict(track.state, dt)
+        # 1. Predict all tracks (one batched call)
+        use_ekf = self.use_ekf and self._ekf is not None
+        bank, bank_rows = self._predict_bank(self._ekf if use_ekf else self.kf, dt)
 
         # 2. Data association (Nearest-Neighbor with gating)
         associations, unassigned_detections, unassigned_tracks = self._associate(
             detections
         )
 
-        # 3. Update associated tracks
+        # 3. Update associated tracks (EKF or Linear, one batched call)
+        rows = [bank_rows[track_id] for track_id in associations]
+        measurements = [detections[det_idx] for det_idx in associations.values()]
+        if use_ekf:
+            bank.update_cartesian(self._ekf, measurements, rows)
+        else:
+            bank.update_linear(self.kf, measurements, rows)
+
         for track_id, det_idx in associations.items():
             track = self.tracks[track_id]
-            measurement = detections[det_idx]
-
-            # Kalman update (EKF or Linear)
-            if self.use_ekf and self._ekf is not None:
-                track.state = self._ekf.update_cartesian(track.state, measurement)
-            else:
-                track.state = self.kf.update(track.state, measurement)
             track.last_update = current_time
             track.hits += 1
             track.consecutive_hits += 1
@@ -281,6 +378,28 @@ class TrackManager:
 
         return list(self.tracks.values())
 
+    def _predict_bank(
+        self, kf: CVFilter, dt: float
+    ) -> Tuple[FilterBank, Dict[int, int]]:
+        """
+        Predict every live track in one batched call.
+
+        Each track's state becomes a view into the returned bank, so a later
+        batched update of the bank is visible through ``track.state``.
+
+        Returns:
+            - bank: predicted FilterBank
+            - bank_rows: {track_id: bank row}
+        """
+        track_ids = [
+            tid for tid, t in self.tracks.items() if t.status != TrackStatus.DELETED
+        ]
+        bank = FilterBank.from_states([self.tracks[tid].state for tid in track_ids])
+        bank.predict(kf, dt)
+        for row, track_id in enumerate(track_ids):
+            self.tracks[track_id].state = bank.state(row)
+        return bank, {track_id: row for row, track_id in enumerate(track_ids)}
+
     def _associate(
         self, detections: List[Tuple[float, float]]
     ) -> Tuple[Dict[int, int], List[int], List[int]]:
@@ -292,7 +411,7 @@ class TrackManager:
             - unassigned_detections: [detection indices]
             - unassigned_tracks: [track ids]
         """
-        if not detections or not self.tracks:
+        if len(detections) == 0 or not self.tracks:
             return (
                 {},
                 list(range(len(detections))),
@@ -302,37 +421,19 @@ class TrackManager:
         track_ids = [
             tid for tid, t in self.tracks.items() if t.status != TrackStatus.DELETED
         ]
-        cost = np.full((len(track_ids), len(detections)), np.inf)
-        for row, track_id in enumerate(track_ids):
-            track = self.tracks[track_id]
-            innovation_covariance = (
-                self.kf.H @ track.state.P @ self.kf.H.T + self.kf.R
-            )
-            for col, detection in enumerate(detections):
-                innovation = np.asarray(detection) - np.asarray(track.position)
-                euclidean_distance = float(np.linalg.norm(innovation))
-                if euclidean_distance > self.gate_distance:
-                    continue
-                nis = float(
-                    innovation
-                    @ np.linalg.solve(innovation_covariance, innovation)
-                )
-                if nis <= self.gate_threshold:
-                    cost[row, col] = nis
-
-        associations: Dict[int, int] = {}
-        assigned_detections = set()
-        assigned_tracks = set()
-        if np.isfinite(cost).any():
-            assignment_cost = np.where(np.isfinite(cost), cost, 1e12)
-            rows, columns = linear_sum_assignment(assignment_cost)
-            for row, col in zip(rows, columns):
-                if not np.isfinite(cost[row, col]):
-                    continue
-                track_id = track_ids[row]
-                associations[track_id] = int(col)
-                assigned_tracks.add(track_id)
-                assigned_detections.add(int(col))
+        rows, cols, nis = self._gated_pairs(
+            [self.tracks[track_id] for track_id in track_ids],
+            np.asarray(detections, dtype=float).reshape(len(detections), 2),
+        )
+        matched_rows, matched_cols = assign_gated_pairs(
+            rows, cols, nis, len(track_ids), len(detections)
+        )
+
+        associations: Dict[int, int] = {
+            track_ids[row]: int(col) for row, col in zip(matched_rows, matched_cols)
+        }
+        assigned_detections = set(associations.values())
+        assigned_tracks = set(associations)
 
         unassigned_detections = [
             i for i in range(len(detections)) if i not in assigned_detections
@@ -341,6 +442,49 @@ class TrackManager:
 
         return associations, unassigned_detections, unassigned_tracks
 
+    def _gated_pairs(
+        self, tracks: List[Track], detections: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Track rows, detection columns and NIS of every gated pair.
+
+        A Euclidean pre-gate at ``gate_distance`` selects candidate pairs
+        (dense distances for small problems, KD-trees on tracks and
+        detections for large ones). Each track's innovation covariance is factored once;
+        the NIS of all candidate pairs is then one batched whitening.
+        """
+        empty = np.empty(0, dtype=np.intp)
+        if not tracks or len(detections) == 0:
+            return empty, empty, np.empty(0)
+
+        positions = np.array([track.state.x[:2] for track in tracks], dtype=float)
+        if len(tracks) * len(detections) < self.KD_TREE_MIN_PAIRS:
+            distances = np.linalg.norm(
+                detections[np.newaxis, :, :] - positions[:, np.newaxis, :], axis=2
+            )
+            rows, cols = np.nonzero(distances <= self.gate_distance)
+        else:
+            neighbours = cKDTree(positions).sparse_distance_matrix(
+                cKDTree(detections), self.gate_distance, output_type="ndarray"
+            )
+            rows = neighbours["i"].astype(np.intp)
+            cols = neighbours["j"].astype(np.intp)
+        if rows.size == 0:
+            return rows, cols, np.empty(0)
+
+        # S = H P H^T + R per track, then W = L^-1 with S = L L^T so that
+        # NIS = |W v|^2 without a solve per pair
+        covariances = np.array([track.state.P for track in tracks], dtype=float)
+        innovation_covariances = (
+            self.kf.H @ covariances @ self.kf.H.T + self.kf.R
+        )
+        whitening = np.linalg.inv(np.linalg.cholesky(innovation_covariances))
+        innovations = detections[cols] - positions[rows]
+        whitened = np.einsum("pij,pj->pi", whitening[rows], innovations)
+        nis = np.einsum("pi,pi->p", whitened, whitened)
+        gated = nis <= self.gate_threshold
+        return rows[gated], cols[gated], nis[gated]
+
     def _create_track(
         self,
         measurement: Tuple[float, float],
@@ -444,10 +588,8 @@ class TrackManager:
         self.current_time += dt
         current_time = self.current_time
 
-        # 1. Predict all tracks
-        for track in self.tracks.values():
-            if track.status != TrackStatus.DELETED:
-                track.state = self._ekf.predict(track.state, dt)
+        # 1. Predict all tracks (one batched call)
+        bank, bank_rows = self._predict_bank(self._ekf, dt)
 
         # 2. Convert polar to Cartesian for association only
         cartesian_dets = [
@@ -459,17 +601,20 @@ class TrackManager:
             cartesian_dets
         )
 
-        # 4. Update associated tracks with polar measurements
+        # 4. Update associated tracks with polar measurements (one batched call)
+        snr = [
+            snr_values[det_idx] if snr_values and det_idx < len(snr_values) else 20.0
+            for det_idx in associations.values()
+        ]
+        bank.update_polar(
+            self._ekf,
+            [polar_detections[det_idx] for det_idx in associations.values()],
+            [bank_rows[track_id] for track_id in associations],
+            snr_db=np.asarray(snr, dtype=float),
+        )
+
         for track_id, det_idx in associations.items():
             track = self.tracks[track_id]
-            z_polar = polar_detections[det_idx]
-            snr = (
-                snr_values[det_idx]
-                if snr_values and det_idx < len(snr_values)
-                else 20.0
-            )
-
-            track.state = self._ekf.update(track.state, z_polar, snr_db=snr)
             track.last_update = current_time
             track.hits += 1
             track.consecutive_hits += 1
@@ -287,9 +287,9 @@ class AnalysisPanel(QWidget):
             self.snr_curve.setData([], [])
 
         # Calculate rolling detection rate
-        if self.loader._measurements and len(self.loader._measurements["time"]) > 0:
-            times_all = self.loader._measurements["time"]
-            detected = self.loader._measurements["detected"].astype(float)
+        times_all, detected = self.loader.get_detection_history()
+        if len(times_all) > 0:
+            detected = detected.astype(float)
 
             # Rolling average with window of 10 samples
             window = min(10, len(detected))
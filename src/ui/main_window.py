@@ -39,9 +39,11 @@ from PySide6.QtWidgets import (
 )
 
 # I/O modules
+from src.io.replay_cache import ReplayFrameCache
 from src.io.replay_loader import ReplayLoader
 from src.io.scenario_loader import ScenarioLoader
 from src.simulation.recorder import FlightRecorder
+from src.simulation.snapshot import FrameSnapshot
 
 from .a_scope import AScope
 from .analysis_panel import AnalysisPanel
@@ -97,9 +99,10 @@ class MainWindow(QMainWindow):
         # Replay mode state
         self.mode = SimulationMode.LIVE
         self.replay_loader: Optional[ReplayLoader] = None
+        self.replay_frames: Optional[ReplayFrameCache] = None
 
         # Recording state
-        self.recorder = FlightRecorder(output_dir="output")
+        self.recorder = FlightRecorder(output_dir="output", streaming=True)
         self.is_recording = False
 
         # ═══ ADVANCED MODULE STATE ═══
@@ -641,42 +644,51 @@ class MainWindow(QMainWindow):
             self.sim_thread = None
         self.status_bar.showMessage("Simulation STOPPED")
 
-    @Slot(dict)
-    def _on_update(self, state: dict) -> None:
-        """Handle simulation state update."""
-        # Route to active display
-        if self.active_display == "b_scope":
-            self.b_scope.update_display(state)
-        else:
-            self.ppi_scope.update_display(state)
-
-        self.a_scope.update_display(state)
-        self.rd_scope.update_display(state)  # Range-Doppler scope
-        self.rhi_scope.update_display(state)  # RHI (Elevation) scope
-        self.tactical_3d.update_display(state)  # 3D Tactical map
-
-        # Record state if recording is active
-        if self.is_recording:
-            self.recorder.record_state(state)
-
-        # Cache target data for inspector lookup
-        targets = state.get("targets", [])
-        for target in targets:
-            self._target_data_cache[target["id"]] = target
-
-        # Update inspector if target is selected
-        if self.ppi_scope.selected_target_id is not None:
-            target_data = self._target_data_cache.get(self.ppi_scope.selected_target_id)
-            if target_data:
-                self.target_inspector.update_target(target_data)
-
-        # Update status bar
-        time_s = state.get("time", 0)
-        detections = state.get("detection_count", 0)
-        total = state.get("total_targets", 0)
-        self.status_bar.showMessage(
-            f"TIME: {time_s:.1f}s | TARGETS: {total} | DETECTIONS: {detections}"
-        )
+    @Slot(object)
+    def _on_update(self, state: FrameSnapshot) -> None:
+        """Handle simulation state update (releases the snapshot buffer)."""
+        try:
+            # Route to active display
+            if self.active_display == "b_scope":
+                self.b_scope.update_display(state)
+            else:
+                self.ppi_scope.update_display(state)
+
+            self.a_scope.update_display(state)
+            self.rd_scope.update_display(state)  # Range-Doppler scope
+            self.rhi_scope.update_display(state)  # RHI (Elevation) scope
+            self.tactical_3d.update_display(state)  # 3D Tactical map
+
+            # Record state if recording is active
+            if self.is_recording:
+                self.recorder.record_state(state)
+
+            # Cache target data for inspector lookup
+            targets = state.get("targets", [])
+            for target in targets:
+                self._target_data_cache[target["id"]] = target
+
+            # Update inspector if target is selected
+            if self.ppi_scope.selected_target_id is not None:
+                target_data = self._target_data_cache.get(self.ppi_scope.selected_target_id)
+                if target_data:
+                    self.target_inspector.update_target(target_data)
+
+            # Update status bar
+            time_s = state.get("time", 0)
+            detections = state.get("detection_count", 0)
+            total = state.get("total_targets", 0)
+            message = f"TIME: {time_s:.1f}s | TARGETS: {total} | DETECTIONS: {detections}"
+            stats = state.get("scheduler")
+            if stats is not None:
+                message += (
+                    f" | RTF: {stats.real_time_factor:.2f}x"
+                    f" | STEP p95: {stats.step_p95_ms:.1f}ms"
+                    f" | DROPPED: {stats.dropped_frames}"
+                )
+            self.status_bar.showMessage(message)
+        finally:
+            state.release()
 
     @Slot(str)
     def _on_error(self, error_msg: str) -> None:
@@ -861,7 +873,11 @@ class MainWindow(QMainWindow):
             "radar_gain_db": self.engine.radar.antenna_gain_db,
         }
 
-        self.recorder.start_recording(config)
+        try:
+            self.recorder.start_recording(config)
+        except RuntimeError as e:
+            QMessageBox.critical(self, "Error", f"Failed to save previous recording:\n{str(e)}")
+            return
         self.is_recording = True
 
         # Update menu items
@@ -883,6 +899,14 @@ class MainWindow(QMainWindow):
         self.start_rec_action.setEnabled(True)
         self.stop_rec_action.setEnabled(False)
 
+        try:
+            # A streamed recording is still being written in the background
+            self.recorder.wait_for_save()
+        except RuntimeError as e:
+            self.status_bar.showMessage("Recording failed - write error")
+            QMessageBox.critical(self, "Error", f"Failed to save recording:\n{str(e)}")
+            return
+
         if filepath:
             self.status_bar.showMessage(f"✓ Saved: {filepath}")
             QMessageBox.information(
@@ -972,9 +996,7 @@ class MainWindow(QMainWindow):
     def _switch_to_live_mode(self) -> None:
         """Switch to LIVE simulation mode."""
         # Close any open replay
-        if self.replay_loader:
-            self.replay_loader.close()
-            self.replay_loader = None
+        self._close_replay_loader()
 
         self.mode = SimulationMode.LIVE
 
@@ -1006,11 +1028,12 @@ class MainWindow(QMainWindow):
         """Load an HDF5 recording file."""
         try:
             # Close any existing loader
-            if self.replay_loader:
-                self.replay_loader.close()
+            self._close_replay_loader()
 
-            # Load new file
+            # Load new file (a just-stopped recording may still be closing)
+            self.recorder.wait_for_save()
             self.replay_loader = ReplayLoader(filepath)
+            self.replay_frames = ReplayFrameCache(self.replay_loader)
 
             # Switch to replay mode
             self._switch_to_replay_mode()
@@ -1045,11 +1068,11 @@ class MainWindow(QMainWindow):
     @Slot(float)
     def _on_replay_time_changed(self, t: float) -> None:
         """Handle timeline scrubbing in replay mode."""
-        if self.mode != SimulationMode.REPLAY or self.replay_loader is None:
+        if self.mode != SimulationMode.REPLAY or self.replay_frames is None:
             return
 
-        # Get interpolated state at time t
-        state = self.replay_loader.get_state_at_time(t)
+        # Get interpolated state at time t (usually prefetched)
+        state = self.replay_frames.get_state_at_time(t)
 
         # Convert to dict format expected by PPI/A-scope
         state_dict = state.to_dict()
@@ -1071,6 +1094,15 @@ class MainWindow(QMainWindow):
             if target_data:
                 self.target_inspector.update_target(target_data)
 
+    def _close_replay_loader(self) -> None:
+        """Stop replay prefetching and close the recording."""
+        if self.replay_frames:
+            self.replay_frames.close()
+            self.replay_frames = None
+        if self.replay_loader:
+            self.replay_loader.close()
+            self.replay_loader = None
+
     @Slot()
     def _on_replay_stopped(self) -> None:
         """Handle replay stop."""
@@ -1477,11 +1509,15 @@ class MainWindow(QMainWindow):
         # Auto-save recording if active
         if self.is_recording:
             filepath = self.recorder.stop_recording()
-            if filepath:
-                print(f"[RECORDING] Auto-saved on exit: {filepath}")
+            try:
+                self.recorder.wait_for_save()
+            except RuntimeError as e:
+                QMessageBox.critical(self, "Error", f"Failed to save recording:\n{str(e)}")
+            else:
+                if filepath:
+                    print(f"[RECORDING] Auto-saved on exit: {filepath}")
 
         self._save_settings()
         self._stop_simulation()
-        if self.replay_loader:
-            self.replay_loader.close()
+        self._close_replay_loader()
         event.accept()
@@ -6,7 +6,7 @@ Video player-style controls for replay mode:
 - Play/Pause button
 - Stop button (reset to start)
 - Timeline slider with scrubbing
-- Speed control (0.5x, 1x, 2x, 5x)
+- Speed control (0.25x to 16x) at a fixed ~60 FPS frame rate
 - Current/Total time display
 
 Signals:
@@ -45,7 +45,10 @@ class PlaybackPanel(QWidget):
     stop_requested = Signal()  # stop and reset
 
     # Speed options
-    SPEEDS = [0.25, 0.5, 1.0, 2.0, 5.0]
+    SPEEDS = [0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0]
+
+    # Timer period; speed scales the time step, not the frame rate
+    FRAME_INTERVAL_MS = 16
 
     def __init__(self, parent: QWidget = None):
         super().__init__(parent)
@@ -316,8 +319,7 @@ class PlaybackPanel(QWidget):
 
         if self.is_playing:
             self.play_btn.setText("❚❚")
-            interval = int(33 / self.speed)  # ~30 FPS scaled by speed
-            self._timer.start(interval)
+            self._timer.start(self.FRAME_INTERVAL_MS)
         else:
             self.play_btn.setText("▶")
             self._timer.stop()
@@ -336,7 +338,7 @@ class PlaybackPanel(QWidget):
 
     def _on_timer_tick(self):
         """Advance playback time."""
-        dt = 0.033 * self.speed  # ~30ms * speed
+        dt = self.FRAME_INTERVAL_MS / 1000 * self.speed
         self.current_time += dt
 
         if self.current_time >= self.duration:
@@ -365,13 +367,11 @@ class PlaybackPanel(QWidget):
         """Resume playback after scrubbing."""
         self._slider_pressed = False
         if hasattr(self, "_was_playing") and self._was_playing:
-            self._timer.start(int(33 / self.speed))
+            self._timer.start(self.FRAME_INTERVAL_MS)
 
     def _on_speed_changed(self, index: int):
         """Handle speed selection."""
         self.speed = self.SPEEDS[index]
-        if self.is_playing:
-            self._timer.setInterval(int(33 / self.speed))
         self.speed_changed.emit(self.speed)
 
     def stop(self):
@@ -379,11 +379,11 @@ class RangeDopplerScope(QWidget):
         if pd_meta:
             range_axis = pd_meta.get("range_axis_m", [])
             vel_axis = pd_meta.get("velocity_axis_mps", [])
-            if range_axis:
+            if len(range_axis):
                 max_range_km = range_axis[-1] / 1000.0
                 if max_range_km > 0:
                     self.max_range_km = max_range_km
-            if vel_axis:
+            if len(vel_axis):
                 max_vel = max(abs(vel_axis[0]), abs(vel_axis[-1]))
                 if max_vel > 0:
                     self.max_velocity_mps = max_vel
@@ -407,7 +407,7 @@ class RangeDopplerScope(QWidget):
         # Update blind speed markers and MTI notch (only on mode change)
         if pd_meta:
             blind_speeds = pd_meta.get("blind_speeds_mps", [])
-            if blind_speeds:
+            if len(blind_speeds):
                 self._update_blind_speed_markers(blind_speeds)
 
             mti_order = pd_meta.get("mti_order", 0)
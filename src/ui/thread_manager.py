@@ -6,8 +6,9 @@ Bridge between simulation loop (background thread) and UI (main thread).
 Uses PySide6 signals/slots for thread-safe communication.
 
 Architecture:
-    - SimulationWorker runs engine.step() in a QThread
-    - Emits update_data signal with current state
+    - SimulationWorker runs engine.step() in a QThread at a fixed
+      physics rate, decoupled from the UI rate (FixedStepScheduler)
+    - Emits update_data signal with a double-buffered FrameSnapshot
     - UI connects to signal to update visualization
 
 Reference: PySide6 Threading Best Practices
@@ -18,7 +19,7 @@ import os
 # Import simulation engine
 import sys
 import time
-from typing import Any, Dict, Optional
+from typing import Optional
 
 import numpy as np
 from PySide6.QtCore import QObject, QThread, Signal
@@ -28,6 +29,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 from src.physics.rcs import SwerlingModel
 from src.simulation.engine import SimulationEngine
 from src.simulation.objects import MotionModel, Radar, Target
+from src.simulation.scheduler import FixedStepScheduler, SchedulerStats
+from src.simulation.snapshot import FrameSnapshot, SnapshotBuffers, fill_snapshot
 
 
 class SimulationWorker(QObject):
@@ -37,13 +40,14 @@ class SimulationWorker(QObject):
     Emits signals for UI updates without blocking the main thread.
 
     Signals:
-        update_data: Emitted with current simulation state
+        update_data: Emitted with a FrameSnapshot of the current state;
+            the receiving slot must call release() when done with it
         finished: Emitted when simulation stops
         error: Emitted on error with message
     """
 
     # Signals (must be class attributes)
-    update_data = Signal(dict)
+    update_data = Signal(object)
     finished = Signal()
     error = Signal(str)
 
@@ -52,6 +56,8 @@ class SimulationWorker(QObject):
         engine: SimulationEngine,
         update_rate_hz: float = 30.0,
         parent: Optional[QObject] = None,
+        physics_rate_hz: Optional[float] = None,
+        max_steps_per_tick: int = 10,
     ):
         """
         Initialize simulation worker.
@@ -60,45 +66,57 @@ class SimulationWorker(QObject):
             engine: SimulationEngine instance
             update_rate_hz: UI update rate [Hz]
             parent: Parent QObject
+            physics_rate_hz: Fixed physics step rate [Hz] (default 1 / engine.dt)
+            max_steps_per_tick: Catch-up limit of physics steps per loop pass
         """
         super().__init__(parent)
         self.engine = engine
-        self.update_interval = 1.0 / update_rate_hz
+        self.scheduler = FixedStepScheduler(
+            physics_rate_hz=physics_rate_hz or 1.0 / engine.dt,
+            display_rate_hz=update_rate_hz,
+            max_steps_per_tick=max_steps_per_tick,
+        )
         self._running = False
         self._paused = False
-        self._speed_factor = 1.0
+        self._snapshots = SnapshotBuffers(count=2)  # Double-buffered
+        self._sequence = 0
+        self._tracks: list = []
 
     def run(self):
         """
         Main simulation loop.
 
-        Runs engine.step() at specified rate and emits update signals.
+        Steps the engine at the fixed physics rate, catching up with
+        several steps per pass when behind, and emits update signals at
+        the independent UI rate.
         """
         self._running = True
-        last_update = time.perf_counter()
+        scheduler = self.scheduler
+        scheduler.start(time.perf_counter())
 
         while self._running:
             try:
-                current_time = time.perf_counter()
-                elapsed = current_time - last_update
-
-                if not self._paused and elapsed >= self.update_interval:
-                    # Calculate dt based on speed factor
-                    dt = elapsed * self._speed_factor
-
-                    # Step simulation
-                    results = self.engine.step(dt)
-
-                    # Build state dictionary for UI
-                    state = self._build_state_dict(results)
-
-                    # Emit update signal
-                    self.update_data.emit(state)
-
-                    last_update = current_time
-
-                # Small sleep to prevent CPU spinning - increased for stability
-                time.sleep(0.01)  # 10ms sleep instead of 1ms
+                if self._paused:
+                    # Restart the clocks so paused time is not caught up
+                    scheduler.start(time.perf_counter())
+                    time.sleep(0.01)
+                    continue
+
+                now = time.perf_counter()
+                for _ in range(scheduler.steps_due(now)):
+                    step_start = time.perf_counter()
+                    self.engine.step(scheduler.step_dt)
+                    self._tracks = self._update_tracks()
+                    scheduler.record_step(time.perf_counter() - step_start)
+
+                if scheduler.frame_due(now):
+                    # Fill a snapshot buffer for UI; the slot releases it
+                    state = self._build_snapshot(self._tracks)
+                    scheduler.record_frame(published=state is not None)
+                    if state is not None:
+                        self.update_data.emit(state)
+
+                time.sleep(scheduler.time_until_next(time.perf_counter()))
 
             except Exception as e:
                 self.error.emit(str(e))
@@ -106,167 +124,51 @@ class SimulationWorker(QObject):
 
         self.finished.emit()
 
-    def _build_state_dict(self, results) -> Dict[str, Any]:
+    def _update_tracks(self) -> list:
         """
-        Build state dictionary for UI update.
+        Run one Track-While-Scan update with this step's detections.
 
-        Returns:
-            Dict containing all data needed for visualization
-        """
-        targets_data = []
-        detections_for_tracker = []  # (x, y) positions for tracker
-
-        for target in self.engine.targets:
-            geom = self.engine.radar.calculate_target_geometry(
-                target.position, target.velocity
-            )
-
-            # Get detection status for this target
-            is_detected = self.engine.state.detections.get(target.target_id, False)
-            snr = self.engine.state.snr_values.get(target.target_id, 0.0)
-
-            target_data = {
-                "id": target.target_id,
-                "name": target.target_type,  # For MIL-STD-2525 affiliation
-                "type": target.target_type,
-                "position": target.position.tolist(),
-                "velocity": target.velocity.tolist(),
-                "range_m": geom["range_m"],
-                "range_km": geom["range_m"] / 1000,
-                "azimuth_rad": geom["azimuth_rad"],
-                "azimuth_deg": geom["azimuth_deg"],
-                "elevation_rad": geom["elevation_rad"],
-                "elevation_deg": geom["elevation_deg"],
-                "radial_velocity_mps": geom["radial_velocity_mps"],
-                "rcs_m2": target.rcs_mean,
-                "is_detected": is_detected,
-                "snr_db": snr,
-            }
-            targets_data.append(target_data)
-
-            # Collect detections for tracker
-            if is_detected:
-                detections_for_tracker.append((target.position[0], target.position[1]))
-
-        # ═══ TRACK-WHILE-SCAN UPDATE ═══
-        tracks_data = []
-        if (
-            hasattr(self.engine, "track_manager")
-            and self.engine.track_manager is not None
-        ):
-            try:
-                # Update tracker with detections
-                tracks = self.engine.track_manager.update(
-                    detections_for_tracker, dt=self.engine.dt
-                )
-
-                # Build track data for UI
-                for track in tracks:
-                    track_dict = {
-                        "track_id": track.id,
-                        "id": track.id,
-                        "status": track.status.value,
-                        "position": list(track.position),
-                        "velocity": list(track.velocity),
-                        "speed_mps": track.speed_mps,
-                        "heading_rad": track.heading_rad,
-                        "hits": track.hits,
-                        "misses": track.misses,
-                        "history": track.history[-20:],  # Last 20 positions
-                        "classification": track.classification,
-                        "confidence": track.confidence,
-                    }
-                    # Covariance drives the EKF uncertainty ellipse.
-                    if hasattr(track.state, "P") and track.state.P is not None:
-                        track_dict["covariance"] = track.state.P.tolist()
-                    tracks_data.append(track_dict)
-            except Exception:
-                pass  # Fail silently
+        Runs every step, including steps whose frame is not emitted.
 
-        # Build false targets data for visualization (with safety)
-        false_targets_data = []
+        Returns:
+            Current tracks (empty without a track manager)
+        """
+        track_manager = getattr(self.engine, "track_manager", None)
+        if track_manager is None:
+            return []
+
+        detections = self.engine.state.detections
+        detections_for_tracker = [
+            (target.position[0], target.position[1])
+            for target in self.engine.targets
+            if detections.get(target.target_id, False)
+        ]
         try:
-            for ft in self.engine.false_targets[:20]:  # Cap at 20 for safety
-                false_targets_data.append(
-                    {
-                        "target_id": ft.false_id,
-                        "position": (
-                            ft.position.tolist()
-                            if hasattr(ft.position, "tolist")
-                            else list(ft.position)
-                        ),
-                        "velocity": (
-                            ft.velocity.tolist()
-                            if hasattr(ft.velocity, "tolist")
-                            else list(ft.velocity)
-                        ),
-                        "rcs_m2": ft.rcs_m2,
-                        "ecm_type": ft.ecm_type,
-                        "is_false_target": True,
-                    }
-                )
+            return track_manager.update(detections_for_tracker, dt=self.scheduler.step_dt)
         except Exception:
-            pass  # Fail silently to prevent crash
-
-        # Pulse-Doppler range-Doppler map
-        rd_map_data = None
-        pd_metadata = None
-        if (
-            getattr(self.engine, "pulse_doppler_enabled", False)
-            and self.engine._rd_map is not None
-        ):
-            rdm = self.engine._rd_map
-            rd_map_data = rdm.data_db.tolist()  # Serialize for signal
-            pd_metadata = {
-                "range_axis_m": rdm.range_axis_m.tolist(),
-                "velocity_axis_mps": rdm.velocity_axis_mps.tolist(),
-                "blind_speeds_mps": rdm.blind_speeds_mps,
-                "mti_order": rdm.mti_order,
-                "processing_gain_db": rdm.processing_gain_db,
-                "n_pulses": rdm.n_pulses,
-                "prf_hz": rdm.prf_hz,
-                "wavelength_m": rdm.wavelength_m,
-                "sample_rate_hz": rdm.sample_rate_hz,
-                "range_sample_spacing_m": rdm.range_sample_spacing_m,
-                "max_instrumented_range_m": rdm.max_instrumented_range_m,
-                "max_unambiguous_range_m": rdm.max_unambiguous_range_m,
-                "max_unambiguous_velocity_mps": rdm.max_unambiguous_velocity_mps,
-                "coherent_processing_gain_db": rdm.coherent_processing_gain_db,
-                "window_enbw_bins": rdm.window_enbw_bins,
-            }
-
-        return {
-            "time": self.engine.simulation_time,
-            "radar": {
-                "position": self.engine.radar.position.tolist(),
-                "antenna_azimuth_rad": self.engine.radar.antenna_azimuth,
-                "antenna_azimuth_deg": np.degrees(self.engine.radar.antenna_azimuth),
-                "frequency_ghz": self.engine.radar.frequency_hz / 1e9,
-                "power_kw": self.engine.radar.power_watts / 1e3,
-            },
-            "targets": targets_data,
-            "tracks": tracks_data,  # Track-While-Scan data
-            "detection_count": sum(1 for t in targets_data if t["is_detected"]),
-            "total_targets": len(targets_data),
-            "total_tracks": len(tracks_data),
-            # ECM state for visualization
-            "jamming_active": getattr(self.engine, "ecm_active", False),
-            "ecm_type": getattr(self.engine, "ecm_type", "noise"),
-            "false_targets": false_targets_data,
-            # Pulse-Doppler state
-            "pulse_doppler_enabled": getattr(
-                self.engine, "pulse_doppler_enabled", False
-            ),
-            "rd_map": rd_map_data,
-            "pd_metadata": pd_metadata,
-            # ECCM state
-            "eccm": self._get_eccm_state(),
-            "log": {
-                "total_opportunities": self.engine.log.total_opportunities,
-                "total_detections": self.engine.log.total_detections,
-                "detection_ratio": self.engine.log.detection_ratio,
-            },
-        }
+            return []  # Fail silently
+
+    def _build_snapshot(self, tracks: list) -> Optional[FrameSnapshot]:
+        """
+        Fill the next free snapshot buffer for UI update.
+
+        Returns:
+            FrameSnapshot with all data needed for visualization, or None
+            when the UI still holds every buffer (the frame is dropped)
+        """
+        snapshot = self._snapshots.acquire()
+        if snapshot is None:
+            return None
+        self._sequence += 1
+        fill_snapshot(
+            snapshot,
+            self.engine,
+            self._sequence,
+            tracks=tracks,
+            eccm_state=self._get_eccm_state(),
+        )
+        snapshot.scheduler = self.scheduler.stats()
+        return snapshot
 
     def _get_eccm_state(self) -> dict:
         """
@@ -307,8 +209,12 @@ class SimulationWorker(QObject):
         self._paused = False
 
     def set_speed(self, factor: float):
-        """Set simulation speed factor."""
-        self._speed_factor = max(0.1, min(10.0, factor))
+        """Set simulation speed factor (simulated seconds per wall second)."""
+        self.scheduler.set_speed(max(0.1, min(10.0, factor)))
+
+    def get_stats(self) -> SchedulerStats:
+        """Real-time factor, step latency percentiles and frame counters."""
+        return self.scheduler.stats()
 
     @property
     def is_running(self) -> bool:
@@ -334,7 +240,7 @@ class SimulationThread(QThread):
     """
 
     # Forward signals from worker
-    update_data = Signal(dict)
+    update_data = Signal(object)
     finished = Signal()
     error = Signal(str)
 
@@ -343,6 +249,8 @@ class SimulationThread(QThread):
         engine: SimulationEngine,
         update_rate_hz: float = 30.0,
         parent: Optional[QObject] = None,
+        physics_rate_hz: Optional[float] = None,
+        max_steps_per_tick: int = 10,
     ):
         """
         Initialize simulation thread.
@@ -351,15 +259,24 @@ class SimulationThread(QThread):
             engine: SimulationEngine instance
             update_rate_hz: UI update rate [Hz]
             parent: Parent QObject
+            physics_rate_hz: Fixed physics step rate [Hz] (default 1 / engine.dt)
+            max_steps_per_tick: Catch-up limit of physics steps per loop pass
         """
         super().__init__(parent)
         self.engine = engine
         self.update_rate_hz = update_rate_hz
+        self.physics_rate_hz = physics_rate_hz
+        self.max_steps_per_tick = max_steps_per_tick
         self._worker: Optional[SimulationWorker] = None
 
     def run(self):
         """Thread entry point."""
-        self._worker = SimulationWorker(self.engine, self.update_rate_hz)
+        self._worker = SimulationWorker(
+            self.engine,
+            self.update_rate_hz,
+            physics_rate_hz=self.physics_rate_hz,
+            max_steps_per_tick=self.max_steps_per_tick,
+        )
 
         # Connect worker signals to thread signals
         self._worker.update_data.connect(self.update_data.emit)
@@ -389,6 +306,12 @@ class SimulationThread(QThread):
         if self._worker:
             self._worker.set_speed(factor)
 
+    def get_stats(self) -> Optional[SchedulerStats]:
+        """Scheduler statistics of the running worker (None before start)."""
+        if self._worker:
+            return self._worker.get_stats()
+        return None
+
     def set_ecm_state(
         self, active: bool, ecm_type: str = "noise", target_id: Optional[int] = None
     ):
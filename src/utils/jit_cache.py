@@ -0,0 +1,353 @@
+"""
+Numba JIT Cache and Ahead-of-Time Warmup
+
+Every numba kernel in RadarSim is declared with ``cache=True``, but by
+default numba keys its on-disk cache to the absolute path of each source
+file and stores it next to that file. Frozen builds (``RadarSim.spec``)
+have no source files, read-only installs cannot write ``__pycache__``,
+and a moved checkout misses its cache, so each of them silently pays
+full compilation again in every new process.
+
+This module provides:
+
+- ``configure_jit_cache()``: a cache directory keyed by module name
+  (``<cache_dir>/src.physics.terrain/...``) instead of absolute path, so
+  a cache built once can be shipped with a build or moved with a
+  checkout. Entries are invalidated by the hash of the kernel's source,
+  not by its mtime.
+- ``warmup()``: compiles, or loads from the cache, every kernel for the
+  argument types its call sites actually pass, and reports the time spent
+  per kernel.
+
+The cache directory is taken from ``RADARSIM_JIT_CACHE_DIR``; frozen
+builds and read-only installs fall back to a per-user cache directory.
+It is configured when this module is imported, which ``src`` does before
+loading any kernel module.
+
+Usage:
+    python -m src warmup                        # Precompile every kernel
+    python -m src warmup --cache-dir build/jit  # e.g. before packaging
+
+Note: numba also keys cache entries on the host CPU. Set
+``NUMBA_CPU_NAME=generic`` when building a cache for other machines.
+"""
+
+import argparse
+import functools
+import hashlib
+import importlib
+import inspect
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numba
+import numpy as np
+from numba.core import caching
+from numba.core.caching import _CacheLocator
+
+# Locator registry owner: renamed from _CacheImpl in newer numba releases
+_CACHE_IMPL = getattr(caching, "CacheImpl", None) or getattr(caching, "_CacheImpl")
+
+CACHE_DIR_ENV = "RADARSIM_JIT_CACHE_DIR"
+
+_PACKAGE = "src"
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Active relocatable cache directory (None: numba's default locators)
+_cache_dir: Optional[str] = None
+
+
+def _user_cache_dir() -> str:
+    """Per-user cache directory for RadarSim's compiled kernels."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        return os.path.join(base, "RadarSim", "jit_cache")
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Caches/RadarSim/jit_cache")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "radarsim", "jit_cache")
+
+
+def default_cache_dir() -> Optional[str]:
+    """
+    Cache directory to use when none is given explicitly.
+
+    Returns:
+        ``$RADARSIM_JIT_CACHE_DIR`` if set; the per-user cache directory
+        for frozen builds and read-only installs; otherwise None, which
+        keeps numba's in-tree ``__pycache__`` cache
+    """
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return configured
+    if getattr(sys, "frozen", False) or not os.access(_PACKAGE_DIR, os.W_OK):
+        return _user_cache_dir()
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _hash_file(path: str, mtime: float, size: int) -> str:
+    # mtime/size are part of the key so an edited file is hashed again
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class _RelocatableCacheLocator(_CacheLocator):
+    """
+    Numba cache locator for RadarSim kernels.
+
+    Stores each module's kernels under ``<cache_dir>/<module name>`` and
+    stamps them with a content hash, so the cache survives the package
+    being moved, copied or frozen.
+    """
+
+    def __init__(self, py_func, py_file):
+        self._py_file = py_file
+        self._code = py_func.__code__
+        self._lineno = py_func.__code__.co_firstlineno
+        self._cache_path = os.path.join(_cache_dir, py_func.__module__)
+
+    def get_cache_path(self) -> str:
+        return self._cache_path
+
+    def get_source_stamp(self) -> str:
+        if os.path.exists(self._py_file):
+            stat = os.stat(self._py_file)
+            return _hash_file(self._py_file, stat.st_mtime, stat.st_size)
+        # Frozen build: no source on disk, stamp the kernel's bytecode
+        constants = repr([c for c in self._code.co_consts if not inspect.iscode(c)])
+        return hashlib.sha256(self._code.co_code + constants.encode()).hexdigest()
+
+    def get_disambiguator(self) -> str:
+        return str(self._lineno)
+
+    @classmethod
+    def from_function(cls, py_func, py_file):
+        module = getattr(py_func, "__module__", None) or ""
+        if _cache_dir is None or not module.startswith(_PACKAGE + "."):
+            return None
+        self = cls(py_func, py_file)
+        try:
+            self.ensure_cache_path()
+        except OSError:
+            # Not writable: fall through to numba's own locators
+            return None
+        return self
+
+
+def configure_jit_cache(cache_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Route RadarSim's numba cache to a relocatable directory.
+
+    Kernels choose their cache when they are decorated, so this must run
+    before the kernel modules are imported (this module does so with the
+    default directory when imported); ``warmup()`` rebinds kernels that
+    were imported earlier.
+
+    Args:
+        cache_dir: Cache directory (default: ``default_cache_dir()``)
+
+    Returns:
+        Absolute cache directory, or None if numba's default is kept
+    """
+    global _cache_dir
+
+    cache_dir = cache_dir or default_cache_dir()
+    if cache_dir is None:
+        return None
+
+    _cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+    if _RelocatableCacheLocator not in _CACHE_IMPL._locator_classes:
+        _CACHE_IMPL._locator_classes.insert(0, _RelocatableCacheLocator)
+    return _cache_dir
+
+
+def jit_cache_dir() -> Optional[str]:
+    """Active relocatable cache directory, or None for numba's default."""
+    return _cache_dir
+
+
+# ``src`` imports this module before any kernel module
+configure_jit_cache()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# KERNEL WARMUP
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _kernel_calls() -> List[Tuple[str, str, List[tuple]]]:
+    """
+    Every RadarSim kernel with the arguments its call sites pass.
+
+    Only the argument *types* matter: arguments left out are compiled as
+    omitted defaults, exactly as at the call site. Integer variants of
+    the received-power kernel come from callers passing integer powers
+    or ranges.
+
+    Returns:
+        (module, kernel qualname, example argument tuples) per kernel
+    """
+    vec3 = np.zeros(3)
+    heights = np.zeros((2, 2), dtype=np.float32)
+    targets = np.zeros((1, 3))
+    signal = np.zeros(4, dtype=np.complex128)
+    f = 1.0
+    return [
+        (
+            "src.physics.radar_equation",
+            "_calculate_received_power_jit",
+            [(f,) * 9, (1,) + (f,) * 8, (f,) * 5 + (1,) + (f,) * 3],
+        ),
+        ("src.physics.radar_equation", "_calculate_snr_jit", [(f, f)]),
+        ("src.physics.radar_equation", "_calculate_noise_power_jit", [(f, f, f)]),
+        ("src.physics.radar_equation", "_calculate_doppler_shift_jit", [(f, f)]),
+        ("src.physics.radar_equation", "_calculate_radial_velocity_jit", [(vec3,) * 4]),
+        ("src.physics.radar_equation", "_calculate_slant_range_jit", [(vec3, vec3)]),
+        ("src.physics.radar_equation", "_calculate_detection_range_jit", [(f,) * 9]),
+        ("src.physics.radar_equation", "_calculate_bistatic_received_power_jit", [(f,) * 8]),
+        ("src.physics.rcs", "_aspect_angle_factor_jit", [(f,)]),
+        ("src.physics.ecm", "_calculate_jsr_jit", [(f,) * 8]),
+        ("src.physics.clutter", "ClutterModel._weibull_samples_jit", [(f, f, 1)]),
+        ("src.physics.clutter", "ClutterModel._k_distribution_samples_jit", [(f, f, 1)]),
+        ("src.physics.terrain", "_noise_2d", [(f, f, 1)]),
+        ("src.physics.terrain", "_fractal_noise", [(f, f, 1, f, f, 1)]),
+        ("src.physics.terrain", "_check_los_raycast", [(f,) * 8 + (1, 1)]),
+        ("src.physics.terrain", "_rasterize_heights", [(f, f, f, 1, 1, f, f, 1)]),
+        ("src.physics.terrain", "_terrain_height", [(f, f, heights) + (f,) * 5 + (1,)]),
+        (
+            "src.physics.terrain",
+            "_check_los_batch",
+            [(f, f, f, targets, heights) + (f,) * 5 + (1, 1)],
+        ),
+        (
+            "src.physics.terrain",
+            "_build_mask_slopes",
+            [(f, f, f, 1, 1, f, heights) + (f,) * 5 + (1,)],
+        ),
+        ("src.signal.waveforms", "_generate_lfm_jit", [(1, f, f, True)]),
+        ("src.signal.waveforms", "_matched_filter_jit", [(signal, signal)]),
+        ("src.simulation.objects", "_update_kinematics_cv", [(vec3, vec3, f)]),
+        ("src.simulation.objects", "_update_kinematics_ca", [(vec3, vec3, vec3, f)]),
+    ]
+
+
+def _call_signature(dispatcher, args: tuple) -> tuple:
+    """Numba argument types of a call, with omitted defaults folded in."""
+    parameters = list(inspect.signature(dispatcher.py_func).parameters.values())
+    types = [numba.typeof(arg) for arg in args]
+    types += [numba.types.Omitted(p.default) for p in parameters[len(args) :]]
+    return tuple(types)
+
+
+@dataclass
+class KernelWarmup:
+    """
+    Warmup outcome of one kernel.
+
+    Attributes:
+        name: Fully qualified kernel name
+        signatures: Signatures warmed
+        loaded: Signatures loaded from the disk cache
+        compiled: Signatures compiled from scratch
+        seconds: Wall-clock time spent
+        error: Failure message (empty on success)
+    """
+
+    name: str
+    signatures: int = 0
+    loaded: int = 0
+    compiled: int = 0
+    seconds: float = 0.0
+    error: str = ""
+
+
+def warmup(
+    kernels: Optional[Sequence[str]] = None,
+    progress: Optional[Callable[[KernelWarmup], None]] = None,
+) -> List[KernelWarmup]:
+    """
+    Compile every RadarSim kernel ahead of the first simulation step.
+
+    Signatures found in the disk cache are loaded instead of compiled, so
+    after one warmup a new process only pays the cache load.
+
+    Args:
+        kernels: Only warm these kernels, by qualname or fully qualified
+            name (default: all)
+        progress: Optional callback, called with each kernel's result
+
+    Returns:
+        One KernelWarmup per kernel
+    """
+    results = []
+    for module_name, qualname, calls in _kernel_calls():
+        name = f"{module_name}.{qualname}"
+        if kernels is not None and qualname not in kernels and name not in kernels:
+            continue
+        result = KernelWarmup(name=name)
+        start_time = time.perf_counter()
+        try:
+            dispatcher = functools.reduce(
+                getattr, qualname.split("."), importlib.import_module(module_name)
+            )
+            if _cache_dir is not None:
+                dispatcher.enable_caching()  # Rebind to the configured directory
+            hits = sum(dispatcher.stats.cache_hits.values())
+            misses = sum(dispatcher.stats.cache_misses.values())
+            for args in calls:
+                dispatcher.compile(_call_signature(dispatcher, args))
+            result.signatures = len(calls)
+            result.loaded = sum(dispatcher.stats.cache_hits.values()) - hits
+            result.compiled = sum(dispatcher.stats.cache_misses.values()) - misses
+        except Exception as exc:
+            result.error = f"{type(exc).__name__}: {exc}"
+        result.seconds = time.perf_counter() - start_time
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    return results
+
+
+def format_report(results: Sequence[KernelWarmup]) -> str:
+    """Per-kernel warmup time table."""
+    width = max(len(result.name) for result in results)
+    lines = [f"{'kernel':<{width}} {'sigs':>4} {'cached':>6} {'compiled':>8} {'ms':>9}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<{width}} {result.signatures:>4} {result.loaded:>6} "
+            f"{result.compiled:>8} {result.seconds * 1000:>9.1f}"
+            + (f"  FAILED: {result.error}" if result.error else "")
+        )
+    total = sum(result.seconds for result in results)
+    lines.append(f"{'total':<{width}} {'':>4} {'':>6} {'':>8} {total * 1000:>9.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """``python -m src warmup``: precompile kernels and print the report."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src warmup",
+        description="Compile RadarSim's numba kernels into the JIT cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=f"Cache directory (default: ${CACHE_DIR_ENV}, else numba's __pycache__)",
+    )
+    parser.add_argument("--quiet", action="store_true", help="Only report failures")
+    args = parser.parse_args(argv)
+
+    cache_dir = configure_jit_cache(args.cache_dir)
+    results = warmup()
+    failed = [result for result in results if result.error]
+
+    if not args.quiet:
+        print(f"JIT cache: {cache_dir or 'numba default (__pycache__ next to each module)'}")
+        print(format_report(results))
+    for result in failed if args.quiet else ():
+        print(f"{result.name}: {result.error}", file=sys.stderr)
+    return 1 if failed else 0
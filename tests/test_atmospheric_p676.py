@@ -1,8 +1,9 @@
 import math
 
+import numpy as np
 import pytest
 
-from src.physics.atmospheric import ITU_R_P676
+from src.physics.atmospheric import ITU_R_P676, AtmosphereState
 
 
 ITU_VALIDATION_POINTS = (
@@ -61,3 +62,40 @@ def test_frequency_outside_recommendation_band_is_rejected(frequency):
 def test_invalid_atmospheric_state_is_rejected(kwargs, message):
     with pytest.raises(ValueError, match=message):
         ITU_R_P676.specific_attenuation_oxygen(10.0, **kwargs)
+
+
+class TestAtmosphereState:
+    def test_array_attenuation_matches_classmethod_exactly(self):
+        atmosphere = AtmosphereState(temperature_c=25.0, water_vapor_density=12.0)
+        ranges_km = np.array([0.0, 0.5, 12.0, 87.25, 300.0])
+
+        expected = [
+            ITU_R_P676.total_attenuation(
+                r, 35.0, temperature_c=25.0, water_vapor_density=12.0
+            )
+            for r in ranges_km
+        ]
+
+        np.testing.assert_array_equal(
+            atmosphere.total_attenuation(ranges_km, 35.0), expected
+        )
+        assert atmosphere.total_attenuation(12.0, 35.0) == expected[2]
+
+    def test_specific_attenuation_is_computed_once_per_state(self):
+        AtmosphereState.cache_clear()
+        atmosphere = AtmosphereState()
+
+        for range_km in (1.0, 5.0, 50.0):
+            atmosphere.total_attenuation(range_km, 10.0)
+        AtmosphereState(pressure_hpa=900.0).total_attenuation(1.0, 10.0)
+
+        info = AtmosphereState.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+        assert info.maxsize is not None
+
+    def test_invalid_state_and_negative_range_are_rejected(self):
+        with pytest.raises(ValueError, match="pressure_hpa"):
+            AtmosphereState(pressure_hpa=0.0)
+        with pytest.raises(ValueError, match="range_km"):
+            AtmosphereState().total_attenuation(np.array([1.0, -1.0]), 10.0)
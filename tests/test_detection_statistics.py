@@ -1,7 +1,13 @@
 import numpy as np
 import pytest
 
-from src.physics.metrics import albersheim_snr, calculate_pd_swerling
+from src.physics.metrics import (
+    PdTable,
+    albersheim_snr,
+    calculate_pd_swerling,
+    calculate_pd_swerling_array,
+    get_pd_table,
+)
 
 
 class TestAlbersheim:
@@ -72,3 +78,44 @@ class TestSquareLawDetection:
         permissive = calculate_pd_swerling(8.0, 1e-4, 0, 1)
 
         assert permissive > strict
+
+    @pytest.mark.parametrize("swerling_case", range(5))
+    def test_array_form_matches_scalar(self, swerling_case):
+        snr_axis = np.array([-np.inf, -10.0, 0.0, 7.5, 13.0, 25.0, np.inf])
+        expected = [calculate_pd_swerling(snr, 1e-6, swerling_case, 4) for snr in snr_axis]
+
+        probabilities = calculate_pd_swerling_array(snr_axis, 1e-6, swerling_case, 4)
+
+        np.testing.assert_allclose(probabilities, expected, rtol=1e-12, atol=1e-15)
+
+
+class TestPdTable:
+    @pytest.mark.parametrize("swerling_case", range(5))
+    def test_interpolation_error_is_within_documented_bound(self, swerling_case):
+        table = PdTable(1e-6, swerling_case, 8, snr_min_db=-5.0, snr_max_db=25.0)
+
+        assert table.max_interpolation_error() < 3e-6
+
+    def test_scalar_and_array_queries_agree(self):
+        table = get_pd_table(1e-6, 1, 1)
+        snr_axis = np.array([-3.0, 4.321, 12.5, 19.999])
+
+        scalar = [table(float(snr)) for snr in snr_axis]
+
+        np.testing.assert_allclose(table(snr_axis), scalar, rtol=0.0, atol=1e-15)
+        assert get_pd_table(1e-6, 1, 1) is table
+
+    def test_out_of_grid_and_non_finite_use_exact_quadrature(self):
+        table = PdTable(1e-6, 1, 2, snr_min_db=0.0, snr_max_db=10.0)
+
+        for snr in (-20.0, 30.0, -np.inf, np.inf):
+            assert table(snr) == pytest.approx(
+                calculate_pd_swerling(snr, 1e-6, 1, 2), rel=1e-12
+            )
+
+    def test_disk_cache_round_trip(self, tmp_path):
+        built = PdTable(1e-5, 3, 4, snr_min_db=0.0, snr_max_db=5.0, cache_dir=tmp_path)
+        loaded = PdTable(1e-5, 3, 4, snr_min_db=0.0, snr_max_db=5.0, cache_dir=tmp_path)
+
+        assert len(list(tmp_path.glob("*.npz"))) == 1
+        np.testing.assert_array_equal(loaded.pd_grid, built.pd_grid)
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from src.tracking.ekf import ExtendedKalmanFilter
+from src.tracking.filter_bank import FilterBank
+from src.tracking.kalman import LinearKalmanFilter
+from src.tracking.tracker import TrackManager
+
+
+def random_states(kf, count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        kf.initialize(
+            rng.uniform(-2e4, 2e4, 2),
+            rng.uniform(-200.0, 200.0, 2),
+            position_uncertainty=rng.uniform(10.0, 300.0),
+            velocity_uncertainty=rng.uniform(5.0, 60.0),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_linear_bank_is_bit_identical_to_scalar_filter():
+    kf = LinearKalmanFilter(process_noise=3.0, measurement_noise=40.0)
+    states = random_states(kf, 50)
+    rng = np.random.default_rng(1)
+    rows = rng.permutation(50)[:30]
+    measurements = rng.uniform(-2e4, 2e4, (30, 2))
+
+    bank = FilterBank.from_states(states)
+    bank.predict(kf, dt=0.4)
+    bank.update_linear(kf, measurements, rows)
+
+    for index, state in enumerate(states):
+        expected = kf.predict(state, 0.4)
+        if index in rows:
+            measurement = measurements[list(rows).index(index)]
+            expected = kf.update(expected, tuple(measurement))
+        np.testing.assert_array_equal(bank.x[index], expected.x)
+        np.testing.assert_array_equal(bank.P[index], expected.P)
+
+
+def test_polar_bank_matches_scalar_ekf():
+    batched_ekf = ExtendedKalmanFilter()
+    scalar_ekf = ExtendedKalmanFilter()
+    states = random_states(batched_ekf, 40, seed=2)
+    rng = np.random.default_rng(3)
+    rows = rng.permutation(40)[:25]
+    positions = rng.uniform(-2e4, 2e4, (25, 2))
+    polar = np.column_stack(
+        [np.hypot(positions[:, 0], positions[:, 1]), np.arctan2(positions[:, 1], positions[:, 0])]
+    )
+    snr_db = rng.uniform(-15.0, 45.0, 25)
+
+    bank = FilterBank.from_states(states)
+    bank.predict(batched_ekf, dt=0.5)
+    bank.update_polar(batched_ekf, polar, rows, snr_db=snr_db)
+
+    for row, measurement, snr in zip(rows, polar, snr_db):
+        expected = scalar_ekf.update(
+            scalar_ekf.predict(states[row], 0.5), tuple(measurement), snr_db=snr
+        )
+        np.testing.assert_allclose(bank.x[row], expected.x, rtol=1e-13, atol=1e-9)
+        np.testing.assert_allclose(bank.P[row], expected.P, rtol=1e-12, atol=1e-9)
+    assert batched_ekf._divergence_count == scalar_ekf._divergence_count
+
+
+def test_track_manager_states_follow_scalar_filter():
+    manager = TrackManager(gate_distance=500.0, measurement_noise=20.0)
+    kf = LinearKalmanFilter(process_noise=5.0, measurement_noise=20.0)
+    scans = [
+        [(1000.0, 0.0), (-3000.0, 2000.0)],
+        [(1010.0, 5.0), (-2990.0, 2010.0)],
+        [(1021.0, 9.0)],
+        [(1030.0, 16.0), (-2975.0, 2032.0)],
+    ]
+    expected = {1: kf.initialize(scans[0][0]), 2: kf.initialize(scans[0][1])}
+    manager.update(scans[0], dt=1.0)
+
+    for scan in scans[1:]:
+        manager.update(scan, dt=1.0)
+        for track_id, detection in zip((1, 2), scan + [None]):
+            expected[track_id] = kf.predict(expected[track_id], 1.0)
+            if detection is not None:
+                expected[track_id] = kf.update(expected[track_id], detection)
+
+    for track_id, state in expected.items():
+        np.testing.assert_array_equal(manager.tracks[track_id].state.x, state.x)
+        np.testing.assert_array_equal(manager.tracks[track_id].state.P, state.P)
+
+
+def test_invalid_bank_inputs_are_rejected():
+    kf = LinearKalmanFilter()
+    bank = FilterBank.from_states(random_states(kf, 3))
+
+    with pytest.raises(ValueError, match="P must have shape"):
+        FilterBank(np.zeros((2, 4)), np.zeros((3, 4, 4)))
+    with pytest.raises(ValueError, match="same length"):
+        bank.update_linear(kf, np.zeros((2, 2)), rows=[0])
+    with pytest.raises(ValueError, match="repeat"):
+        bank.update_linear(kf, np.zeros((2, 2)), rows=[1, 1])
+    with pytest.raises(ValueError, match="dt must be positive"):
+        bank.predict(kf, dt=0.0)
@@ -0,0 +1,106 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numba
+
+from src.physics import rcs
+from src.utils import jit_cache
+from src.utils.jit_cache import (
+    CACHE_DIR_ENV,
+    KernelWarmup,
+    default_cache_dir,
+    format_report,
+    warmup,
+)
+
+
+ROOT = Path(__file__).parents[1]
+
+WARMUP_SCRIPT = """
+import json, sys
+from src.utils.jit_cache import configure_jit_cache, warmup
+configure_jit_cache(sys.argv[1])
+(result,) = warmup(kernels=["_calculate_snr_jit"])
+print(json.dumps([result.loaded, result.compiled, result.error]))
+"""
+
+
+def run_warmup(cache_dir):
+    env = dict(os.environ)
+    env.pop(CACHE_DIR_ENV, None)
+    output = subprocess.run(
+        [sys.executable, "-c", WARMUP_SCRIPT, str(cache_dir)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+def test_warmup_cache_is_keyed_by_module_and_reused(tmp_path):
+    cache_dir = tmp_path / "jit"
+
+    assert run_warmup(cache_dir) == [0, 1, ""]
+    assert (cache_dir / "src.physics.radar_equation").is_dir()
+    assert run_warmup(cache_dir) == [1, 0, ""]
+
+
+def test_every_kernel_is_registered():
+    registered = {
+        (module, qualname.rsplit(".", 1)[-1])
+        for module, qualname, _ in jit_cache._kernel_calls()
+    }
+    declared = set()
+    for path in (ROOT / "src").rglob("*.py"):
+        lines = path.read_text(encoding="utf-8").splitlines()
+        module = ".".join(path.relative_to(ROOT).with_suffix("").parts)
+        for index, line in enumerate(lines):
+            if line.strip().startswith("@numba.jit"):
+                definition = next(text for text in lines[index + 1 :] if "def " in text)
+                declared.add((module, definition.split("def ")[1].split("(")[0]))
+    assert declared == registered
+
+
+def test_call_signature_folds_omitted_defaults():
+    (signature,) = [
+        jit_cache._call_signature(rcs._aspect_angle_factor_jit, args)
+        for module, qualname, calls in jit_cache._kernel_calls()
+        if qualname == "_aspect_angle_factor_jit"
+        for args in calls
+    ]
+    assert signature[0] == numba.float64
+    assert [kind.value for kind in signature[1:]] == [0.3, 1.0, 0.5]
+
+
+def test_warmup_reports_each_requested_kernel():
+    seen = []
+    results = warmup(
+        kernels=["_calculate_snr_jit", "src.signal.waveforms._generate_lfm_jit"],
+        progress=seen.append,
+    )
+
+    assert [result.name for result in results] == [
+        "src.physics.radar_equation._calculate_snr_jit",
+        "src.signal.waveforms._generate_lfm_jit",
+    ]
+    assert seen == results
+    assert all(result.signatures == 1 and not result.error for result in results)
+
+    report = format_report(results + [KernelWarmup(name="broken", error="TypingError: x")])
+    assert "_generate_lfm_jit" in report
+    assert "FAILED: TypingError: x" in report
+    assert report.splitlines()[-1].startswith("total")
+
+
+def test_default_cache_dir_prefers_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    assert default_cache_dir() == str(tmp_path)
+
+    monkeypatch.delenv(CACHE_DIR_ENV)
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    assert default_cache_dir() == jit_cache._user_cache_dir()
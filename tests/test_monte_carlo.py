@@ -0,0 +1,128 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from src.simulation.monte_carlo import (
+    MonteCarloBatch,
+    MonteCarloTask,
+    RunStatistics,
+    run_seed,
+    run_task,
+)
+
+
+SCENARIOS = Path(__file__).parents[1] / "scenarios"
+F16 = str(SCENARIOS / "f16_vs_sa6.yaml")
+CLUTTER = str(SCENARIOS / "ground_clutter_filtering.yaml")
+
+
+def test_run_is_reproducible_from_its_seed():
+    task = MonteCarloTask(scenario=F16, run=0, seed=run_seed(0, F16, 0), duration_s=1.0)
+    first = run_task(task)
+    again = run_task(task)
+    other = run_task(
+        MonteCarloTask(scenario=F16, run=1, seed=run_seed(0, F16, 1), duration_s=1.0)
+    )
+
+    assert first.error == ""
+    assert first.name == "F-16 vs SA-6 Air Defense"
+    assert first.n_steps == 30  # 1 s at the scenario's 30 Hz update rate
+    assert first.n_opportunities == first.n_steps * first.n_targets
+    assert first.min_snr_db <= first.mean_snr_db <= first.max_snr_db
+    assert 0.0 <= first.mean_pd <= 1.0
+    for name in ("n_detections", "mean_pd", "mean_snr_db", "min_snr_db", "max_snr_db"):
+        assert getattr(again, name) == getattr(first, name)
+    assert other.mean_snr_db != first.mean_snr_db
+
+
+def test_seeds_depend_on_scenario_run_and_base_seed():
+    seeds = {
+        run_seed(base, scenario, run)
+        for base in (0, 1)
+        for scenario in (F16, CLUTTER)
+        for run in (0, 1)
+    }
+    assert len(seeds) == 8
+    assert run_seed(0, F16, 3) == run_seed(0, F16, 3)
+
+
+def test_csv_batch_appends_and_resumes(tmp_path):
+    output = tmp_path / "mc.csv"
+    batch = MonteCarloBatch(
+        [F16, CLUTTER], n_runs=2, output_path=output, duration_s=0.5, n_workers=0
+    )
+    first = batch.run()
+    assert sorted(stats.key for stats in first) == sorted(
+        (str(Path(scenario)), run) for scenario in (F16, CLUTTER) for run in range(2)
+    )
+
+    seen = []
+    resumed = MonteCarloBatch(
+        [F16, CLUTTER], n_runs=3, output_path=output, duration_s=0.5, n_workers=0
+    )
+    assert len(resumed.pending()) == 2
+    new = resumed.run(progress=lambda stats, done, total: seen.append((done, total)))
+    assert sorted(stats.run for stats in new) == [2, 2]
+    assert seen == [(1, 2), (2, 2)]
+    assert resumed.pending() == []
+    assert resumed.run() == []
+
+    rows = {stats.key: stats for stats in resumed.results()}
+    assert len(rows) == 6
+    for stats in first:
+        row = rows[stats.key]
+        assert isinstance(row, RunStatistics)
+        assert row.seed == stats.seed
+        assert row.n_detections == stats.n_detections
+        assert row.mean_snr_db == pytest.approx(stats.mean_snr_db)
+        assert row.first_detection_s == stats.first_detection_s or (
+            math.isnan(row.first_detection_s) and math.isnan(stats.first_detection_s)
+        )
+
+
+def test_failed_runs_are_recorded_and_retried(tmp_path):
+    scenario = tmp_path / "broken.yaml"
+    scenario.write_text("scenario: {name: Broken}\nradar: {position: [0, 0]}\n")
+    batch = MonteCarloBatch([scenario], n_runs=1, output_path=tmp_path / "mc.csv", n_workers=0)
+
+    (stats,) = batch.run()
+    assert stats.error
+    assert len(batch.results()) == 1
+    assert len(batch.pending()) == 1
+
+
+def test_worker_pool_streams_results(tmp_path):
+    output = tmp_path / "mc.csv"
+    batch = MonteCarloBatch([F16], n_runs=3, output_path=output, duration_s=0.5, n_workers=2)
+    results = batch.run()
+
+    assert sorted(stats.run for stats in results) == [0, 1, 2]
+    assert all(not stats.error for stats in results)
+    serial = run_task(batch.tasks()[1])
+    (pooled,) = [stats for stats in results if stats.run == 1]
+    assert pooled.mean_snr_db == serial.mean_snr_db
+
+
+def test_parquet_dataset_resumes(tmp_path):
+    pytest.importorskip("pyarrow")
+    output = tmp_path / "mc.parquet"
+    MonteCarloBatch(
+        [F16], n_runs=2, output_path=output, duration_s=0.5, n_workers=0, flush_every=1
+    ).run()
+    batch = MonteCarloBatch([F16], n_runs=3, output_path=output, duration_s=0.5, n_workers=0)
+    assert [task.run for task in batch.pending()] == [2]
+    batch.run()
+    assert len(list(output.glob("part-*.parquet"))) == 3
+    assert len(batch.results()) == 3
+
+
+def test_invalid_batch_settings_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="scenario"):
+        MonteCarloBatch([], n_runs=1, output_path=tmp_path / "mc.csv")
+    with pytest.raises(ValueError, match="n_runs"):
+        MonteCarloBatch([F16], n_runs=0, output_path=tmp_path / "mc.csv")
+    with pytest.raises(ValueError, match="duration_s"):
+        MonteCarloBatch([F16], n_runs=1, output_path=tmp_path / "mc.csv", duration_s=0.0)
+    with pytest.raises(ValueError, match=".csv or .parquet"):
+        MonteCarloBatch([F16], n_runs=1, output_path=tmp_path / "mc.json")
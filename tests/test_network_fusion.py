@@ -7,6 +7,7 @@ Tests:
     3. CI weight optimization (ω ∈ [0, 1])
     4. Multi-estimate CI (N > 2)
     5. Strobe Triangulation — error < 10% for 3+ strobes
+       and multi-jammer intersection without ghosts
     6. Triangulation with noise — degrades gracefully
     7. GDOP calculation
     8. Track-to-Track Association
@@ -29,9 +30,11 @@ import pytest
 import src.simulation.network_manager as network_manager
 from src.simulation.network_manager import (
     CovarianceIntersection,
+    JammerFix,
     LatencyModel,
     NetworkManager,
     NetworkTrack,
+    StrobeIntersector,
     StrobeReport,
     StrobeTriangulator,
     TrackAssociator,
@@ -234,6 +237,46 @@ class TestMultiEstimateCI:
         )
 
 
+    def test_dominated_estimate_gets_zero_weight(self):
+        states = [np.zeros(2), np.ones(2), np.full(2, 2.0)]
+        covariances = [np.diag([1.0, 4.0]), np.diag([4.0, 1.0]), np.diag([40.0, 40.0])]
+
+        _, _, weights = CovarianceIntersection.fuse_batch(
+            np.array(states)[np.newaxis], np.array(covariances)[np.newaxis]
+        )
+
+        assert weights[0, 2] == 0.0
+        np.testing.assert_allclose(weights[0, :2], [0.5, 0.5], atol=1e-8)
+
+    def test_batch_matches_per_cluster_fusion_and_warm_start(self):
+        rng = np.random.default_rng(5)
+        factors = rng.standard_normal((6, 3, 4, 4))
+        covariances = factors @ np.swapaxes(factors, -1, -2) + np.eye(4)
+        states = rng.standard_normal((6, 3, 4)) * 10.0
+
+        x_batch, P_batch, weights = CovarianceIntersection.fuse_batch(states, covariances)
+        for k in range(6):
+            x_single, P_single = CovarianceIntersection.fuse_multiple(
+                list(states[k]), list(covariances[k])
+            )
+            np.testing.assert_allclose(x_batch[k], x_single, atol=1e-8)
+            np.testing.assert_allclose(P_batch[k], P_single, atol=1e-8)
+        np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+        assert np.all(weights >= 0.0)
+
+        _, P_warm, warm_weights = CovarianceIntersection.fuse_batch(
+            states, covariances, initial_weights=weights
+        )
+        np.testing.assert_allclose(P_warm, P_batch, atol=1e-8)
+        np.testing.assert_allclose(warm_weights, weights, atol=1e-8)
+
+    def test_batch_rejects_invalid_covariance(self):
+        covariances = np.tile(np.eye(2), (1, 2, 1, 1))
+        covariances[0, 1, 0, 0] = -1.0
+        with pytest.raises(ValueError, match="positive definite"):
+            CovarianceIntersection.fuse_batch(np.zeros((1, 2, 2)), covariances)
+
+
 # ═══════════════════════════════════════════════════════════════════
 # TEST 3: STROBE TRIANGULATION
 # ═══════════════════════════════════════════════════════════════════
@@ -372,6 +415,105 @@ class TestStrobeTriangulation:
         assert result is None
 
 
+class TestStrobeIntersection:
+    """
+    Verify multi-jammer localization without ghost intersections.
+
+    Reference: Poisel (2012), Ch. 6
+    """
+
+    SIGMA = np.radians(0.5)
+
+    def _strobes(self, radars, jammers, rng, sigma=SIGMA):
+        strobes = []
+        for i, radar in enumerate(radars):
+            for jammer in jammers:
+                delta = jammer - radar
+                strobes.append(
+                    StrobeReport(
+                        node_id=f"R{i}",
+                        radar_position=radar,
+                        bearing_rad=np.arctan2(delta[1], delta[0]) + rng.normal(0, sigma),
+                        timestamp=0.0,
+                        bearing_sigma_rad=sigma,
+                    )
+                )
+        return strobes
+
+    def test_two_jammers_three_radars_have_no_ghosts(self):
+        """2 jammers × 3 radars: 2 fixes at the jammers, not at the 2 ghost crossings."""
+        radars = [np.array([0.0, 0.0]), np.array([60000.0, 0.0]), np.array([30000.0, 50000.0])]
+        jammers = np.array([[20000.0, 20000.0], [42000.0, 12000.0]])
+        fixes = StrobeIntersector().locate(self._strobes(radars, jammers, np.random.default_rng(0)))
+
+        assert len(fixes) == 2
+        for fix in fixes:
+            assert isinstance(fix, JammerFix)
+            assert sorted(fix.node_ids) == ["R0", "R1", "R2"]
+        errors = np.linalg.norm(
+            np.array([fix.position for fix in fixes])[:, np.newaxis] - jammers, axis=2
+        )
+        assert sorted(errors.argmin(axis=1)) == [0, 1]
+        assert errors.min(axis=1).max() < 1000.0
+
+    def test_many_jammers(self):
+        """8 jammers × 6 radars: every jammer found once, no extra fixes."""
+        rng = np.random.default_rng(3)
+        radars = list(rng.uniform(-80000.0, 80000.0, (6, 2)))
+        jammers = rng.uniform(-50000.0, 50000.0, (8, 2))
+        strobes = self._strobes(radars, jammers, rng)
+        fixes = StrobeIntersector().locate([strobes[i] for i in rng.permutation(len(strobes))])
+
+        assert len(fixes) == 8
+        errors = np.linalg.norm(
+            np.array([fix.position for fix in fixes])[:, np.newaxis] - jammers, axis=2
+        )
+        assert sorted(errors.argmin(axis=1)) == list(range(8))
+        for fix, error in zip(fixes, errors.min(axis=1)):
+            # Within 4σ of the reported covariance
+            assert error < 4.0 * np.sqrt(np.trace(fix.covariance))
+
+    def test_fix_matches_single_jammer_triangulation(self):
+        """Perfect bearings: batched WLS agrees with triangulate() and gdop()."""
+        radars = [np.array([0.0, 0.0]), np.array([50000.0, 0.0]), np.array([25000.0, 40000.0])]
+        jammer = np.array([[25000.0, 15000.0]])
+        strobes = self._strobes(radars, jammer, np.random.default_rng(1), sigma=1e-9)
+        (fix,) = StrobeIntersector().locate(strobes)
+        position, _ = StrobeTriangulator.triangulate(strobes)
+
+        np.testing.assert_allclose(fix.position, jammer[0], atol=1.0)
+        np.testing.assert_allclose(fix.position, position, atol=1.0)
+        assert fix.gdop == pytest.approx(StrobeTriangulator.gdop(radars, jammer[0]), rel=1e-6)
+        assert fix.residual_m < 1.0
+        np.testing.assert_allclose(fix.covariance, fix.covariance.T)
+        assert np.all(np.linalg.eigvalsh(fix.covariance) > 0.0)
+
+    def test_min_nodes(self):
+        """A jammer seen by 2 radars needs min_nodes=2."""
+        radars = [np.array([0.0, 0.0]), np.array([10000.0, 0.0])]
+        strobes = self._strobes(radars, np.array([[5000.0, 5000.0]]), np.random.default_rng(2))
+        intersector = StrobeIntersector()
+
+        assert intersector.locate(strobes) == []
+        (fix,) = intersector.locate(strobes, min_nodes=2)
+        assert np.linalg.norm(fix.position - [5000.0, 5000.0]) < 200.0
+
+    def test_bearings_behind_radars_do_not_intersect(self):
+        strobes = [
+            StrobeReport("R1", np.array([0.0, 0.0]), np.radians(-135), 0.0),
+            StrobeReport("R2", np.array([10000.0, 0.0]), np.radians(-45), 0.0),
+        ]
+        assert StrobeIntersector().locate(strobes, min_nodes=2) == []
+
+    def test_invalid_settings_are_rejected(self):
+        with pytest.raises(ValueError, match="gate_sigma"):
+            StrobeIntersector(gate_sigma=0.0)
+        with pytest.raises(ValueError, match="min_nodes"):
+            StrobeIntersector(min_nodes=1)
+        with pytest.raises(ValueError, match="bearing_sigma_rad"):
+            StrobeReport("R1", np.zeros(2), 0.0, 0.0, bearing_sigma_rad=0.0)
+
+
 # ═══════════════════════════════════════════════════════════════════
 # TEST 4: GDOP
 # ═══════════════════════════════════════════════════════════════════
@@ -509,6 +651,107 @@ class TestTrackAssociation:
         pairs = assoc.associate([t_a1, t_a2], [t_b1, t_b2])
         assert len(pairs) == 2
 
+    def test_gated_pairs_match_brute_force(self):
+        rng = np.random.default_rng(5)
+        assoc = TrackAssociator(gate_distance_m=800)
+        positions_a = rng.uniform(-5000, 5000, (60, 2))
+        positions_b = rng.uniform(-5000, 5000, (50, 2))
+        covariances_a = np.array([np.diag(rng.uniform(1e4, 1e5, 2)) for _ in positions_a])
+        covariances_b = np.array([np.diag(rng.uniform(1e4, 1e5, 2)) for _ in positions_b])
+
+        rows, cols, nis = assoc.gated_pairs(positions_a, covariances_a, positions_b, covariances_b)
+
+        expected = {}
+        for i, (x_a, P_a) in enumerate(zip(positions_a, covariances_a)):
+            for j, (x_b, P_b) in enumerate(zip(positions_b, covariances_b)):
+                d = x_a - x_b
+                value = d @ np.linalg.solve(P_a + P_b, d)
+                if np.linalg.norm(d) <= 800 and value <= assoc.gate_threshold:
+                    expected[(i, j)] = value
+        assert len(expected) > 10
+        assert dict(zip(zip(rows.tolist(), cols.tolist()), nis)) == pytest.approx(expected)
+
+        rows, cols, _ = assoc.gated_pairs(positions_a, covariances_a)
+        expected = {
+            (i, j)
+            for i in range(len(positions_a))
+            for j in range(i + 1, len(positions_a))
+            if np.linalg.norm(positions_a[i] - positions_a[j]) <= 800
+            and (positions_a[i] - positions_a[j])
+            @ np.linalg.solve(covariances_a[i] + covariances_a[j], positions_a[i] - positions_a[j])
+            <= assoc.gate_threshold
+        }
+        assert len(expected) > 10
+        assert set(zip(rows.tolist(), cols.tolist())) == expected
+
+    def _crossing_tracks(self, n_nodes, rng):
+        """Closely spaced targets seen by every node, with per-node noise."""
+        targets = np.array([[0.0, 0.0], [300.0, 0.0], [150.0, 250.0], [5000.0, 5000.0]])
+        return [
+            [
+                NetworkTrack(
+                    f"R{node}:{k}",
+                    f"R{node}",
+                    np.array([*(target + rng.normal(0, 20, 2)), 0.0, 0.0]),
+                    np.diag([900.0, 900.0, 25.0, 25.0]),
+                    0.0,
+                )
+                for k, target in enumerate(targets)
+            ]
+            for node in range(n_nodes)
+        ]
+
+    def test_gate_matches_pairwise_association(self):
+        rng = np.random.default_rng(4)
+        associator = TrackAssociator(gate_distance_m=300.0)
+        positions_a = rng.uniform(0.0, 1000.0, (200, 2))
+        positions_b = positions_a + rng.normal(0.0, 150.0, (200, 2))
+        covariance = np.diag([2500.0, 2500.0, 4.0, 4.0])
+
+        passed = associator.gate(
+            positions_a,
+            np.tile(covariance[:2, :2], (200, 1, 1)),
+            positions_b,
+            np.tile(covariance[:2, :2], (200, 1, 1)),
+        )
+        expected = [
+            bool(
+                associator.associate(
+                    [NetworkTrack("A", "A", np.r_[a, 0.0, 0.0], covariance, 0.0)],
+                    [NetworkTrack("B", "B", np.r_[b, 0.0, 0.0], covariance, 0.0)],
+                )
+            )
+            for a, b in zip(positions_a, positions_b)
+        ]
+        assert passed.tolist() == expected
+        assert 0 < passed.sum() < 200
+
+    def test_global_association_is_order_invariant(self):
+        assoc = TrackAssociator(gate_distance_m=1000)
+        track_lists = self._crossing_tracks(4, np.random.default_rng(2))
+
+        def partition(lists):
+            return {
+                frozenset(track.track_id for track in cluster)
+                for cluster in assoc.associate_global(lists)
+            }
+
+        clusters = partition(track_lists)
+        assert partition(track_lists[::-1]) == clusters
+        assert partition([track_list[::-1] for track_list in track_lists]) == clusters
+        # Every cluster holds one target seen by all four nodes
+        assert clusters == {frozenset(f"R{node}:{k}" for node in range(4)) for k in range(4)}
+
+    def test_global_association_of_two_nodes_is_the_2d_assignment(self):
+        assoc = TrackAssociator(gate_distance_m=1000)
+        tracks_a, tracks_b = self._crossing_tracks(2, np.random.default_rng(4))
+        pairs = {(a.track_id, b.track_id) for a, b in assoc.associate(tracks_a, tracks_b)}
+        clusters = {
+            tuple(track.track_id for track in cluster)
+            for cluster in assoc.associate_global([tracks_a, tracks_b])
+        }
+        assert clusters == pairs
+
 
 # ═══════════════════════════════════════════════════════════════════
 # TEST 7: NETWORK MANAGER INTEGRATION
@@ -623,6 +866,232 @@ class TestNetworkManager:
         assert len(fused) == 2
         assert {tuple(track.source_nodes) for track in fused} == {("R1",), ("R2",)}
 
+    def test_persistent_clusters_are_warm_started(self, monkeypatch):
+        nm = NetworkManager(link_delay_ms=0, association_gate_m=500)
+        nm.register_node("R1", np.zeros(2))
+        nm.register_node("R2", np.array([10_000.0, 0.0]))
+        nm.submit_tracks(
+            "R1",
+            [NetworkTrack("R1:1", "R1", np.zeros(4), np.diag([100.0, 400.0, 4.0, 4.0]), 0.0)],
+        )
+        nm.submit_tracks(
+            "R2",
+            [NetworkTrack("R2:1", "R2", np.ones(4), np.diag([400.0, 100.0, 4.0, 4.0]), 0.0)],
+        )
+        first = nm.fuse(0.0)
+
+        initial_weights = []
+        fuse_batch = CovarianceIntersection.fuse_batch
+
+        def recording_fuse_batch(states, covariances, initial_weights_=None):
+            initial_weights.append(initial_weights_)
+            return fuse_batch(states, covariances, initial_weights_)
+
+        monkeypatch.setattr(nm.ci, "fuse_batch", recording_fuse_batch)
+        second = nm.fuse(0.5)
+
+        assert len(initial_weights) == 1
+        assert np.all(np.isfinite(initial_weights[0]))
+        assert second[0].fused_id == first[0].fused_id
+        assert np.trace(second[0].covariance) > np.trace(first[0].covariance)
+
+        # Nothing changed since: the cached fused track is returned as-is
+        third = nm.fuse(0.5)
+        assert len(initial_weights) == 1
+        assert third[0] is second[0]
+
+    def _three_node_manager(self):
+        nm = NetworkManager(link_delay_ms=0, association_gate_m=500)
+        for node_id, x in (("R1", 0.0), ("R2", 20_000.0), ("R3", 40_000.0)):
+            nm.register_node(node_id, np.array([x, 0.0]))
+        return nm
+
+    @staticmethod
+    def _tracks(node_id, positions, time_s=0.0):
+        return [
+            NetworkTrack(
+                f"{node_id}:{i}",
+                node_id,
+                np.array([x, y, 100.0, 0.0]),
+                np.diag([100.0, 100.0, 4.0, 4.0]),
+                time_s,
+            )
+            for i, (x, y) in enumerate(positions)
+        ]
+
+    def test_fused_ids_are_stable_across_cycles(self):
+        nm = self._three_node_manager()
+        targets = [(10_000.0, 5_000.0), (30_000.0, -8_000.0)]
+        for node_id in ("R1", "R2", "R3"):
+            nm.submit_tracks(node_id, self._tracks(node_id, targets), 0.0)
+        ids = [track.fused_id for track in nm.fuse(0.0)]
+        assert len(ids) == 2
+
+        for cycle in range(1, 4):
+            time_s = float(cycle)
+            moved = [(x + 100.0 * time_s, y) for x, y in targets]
+            nm.submit_tracks("R2", self._tracks("R2", moved, time_s), time_s)
+            fused = nm.fuse(time_s)
+            assert [track.fused_id for track in fused] == ids
+            assert all(track.source_nodes == ["R1", "R2", "R3"] for track in fused)
+
+    def test_only_changed_nodes_are_reassociated(self, monkeypatch):
+        nm = self._three_node_manager()
+        for node_id in ("R1", "R2", "R3"):
+            nm.submit_tracks(node_id, self._tracks(node_id, [(10_000.0, 5_000.0)]), 0.0)
+        nm.fuse(0.0)
+
+        associated, gated = [], []
+        associate, gate = nm.associator.associate, nm.associator.gate
+
+        def recording_associate(tracks_a, tracks_b):
+            associated.extend(track.node_id for track in tracks_b)
+            return associate(tracks_a, tracks_b)
+
+        def recording_gate(positions_a, *args):
+            gated.append(len(positions_a))
+            return gate(positions_a, *args)
+
+        monkeypatch.setattr(nm.associator, "associate", recording_associate)
+        monkeypatch.setattr(nm.associator, "gate", recording_gate)
+        nm.fuse(1.0)
+        assert associated == [] and gated == []
+
+        # R3's track returns to its cluster through one stacked gate
+        nm.submit_tracks("R3", self._tracks("R3", [(10_100.0, 5_000.0)], 1.0), 1.0)
+        (fused,) = nm.fuse(1.0)
+        assert gated == [1]
+        assert associated == []
+        assert fused.source_nodes == ["R1", "R2", "R3"]
+
+    def test_dropped_tracks_leave_their_cluster(self):
+        nm = self._three_node_manager()
+        for node_id in ("R1", "R2"):
+            nm.submit_tracks(
+                node_id, self._tracks(node_id, [(10_000.0, 5_000.0), (30_000.0, 0.0)]), 0.0
+            )
+        shared, other = nm.fuse(0.0)
+
+        # R2 loses the first target; R1 then drops everything
+        nm.submit_tracks("R2", self._tracks("R2", [(10_000.0, 5_000.0), (30_000.0, 0.0)])[1:], 0.0)
+        fused = nm.fuse(0.0)
+        assert [track.fused_id for track in fused] == [shared.fused_id, other.fused_id]
+        assert fused[0].source_nodes == ["R1"]
+
+        nm.submit_tracks("R1", [], 0.0)
+        (remaining,) = nm.fuse(0.0)
+        assert remaining.source_nodes == ["R2"]
+        assert remaining.fused_id == other.fused_id
+
+    @pytest.mark.parametrize("n_workers", [0, 2])
+    def test_track_dropped_by_a_later_node_in_the_same_cycle(self, n_workers):
+        nm = NetworkManager(link_delay_ms=0, association_gate_m=500, n_workers=n_workers)
+        try:
+            for node_id in ("R1", "R2"):
+                nm.register_node(node_id, np.zeros(2))
+                nm.submit_tracks(node_id, self._tracks(node_id, [(10_000.0, 5_000.0)]), 0.0)
+            (shared,) = nm.fuse(0.0)
+            assert shared.source_nodes == ["R1", "R2"]
+
+            # R1 is re-associated first while R2's member is already gone
+            nm.submit_tracks("R1", self._tracks("R1", [(10_100.0, 5_000.0)], 1.0), 1.0)
+            nm.submit_tracks("R2", [], 1.0)
+            (remaining,) = nm.fuse(1.0)
+        finally:
+            nm.close()
+        assert remaining.source_nodes == ["R1"]
+        assert remaining.fused_id == shared.fused_id
+
+    def test_global_mode_is_independent_of_node_order(self):
+        rng = np.random.default_rng(8)
+        targets = rng.uniform(-20_000, 20_000, (15, 2))
+        partitions, ids = [], []
+        for order in (("R1", "R2", "R3"), ("R3", "R1", "R2")):
+            nm = NetworkManager(link_delay_ms=0, association_gate_m=1000, association_mode="global")
+            for node_id in order:
+                nm.register_node(node_id, np.zeros(2))
+            for node_id in ("R1", "R2", "R3"):
+                noise = np.random.default_rng(int(node_id[1])).normal(0, 5, targets.shape)
+                nm.submit_tracks(node_id, self._tracks(node_id, targets + noise), 0.0)
+            fused = nm.fuse(0.0)
+            partitions.append({frozenset(track.source_nodes) for track in fused})
+            ids.append([track.fused_id for track in fused])
+
+            # Moved tracks from one node keep every fused_id
+            noise = np.random.default_rng(20).normal(0, 5, targets.shape)
+            moved = targets + noise + np.array([50.0, 0.0])
+            nm.submit_tracks("R2", self._tracks("R2", moved, 0.5), 0.5)
+            assert [track.fused_id for track in nm.fuse(0.5)] == ids[-1]
+
+        assert partitions[0] == partitions[1] == {frozenset({"R1", "R2", "R3"})}
+        assert len(ids[0]) == 15
+
+    def _sharded_picture(self, association_mode, **parallel):
+        rng = np.random.default_rng(12)
+        targets = rng.uniform(-150_000, 150_000, (40, 2))
+        nm = NetworkManager(
+            link_delay_ms=0,
+            association_gate_m=1000,
+            association_mode=association_mode,
+            shard_size_m=60_000,
+            **parallel,
+        )
+        try:
+            for node in range(6):
+                node_id = f"R{node}"
+                nm.register_node(node_id, np.zeros(2))
+                positions = targets + rng.normal(0, 5, targets.shape)
+                nm.submit_tracks(node_id, self._tracks(node_id, positions), 0.0)
+            pictures = [nm.fuse(0.0)]
+            nm.submit_tracks("R3", self._tracks("R3", targets + [100.0, 0.0], 1.0), 1.0)
+            pictures.append(nm.fuse(1.0))
+        finally:
+            nm.close()
+        return pictures
+
+    @pytest.mark.parametrize("association_mode", ["sequential", "global"])
+    def test_sharded_fusion_is_deterministic(self, association_mode):
+        serial = self._sharded_picture(association_mode)
+        one = self._sharded_picture(association_mode, n_workers=1)
+        three = self._sharded_picture(association_mode, n_workers=3)
+
+        for serial_tracks, one_tracks, three_tracks in zip(serial, one, three):
+            assert len(serial_tracks) == 40
+            for a, b, c in zip(serial_tracks, one_tracks, three_tracks):
+                assert a.fused_id == b.fused_id == c.fused_id
+                assert a.source_nodes == b.source_nodes == c.source_nodes
+                np.testing.assert_array_equal(b.state, c.state)
+                np.testing.assert_array_equal(b.covariance, c.covariance)
+                np.testing.assert_allclose(a.state, b.state, rtol=1e-9, atol=1e-6)
+                np.testing.assert_allclose(a.covariance, b.covariance, rtol=1e-9, atol=1e-9)
+
+    def test_sharded_fusion_on_process_pool(self):
+        serial = self._sharded_picture("global")
+        pooled = self._sharded_picture("global", n_workers=2, worker_processes=True)
+        assert [track.fused_id for track in pooled[-1]] == [
+            track.fused_id for track in serial[-1]
+        ]
+        for a, b in zip(serial[-1], pooled[-1]):
+            np.testing.assert_allclose(a.covariance, b.covariance, rtol=1e-9, atol=1e-9)
+
+    def test_invalid_sharding_settings_are_rejected(self):
+        with pytest.raises(ValueError, match="n_workers"):
+            NetworkManager(n_workers=-1)
+        with pytest.raises(ValueError, match="shard_size_m"):
+            NetworkManager(shard_size_m=0.0)
+        with pytest.raises(ValueError, match="n_shards"):
+            NetworkManager(n_shards=0)
+
+    def test_invalid_association_mode_is_rejected(self):
+        with pytest.raises(ValueError, match="association_mode"):
+            NetworkManager(association_mode="pairwise")
+
+    def test_track_from_the_future_is_rejected(self):
+        nm = self._three_node_manager()
+        nm.submit_tracks("R1", self._tracks("R1", [(0.0, 0.0)], time_s=2.0), 0.0)
+        with pytest.raises(ValueError, match="future"):
+            nm.fuse(1.0)
+
     def test_jammer_triangulation(self):
         """Jammer triangulation through network manager."""
         nm = NetworkManager()
@@ -657,6 +1126,35 @@ class TestNetworkManager:
         error = np.linalg.norm(est_pos - jammer_true)
         assert error < 100, f"Triangulation error {error:.1f}m"
 
+    def test_multi_jammer_triangulation(self):
+        """Every jammer is located from the latest strobes of each node."""
+        nm = NetworkManager(link_delay_ms=0)
+        radars = {"R1": [0.0, 0.0], "R2": [60000.0, 0.0], "R3": [30000.0, 50000.0]}
+        jammers = np.array([[20000.0, 20000.0], [42000.0, 12000.0], [33000.0, 27000.0]])
+        for nid, position in radars.items():
+            nm.register_node(nid, np.array(position))
+            delta = jammers - nm.nodes[nid].position_xy
+            nm.submit_strobes(
+                nid,
+                [
+                    StrobeReport(nid, nm.nodes[nid].position_xy, bearing, 0.0)
+                    for bearing in np.arctan2(delta[:, 1], delta[:, 0])
+                ],
+                current_time=0.0,
+            )
+
+        jammer_locs = nm.triangulate_jammers(current_time=0.1)
+        assert len(jammer_locs) == len(nm.jammer_fixes) == 3
+        positions = np.array([position for position, _ in jammer_locs])
+        errors = np.linalg.norm(positions[:, np.newaxis] - jammers, axis=2)
+        assert sorted(errors.argmin(axis=1)) == [0, 1, 2]
+        assert errors.min(axis=1).max() < 100.0
+        assert nm.get_status()["n_jammer_locs"] == 3
+
+        # Stale strobes are dropped
+        assert nm.triangulate_jammers(current_time=10.0) == []
+        assert nm.jammer_fixes == []
+
 
 # ═══════════════════════════════════════════════════════════════════
 # TEST 8: PERFORMANCE BENCHMARK
@@ -492,6 +492,140 @@ class TestRangeDopplerMap:
             PulseDopplerProcessor(prf_hz=1000.0, pulse_width_s=1e-3)
 
 
+# ═══════════════════════════════════════════════════════════════════
+# TEST 7: BATCHED MULTI-CPI PROCESSING
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestBatchProcessing:
+    """The CPI-stack API must reproduce the single-CPI chain dwell by dwell."""
+
+    def test_batch_matches_single_cpi_chain(self):
+        processor = PulseDopplerProcessor(
+            n_pulses=32, n_range_bins=256, mti_order=1, window_type="hamming"
+        )
+        ranges = np.array([[9000.0, 12000.0], [20000.0, 0.0], [160000.0, 15000.0]])
+        velocities = np.array([[5.0, -40.0], [120.0, 0.0], [30.0, 7.0]])
+        amplitudes = np.array([[1.0, 0.5], [2.0, 0.0], [1.0, 1.0]])
+
+        stack = processor.generate_cpi_batch(
+            ranges, velocities, amplitudes, noise_power=0.0
+        )
+        rd = processor.process_cpi_batch(
+            ranges, velocities, amplitudes, noise_power=0.0, workers=2
+        )
+
+        assert rd.data_linear.shape == (3, 31, 256)
+        for dwell in range(3):
+            single = processor.process_cpi(
+                ranges[dwell], velocities[dwell], amplitudes[dwell], noise_power=0.0
+            )
+            np.testing.assert_allclose(
+                stack[dwell],
+                processor.generate_cpi(
+                    ranges[dwell], velocities[dwell], amplitudes[dwell], 0.0
+                ),
+                rtol=1e-12,
+                atol=1e-15,
+            )
+            np.testing.assert_allclose(
+                rd.data_linear[dwell], single.data_linear, rtol=1e-9, atol=1e-20
+            )
+
+    def test_shared_targets_with_independent_noise(self, xband_processor):
+        stack = xband_processor.generate_cpi_batch(
+            np.array([10000.0]),
+            np.array([50.0]),
+            np.array([1.0]),
+            noise_power=1e-12,
+            seed=1,
+            n_cpi=4,
+        )
+
+        assert stack.shape == (4, 64, 512)
+        assert not np.allclose(stack[0], stack[1])
+        np.testing.assert_array_equal(
+            stack,
+            xband_processor.generate_cpi_batch(
+                np.array([10000.0]),
+                np.array([50.0]),
+                np.array([1.0]),
+                noise_power=1e-12,
+                seed=1,
+                n_cpi=4,
+            ),
+        )
+
+    def test_invalid_batch_shapes_are_rejected(self, xband_processor):
+        with pytest.raises(ValueError, match="n_cpi, n_targets"):
+            xband_processor.generate_cpi_batch(
+                np.array([1.0]), np.array([0.0]), np.array([1.0])
+            )
+        with pytest.raises(ValueError, match="n_cpi"):
+            xband_processor.generate_cpi_batch(
+                np.ones((2, 1)), np.ones((2, 1)), np.ones((2, 1)), n_cpi=2
+            )
+        with pytest.raises(ValueError, match="cpi_data"):
+            xband_processor.range_compress(np.zeros((2, 3, 64, 512)))
+
+
+class TestPreallocatedProcessing:
+    """Cached filters, in-place ``out=`` and single-precision processing."""
+
+    def test_out_arguments_match_allocating_calls(self):
+        processor = PulseDopplerProcessor(
+            n_pulses=32, n_range_bins=256, mti_order=2, window_type="hann"
+        )
+        raw = processor.generate_cpi(
+            np.array([9000.0]), np.array([40.0]), np.array([1.0]), 1e-6, seed=5
+        )
+        compressed = np.empty((32, 256), dtype=np.complex128)
+        filtered = np.empty((30, 256), dtype=np.complex128)
+        rd = np.empty((30, 256), dtype=np.complex128)
+
+        assert processor.range_compress(raw, out=compressed) is compressed
+        assert processor.mti_cancel(compressed, out=filtered) is filtered
+        assert processor.doppler_fft(filtered, out=rd) is rd
+
+        np.testing.assert_array_equal(compressed, processor.range_compress(raw))
+        np.testing.assert_array_equal(filtered, processor.mti_cancel(compressed))
+        window = PulseDopplerProcessor._generate_window(30, "hann")
+        reference = np.fft.fftshift(
+            np.fft.fft(filtered * window[:, np.newaxis], axis=0), axes=0
+        ) / window.sum()
+        np.testing.assert_allclose(rd, reference, rtol=1e-12, atol=1e-15)
+
+    def test_work_buffers_are_reused_across_cpis(self, xband_processor):
+        xband_processor.process_cpi(np.array([5000.0]), np.array([0.0]), np.array([1.0]))
+        buffers = dict(xband_processor._buffers)
+        xband_processor.process_cpi(np.array([7000.0]), np.array([9.0]), np.array([1.0]))
+
+        assert all(xband_processor._buffers[role] is buffers[role] for role in buffers)
+
+    def test_complex64_mode_tracks_double_precision(self):
+        arguments = (np.array([12000.0]), np.array([25.0]), np.array([1e-3]), 1e-9, 2)
+        double = PulseDopplerProcessor(mti_order=1).process_cpi(*arguments)
+        single = PulseDopplerProcessor(
+            mti_order=1, complex_dtype=np.complex64
+        ).process_cpi(*arguments)
+
+        assert single.data_linear.dtype == np.float32
+        np.testing.assert_allclose(
+            single.data_linear,
+            double.data_linear,
+            rtol=0.0,
+            atol=1e-5 * double.data_linear.max(),
+        )
+
+    def test_invalid_dtype_and_out_are_rejected(self, xband_processor):
+        with pytest.raises(ValueError, match="complex_dtype"):
+            PulseDopplerProcessor(complex_dtype=np.float64)
+        with pytest.raises(ValueError, match="out must have"):
+            xband_processor.range_compress(
+                np.zeros((64, 512)), out=np.empty((64, 512), dtype=np.complex64)
+            )
+
+
 # ═══════════════════════════════════════════════════════════════════
 # SELF-VALIDATION (standalone runner)
 # ═══════════════════════════════════════════════════════════════════
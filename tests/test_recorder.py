@@ -0,0 +1,115 @@
+import h5py
+import numpy as np
+import pytest
+
+from src.io.replay_loader import ReplayLoader
+from src.simulation.recorder import FlightRecorder, validate_hdf5_structure
+
+CONFIG = {"radar_frequency_hz": 10e9, "radar_power_watts": 100e3, "bands": [1, 2]}
+
+
+def make_state(step):
+    targets = [
+        {
+            "id": target_id,
+            "type": "aircraft" if target_id % 2 else "missile",
+            "rcs_m2": float(target_id),
+            "position": [1000.0 * target_id + 10.0 * step, 50.0 * step, 3000.0],
+            "velocity": [10.0, 50.0, float(step)],
+            "range_km": 1.0 + 0.01 * step,
+            "azimuth_rad": 0.1 * target_id,
+            "snr_db": 12.0 - 0.1 * step,
+            "is_detected": (step + target_id) % 3 != 0,
+        }
+        # Target 4 appears mid-session
+        for target_id in (1, 2, 3, 4)
+        if target_id != 4 or step >= 20
+    ]
+    return {"time": 0.1 * step, "targets": targets}
+
+
+def record(recorder, steps=50):
+    recorder.start_recording(CONFIG)
+    for step in range(steps):
+        recorder.record_state(make_state(step))
+    filepath = recorder.stop_recording()
+    assert recorder.wait_for_save(timeout=10.0)
+    return filepath
+
+
+def read_datasets(filepath):
+    datasets = {}
+    with h5py.File(filepath, "r") as f:
+        f.visititems(
+            lambda name, obj: datasets.__setitem__(name, obj[()])
+            if isinstance(obj, h5py.Dataset)
+            else None
+        )
+        metadata = {name: f["targets"][name].attrs["metadata"] for name in f["targets"]}
+        config = dict(f["config"].attrs)
+    return datasets, metadata, config
+
+
+@pytest.mark.parametrize("compression", ["gzip", "lzf", None])
+def test_streamed_file_matches_in_memory_file(tmp_path, compression):
+    expected_path = record(FlightRecorder(tmp_path / "memory"))
+    streamed = FlightRecorder(
+        tmp_path / "stream", streaming=True, batch_size=7, compression=compression, queue_size=2
+    )
+    streamed_path = record(streamed)
+
+    expected, expected_metadata, expected_config = read_datasets(expected_path)
+    actual, metadata, config = read_datasets(streamed_path)
+    assert sorted(actual) == sorted(expected)
+    for name, values in expected.items():
+        assert actual[name].dtype == values.dtype, name
+        np.testing.assert_array_equal(actual[name], values, err_msg=name)
+    assert metadata == expected_metadata
+    assert config == expected_config
+
+    with h5py.File(streamed_path, "r") as f:
+        positions = f["targets/1/positions"]
+        assert positions.chunks == (7, 4)
+        assert positions.maxshape == (None, 4)
+        assert positions.compression == compression
+    assert validate_hdf5_structure(streamed_path)["valid"]
+
+
+def test_streamed_session_replays_and_reports_stats(tmp_path):
+    recorder = FlightRecorder(tmp_path, streaming=True, batch_size=16)
+    recorder.start_recording(CONFIG)
+    for step in range(40):
+        recorder.record_state(make_state(step))
+    stats = recorder.get_recording_stats()
+    filepath = recorder.stop_recording()
+    recorder.wait_for_save()
+
+    assert stats["num_snapshots"] == 40
+    assert stats["num_targets"] == 4
+    assert stats["num_measurements"] == 3 * 40 + 20
+    assert stats["duration_s"] == pytest.approx(3.9)
+    assert recorder.get_recording_stats()["is_recording"] is False
+
+    with ReplayLoader(filepath) as loader:
+        assert sorted(loader.metadata.target_ids) == [1, 2, 3, 4]
+        assert loader.metadata.num_measurements == stats["num_measurements"]
+        assert loader.duration == pytest.approx(3.9)
+
+
+def test_empty_streamed_session_leaves_no_file(tmp_path):
+    recorder = FlightRecorder(tmp_path, streaming=True)
+    recorder.start_recording(CONFIG)
+
+    assert recorder.stop_recording() is None
+    assert not list(tmp_path.glob("*.h5"))
+    recorder.record_state(make_state(0))  # ignored while stopped
+    assert recorder.stop_recording() is None
+
+
+def test_invalid_streaming_options_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="batch_size"):
+        FlightRecorder(tmp_path, streaming=True, batch_size=0)
+    with pytest.raises(ValueError, match="queue_size"):
+        FlightRecorder(tmp_path, streaming=True, queue_size=0)
+    with pytest.raises(ValueError, match="compression"):
+        FlightRecorder(tmp_path, streaming=True, compression="zstd")
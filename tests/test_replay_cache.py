@@ -0,0 +1,100 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.io.replay_cache import ReplayFrameCache
+from src.io.replay_loader import ReplayLoader
+from src.simulation.recorder import FlightRecorder
+
+
+@pytest.fixture
+def loader(tmp_path):
+    recorder = FlightRecorder(tmp_path)
+    recorder.start_recording({"radar_frequency_hz": 3e9})
+    for step in range(200):
+        recorder.record_state(
+            {
+                "time": 0.1 * step,
+                "targets": [
+                    {
+                        "id": target_id,
+                        "position": [1e4 * target_id + 50.0 * step, 20.0 * step, 1e3],
+                        "velocity": [500.0, 200.0, 0.0],
+                        "snr_db": 10.0 + target_id,
+                        "is_detected": step % 2 == 0,
+                    }
+                    for target_id in (1, 2, 3)
+                ],
+            }
+        )
+    filepath = recorder.stop_recording()
+    with ReplayLoader(filepath, persist_index=False) as replay:
+        yield replay
+
+
+def wait_for_prefetch(frames, count, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while frames.stats.prefetched < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert frames.stats.prefetched >= count
+
+
+def assert_same_state(state, expected):
+    assert state.time == pytest.approx(expected.time)
+    assert state.detection_count == expected.detection_count
+    for target, target_expected in zip(state.targets, expected.targets):
+        np.testing.assert_array_equal(target.position, target_expected.position)
+        assert target.snr_db == target_expected.snr_db
+
+
+def test_playback_is_served_from_prefetched_frames(loader):
+    step = 0.016 * 8  # 8x playback at the panel's frame interval
+    with ReplayFrameCache(loader, lookahead=10, time_resolution_s=1e-3) as frames:
+        t = 1.0
+        frames.get_state_at_time(t)
+        t += step
+        frames.get_state_at_time(t)
+        wait_for_prefetch(frames, 10)
+        assert frames.stats.misses == 2
+
+        for _ in range(10):
+            t += step
+            state = frames.get_state_at_time(t)
+            assert_same_state(state, loader.get_state_at_time(round(t / 1e-3) * 1e-3))
+        assert frames.stats.hits == 10
+        assert frames.stats.misses == 2
+        assert frames.stats.hit_rate == pytest.approx(10 / 12)
+
+
+def test_back_scrub_hits_recent_frames(loader):
+    with ReplayFrameCache(loader, lookahead=0, capacity=4) as frames:
+        for t in (2.0, 2.5, 3.0, 3.5):
+            frames.get_state_at_time(t)
+        for t in (3.0, 2.5, 2.0):
+            frames.get_state_at_time(t)
+        assert frames.stats.hits == 3
+
+        frames.get_state_at_time(4.0)  # evicts 3.5, the least recently used
+        assert frames.stats.evictions == 1
+        frames.get_state_at_time(3.5)
+        assert frames.stats.misses == 6
+        assert frames.stats.prefetched == 0
+
+
+def test_prefetch_stops_at_recording_end(loader):
+    with ReplayFrameCache(loader, lookahead=50, time_resolution_s=0.1) as frames:
+        frames.get_state_at_time(19.5)
+        frames.get_state_at_time(19.6)
+        wait_for_prefetch(frames, 3)
+        time.sleep(0.05)
+        assert frames.stats.prefetched == 3  # 19.7, 19.8, 19.9
+
+
+def test_invalid_cache_settings_are_rejected(loader):
+    with pytest.raises(ValueError, match="capacity"):
+        ReplayFrameCache(loader, lookahead=8, capacity=8)
+    with pytest.raises(ValueError, match="lookahead"):
+        ReplayFrameCache(loader, lookahead=-1)
+    with pytest.raises(ValueError, match="time_resolution_s"):
+        ReplayFrameCache(loader, time_resolution_s=0.0)
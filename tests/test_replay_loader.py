@@ -0,0 +1,132 @@
+import os
+
+import h5py
+import numpy as np
+import pytest
+
+from src.io.replay_loader import ReplayLoader
+from src.simulation.recorder import FlightRecorder
+
+
+def make_state(step, rng):
+    targets = [
+        {
+            "id": target_id,
+            "type": "aircraft",
+            "rcs_m2": 2.0,
+            "has_jammer": target_id == 3,
+            "position": rng.uniform(-5e4, 5e4, 3).tolist(),
+            "velocity": rng.uniform(-300.0, 300.0, 3).tolist(),
+            "range_km": 10.0,
+            "azimuth_rad": 0.3,
+            "snr_db": rng.uniform(-5.0, 30.0),
+            "is_detected": bool(rng.random() < 0.6),
+        }
+        # Target 12 appears late, target 7 leaves early
+        for target_id in (1, 3, 7, 12)
+        if (target_id != 12 or step >= 30) and (target_id != 7 or step < 45)
+    ]
+    return {"time": 0.25 * step, "targets": targets}
+
+
+@pytest.fixture(params=["contiguous", "chunked"])
+def recording(request, tmp_path):
+    if request.param == "contiguous":
+        recorder = FlightRecorder(tmp_path)
+    else:
+        recorder = FlightRecorder(tmp_path, streaming=True, batch_size=7)
+    rng = np.random.default_rng(0)
+    recorder.start_recording({"radar_frequency_hz": 3e9})
+    for step in range(80):
+        recorder.record_state(make_state(step, rng))
+    filepath = recorder.stop_recording()
+    recorder.wait_for_save()
+    return filepath
+
+
+def reference_frame(filepath, t):
+    """Per-target scan of fully loaded arrays."""
+    expected = {}
+    with h5py.File(filepath, "r") as f:
+        duration = f["timestamps"][-1]
+        meas = {name: f["measurements"][name][()] for name in f["measurements"]}
+        for name in f["targets"]:
+            positions = f["targets"][name]["positions"][()]
+            velocities = f["targets"][name]["velocities"][()]
+            times = positions[:, 0]
+            tc = max(0.0, min(t, duration))
+            idx = np.searchsorted(times, tc)
+            if idx == 0:
+                i0 = i1 = 0
+            elif idx >= len(times):
+                i0 = i1 = len(times) - 1
+            else:
+                i0, i1 = idx - 1, idx
+            alpha = (tc - times[i0]) / (times[i1] - times[i0]) if i1 != i0 else 0.0
+            position = positions[i0, 1:] + alpha * (positions[i1, 1:] - positions[i0, 1:])
+            velocity = velocities[i0, 1:] + alpha * (velocities[i1, 1:] - velocities[i0, 1:])
+
+            near = np.flatnonzero(
+                (meas["target_id"] == int(name)) & (np.abs(meas["time"] - t) < 0.5)
+            )
+            snr, detected = 0.0, False
+            if near.size:
+                snr, detected = meas["snr_db"][near[-1]], meas["detected"][near[-1]]
+            expected[int(name)] = (position, velocity, snr, detected)
+    return expected
+
+
+@pytest.mark.parametrize("t", [-3.0, 0.0, 0.1, 3.3, 7.5, 11.12, 11.25, 19.75, 40.0])
+def test_frame_matches_full_scan(recording, t):
+    expected = reference_frame(recording, t)
+
+    with ReplayLoader(recording) as loader:
+        frame = loader.get_frame_at_time(t)
+        state = loader.get_state_at_time(t)
+
+    assert sorted(frame.target_ids.tolist()) == sorted(expected)
+    for k, target_id in enumerate(frame.target_ids):
+        position, velocity, snr, detected = expected[target_id]
+        np.testing.assert_array_equal(frame.positions[k], position)
+        np.testing.assert_array_equal(frame.velocities[k], velocity)
+        assert frame.snr_db[k] == snr
+        assert frame.is_detected[k] == detected
+        assert frame.range_km[k] == pytest.approx(np.linalg.norm(position) / 1000)
+        assert 0.0 <= frame.azimuth_deg[k] < 360.0
+    assert state.detection_count == int(frame.is_detected.sum())
+    assert [target.target_id for target in state.targets] == frame.target_ids.tolist()
+    assert state.targets[list(frame.target_ids).index(3)].has_jammer
+
+
+def test_index_sidecar_is_reused_and_invalidated(recording, monkeypatch):
+    with ReplayLoader(recording) as loader:
+        index_path = loader.index_path
+        expected = loader.get_frame_at_time(5.1)
+    assert index_path.exists()
+
+    def fail(self):
+        raise AssertionError("index rebuilt")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ReplayLoader, "_build_index", fail)
+        with ReplayLoader(recording) as loader:
+            np.testing.assert_array_equal(loader.get_frame_at_time(5.1).positions, expected.positions)
+
+        # A modified recording invalidates the sidecar
+        stat = os.stat(recording)
+        os.utime(recording, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        with pytest.raises(AssertionError, match="index rebuilt"):
+            ReplayLoader(recording)
+
+
+def test_index_can_stay_in_memory(recording):
+    with ReplayLoader(recording, persist_index=False, cache_bytes=1) as loader:
+        frame = loader.get_frame_at_time(12.6)
+        times, snr = loader.get_snr_history(7)
+    assert not os.path.exists(f"{recording}.idx.npz")
+    assert sorted(frame.target_ids.tolist()) == [1, 3, 7, 12]
+
+    with h5py.File(recording, "r") as f:
+        mask = f["measurements/target_id"][()] == 7
+        np.testing.assert_array_equal(times, f["measurements/time"][()][mask])
+        np.testing.assert_array_equal(snr, f["measurements/snr_db"][()][mask])
@@ -0,0 +1,92 @@
+import pytest
+
+from src.simulation.scheduler import FixedStepScheduler
+
+
+def test_steps_follow_the_physics_rate_not_the_tick_rate():
+    scheduler = FixedStepScheduler(physics_rate_hz=100.0, display_rate_hz=30.0)
+    scheduler.start(0.0)
+    # Irregular ticks averaging 7 ms: the step count tracks elapsed time only
+    now, steps = 0.0, 0
+    for tick in range(300):
+        now += 0.004 if tick % 2 else 0.010
+        steps += scheduler.steps_due(now)
+    assert steps == pytest.approx(now * 100.0, abs=1)
+    assert scheduler.step_dt == pytest.approx(0.01)
+
+
+def test_speed_factor_runs_more_fixed_steps():
+    scheduler = FixedStepScheduler(physics_rate_hz=50.0, max_steps_per_tick=100)
+    scheduler.set_speed(8.0)
+    scheduler.start(0.0)
+    steps = sum(scheduler.steps_due(0.1 * tick) for tick in range(1, 11))
+    assert steps == 400  # 1 s of wall time at 8x, 50 Hz
+    stats = scheduler.stats()
+    assert stats.real_time_factor == pytest.approx(8.0)
+    assert stats.skipped_steps == 0
+
+
+def test_catch_up_is_bounded_and_backlog_is_skipped():
+    scheduler = FixedStepScheduler(physics_rate_hz=100.0, max_steps_per_tick=5)
+    scheduler.start(0.0)
+    assert scheduler.steps_due(0.5) == 5  # 50 steps due after a 500 ms stall
+    assert scheduler.steps_due(0.51) == 1  # Backlog discarded, not carried over
+    stats = scheduler.stats()
+    assert stats.skipped_steps == 45
+    assert stats.real_time_factor == pytest.approx(0.06 / 0.51)
+
+
+def test_frames_run_at_display_rate_without_bursts():
+    scheduler = FixedStepScheduler(physics_rate_hz=1000.0, display_rate_hz=20.0)
+    scheduler.start(0.0)
+    frames = sum(scheduler.frame_due(0.001 * tick) for tick in range(1000))
+    assert frames == 20
+
+    # After a stall, one frame is due, not one per missed interval
+    assert scheduler.frame_due(5.0)
+    assert not scheduler.frame_due(5.01)
+    assert scheduler.frame_due(5.05)
+
+
+def test_restart_does_not_catch_up_paused_time():
+    scheduler = FixedStepScheduler(physics_rate_hz=100.0)
+    scheduler.start(0.0)
+    assert scheduler.steps_due(0.05) == 5
+    scheduler.start(10.0)  # Resume after a 10 s pause
+    assert scheduler.steps_due(10.02) == 2
+    assert scheduler.stats().real_time_factor == pytest.approx(1.0)
+
+
+def test_time_until_next_wakes_for_the_earlier_deadline():
+    scheduler = FixedStepScheduler(physics_rate_hz=10.0, display_rate_hz=50.0)
+    scheduler.start(0.0)
+    assert scheduler.frame_due(0.0)
+    assert scheduler.steps_due(0.0) == 0
+    assert scheduler.time_until_next(0.0) == pytest.approx(0.02)  # Next frame
+    scheduler.set_speed(10.0)
+    assert scheduler.time_until_next(0.0) == pytest.approx(0.01)  # Next step
+
+
+def test_stats_report_latency_percentiles_and_frames():
+    scheduler = FixedStepScheduler(latency_window=100)
+    for ms in range(1, 201):
+        scheduler.record_step(ms / 1000)
+    scheduler.record_frame(published=True)
+    scheduler.record_frame(published=False)
+    stats = scheduler.stats()
+    assert stats.steps == 200
+    assert stats.step_p50_ms == pytest.approx(150.5)  # Last 100 steps only
+    assert stats.step_p99_ms == pytest.approx(199.01)
+    assert stats.frames_published == 1
+    assert stats.dropped_frames == 1
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError, match="physics_rate_hz"):
+        FixedStepScheduler(physics_rate_hz=0.0)
+    with pytest.raises(ValueError, match="display_rate_hz"):
+        FixedStepScheduler(display_rate_hz=-1.0)
+    with pytest.raises(ValueError, match="max_steps_per_tick"):
+        FixedStepScheduler(max_steps_per_tick=0)
+    with pytest.raises(ValueError, match="speed"):
+        FixedStepScheduler(speed_factor=0.0)
@@ -388,7 +388,12 @@ class TestCFARDetector:
         standard_deviation = np.sqrt(1e-3 * (1.0 - 1e-3) / sample_count)
         assert abs(measured - 1e-3) < 4.0 * standard_deviation
 
-    def test_true_2d_ca_cfar_detects_target_and_returns_calibrated_threshold(self):
+    @pytest.mark.parametrize(
+        "cfar_type", [CFARType.CA, CFARType.GO, CFARType.SO, CFARType.OS]
+    )
+    def test_true_2d_cfar_detects_target_and_returns_calibrated_threshold(
+        self, cfar_type
+    ):
         rng = np.random.default_rng(9)
         power = rng.exponential(size=(64, 96))
         power[32, 48] = 100.0
@@ -396,7 +401,7 @@ class TestCFARDetector:
             guard_cells=1,
             reference_cells=3,
             pfa=1e-3,
-            cfar_type=CFARType.CA,
+            cfar_type=cfar_type,
         )
 
         detections, thresholds = detector.detect_2d(power, db_input=False)
@@ -405,6 +410,55 @@ class TestCFARDetector:
         assert thresholds[32, 48] > 0.0
         assert not np.any(thresholds[:4])
 
+    @pytest.mark.parametrize(
+        "cfar_type", [CFARType.CA, CFARType.GO, CFARType.SO, CFARType.OS]
+    )
+    def test_2d_cfar_matches_per_cell_training_window(self, cfar_type):
+        rng = np.random.default_rng(4)
+        power = rng.exponential(size=(20, 24))
+        detector = CFARDetector(
+            guard_cells=1, reference_cells=2, pfa=1e-3, cfar_type=cfar_type
+        )
+        _, thresholds = detector.detect_2d(power, db_input=False)
+
+        margin = 3
+        training = np.ones((7, 7), dtype=bool)
+        training[2:5, 2:5] = False
+        left = training.copy()
+        left[:, margin + 1 :] = False
+        left[margin:, margin] = False
+        right = training & ~left
+        rank = int(np.ceil(detector.os_rank / 4 * training.sum()))
+
+        multipliers = []
+        for row, column in [(3, 3), (9, 14), (16, 20)]:
+            window = power[row - 3 : row + 4, column - 3 : column + 4]
+            if cfar_type == CFARType.CA:
+                level = window[training].mean()
+            elif cfar_type == CFARType.GO:
+                level = max(window[left].mean(), window[right].mean())
+            elif cfar_type == CFARType.SO:
+                level = min(window[left].mean(), window[right].mean())
+            else:
+                level = np.sort(window[training])[rank - 1]
+            multipliers.append(thresholds[row, column] / level)
+
+        assert multipliers == pytest.approx([multipliers[0]] * 3, rel=1e-12)
+
+    @pytest.mark.parametrize(
+        "cfar_type", [CFARType.CA, CFARType.GO, CFARType.SO, CFARType.OS]
+    )
+    def test_2d_cfar_false_alarm_rate_on_noise(self, cfar_type):
+        rng = np.random.default_rng(2027)
+        power = rng.exponential(size=(600, 600))
+        detector = CFARDetector(
+            guard_cells=1, reference_cells=2, pfa=1e-3, cfar_type=cfar_type
+        )
+
+        detections, _ = detector.detect_2d(power, db_input=False)
+
+        assert np.mean(detections[3:-3, 3:-3]) == pytest.approx(1e-3, rel=0.15)
+
     def test_cfar_loss_is_positive_and_relative_to_known_noise_threshold(self):
         loss_db = CFARDetector.calculate_cfar_loss(32, 1e-6)
         assert loss_db == pytest.approx(0.94, abs=0.05)
@@ -26,9 +26,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.simulation.engine import (
     SimulationEngine,
+    SimulationLog,
     validate_detection_logic,
     validate_linear_motion,
 )
+from src.physics.rcs import SwerlingModel
+from src.physics.terrain import TerrainConfig, TerrainMap
 from src.simulation.objects import (
     KinematicState,
     MotionModel,
@@ -315,9 +318,250 @@ class TestKinematicState:
         assert state.position[2] == 0.0
 
 
+# =============================================================================
+# TEST 7: Vectorized (batch) Engine Step
+# =============================================================================
+
+
+def _build_mixed_engine(**kwargs):
+    """Deterministic-RCS scene with CV, CA and static targets."""
+    rng = np.random.default_rng(7)
+    radar = Radar(radar_id="test", position=np.array([0.0, 0.0, 30.0]))
+    models = [
+        MotionModel.CONSTANT_VELOCITY,
+        MotionModel.CONSTANT_ACCELERATION,
+        MotionModel.STATIC,
+    ]
+    targets = []
+    for i in range(12):
+        position = rng.uniform(-40e3, 40e3, 3)
+        position[2] = abs(position[2]) / 20.0
+        targets.append(
+            Target(
+                target_id=i,
+                position=position,
+                velocity=rng.uniform(-300.0, 300.0, 3),
+                acceleration=rng.uniform(-5.0, 5.0, 3),
+                rcs_m2=rng.uniform(0.5, 10.0),
+                swerling_model=SwerlingModel.SWERLING_0,
+                motion_model=models[i % 3],
+                has_jammer=i % 5 == 0,
+            )
+        )
+    return SimulationEngine(radar=radar, targets=targets, dt=0.1, **kwargs)
+
+
+class TestBatchStep:
+    """step_batch() must reproduce the physics of the scalar step()."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"enable_clutter": True},
+            {"enable_clutter": True, "terrain_type": "sea"},
+            {"enable_clutter": True, "rain_rate_mm_hr": 10.0},
+            {"terrain": TerrainMap(TerrainConfig(seed=3, max_height=60.0))},
+        ],
+    )
+    def test_matches_scalar_step(self, kwargs):
+        scalar = _build_mixed_engine(**kwargs)
+        batched = _build_mixed_engine(**kwargs)
+        scalar.set_ecm_mode(True, "noise")
+        batched.set_ecm_mode(True, "noise")
+
+        for _ in range(3):
+            expected = scalar.step()
+            block = batched.step_batch()
+
+        for reference, result in zip(expected, block.to_results()):
+            assert result.target_id == reference.target_id
+            for name in (
+                "true_range_m",
+                "true_azimuth_rad",
+                "true_velocity_mps",
+                "true_rcs_m2",
+                "snr_db",
+                "pd",
+                "atmospheric_loss_db",
+                "rain_attenuation_db",
+                "surface_clutter_loss_db",
+                "rain_clutter_loss_db",
+                "jammer_loss_db",
+            ):
+                assert getattr(result, name) == pytest.approx(
+                    getattr(reference, name), rel=1e-9, abs=1e-9
+                ), name
+            assert result.surface_clutter_model == reference.surface_clutter_model
+            assert (result.jammer_jsr_db is None) == (reference.jammer_jsr_db is None)
+
+    def test_targets_observe_batched_kinematics(self):
+        engine = _build_mixed_engine()
+        target = engine.targets[0]
+        start = target.position.copy()
+
+        engine.step_batch()
+
+        np.testing.assert_allclose(target.position, start + target.velocity * 0.1)
+
+    def test_batched_kinematics_keep_position_history(self):
+        scalar = _build_mixed_engine()
+        batched = _build_mixed_engine()
+        for _ in range(3):
+            scalar.step()
+            batched.step_batch()
+
+        for reference, target in zip(scalar.targets, batched.targets):
+            assert len(target._position_history) == 3
+            np.testing.assert_allclose(
+                target._position_history, reference._position_history, rtol=1e-12
+            )
+            np.testing.assert_array_equal(target._position_history[-1], target.position)
+            assert not np.shares_memory(target._position_history[-1], target.position)
+
+    def test_log_counts_and_history(self):
+        engine = _build_mixed_engine(batch_mode=True)
+        log = engine.run(duration_s=0.5)
+
+        assert log.total_opportunities == 5 * len(engine.targets)
+        history = log.get_target_history(3)
+        assert len(history) == 5
+        assert [r.time for r in history] == sorted(r.time for r in history)
+
+    def test_scalar_step_after_batch_rebinds(self):
+        engine = _build_mixed_engine()
+        engine.step_batch()
+        engine.step()
+        engine.step_batch()
+        target = engine.targets[0]
+
+        history = engine.log.get_target_columns(target.target_id)
+        assert history["true_range_m"][-1] == pytest.approx(
+            np.linalg.norm(target.position - engine.radar.position)
+        )
+
+    def test_fixed_site_masking_uses_horizon_profile(self):
+        terrain = TerrainMap(TerrainConfig(seed=3, max_height=60.0))
+        engine = _build_mixed_engine(terrain=terrain)
+
+        engine.step_batch()
+        assert terrain._horizon_profile is None
+        engine.step_batch()
+        profile = terrain._horizon_profile
+        assert profile is not None and profile.matches(engine.radar.position)
+
+        engine.radar.state.position[0] += 100.0
+        engine.step_batch()
+        assert terrain._horizon_profile is profile
+
+    def test_scalar_step_judges_radar_motion_once_per_step(self):
+        terrain = TerrainMap(TerrainConfig(seed=3, max_height=60.0))
+        engine = _build_mixed_engine(terrain=terrain)
+
+        # Moving radar: exact LOS for every target, no profile
+        for _ in range(3):
+            engine.radar.state.position[0] += 100.0
+            engine.step()
+        assert terrain._horizon_profile is None
+
+        engine.step()
+        profile = terrain._horizon_profile
+        assert profile is not None and profile.matches(engine.radar.position)
+        engine.step()
+        assert terrain._horizon_profile is profile
+
+
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
+
+
+class TestSimulationLog:
+    """The columnar log must return exactly what the engine produced."""
+
+    def test_history_round_trips_scalar_and_batch_results(self):
+        engine = _build_mixed_engine(enable_clutter=True)
+        produced = []
+        for step in (engine.step, engine.step_batch, engine.step):
+            output = step()
+            produced.extend(output if isinstance(output, list) else output.to_results())
+
+        for target_id in (0, 5):
+            expected = [r for r in produced if r.target_id == target_id]
+            assert engine.log.get_target_history(target_id) == expected
+        assert engine.log.get_target_history(99) == []
+
+    def test_columns_grow_past_initial_capacity(self):
+        engine = _build_mixed_engine(batch_mode=True)
+        engine.log = SimulationLog(initial_capacity=5)
+        engine.run(duration_s=1.0)
+
+        assert len(engine.log) == 10 * len(engine.targets)
+        columns = engine.log.get_target_columns(4)
+        np.testing.assert_allclose(columns["time"], np.arange(1, 11) * 0.1)
+
+    @pytest.mark.parametrize("initial_capacity", [1024, 16])
+    def test_ring_buffer_keeps_only_the_retention_window(self, initial_capacity):
+        engine = _build_mixed_engine(batch_mode=True)
+        engine.log = SimulationLog(retention_s=0.25, initial_capacity=initial_capacity)
+        engine.run(duration_s=3.0)
+
+        history = engine.log.get_target_history(2)
+        assert [round(r.time, 6) for r in history] == [2.8, 2.9, 3.0]
+        assert engine.log.total_opportunities == 30 * len(engine.targets)
+        # Live rows stay within a few steps; the buffer stops growing once
+        # eviction frees half of it
+        assert engine.log._capacity <= max(initial_capacity, 16 * len(engine.targets))
+
+    def test_spilled_rows_are_read_back(self, tmp_path):
+        engine = _build_mixed_engine(log_retention_s=0.2, log_spill_dir=tmp_path)
+        engine.log = SimulationLog(retention_s=0.2, spill_dir=tmp_path, initial_capacity=16)
+        produced = []
+        for _ in range(20):
+            produced.extend(engine.step_batch().to_results())
+
+        assert list(tmp_path.glob("*.npz"))
+        assert len(engine.log) < len(produced)
+        expected = [r for r in produced if r.target_id == 7]
+        assert engine.log.get_target_history(7) == expected
+
+    def test_deprecated_detection_history_lists_every_row(self, tmp_path):
+        engine = _build_mixed_engine()
+        engine.log = SimulationLog(retention_s=0.2, spill_dir=tmp_path, initial_capacity=16)
+        produced = []
+        for _ in range(10):
+            produced.extend(engine.step())
+            produced.extend(engine.step_batch().to_results())
+
+        with pytest.deprecated_call():
+            history = engine.log.detection_history
+        assert history == produced
+        with pytest.raises(AttributeError):
+            engine.log.detection_history = []
+
+    def test_second_run_does_not_overwrite_spilled_rows(self, tmp_path):
+        engine = _build_mixed_engine(batch_mode=True)
+        first_log = SimulationLog(retention_s=0.2, spill_dir=tmp_path, initial_capacity=16)
+        engine.log = first_log
+        engine.run(duration_s=2.0)
+        expected = first_log.get_target_history(7)
+
+        # Same spill directory, sequence numbers restart at 0
+        engine.reset()
+        engine.log = SimulationLog(retention_s=0.2, spill_dir=tmp_path, initial_capacity=16)
+        engine.step_batch()
+        engine.run(duration_s=2.0)
+
+        assert first_log.get_target_history(7) == expected
+        assert len(list(tmp_path.glob("*.npz"))) == len(first_log._spill_chunks) + len(
+            engine.log._spill_chunks
+        )
+
+    def test_invalid_retention_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="retention_s"):
+            SimulationLog(retention_s=0.0)
+        with pytest.raises(ValueError, match="spill_dir requires"):
+            SimulationLog(spill_dir=tmp_path)
@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+
+from src.physics.rcs import SwerlingModel
+from src.simulation.engine import SimulationEngine
+from src.simulation.objects import Radar, Target
+from src.simulation.snapshot import (
+    HISTORY_LENGTH,
+    FrameSnapshot,
+    SnapshotBuffers,
+    fill_snapshot,
+)
+
+
+def build_engine():
+    rng = np.random.default_rng(3)
+    radar = Radar(radar_id="test", position=np.array([100.0, -50.0, 30.0]))
+    targets = []
+    for i in range(8):
+        position = rng.uniform(-30e3, 30e3, 3)
+        position[2] = abs(position[2]) / 10.0
+        targets.append(
+            Target(
+                target_id=i,
+                position=position,
+                velocity=rng.uniform(-250.0, 250.0, 3),
+                rcs_m2=rng.uniform(1.0, 20.0),
+                swerling_model=SwerlingModel.SWERLING_0,
+                target_type="aircraft" if i % 2 else "missile",
+            )
+        )
+    # Target on top of the radar: zero range, radial velocity defined as 0
+    targets.append(
+        Target(target_id=99, position=radar.position.copy(), velocity=np.array([10.0, 0.0, 0.0]))
+    )
+    return SimulationEngine(radar=radar, targets=targets, dt=0.1)
+
+
+def step(engine, n_steps=1):
+    tracks = []
+    for _ in range(n_steps):
+        engine.step(engine.dt)
+        detections = [
+            (target.position[0], target.position[1])
+            for target in engine.targets
+            if engine.state.detections.get(target.target_id, False)
+        ]
+        tracks = engine.track_manager.update(detections, dt=engine.dt)
+    return tracks
+
+
+def test_target_rows_match_scalar_geometry():
+    engine = build_engine()
+    step(engine)
+    snapshot = fill_snapshot(FrameSnapshot(), engine, sequence=1)
+
+    assert snapshot.time == pytest.approx(engine.simulation_time)
+    assert len(snapshot.targets) == len(engine.targets)
+    for row, target in zip(snapshot.targets, engine.targets):
+        geometry = engine.radar.calculate_target_geometry(target.position, target.velocity)
+        assert row["id"] == target.target_id
+        assert row["type"] == target.target_type
+        np.testing.assert_array_equal(row["position"], target.position)
+        assert row["range_m"] == pytest.approx(geometry["range_m"])
+        assert row["azimuth_rad"] == pytest.approx(geometry["azimuth_rad"])
+        assert row["elevation_rad"] == pytest.approx(geometry["elevation_rad"])
+        assert row["radial_velocity_mps"] == pytest.approx(
+            geometry["radial_velocity_mps"], abs=1e-9
+        )
+        assert row["is_detected"] == engine.state.detections.get(target.target_id, False)
+        assert row["snr_db"] == engine.state.snr_values.get(target.target_id, 0.0)
+    assert snapshot.detection_count == sum(engine.state.detections.values())
+
+
+def test_mapping_reads_like_the_former_state_dict():
+    engine = build_engine()
+    tracks = step(engine, n_steps=30)
+    assert tracks
+    snapshot = fill_snapshot(FrameSnapshot(), engine, sequence=1, tracks=tracks)
+
+    target = snapshot["targets"][0]
+    geometry = engine.radar.calculate_target_geometry(
+        engine.targets[0].position, engine.targets[0].velocity
+    )
+    assert target["name"] == target["type"] == engine.targets[0].target_type
+    assert isinstance(target["position"], list)
+    assert target["range_km"] == pytest.approx(geometry["range_m"] / 1000)
+    assert target["azimuth_deg"] == pytest.approx(geometry["azimuth_deg"])
+    assert snapshot.get("total_targets") == len(engine.targets)
+    assert snapshot["targets"] is snapshot["targets"]  # Built once per frame
+
+    for track_dict, track in zip(snapshot["tracks"], tracks):
+        assert track_dict["id"] == track_dict["track_id"] == track.id
+        assert track_dict["status"] == track.status.value
+        assert track_dict["position"] == pytest.approx(list(track.position))
+        assert track_dict["history"] == pytest.approx(track.history[-HISTORY_LENGTH:])
+        np.testing.assert_allclose(track_dict["covariance"], track.state.P)
+    assert snapshot["total_tracks"] == len(tracks)
+    assert snapshot["rd_map"] is None
+    assert set(snapshot.to_dict()) == set(snapshot)
+    with pytest.raises(KeyError):
+        snapshot["missing"]
+
+
+def test_snapshot_arrays_are_read_only():
+    engine = build_engine()
+    step(engine)
+    snapshot = fill_snapshot(FrameSnapshot(), engine, sequence=1)
+    with pytest.raises(ValueError):
+        snapshot.targets["range_m"][0] = 0.0
+
+
+def test_rd_map_is_a_read_only_copy():
+    engine = build_engine()
+    engine.set_pulse_doppler_mode(True, n_pulses=16)
+    if not engine.pulse_doppler_enabled:
+        pytest.skip("pulse-Doppler processing unavailable")
+    while engine._rd_map is None:  # Processing is throttled to every 5th frame
+        step(engine)
+    snapshot = fill_snapshot(FrameSnapshot(), engine, sequence=1)
+
+    data_db = engine._rd_map.data_db
+    np.testing.assert_array_equal(snapshot.rd_map, data_db)
+    assert not np.shares_memory(snapshot.rd_map, data_db)
+    assert not snapshot.rd_map.flags.writeable
+    np.testing.assert_array_equal(
+        snapshot["pd_metadata"]["range_axis_m"], engine._rd_map.range_axis_m
+    )
+
+
+def test_buffers_never_hand_out_a_held_snapshot():
+    engine = build_engine()
+    buffers = SnapshotBuffers(count=2)
+    first = fill_snapshot(buffers.acquire(), engine, sequence=1)
+    first_targets = first["targets"]
+    second = buffers.acquire()
+    assert second is not first
+    assert buffers.acquire() is None  # Producer drops the frame
+
+    first.release()
+    first.release()  # Releasing twice must not duplicate the buffer
+    assert buffers.available == 1
+
+    step(engine)
+    reused = fill_snapshot(buffers.acquire(), engine, sequence=2)
+    assert reused is first
+    assert reused["targets"] is not first_targets  # Dicts rebuilt for the new frame
+    assert first_targets[0]["position"] != reused["targets"][0]["position"]
+
+
+def test_invalid_buffer_count_is_rejected():
+    with pytest.raises(ValueError, match="count"):
+        SnapshotBuffers(count=0)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from src.simulation.headless_runner import SimulationConfig, run_single_simulation
+from src.simulation.scenario_generator import ParameterSpace, ScenarioGenerator
+from src.simulation.sweep_executor import SweepExecutor, run_sweep
+
+
+def assert_same_result(vectorized, reference):
+    assert vectorized.config is reference.config
+    assert vectorized.n_pulses == reference.n_pulses
+    assert vectorized.n_detections == reference.n_detections
+    assert vectorized.detection_ratio == pytest.approx(reference.detection_ratio)
+    for name in ("mean_snr_db", "min_snr_db", "max_snr_db"):
+        assert getattr(vectorized, name) == pytest.approx(getattr(reference, name), abs=1e-9)
+    assert len(vectorized.snr_history) == len(reference.snr_history)
+    np.testing.assert_allclose(vectorized.snr_history, reference.snr_history, atol=1e-9)
+
+
+def test_sweep_matches_per_run_simulation():
+    space = ParameterSpace(
+        ranges_km=[10, 80, 200],
+        rcs_values_m2=[0.5, 5.0],
+        frequencies_ghz=[3.0, 10.0],
+        n_runs_per_config=2,
+        duration_s=2.0,
+    )
+    configs = ScenarioGenerator.generate(space)
+    configs.append(SimulationConfig(enable_atmospheric=False, duration_s=1.0, seed=11))
+
+    results = SweepExecutor().run(configs)
+
+    assert len(results) == len(configs)
+    for vectorized, config in zip(results, configs):
+        assert_same_result(vectorized, run_single_simulation(config))
+
+
+def test_moving_targets_that_leave_or_enter_range():
+    configs = [
+        # Closes to zero range half way through: later steps are skipped
+        SimulationConfig(
+            target_range_m=2000.0, target_velocity_mps=-400.0, duration_s=10.0, seed=3
+        ),
+        # Starts behind the radar and crosses into range
+        SimulationConfig(target_range_m=-500.0, target_velocity_mps=300.0, duration_s=4.0, seed=4),
+        # Never in range
+        SimulationConfig(target_range_m=-500.0, duration_s=1.0, seed=5),
+    ]
+    results = run_sweep(configs)
+
+    for vectorized, config in zip(results, configs):
+        assert_same_result(vectorized, run_single_simulation(config))
+    assert results[2].n_pulses == 0
+    assert results[2].mean_snr_db == 0.0
+    assert results[2].snr_history == []
+
+
+def test_results_do_not_depend_on_block_size_or_order():
+    configs = ScenarioGenerator.quick_sweep(n_ranges=7, n_runs=3)
+    for config in configs:
+        config.duration_s = 1.0
+
+    whole = SweepExecutor().run(configs)
+    blocked = SweepExecutor(max_runs_per_block=4).run(configs)
+    reversed_runs = SweepExecutor(max_runs_per_block=5).run(configs[::-1])[::-1]
+
+    for other in (blocked, reversed_runs):
+        for first, second in zip(whole, other):
+            assert first.config is second.config
+            assert first.n_detections == second.n_detections
+            assert first.mean_snr_db == second.mean_snr_db
+            assert first.snr_history == second.snr_history
+
+
+def test_runs_have_independent_streams():
+    configs = [SimulationConfig(duration_s=1.0, seed=seed) for seed in (1, 2, 1)]
+    first, second, repeat = run_sweep(configs)
+
+    assert first.snr_history != second.snr_history
+    assert first.snr_history == repeat.snr_history
+
+
+def test_invalid_block_size_is_rejected():
+    with pytest.raises(ValueError, match="max_runs_per_block"):
+        SweepExecutor(max_runs_per_block=0)
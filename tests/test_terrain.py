@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from src.physics.terrain import TerrainConfig, TerrainMap
+
+
+def _rays(n_rays=300, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.column_stack(
+        [
+            rng.uniform(-40e3, 40e3, n_rays),
+            rng.uniform(-40e3, 40e3, n_rays),
+            rng.uniform(50.0, 2500.0, n_rays),
+        ]
+    )
+
+
+class TestBatchedLineOfSight:
+    def test_batch_matches_scalar_raymarch_without_grid(self):
+        terrain = TerrainMap(TerrainConfig(seed=11, scale=20000.0, max_height=800.0))
+        radar = np.array([0.0, 0.0, 500.0])
+        targets = _rays()
+
+        visible, block_range, block_xy = terrain.check_line_of_sight_batch(
+            radar, targets
+        )
+
+        reference = [terrain.check_line_of_sight(radar, p) for p in targets]
+        assert 0 < visible.sum() < len(targets)
+        for k, (is_visible, reference_range, reference_xy) in enumerate(reference):
+            assert visible[k] == is_visible
+            if is_visible:
+                assert np.isnan(block_range[k])
+            else:
+                assert block_range[k] == reference_range
+                assert tuple(block_xy[k]) == reference_xy
+
+    def test_height_grid_interpolates_within_tolerance(self):
+        terrain = TerrainMap(TerrainConfig(seed=11, scale=20000.0, max_height=800.0))
+        radar = np.array([0.0, 0.0, 500.0])
+        targets = _rays()
+        exact_visible, exact_range, _ = terrain.check_line_of_sight_batch(
+            radar, targets
+        )
+
+        grid = terrain.build_height_grid((0.0, 0.0), 45e3, resolution_m=50.0)
+        grid_visible, grid_range, _ = terrain.check_line_of_sight_batch(radar, targets)
+
+        assert grid.extent[0] <= -45e3 and grid.extent[1] >= 45e3
+        assert np.mean(grid_visible == exact_visible) > 0.98
+        both_blocked = ~grid_visible & ~exact_visible
+        np.testing.assert_allclose(
+            grid_range[both_blocked], exact_range[both_blocked], rtol=0.05
+        )
+        assert terrain.check_line_of_sight(radar, targets[0])[0] == grid_visible[0]
+
+        terrain.clear_height_grid()
+        np.testing.assert_array_equal(
+            terrain.check_line_of_sight_batch(radar, targets)[0], exact_visible
+        )
+
+    def test_grid_sample_is_bilinear_and_nan_outside(self):
+        terrain = TerrainMap(TerrainConfig(seed=5, max_height=1000.0))
+        grid = terrain.build_height_grid((0.0, 0.0), 1000.0, resolution_m=100.0)
+        h = grid.heights
+
+        x0, y0 = grid.origin_x, grid.origin_y
+        midpoint = grid.sample(x0 + 50.0, y0 + 50.0)
+
+        assert midpoint == pytest.approx(
+            0.25 * (h[0, 0] + h[0, 1] + h[1, 0] + h[1, 1]), rel=1e-6
+        )
+        assert np.isnan(grid.sample(x0 - 1.0, y0))
+
+    def test_height_grid_memory_cap_is_enforced(self):
+        terrain = TerrainMap()
+
+        with pytest.raises(ValueError, match="max_memory_mb"):
+            terrain.build_height_grid((0.0, 0.0), 200e3, resolution_m=10.0)
+        assert terrain.height_grid is None
+
+
+class TestHorizonProfile:
+    def test_profile_agrees_with_raymarch(self):
+        terrain = TerrainMap(TerrainConfig(seed=11, scale=20000.0, max_height=800.0))
+        radar = np.array([0.0, 0.0, 500.0])
+        targets = _rays(1000)
+
+        exact, _, _ = terrain.check_line_of_sight_batch(radar, targets)
+        profile = terrain.build_horizon_profile(radar)
+
+        assert profile.mask_slope.shape[0] == 3600
+        assert profile.max_range_m >= terrain.get_horizon_range(500.0, 800.0)
+        visible = profile.is_visible(targets)
+        assert np.mean(visible == exact) > 0.99
+        assert [profile.point_is_visible(p) for p in targets] == visible.tolist()
+
+    def test_mask_angle_is_monotonic_in_range(self):
+        terrain = TerrainMap(TerrainConfig(seed=2, max_height=1200.0))
+        profile = terrain.build_horizon_profile(np.array([0.0, 0.0, 100.0]))
+
+        angles = profile.mask_angle_deg(np.full(50, 1.0), np.linspace(1e3, 80e3, 50))
+
+        assert np.all(np.diff(angles) >= 0.0)
+        assert profile.mask_angle_deg(1.0, 0.0) == -90.0
+
+    def test_profile_is_cached_until_radar_moves(self):
+        terrain = TerrainMap(TerrainConfig(seed=2, max_height=500.0))
+        site = np.array([0.0, 0.0, 50.0])
+
+        profile = terrain.get_horizon_profile(site)
+
+        assert terrain.get_horizon_profile(site.copy()) is profile
+        moved = terrain.get_horizon_profile(site + np.array([10.0, 0.0, 0.0]))
+        assert moved is not profile
+        assert moved.matches(site + np.array([10.0, 0.0, 0.0]))
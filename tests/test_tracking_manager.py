@@ -2,7 +2,9 @@ import numpy as np
 import pytest
 
 from src.simulation.objects import Radar
-from src.tracking.tracker import Track, TrackManager, TrackStatus
+from scipy.optimize import linear_sum_assignment
+
+from src.tracking.tracker import Track, TrackManager, TrackStatus, assign_gated_pairs
 
 
 def make_track(manager, track_id, position, position_variance):
@@ -37,6 +39,62 @@ def test_global_assignment_preserves_two_feasible_matches():
     assert unassigned_tracks == []
 
 
+@pytest.mark.parametrize("n_tracks", [12, 120])
+def test_vectorized_gating_matches_pairwise_nis(n_tracks):
+    rng = np.random.default_rng(n_tracks)
+    manager = TrackManager(gate_distance=400.0, measurement_noise=30.0)
+    for track_id in range(1, n_tracks + 1):
+        manager.tracks[track_id] = make_track(
+            manager, track_id, rng.uniform(-5000.0, 5000.0, 2), rng.uniform(50.0, 5e4)
+        )
+    detections = rng.uniform(-5000.0, 5000.0, (n_tracks, 2))
+    tracks = list(manager.tracks.values())
+
+    expected = np.full((n_tracks, n_tracks), np.inf)
+    for row, track in enumerate(tracks):
+        covariance = manager.kf.H @ track.state.P @ manager.kf.H.T + manager.kf.R
+        for col, detection in enumerate(detections):
+            innovation = detection - np.asarray(track.position)
+            if np.linalg.norm(innovation) > manager.gate_distance:
+                continue
+            nis = innovation @ np.linalg.solve(covariance, innovation)
+            if nis <= manager.gate_threshold:
+                expected[row, col] = nis
+
+    rows, cols, nis = manager._gated_pairs(tracks, detections)
+    cost = np.full((n_tracks, n_tracks), np.inf)
+    cost[rows, cols] = nis
+
+    assert np.isfinite(expected).sum() > 0
+    np.testing.assert_array_equal(np.isfinite(cost), np.isfinite(expected))
+    finite = np.isfinite(expected)
+    np.testing.assert_allclose(cost[finite], expected[finite], rtol=1e-10)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_component_assignment_matches_dense_padded_solve(seed):
+    rng = np.random.default_rng(seed)
+    n_rows, n_cols = 150, 200
+    gated = rng.random((n_rows, n_cols)) < 0.006
+    rows, cols = np.nonzero(gated)
+    costs = rng.uniform(0.0, 11.0, rows.size)
+
+    dense = np.full((n_rows, n_cols), 1e12)
+    dense[rows, cols] = costs
+    dense_rows, dense_cols = linear_sum_assignment(dense)
+    keep = gated[dense_rows, dense_cols]
+
+    matched_rows, matched_cols = assign_gated_pairs(rows, cols, costs, n_rows, n_cols)
+
+    assert np.all(gated[matched_rows, matched_cols])
+    assert np.unique(matched_rows).size == matched_rows.size
+    assert np.unique(matched_cols).size == matched_cols.size
+    assert matched_rows.size == np.count_nonzero(keep)
+    assert dense[matched_rows, matched_cols].sum() == pytest.approx(
+        dense[dense_rows[keep], dense_cols[keep]].sum(), rel=1e-12
+    )
+
+
 def test_confirmation_requires_consecutive_hits():
     manager = TrackManager(
         gate_distance=500.0,